@@ -1,7 +1,10 @@
 """A collection of runtime performance bencharks, useful for debugging performance related issues."""
 
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
 
 import gymnasium
 
@@ -99,3 +102,348 @@ def benchmark_render(env: gymnasium.Env, target_duration: int = 5) -> float:
 
     renders_per_time = renders / length
     return renders_per_time
+
+
+def benchmark_vector_step(
+    envs: gymnasium.vector.VectorEnv, target_duration: int = 5, seed=None
+) -> float:
+    """A benchmark to measure the runtime performance of step for a vector environment.
+
+    Args:
+        envs: the vector environment to benchmarked.
+        target_duration: the duration of the benchmark in seconds (note: it will go slightly over it).
+        seed: seeds the environments and actions sampled.
+
+    Returns: the average sub-environment steps per second (vector steps times ``num_envs``).
+    """
+    steps = 0
+    end = 0.0
+    envs.reset(seed=seed)
+    envs.action_space.seed(seed)
+    start = time.time()
+
+    while True:
+        steps += 1
+        envs.step(envs.action_space.sample())
+
+        if time.time() - start > target_duration:
+            end = time.time()
+            break
+
+    length = end - start
+
+    steps_per_time = steps * envs.num_envs / length
+    return steps_per_time
+
+
+def benchmark_async_workers(
+    env_fn: Callable[[], gymnasium.Env],
+    num_workers: Sequence[int],
+    envs_per_worker: Sequence[int],
+    target_duration: int = 5,
+    seed=None,
+    **vector_kwargs: Any,
+) -> dict[tuple[int, int], float]:
+    """A benchmark sweeping the number of worker processes and ``envs_per_worker`` of :class:`AsyncVectorEnv`.
+
+    example usage:
+        ```py
+        results = benchmark_async_workers(lambda: gymnasium.make("CartPole-v1"), [4, 8], [1, 8, 32])
+        best_workers, best_envs_per_worker = max(results, key=results.get)
+        ```
+
+    Args:
+        env_fn: the function to initialize each sub-environment.
+        num_workers: the numbers of worker processes to benchmark.
+        envs_per_worker: the numbers of sub-environments per worker to benchmark.
+        target_duration: the duration of each benchmark in seconds (note: it will go slightly over it).
+        seed: seeds the environments and actions sampled.
+        **vector_kwargs: extra keyword arguments for :class:`AsyncVectorEnv` (e.g. ``shared_step_memory=True``).
+
+    Returns: the sub-environment steps per second for each ``(num_workers, envs_per_worker)`` pair.
+    """
+    results = {}
+    for workers in num_workers:
+        for per_worker in envs_per_worker:
+            envs = gymnasium.vector.AsyncVectorEnv(
+                [env_fn for _ in range(workers * per_worker)],
+                envs_per_worker=per_worker,
+                **vector_kwargs,
+            )
+            results[(workers, per_worker)] = benchmark_vector_step(
+                envs, target_duration, seed
+            )
+            envs.close()
+    return results
+
+
+def benchmark_observation_buffers(
+    env_fn: Callable[[], gymnasium.Env],
+    num_envs: int = 8,
+    target_duration: int = 5,
+    seed=None,
+    vector_env_cls: type[gymnasium.vector.VectorEnv] | None = None,
+) -> dict[str, dict[str, float]]:
+    """A benchmark comparing how a vector environment hands out its batched observations, e.g. for pixel observations.
+
+    The modes benchmarked are ``"copy"`` (``copy=True``, a deep copy every step), ``"no_copy"`` (``copy=False``),
+    ``"double_buffer"`` and ``"triple_buffer"`` (``observation_buffers=2`` and ``3``) and ``"read_only"``
+    (``copy=False, read_only=True``).
+
+    example usage:
+        ```py
+        results = benchmark_observation_buffers(
+            lambda: gymnasium.wrappers.AddRenderObservation(gymnasium.make("CartPole-v1", render_mode="rgb_array"))
+        )
+        ```
+
+    Args:
+        env_fn: the function to initialize each sub-environment.
+        num_envs: the number of sub-environments.
+        target_duration: the duration of each benchmark in seconds (note: it will go slightly over it).
+        seed: seeds the environments and actions sampled.
+        vector_env_cls: the vector environment class, by default :class:`SyncVectorEnv`.
+
+    Returns: for each mode, the sub-environment ``"steps_per_second"``, the ``"peak_memory"`` in bytes allocated while
+        stepping (as traced by :mod:`tracemalloc`) and the ``"buffer_memory"`` in bytes of the batched observation buffers.
+    """
+    import tracemalloc
+
+    if vector_env_cls is None:
+        vector_env_cls = gymnasium.vector.SyncVectorEnv
+
+    modes = {
+        "copy": {"copy": True},
+        "no_copy": {"copy": False},
+        "double_buffer": {"observation_buffers": 2},
+        "triple_buffer": {"observation_buffers": 3},
+        "read_only": {"copy": False, "read_only": True},
+    }
+    results = {}
+    for mode, vector_kwargs in modes.items():
+        envs = vector_env_cls([env_fn for _ in range(num_envs)], **vector_kwargs)
+        steps_per_second = benchmark_vector_step(envs, target_duration, seed)
+
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(10):
+            envs.step(envs.action_space.sample())
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        batch_bytes = _nbytes(
+            gymnasium.vector.utils.create_empty_array(
+                envs.single_observation_space, n=num_envs, fn=np.zeros
+            )
+        )
+        results[mode] = {
+            "steps_per_second": steps_per_second,
+            "peak_memory": peak - baseline,
+            "buffer_memory": batch_bytes * vector_kwargs.get("observation_buffers", 1),
+        }
+        envs.close()
+    return results
+
+
+def benchmark_space_plan(
+    spaces: dict[str, gymnasium.Space] | None = None,
+    num_envs: int = 8,
+    target_duration: float = 1,
+    seed=None,
+) -> dict[str, dict[str, float]]:
+    """A benchmark comparing :class:`SpacePlan` against :func:`concatenate` and :func:`iterate` for (nested) spaces.
+
+    example usage:
+        ```py
+        results = benchmark_space_plan()
+        speedup = results["nested_dict"]["concatenate"] / results["nested_dict"]["plan_concatenate"]
+        ```
+
+    Args:
+        spaces: the (single) spaces to benchmark by name, by default a box, a flat dict and a nested dict and tuple space.
+        num_envs: the number of samples in each batch.
+        target_duration: the duration of each benchmark in seconds (note: it will go slightly over it).
+        seed: seeds the spaces sampled.
+
+    Returns: for each space, the seconds per call of ``"concatenate"``, ``"plan_concatenate"``,
+        ``"iterate"`` and ``"plan_iterate"`` (iterating over the whole batch).
+    """
+    from gymnasium.spaces import Box, Dict, Discrete, MultiBinary, Tuple
+    from gymnasium.vector.utils import (
+        SpacePlan,
+        batch_space,
+        concatenate,
+        create_empty_array,
+        iterate,
+    )
+
+    if spaces is None:
+        spaces = {
+            "box": Box(0, 1, shape=(4,)),
+            "flat_dict": Dict({f"key_{i}": Box(0, 1, shape=(3,)) for i in range(8)}),
+            "nested_dict": Dict(
+                agent=Dict(
+                    position=Box(-1, 1, shape=(2,)),
+                    sensors=Dict(lidar=Box(0, 1, shape=(16,)), bump=MultiBinary(4)),
+                ),
+                goal=Tuple((Box(-1, 1, shape=(2,)), Discrete(5))),
+                step=Discrete(100),
+            ),
+        }
+
+    def _seconds_per_call(function: Callable[[], Any]) -> float:
+        calls = 0
+        start = time.time()
+        while time.time() - start <= target_duration:
+            function()
+            calls += 1
+        return (time.time() - start) / calls
+
+    results = {}
+    for name, space in spaces.items():
+        space.seed(seed)
+        plan = SpacePlan(space, num_envs)
+        batched_space = batch_space(space, num_envs)
+        samples = [space.sample() for _ in range(num_envs)]
+        out = create_empty_array(space, n=num_envs)
+        batch = batched_space.sample()
+
+        results[name] = {
+            "concatenate": _seconds_per_call(lambda: concatenate(space, samples, out)),
+            "plan_concatenate": _seconds_per_call(
+                lambda: plan.concatenate(samples, out)
+            ),
+            "iterate": _seconds_per_call(lambda: list(iterate(batched_space, batch))),
+            "plan_iterate": _seconds_per_call(lambda: list(plan.iterate(batch))),
+        }
+    return results
+
+
+def benchmark_wrapper_overhead(
+    env_fn: Callable[[], gymnasium.Env],
+    wrapper_fns: Sequence[Callable[[gymnasium.Env], gymnasium.Env]],
+    target_duration: float = 1,
+    seed=None,
+) -> dict[str, list[float]]:
+    """A benchmark of the step overhead of each layer of a wrapper stack, with and without fusing the transform wrappers.
+
+    For ``k = 0, ..., len(wrapper_fns)``, the environment is wrapped with the first ``k`` wrappers, then the time of
+    a step is measured for the wrapper stack and for the stack with its transform wrappers fused (:func:`fuse_transforms`).
+    The same action is used for every step, such that the action sampling isn't part of the step time.
+
+    example usage:
+        ```py
+        results = benchmark_wrapper_overhead(
+            lambda: gymnasium.make("CarRacing-v3"),
+            [
+                gymnasium.wrappers.ClipAction,
+                lambda env: gymnasium.wrappers.ResizeObservation(env, (64, 64)),
+                gymnasium.wrappers.GrayscaleObservation,
+                lambda env: gymnasium.wrappers.DtypeObservation(env, np.float32),
+            ],
+        )
+        speedup = results["unfused"][-1] / results["fused"][-1]
+        ```
+
+    Args:
+        env_fn: the function to initialize the (unwrapped) environment.
+        wrapper_fns: the functions to wrap the environment with, from the inner most wrapper.
+        target_duration: the duration of each benchmark in seconds (note: it will go slightly over it).
+        seed: seeds the environment and action sampled.
+
+    Returns: the seconds per step with ``k`` wrappers of the ``"unfused"`` and ``"fused"`` stacks,
+        and the ``"unfused_layer_overhead"`` and ``"fused_layer_overhead"`` in seconds of the ``k``-th wrapper.
+    """
+    from gymnasium.wrappers import fuse_transforms
+
+    def _seconds_per_step(env: gymnasium.Env) -> float:
+        env.reset(seed=seed)
+        env.action_space.seed(seed)
+        action = env.action_space.sample()
+
+        steps = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start <= target_duration:
+            _, _, terminated, truncated, _ = env.step(action)
+            if terminated or truncated:
+                env.reset()
+            steps += 1
+        return (time.perf_counter() - start) / steps
+
+    results: dict[str, list[float]] = {"unfused": [], "fused": []}
+    for num_wrappers in range(len(wrapper_fns) + 1):
+        for mode in ("unfused", "fused"):
+            env = env_fn()
+            for wrapper_fn in wrapper_fns[:num_wrappers]:
+                env = wrapper_fn(env)
+            if mode == "fused":
+                env = fuse_transforms(env, min_wrappers=1)
+
+            results[mode].append(_seconds_per_step(env))
+            env.close()
+
+    for mode in ("unfused", "fused"):
+        results[f"{mode}_layer_overhead"] = [
+            after - before for before, after in zip(results[mode], results[mode][1:])
+        ]
+    return results
+
+
+def benchmark_async_startup(
+    env_fn: Callable[[], gymnasium.Env],
+    num_envs: int = 8,
+    contexts: Sequence[str] = ("fork", "spawn", "forkserver"),
+    worker_pool: gymnasium.vector.utils.WorkerPool | None = None,
+    repeats: int = 3,
+    seed=None,
+    **vector_kwargs: Any,
+) -> dict[str, float]:
+    """A benchmark of the startup time of :class:`AsyncVectorEnv`, from its creation until its first reset returns.
+
+    The per-instance process creation of every multiprocessing context in ``contexts`` is compared
+    to leasing the workers from ``worker_pool`` (a :class:`WorkerPool`), whose fork server is started before timing.
+
+    example usage:
+        ```py
+        pool = WorkerPool(preload=["gymnasium", "gymnasium.envs.box2d"])
+        results = benchmark_async_startup(lambda: gymnasium.make("LunarLander-v3"), num_envs=64, worker_pool=pool)
+        speedup = results["spawn"] / results["worker_pool"]
+        ```
+
+    Args:
+        env_fn: the function to initialize each sub-environment.
+        num_envs: the number of sub-environments.
+        contexts: the multiprocessing contexts to benchmark.
+        worker_pool: the worker pool to benchmark, if ``None`` then only the ``contexts`` are benchmarked.
+        repeats: the number of vector environments created for each context, the startup times are averaged.
+        seed: seeds the first reset.
+        **vector_kwargs: extra keyword arguments for :class:`AsyncVectorEnv` (e.g. ``envs_per_worker=8``).
+
+    Returns: the average startup time in seconds for each context and ``"worker_pool"``.
+    """
+    modes = {context: {"context": context} for context in contexts}
+    if worker_pool is not None:
+        modes["worker_pool"] = {"worker_pool": worker_pool}
+
+    results = {}
+    for mode, mode_kwargs in modes.items():
+        startup_times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            envs = gymnasium.vector.AsyncVectorEnv(
+                [env_fn for _ in range(num_envs)], **mode_kwargs, **vector_kwargs
+            )
+            envs.reset(seed=seed)
+            startup_times.append(time.perf_counter() - start)
+            envs.close()
+        results[mode] = sum(startup_times) / repeats
+    return results
+
+
+def _nbytes(batch: Any) -> int:
+    """The number of bytes of the (possibly nested) NumPy arrays of a batch."""
+    if isinstance(batch, dict):
+        return sum(_nbytes(value) for value in batch.values())
+    elif isinstance(batch, tuple):
+        return sum(_nbytes(value) for value in batch)
+    return getattr(batch, "nbytes", 0)
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import os
+import queue
+import threading
 from collections.abc import Callable
 
+import numpy as np
+
 import gymnasium as gym
 from gymnasium import logger
 
 
 try:
+    from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
     from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
 except ImportError as e:
     raise gym.error.DependencyNotInstalled(
@@ -17,6 +22,172 @@ except ImportError as e:
     ) from e
 
 
+class VideoEncoder:
+    """Encodes a video in the background, streaming its frames through a bounded queue to an ffmpeg subprocess.
+
+    Frames are not kept in memory until the video is saved, :meth:`write` puts the frame in a queue of at most
+    ``max_queue_size`` frames that a background thread writes to ffmpeg (with moviepy's ``FFMPEG_VideoWriter``), so the
+    encoding overlaps with the caller. :meth:`close` returns straight away, the video file is finalized in the background,
+    use :meth:`wait` to wait for it to be written.
+
+    When the queue is full (the encoder is slower than the frames are written), the ``backpressure`` option is either
+
+     * "block" (default) - :meth:`write` waits for the encoder, no frame is lost
+     * "drop" - the frame is dropped
+     * "downsample" - once the queue is half full, only every second frame is queued, the others (and the frames
+       that find the queue full) are dropped
+
+    The dropped frames are counted in :attr:`dropped_frames`.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.utils.save_video import VideoEncoder
+        >>> encoder = VideoEncoder("videos/rl-video.mp4", fps=30)  # doctest: +SKIP
+        >>> for _ in range(60):  # doctest: +SKIP
+        ...     encoder.write(np.zeros((64, 64, 3), dtype=np.uint8))
+        >>> encoder.close()  # doctest: +SKIP
+        >>> encoder.wait()  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fps: float,
+        max_queue_size: int = 128,
+        backpressure: str = "block",
+        verbose: bool = False,
+    ):
+        """Starts the background encoder of a video, ffmpeg is started with the first frame.
+
+        Args:
+            path: The path of the video file
+            fps: The frames per second of the video
+            max_queue_size: The maximum number of frames waiting to be encoded
+            backpressure: What to do with a frame when the queue is full, options: "block", "drop" or "downsample"
+            verbose: If to print when the video is saved
+
+        Raises:
+            ValueError: If ``max_queue_size`` is less than 1 or ``backpressure`` is unknown.
+        """
+        if max_queue_size < 1:
+            raise ValueError(
+                f"Expected `max_queue_size` to be at least 1, actual got {max_queue_size}"
+            )
+        if backpressure not in {"block", "drop", "downsample"}:
+            raise ValueError(
+                f"Unexpected `backpressure`, expected 'block', 'drop' or 'downsample', actual value: {backpressure!r}"
+            )
+
+        self.path = path
+        self.fps = fps
+        self.backpressure = backpressure
+        self.verbose = verbose
+
+        self.written_frames = 0
+        self.dropped_frames = 0
+        self.closed = False
+
+        self._queue: queue.Queue[np.ndarray | None] = queue.Queue(max_queue_size)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._encode, name=f"VideoEncoder-{path}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def done(self) -> bool:
+        """If the video is finalized (or the encoder failed)."""
+        return not self._thread.is_alive()
+
+    def write(self, frame: np.ndarray):
+        """Queues a frame (an RGB array of shape ``(height, width, 3)``) to be encoded, see ``backpressure``.
+
+        Raises:
+            ValueError: If the encoder was closed.
+        """
+        if self.closed:
+            raise ValueError(
+                f"Cannot write a frame, the encoder of {self.path} is closed."
+            )
+        if self._error is not None:
+            raise self._error
+
+        self.written_frames += 1
+        if self.backpressure == "block":
+            self._queue.put(frame)
+        elif (
+            self.backpressure == "downsample"
+            and self.written_frames % 2 == 0
+            and self._queue.qsize() >= self._queue.maxsize / 2
+        ):
+            self.dropped_frames += 1
+        else:
+            try:
+                self._queue.put_nowait(frame)
+            except queue.Full:
+                self.dropped_frames += 1
+
+    def close(self):
+        """Stops writing frames, the video is finalized in the background. Closing an encoder more than once has no effect."""
+        if not self.closed:
+            self.closed = True
+            self._queue.put(None)
+
+    def wait(self, timeout: float | None = None):
+        """Closes the encoder and waits for the video file to be written.
+
+        Args:
+            timeout: Number of seconds to wait for the video. If ``None``, it waits until the video is written.
+
+        Raises:
+            TimeoutError: If the video was not written within ``timeout`` seconds.
+            Exception: The error raised while encoding the video.
+        """
+        self.close()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise TimeoutError(
+                f"Encoding the video {self.path} timed-out after {timeout} seconds."
+            )
+        if self._error is not None:
+            raise self._error
+
+    def _encode(self):
+        writer = None
+        try:
+            frame = self._queue.get()
+            while frame is not None:
+                frame = np.asarray(frame, dtype=np.uint8)
+                if writer is None:
+                    shape = frame.shape
+                    if len(shape) != 3 or shape[2] != 3:
+                        raise ValueError(
+                            f"Expected the frames to be RGB arrays of shape (height, width, 3), actual shape: {shape}"
+                        )
+                    writer = FFMPEG_VideoWriter(
+                        self.path, (shape[1], shape[0]), self.fps
+                    )
+                elif frame.shape != shape:
+                    raise ValueError(
+                        f"Expected every frame of the video to have the shape {shape}, actual shape: {frame.shape}"
+                    )
+                writer.write_frame(frame)
+                frame = self._queue.get()
+        except BaseException as e:
+            self._error = e
+            # Unblock the frames still being written until the encoder is closed
+            while self._queue.get() is not None:
+                pass
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if self._error is None and self.verbose:
+            print(
+                f"Saved video {self.path} ({self.written_frames - self.dropped_frames} frames, {self.dropped_frames} dropped)"
+            )
+
+
 def capped_cubic_video_schedule(episode_id: int) -> bool:
     r"""The default episode trigger.
 
@@ -44,8 +215,9 @@ def save_video(
     episode_index: int = 0,
     step_starting_index: int = 0,
     save_logger: str | None = None,
+    background: bool = False,
     **kwargs,
-):
+) -> list[VideoEncoder]:
     """Save videos from rendering frames.
 
     This function extract video from a list of render frame episodes.
@@ -61,8 +233,13 @@ def save_video(
         episode_index (int): The index of the current episode.
         step_starting_index (int): The step index of the first frame.
         save_logger: If to log the video saving progress, helpful for long videos that take a while, use "bar" to enable.
+        background: If to return before the videos are written, the videos are encoded by :class:`VideoEncoder`
+            in the background, use :meth:`VideoEncoder.wait` on the returned encoders to wait for them.
         **kwargs: The kwargs that will be passed to moviepy's ImageSequenceClip.
-            You need to specify either fps or duration.
+            You need to specify either fps or duration. With only ``fps``, the videos are encoded with :class:`VideoEncoder`.
+
+    Returns:
+        The video encoders, an empty list if the videos were written with moviepy's ImageSequenceClip
 
     Example:
         >>> import gymnasium as gym
@@ -97,10 +274,22 @@ def save_video(
     os.makedirs(video_folder, exist_ok=True)
     path_prefix = f"{video_folder}/{name_prefix}"
 
+    encoders: list[VideoEncoder] = []
+
+    def _write_video(video_frames: list, path: str):
+        if kwargs.keys() == {"fps"}:
+            encoder = VideoEncoder(path, kwargs["fps"], verbose=save_logger is not None)
+            for frame in video_frames:
+                encoder.write(frame)
+            encoder.close()
+            encoders.append(encoder)
+        else:
+            clip = ImageSequenceClip(video_frames, **kwargs)
+            clip.write_videofile(path, logger=save_logger)
+
     if episode_trigger is not None and episode_trigger(episode_index):
-        clip = ImageSequenceClip(frames[:video_length], **kwargs)
-        clip.write_videofile(
-            f"{path_prefix}-episode-{episode_index}.mp4", logger=save_logger
+        _write_video(
+            frames[:video_length], f"{path_prefix}-episode-{episode_index}.mp4"
         )
 
     if step_trigger is not None:
@@ -112,7 +301,12 @@ def save_video(
                 end_index = (
                     frame_index + video_length if video_length is not None else None
                 )
-                clip = ImageSequenceClip(frames[frame_index:end_index], **kwargs)
-                clip.write_videofile(
-                    f"{path_prefix}-step-{step_index}.mp4", logger=save_logger
+                _write_video(
+                    frames[frame_index:end_index],
+                    f"{path_prefix}-step-{step_index}.mp4",
                 )
+
+    if not background:
+        for encoder in encoders:
+            encoder.wait()
+    return encoders
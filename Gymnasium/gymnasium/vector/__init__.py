@@ -3,6 +3,7 @@
 from gymnasium.vector import utils
 from gymnasium.vector.async_vector_env import AsyncVectorEnv
 from gymnasium.vector.sync_vector_env import SyncVectorEnv
+from gymnasium.vector.threaded_vector_env import ThreadedVectorEnv
 from gymnasium.vector.vector_env import (
     AutoresetMode,
     VectorActionWrapper,
@@ -21,6 +22,7 @@ __all__ = [
     "VectorRewardWrapper",
     "SyncVectorEnv",
     "AsyncVectorEnv",
+    "ThreadedVectorEnv",
     "utils",
     "AutoresetMode",
 ]
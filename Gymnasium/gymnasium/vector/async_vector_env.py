@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import math
 import multiprocessing
 import sys
 import time
 import traceback
 from collections.abc import Callable, Sequence
 from copy import deepcopy
+from ctypes import c_bool
 from enum import Enum
 from multiprocessing import Queue
-from multiprocessing.connection import Connection
+from multiprocessing.connection import Connection, wait
+from multiprocessing.reduction import ForkingPickler
 from multiprocessing.sharedctypes import SynchronizedArray
 from typing import Any
 
@@ -24,17 +27,21 @@ from gymnasium.error import (
     CustomSpaceError,
     NoAsyncCallError,
 )
+from gymnasium.spaces import Box, Dict, Discrete, MultiBinary, MultiDiscrete, Tuple
 from gymnasium.spaces.utils import is_space_dtype_shape_equiv
 from gymnasium.vector.utils import (
     CloudpickleWrapper,
+    ObservationBuffers,
+    SpacePlan,
+    WorkerPool,
     batch_differing_spaces,
     batch_space,
     clear_mpi_env_vars,
-    concatenate,
+    copy_observations,
     create_empty_array,
     create_shared_memory,
-    iterate,
     read_from_shared_memory,
+    read_only_view,
     write_to_shared_memory,
 )
 from gymnasium.vector.vector_env import ArrayType, AutoresetMode, VectorEnv
@@ -43,6 +50,14 @@ from gymnasium.vector.vector_env import ArrayType, AutoresetMode, VectorEnv
 __all__ = ["AsyncVectorEnv", "AsyncState"]
 
 
+# With ``shared_step_memory=True``, a step is requested by this single byte message rather than a pickled command,
+# and a worker answers with an empty message when the step succeeded with an empty info
+_STEP_MESSAGE = b"s"
+
+# The bins of the step latency histograms of ``monitor_workers=True``, from 1 microsecond to 10 seconds (3 bins per decade)
+_LATENCY_BIN_EDGES = np.concatenate(([0.0], np.geomspace(1e-6, 10.0, 22), [np.inf]))
+
+
 class AsyncState(Enum):
     """The AsyncVectorEnv possible states given the different actions."""
 
@@ -50,6 +65,7 @@ class AsyncState(Enum):
     WAITING_RESET = "reset"
     WAITING_STEP = "step"
     WAITING_CALL = "call"
+    WAITING_PARTIAL_STEP = "partial_step"
 
 
 class AsyncVectorEnv(VectorEnv):
@@ -104,6 +120,16 @@ class AsyncVectorEnv(VectorEnv):
         ) = None,
         observation_mode: str | Space = "same",
         autoreset_mode: str | AutoresetMode = AutoresetMode.NEXT_STEP,
+        shared_step_memory: bool = False,
+        envs_per_worker: int = 1,
+        batch_size: int | None = None,
+        observation_buffers: int = 1,
+        read_only: bool = False,
+        shared_memory_capacity: int | None = None,
+        respawn_workers: bool = False,
+        monitor_workers: bool = False,
+        worker_pool: WorkerPool | None = None,
+        worker_pool_timeout: float | None = None,
     ):
         """Vectorized environment that runs multiple environments in parallel.
 
@@ -119,11 +145,47 @@ class AsyncVectorEnv(VectorEnv):
                 so for some environments you may want to have it set to ``False``.
             worker: If set, then use that worker in a subprocess instead of a default one.
                 Can be useful to override some inner vector env logic, for instance, how resets on termination or truncation are handled.
+                With ``envs_per_worker > 1``, the worker receives the list of environment functions of its sub-environments
+                rather than a single function, and the ``env_slice`` and ``num_envs`` keyword arguments
+                (see ``_async_batch_worker``), as it handles the messages of all its sub-environments.
             observation_mode: Defines how environment observation spaces should be batched. 'same' defines that there should be ``n`` copies of identical spaces.
                 'different' defines that there can be multiple observation spaces with different parameters though requires the same shape and dtype,
                 warning, may raise unexpected errors. Passing a ``Tuple[Space, Space]`` object allows defining a custom ``single_observation_space`` and
                 ``observation_space``, warning, may raise unexpected errors.
             autoreset_mode: The Autoreset Mode used, see https://farama.org/Vector-Autoreset-Mode for more information.
+            shared_step_memory: If ``True``, then the actions, rewards, terminations and truncations are also communicated
+                through shared variables, each step only sends a single byte to every worker and infos are only pickled
+                when they are non-empty. This removes most of the inter-process overhead for environments with small
+                observations. Requires ``shared_memory=True``, custom workers receive the shared step buffers as an extra argument.
+            envs_per_worker: Number of sub-environments stepped one after the other by each worker process, the environments
+                ``[i * envs_per_worker, (i + 1) * envs_per_worker)`` run in worker ``i`` (the last worker may run fewer).
+                Cheap environments can then fill every core with far fewer processes than environments.
+                For values above 1, the default worker is ``_async_batch_worker``.
+            batch_size: Number of sub-environments returned by :meth:`recv`, by default ``num_envs``.
+                With :meth:`send` and :meth:`recv` (EnvPool-style partial batches), the batch holds the first ``batch_size``
+                sub-environments to finish their step, so a slow sub-environment does not stall the others.
+                Requires ``envs_per_worker=1``.
+            observation_buffers: If more than 1, the batched observations are written into this many buffers in turn
+                and returned without a deep copy (``copy`` is ignored). An observation is only overwritten by the
+                ``observation_buffers``-th following call to :meth:`reset` or :meth:`step`. With ``shared_memory=True``,
+                the observations are copied from the shared memory into the next buffer instead of a newly allocated one.
+            read_only: If ``True``, then the :meth:`reset` and :meth:`step` methods return read-only views of the observations.
+            shared_memory_capacity: The maximum number of nodes and edges of a :class:`Graph` observation or elements of a
+                :class:`Sequence` observation in the shared memory, by default 128. Larger observations raise an error in the worker.
+            respawn_workers: If ``True``, then a worker process that dies (e.g. from a segfault in native code) is restarted
+                rather than raising an error. Its sub-environments are created again and reset: the step in progress
+                returns the reset observation with a reward of 0 and ``truncated=True`` (followed by an autoreset step with
+                ``NEXT_STEP``, with the reset observation as ``final_obs`` with ``SAME_STEP``), and the info of those
+                sub-environments has ``"worker_respawned": True``. Other pending calls are sent again to the new worker.
+                Errors raised by the sub-environments are still raised. The respawns are counted in :attr:`worker_respawns`.
+            monitor_workers: If ``True``, then each worker writes a heartbeat timestamp and a histogram of its step
+                latencies to shared memory, see :attr:`worker_heartbeats` and :attr:`step_latency_histograms`.
+                Custom workers receive the shared buffers as the ``monitor_buffers`` keyword argument.
+            worker_pool: If set, then the workers are leased from the pool and started with its context (by default a
+                fork server with preloaded modules) rather than ``context``. The lease is released when the environment is closed,
+                or if starting the workers fails.
+            worker_pool_timeout: Number of seconds to wait for the workers of the ``worker_pool`` to be released by other
+                environments. If ``None``, then it waits until they are released.
 
         Warnings:
             worker is an advanced mode option. It provides a high degree of flexibility and a high chance
@@ -135,14 +197,28 @@ class AsyncVectorEnv(VectorEnv):
                 (or, by default, the observation space of the first sub-environment).
             ValueError: If observation_space is a custom space (i.e. not a default space in Gym,
                 such as gymnasium.spaces.Box, gymnasium.spaces.Discrete, or gymnasium.spaces.Dict) and shared_memory is True.
+            ValueError: If ``shared_step_memory`` is ``True`` but ``shared_memory`` is not, or the action space is a custom space.
+            ValueError: If ``envs_per_worker`` is less than 1.
+            ValueError: If ``batch_size`` is not in ``[1, num_envs]`` or is used with ``envs_per_worker > 1``.
+            ValueError: If ``observation_buffers`` is less than 1.
+            ValueError: If both ``context`` and ``worker_pool`` are set.
+            TimeoutError: If the workers of the ``worker_pool`` were not released within ``worker_pool_timeout`` seconds.
         """
         self.env_fns = env_fns
         self.shared_memory = shared_memory
         self.copy = copy
+        self.observation_buffers = observation_buffers
+        self.read_only = read_only
+        if context is not None and worker_pool is not None:
+            raise ValueError(
+                f"Expected `context` to be None with a `worker_pool`, actual got {context!r}"
+            )
         self.context = context
+        self.worker_pool = worker_pool
         self.daemon = daemon
         self.worker = worker
         self.observation_mode = observation_mode
+        self.shared_step_memory = shared_step_memory
         self.autoreset_mode = (
             autoreset_mode
             if isinstance(autoreset_mode, AutoresetMode)
@@ -151,6 +227,31 @@ class AsyncVectorEnv(VectorEnv):
 
         self.num_envs = len(env_fns)
 
+        if envs_per_worker < 1:
+            raise ValueError(
+                f"Expected `envs_per_worker` to be at least 1, actual got {envs_per_worker}"
+            )
+        self.envs_per_worker = envs_per_worker
+        self.num_workers = math.ceil(self.num_envs / envs_per_worker)
+        self._worker_slices = [
+            slice(i * envs_per_worker, min((i + 1) * envs_per_worker, self.num_envs))
+            for i in range(self.num_workers)
+        ]
+
+        if batch_size is None:
+            batch_size = self.num_envs
+        elif not 1 <= batch_size <= self.num_envs:
+            raise ValueError(
+                f"Expected `batch_size` to be between 1 and num_envs={self.num_envs}, actual got {batch_size}"
+            )
+        elif batch_size < self.num_envs and envs_per_worker > 1:
+            raise ValueError(
+                "`AsyncVectorEnv(..., batch_size=...)` requires `envs_per_worker=1`."
+            )
+        self.batch_size = batch_size
+        # The sub-environments that were sent an action with `send` and whose results were not yet returned by `recv`
+        self._pending = np.zeros(self.num_envs, dtype=np.bool_)
+
         # This would be nice to get rid of, but without it there's a deadlock between shared memory and pipes
         # Create a dummy environment to gather the metadata and observation / action space of the environment
         dummy_env = env_fns[0]()
@@ -188,12 +289,22 @@ class AsyncVectorEnv(VectorEnv):
         dummy_env.close()
         del dummy_env
 
+        self._action_plan = SpacePlan(self.single_action_space, self.num_envs)
+        self._observation_plan = SpacePlan(self.single_observation_space, self.num_envs)
+
         # Generate the multiprocessing context for the observation buffer
-        ctx = multiprocessing.get_context(context)
+        ctx = (
+            multiprocessing.get_context(context)
+            if worker_pool is None
+            else worker_pool.context
+        )
         if self.shared_memory:
             try:
                 _obs_buffer = create_shared_memory(
-                    self.single_observation_space, n=self.num_envs, ctx=ctx
+                    self.single_observation_space,
+                    n=self.num_envs,
+                    ctx=ctx,
+                    capacity=shared_memory_capacity,
                 )
                 self.observations = read_from_shared_memory(
                     self.single_observation_space, _obs_buffer, n=self.num_envs
@@ -207,36 +318,107 @@ class AsyncVectorEnv(VectorEnv):
             self.observations = create_empty_array(
                 self.single_observation_space, n=self.num_envs, fn=np.zeros
             )
+        # Strings, graphs and sequences read from shared memory don't follow it, so they are read after every step
+        self._obs_buffer = _obs_buffer
+        self._reread_observations = self.shared_memory and not _is_shared_memory_view(
+            self.single_observation_space
+        )
 
-        self.parent_pipes, self.processes = [], []
-        self.error_queue = ctx.Queue()
-        target = worker or _async_worker
-        with clear_mpi_env_vars():
-            for idx, env_fn in enumerate(self.env_fns):
-                parent_pipe, child_pipe = ctx.Pipe()
-                process = ctx.Process(
-                    target=target,
-                    name=f"Worker<{type(self).__name__}>-{idx}",
-                    args=(
-                        idx,
-                        CloudpickleWrapper(env_fn),
-                        child_pipe,
-                        parent_pipe,
-                        _obs_buffer,
-                        self.error_queue,
-                        self.autoreset_mode,
-                    ),
+        if observation_buffers < 1:
+            raise ValueError(
+                f"Expected `observation_buffers` to be at least 1, actual got {observation_buffers}"
+            )
+        elif observation_buffers == 1:
+            self._observation_buffers = None
+        else:
+            self._observation_buffers = ObservationBuffers(
+                self.single_observation_space, self.num_envs, observation_buffers
+            )
+
+        if self.shared_step_memory:
+            if not self.shared_memory:
+                raise ValueError(
+                    "`AsyncVectorEnv(..., shared_step_memory=True)` requires `shared_memory=True`."
+                )
+            try:
+                _action_buffer = create_shared_memory(
+                    self.single_action_space, n=self.num_envs, ctx=ctx
                 )
+            except CustomSpaceError as e:
+                raise ValueError(
+                    "Using `AsyncVector(..., shared_step_memory=True)` with a custom action space caused an error, you can disable this feature with `shared_step_memory=False`."
+                ) from e
+            _step_buffers = (
+                _action_buffer,
+                ctx.Array("d", self.num_envs),
+                ctx.Array(c_bool, self.num_envs),
+                ctx.Array(c_bool, self.num_envs),
+            )
+            self._shared_actions = read_from_shared_memory(
+                self.single_action_space, _action_buffer, n=self.num_envs
+            )
+            (
+                self._shared_rewards,
+                self._shared_terminations,
+                self._shared_truncations,
+            ) = (
+                np.frombuffer(buffer.get_obj(), dtype=dtype)
+                for buffer, dtype in zip(
+                    _step_buffers[1:], (np.float64, np.bool_, np.bool_)
+                )
+            )
+            extra_worker_args = (_step_buffers,)
+        else:
+            extra_worker_args = ()
+
+        if monitor_workers:
+            self._monitor_buffers = (
+                ctx.Array("d", self.num_workers),
+                ctx.Array("q", self.num_workers * (len(_LATENCY_BIN_EDGES) - 1)),
+            )
+        else:
+            self._monitor_buffers = None
 
-                self.parent_pipes.append(parent_pipe)
-                self.processes.append(process)
+        self.respawn_workers = respawn_workers
+        self.monitor_workers = monitor_workers
+        # The number of times each worker was respawned and the last message sent to each worker (to send it again)
+        self.worker_respawns = np.zeros(self.num_workers, dtype=np.int64)
+        self._worker_messages: list[tuple[str, Any] | bytes | None] = [
+            None for _ in range(self.num_workers)
+        ]
 
-                process.daemon = daemon
-                process.start()
-                child_pipe.close()
+        self.error_queue = ctx.Queue()
+        self._ctx = ctx
+        if self.envs_per_worker == 1:
+            self._worker_target = worker or _async_worker
+        else:
+            self._worker_target = worker or _async_batch_worker
+        self._worker_args = (
+            _obs_buffer,
+            self.error_queue,
+            self.autoreset_mode,
+        ) + extra_worker_args
+
+        self._worker_lease = (
+            None
+            if worker_pool is None
+            else worker_pool.lease(self.num_workers, timeout=worker_pool_timeout)
+        )
+        self.parent_pipes: list[Connection | None] = [None] * self.num_workers
+        self.processes: list[multiprocessing.Process | None] = [None] * self.num_workers
+        try:
+            with clear_mpi_env_vars():
+                for idx in range(self.num_workers):
+                    self._start_worker(idx)
 
-        self._state = AsyncState.DEFAULT
-        self._check_spaces()
+            self._state = AsyncState.DEFAULT
+            self._check_spaces()
+        except BaseException:
+            # An environment that failed to initialise is never closed, so its workers are terminated
+            #   and the lease released here, otherwise the workers of the pool would never be returned
+            self._terminate_workers()
+            self.closed = True
+            raise
 
     @property
     def np_random_seed(self) -> tuple[int, ...]:
@@ -248,6 +430,39 @@ class AsyncVectorEnv(VectorEnv):
         """Returns the tuple of the numpy random number generators for the wrapped envs."""
         return self.get_attr("np_random")
 
+    @property
+    def worker_heartbeats(self) -> np.ndarray:
+        """The :func:`time.time` of the last heartbeat of each worker, written when it receives a command and after each step.
+
+        A worker that has a pending call but whose heartbeat is old is stuck in its sub-environments.
+        Requires ``monitor_workers=True``.
+        """
+        if self._monitor_buffers is None:
+            raise ValueError(
+                "`AsyncVectorEnv.worker_heartbeats` requires `monitor_workers=True`."
+            )
+        return np.frombuffer(
+            self._monitor_buffers[0].get_obj(), dtype=np.float64
+        ).copy()
+
+    @property
+    def step_latency_histograms(self) -> tuple[np.ndarray, np.ndarray]:
+        """The histograms of the step latencies (in seconds) of each worker and the bin edges, like :func:`numpy.histogram`.
+
+        The histograms have shape ``(num_workers, len(bin_edges) - 1)``, with logarithmic bins from 1 microsecond
+        to 10 seconds (and a first and last bin for shorter and longer steps). With ``envs_per_worker > 1``,
+        the latency is of stepping all the sub-environments of a worker. Requires ``monitor_workers=True``.
+        """
+        if self._monitor_buffers is None:
+            raise ValueError(
+                "`AsyncVectorEnv.step_latency_histograms` requires `monitor_workers=True`."
+            )
+        histograms = np.frombuffer(self._monitor_buffers[1].get_obj(), dtype=np.int64)
+        return (
+            histograms.reshape(self.num_workers, -1).copy(),
+            _LATENCY_BIN_EDGES.copy(),
+        )
+
     def reset(
         self,
         *,
@@ -316,16 +531,30 @@ class AsyncVectorEnv(VectorEnv):
                 reset_mask
             ), f"`options['reset_mask': mask]` must contain a boolean array, got reset_mask={reset_mask}"
 
-            for pipe, env_seed, env_reset in zip(self.parent_pipes, seed, reset_mask):
-                if env_reset:
-                    env_kwargs = {"seed": env_seed, "options": options}
-                    pipe.send(("reset", env_kwargs))
-                else:
-                    pipe.send(("reset-noop", None))
+            if self.envs_per_worker == 1:
+                for worker_idx, (env_seed, env_reset) in enumerate(
+                    zip(seed, reset_mask)
+                ):
+                    if env_reset:
+                        env_kwargs = {"seed": env_seed, "options": options}
+                        self._send_to_worker(worker_idx, ("reset", env_kwargs))
+                    else:
+                        self._send_to_worker(worker_idx, ("reset-noop", None))
+            else:
+                for worker_idx, worker_slice in enumerate(self._worker_slices):
+                    if np.any(reset_mask[worker_slice]):
+                        env_kwargs = {
+                            "seed": seed[worker_slice],
+                            "options": options,
+                            "reset_mask": reset_mask[worker_slice],
+                        }
+                        self._send_to_worker(worker_idx, ("reset", env_kwargs))
+                    else:
+                        self._send_to_worker(worker_idx, ("reset-noop", None))
         else:
-            for pipe, env_seed in zip(self.parent_pipes, seed):
+            for worker_idx, env_seed in enumerate(self._split_by_worker(seed)):
                 env_kwargs = {"seed": env_seed, "options": options}
-                pipe.send(("reset", env_kwargs))
+                self._send_to_worker(worker_idx, ("reset", env_kwargs))
 
         self._state = AsyncState.WAITING_RESET
 
@@ -359,21 +588,21 @@ class AsyncVectorEnv(VectorEnv):
                 f"The call to `reset_wait` has timed out after {timeout} second(s)."
             )
 
-        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        results, successes = zip(
+            *[self._recv_from_worker(idx) for idx in range(self.num_workers)]
+        )
         self._raise_if_errors(successes)
 
-        infos = {}
-        results, info_data = zip(*results)
-        for i, info in enumerate(info_data):
-            infos = self._add_info(infos, info, i)
+        results, info_data = zip(*self._join_worker_results(results))
+        infos = self._batch_infos(enumerate(info_data))
 
         if not self.shared_memory:
-            self.observations = concatenate(
-                self.single_observation_space, results, self.observations
+            self.observations = self._observation_plan.concatenate(
+                results, self._next_observations()
             )
 
         self._state = AsyncState.DEFAULT
-        return (deepcopy(self.observations) if self.copy else self.observations), infos
+        return self._output_observations(), infos
 
     def step(
         self, actions: ActType
@@ -409,9 +638,16 @@ class AsyncVectorEnv(VectorEnv):
                 str(self._state.value),
             )
 
-        iter_actions = iterate(self.action_space, actions)
-        for pipe, action in zip(self.parent_pipes, iter_actions, strict=True):
-            pipe.send(("step", action))
+        if self.shared_step_memory:
+            _write_batch_to_shared_actions(self._shared_actions, actions)
+            for worker_idx in range(self.num_workers):
+                self._send_to_worker(worker_idx, _STEP_MESSAGE)
+        else:
+            iter_actions = self._split_by_worker(self._action_plan.iterate(actions))
+            for worker_idx, action in zip(
+                range(self.num_workers), iter_actions, strict=True
+            ):
+                self._send_to_worker(worker_idx, ("step", action))
         self._state = AsyncState.WAITING_STEP
 
     def step_wait(
@@ -443,37 +679,223 @@ class AsyncVectorEnv(VectorEnv):
                 f"The call to `step_wait` has timed out after {timeout} second(s)."
             )
 
-        observations, rewards, terminations, truncations, infos = [], [], [], [], {}
+        if self.shared_step_memory:
+            return self._shared_step_wait()
+
+        observations, rewards, terminations, truncations, env_infos = [], [], [], [], []
         successes = []
-        for env_idx, pipe in enumerate(self.parent_pipes):
-            env_step_return, success = pipe.recv()
+        for worker_idx in range(self.num_workers):
+            worker_step_return, success = self._recv_from_worker(worker_idx)
 
             successes.append(success)
             if success:
-                observations.append(env_step_return[0])
-                rewards.append(env_step_return[1])
-                terminations.append(env_step_return[2])
-                truncations.append(env_step_return[3])
-                infos = self._add_info(infos, env_step_return[4], env_idx)
+                for env_idx, env_step_return in self._worker_env_items(
+                    worker_idx, worker_step_return
+                ):
+                    observations.append(env_step_return[0])
+                    rewards.append(env_step_return[1])
+                    terminations.append(env_step_return[2])
+                    truncations.append(env_step_return[3])
+                    env_infos.append((env_idx, env_step_return[4]))
 
         self._raise_if_errors(successes)
+        infos = self._batch_infos(env_infos)
 
         if not self.shared_memory:
-            self.observations = concatenate(
-                self.single_observation_space,
-                observations,
-                self.observations,
+            self.observations = self._observation_plan.concatenate(
+                observations, self._next_observations()
             )
 
         self._state = AsyncState.DEFAULT
         return (
-            deepcopy(self.observations) if self.copy else self.observations,
+            self._output_observations(),
             np.array(rewards, dtype=np.float64),
             np.array(terminations, dtype=np.bool_),
             np.array(truncations, dtype=np.bool_),
             infos,
         )
 
+    def _shared_step_wait(
+        self,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        """Collects the step results written to shared memory, only non-empty infos (or errors) are unpickled."""
+        env_infos, successes = [], []
+        for worker_idx in range(self.num_workers):
+            message = self._recv_from_worker(worker_idx, raw=True)
+            if message:
+                worker_info, success = ForkingPickler.loads(message)
+                if success:
+                    env_infos += self._worker_env_items(worker_idx, worker_info)
+            else:
+                success = True
+            successes.append(success)
+
+        self._raise_if_errors(successes)
+        infos = self._batch_infos(env_infos)
+
+        self._state = AsyncState.DEFAULT
+        return (
+            self._output_observations(),
+            self._shared_rewards.copy(),
+            self._shared_terminations.copy(),
+            self._shared_truncations.copy(),
+            infos,
+        )
+
+    def send(self, actions: ActType, env_ids: Sequence[int] | np.ndarray | None = None):
+        """Sends actions to a subset of the sub-environments, without waiting for the results.
+
+        Together with :meth:`recv`, this allows stepping the sub-environments independently of each other (EnvPool-style).
+
+        Example:
+            >>> import gymnasium as gym
+            >>> envs = gym.make_vec("CartPole-v1", num_envs=4, vectorization_mode="async", vector_kwargs={"batch_size": 2})
+            >>> _ = envs.reset(seed=123)
+            >>> envs.send(np.zeros(4, dtype=np.int64))
+            >>> observations, rewards, terminations, truncations, infos = envs.recv()
+            >>> observations.shape, infos["env_id"].shape
+            ((2, 4), (2,))
+            >>> envs.send(np.ones(2, dtype=np.int64), infos["env_id"])
+            >>> envs.close()
+
+        Args:
+            actions: Batch of actions for the sub-environments ``env_ids``, in the same order.
+            env_ids: The sub-environments to step, by default all of them.
+
+        Raises:
+            ClosedEnvironmentError: If the environment was closed (if :meth:`close` was previously called).
+            AlreadyPendingCallError: If a call to another method is pending, or some of the sub-environments have not
+                returned the results of the previous :meth:`send` yet.
+            ValueError: If ``envs_per_worker > 1``.
+        """
+        self._assert_is_running()
+        if self._state not in (AsyncState.DEFAULT, AsyncState.WAITING_PARTIAL_STEP):
+            raise AlreadyPendingCallError(
+                f"Calling `send` while waiting for a pending call to `{self._state.value}` to complete.",
+                str(self._state.value),
+            )
+
+        if self.envs_per_worker > 1:
+            raise ValueError("`send` and `recv` require `envs_per_worker=1`.")
+
+        env_ids = (
+            np.arange(self.num_envs)
+            if env_ids is None
+            else np.asarray(env_ids, dtype=np.int64)
+        )
+        if np.any(self._pending[env_ids]):
+            raise AlreadyPendingCallError(
+                f"Calling `send` for sub-environments {env_ids[self._pending[env_ids]].tolist()} that are still waiting for the results of a previous `send`.",
+                AsyncState.WAITING_PARTIAL_STEP.value,
+            )
+
+        if self.shared_step_memory:
+            _write_batch_to_shared_actions(self._shared_actions, actions, env_ids)
+            for env_id in env_ids:
+                self._send_to_worker(env_id, _STEP_MESSAGE)
+        else:
+            for env_id, action in zip(
+                env_ids, self._action_plan.iterate(actions), strict=True
+            ):
+                self._send_to_worker(env_id, ("step", action))
+
+        self._pending[env_ids] = True
+        self._state = AsyncState.WAITING_PARTIAL_STEP
+
+    def recv(
+        self, timeout: int | float | None = None
+    ) -> tuple[ObsType, np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+        """Waits for the first ``batch_size`` sub-environments stepped with :meth:`send` to finish.
+
+        If fewer than ``batch_size`` sub-environments are pending, waits for all of them.
+
+        Args:
+            timeout: Number of seconds before the call to :meth:`recv` times out. If ``None``, the call to :meth:`recv` never times out.
+
+        Returns:
+            The step information of the ready sub-environments, (obs, reward, terminated, truncated, info),
+            each with a batch dimension of ``batch_size``. ``info["env_id"]`` contains the ids of these sub-environments.
+
+        Raises:
+            ClosedEnvironmentError: If the environment was closed (if :meth:`close` was previously called).
+            NoAsyncCallError: If :meth:`recv` was called without any pending call to :meth:`send`.
+            TimeoutError: If :meth:`recv` timed out.
+        """
+        self._assert_is_running()
+        if self._state != AsyncState.WAITING_PARTIAL_STEP:
+            raise NoAsyncCallError(
+                "Calling `recv` without any prior call to `send`.",
+                AsyncState.WAITING_PARTIAL_STEP.value,
+            )
+
+        pending = np.flatnonzero(self._pending)
+        num_results = min(self.batch_size, len(pending))
+        pipe_ids = {id(self.parent_pipes[env_id]): env_id for env_id in pending}
+
+        ready = []
+        end_time = None if timeout is None else time.perf_counter() + timeout
+        while len(ready) < num_results:
+            remaining = (
+                None if end_time is None else max(end_time - time.perf_counter(), 0)
+            )
+            waiting = [
+                self.parent_pipes[env_id] for env_id in pending if env_id not in ready
+            ]
+            ready_pipes = wait(waiting, remaining)
+            if not ready_pipes:
+                raise multiprocessing.TimeoutError(
+                    f"The call to `recv` has timed out after {timeout} second(s)."
+                )
+            ready += [pipe_ids[id(pipe)] for pipe in ready_pipes]
+        env_ids = np.array(ready[:num_results], dtype=np.int64)
+
+        observations, rewards, terminations, truncations, env_infos = [], [], [], [], []
+        successes = []
+        for i, env_id in enumerate(env_ids):
+            if self.shared_step_memory:
+                message = self._recv_from_worker(env_id, raw=True)
+                info, success = ForkingPickler.loads(message) if message else ({}, True)
+                env_step_return = (None, None, None, None, info)
+            else:
+                env_step_return, success = self._recv_from_worker(env_id)
+
+            successes.append(success)
+            if success:
+                observations.append(env_step_return[0])
+                rewards.append(env_step_return[1])
+                terminations.append(env_step_return[2])
+                truncations.append(env_step_return[3])
+                env_infos.append((i, env_step_return[4]))
+
+        self._pending[env_ids] = False
+        if not np.any(self._pending):
+            self._state = AsyncState.DEFAULT
+        self._raise_if_errors(successes)
+
+        if self.shared_memory:
+            self._read_shared_observations()
+            observations = _take_from_batch(
+                self.single_observation_space, self.observations, env_ids
+            )
+        else:
+            observations = self._observation_plan.concatenate(
+                observations,
+                create_empty_array(self.single_observation_space, n=len(env_ids)),
+            )
+        if self.shared_step_memory:
+            rewards = self._shared_rewards[env_ids]
+            terminations = self._shared_terminations[env_ids]
+            truncations = self._shared_truncations[env_ids]
+        else:
+            rewards = np.array(rewards, dtype=np.float64)
+            terminations = np.array(terminations, dtype=np.bool_)
+            truncations = np.array(truncations, dtype=np.bool_)
+
+        # the infos are batched in the order of `env_ids`, aligned with the observations
+        infos = self._batch_infos(env_infos, num_envs=len(env_ids))
+        infos["env_id"] = env_ids
+        return observations, rewards, terminations, truncations, infos
+
     def call(self, name: str, *args: Any, **kwargs: Any) -> tuple[Any, ...]:
         """Call a method from each parallel environment with args and kwargs.
 
@@ -511,8 +933,8 @@ class AsyncVectorEnv(VectorEnv):
                 str(self._state.value),
             )
 
-        for pipe in self.parent_pipes:
-            pipe.send(("_call", (name, args, kwargs)))
+        for worker_idx in range(self.num_workers):
+            self._send_to_worker(worker_idx, ("_call", (name, args, kwargs)))
         self._state = AsyncState.WAITING_CALL
 
     def call_wait(self, timeout: int | float | None = None) -> tuple[Any, ...]:
@@ -542,11 +964,13 @@ class AsyncVectorEnv(VectorEnv):
                 f"The call to `call_wait` has timed out after {timeout} second(s)."
             )
 
-        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        results, successes = zip(
+            *[self._recv_from_worker(idx) for idx in range(self.num_workers)]
+        )
         self._raise_if_errors(successes)
         self._state = AsyncState.DEFAULT
 
-        return results
+        return tuple(self._join_worker_results(results))
 
     def get_attr(self, name: str) -> tuple[Any, ...]:
         """Get a property from each parallel environment.
@@ -587,9 +1011,11 @@ class AsyncVectorEnv(VectorEnv):
                 str(self._state.value),
             )
 
-        for pipe, value in zip(self.parent_pipes, values):
-            pipe.send(("_setattr", (name, value)))
-        _, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        for worker_idx, value in enumerate(self._split_by_worker(values)):
+            self._send_to_worker(worker_idx, ("_setattr", (name, value)))
+        _, successes = zip(
+            *[self._recv_from_worker(idx) for idx in range(self.num_workers)]
+        )
         self._raise_if_errors(successes)
 
     def close_extras(self, timeout: int | float | None = None, terminate: bool = False):
@@ -610,9 +1036,13 @@ class AsyncVectorEnv(VectorEnv):
                 logger.warn(
                     f"Calling `close` while waiting for a pending call to `{self._state.value}` to complete."
                 )
-                function = getattr(self, f"{self._state.value}_wait")
-                function(timeout)
-        except multiprocessing.TimeoutError:
+                if self._state == AsyncState.WAITING_PARTIAL_STEP:
+                    while self._state == AsyncState.WAITING_PARTIAL_STEP:
+                        self.recv(timeout)
+                else:
+                    function = getattr(self, f"{self._state.value}_wait")
+                    function(timeout)
+        except (multiprocessing.TimeoutError, EOFError, ConnectionResetError):
             terminate = True
 
         if terminate:
@@ -620,18 +1050,30 @@ class AsyncVectorEnv(VectorEnv):
                 if process.is_alive():
                     process.terminate()
         else:
-            for pipe in self.parent_pipes:
-                if (pipe is not None) and (not pipe.closed):
+            # The pipes of dead workers are skipped, as they would never answer
+            open_pipes = [
+                pipe
+                for pipe, process in zip(self.parent_pipes, self.processes)
+                if pipe is not None and not pipe.closed and process.is_alive()
+            ]
+            for pipe in open_pipes:
+                try:
                     pipe.send(("close", None))
-            for pipe in self.parent_pipes:
-                if (pipe is not None) and (not pipe.closed):
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+            for pipe in open_pipes:
+                try:
                     pipe.recv()
+                except (EOFError, ConnectionResetError):
+                    pass
 
         for pipe in self.parent_pipes:
             if pipe is not None:
                 pipe.close()
         for process in self.processes:
             process.join()
+        if self._worker_lease is not None:
+            self._worker_lease.release()
 
     def _poll_pipe_envs(self, timeout: int | None = None):
         self._assert_is_running()
@@ -649,11 +1091,174 @@ class AsyncVectorEnv(VectorEnv):
                 return False
         return True
 
+    def _terminate_workers(self):
+        """Terminates the started worker processes, closes their pipes and releases the workers of the pool."""
+        for process in self.processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+                process.join()
+        for pipe in self.parent_pipes:
+            if pipe is not None:
+                pipe.close()
+        if self._worker_lease is not None:
+            self._worker_lease.release()
+
+    def _start_worker(self, worker_idx: int):
+        """Starts (or restarts) the process of worker ``worker_idx`` with a new pipe."""
+        if self.envs_per_worker == 1:
+            worker_env_fn = CloudpickleWrapper(self.env_fns[worker_idx])
+            worker_kwargs = {}
+        else:
+            worker_slice = self._worker_slices[worker_idx]
+            worker_env_fn = [
+                CloudpickleWrapper(env_fn) for env_fn in self.env_fns[worker_slice]
+            ]
+            worker_kwargs = {"env_slice": worker_slice, "num_envs": self.num_envs}
+        if self._monitor_buffers is not None:
+            worker_kwargs["monitor_buffers"] = self._monitor_buffers
+
+        parent_pipe, child_pipe = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=self._worker_target,
+            name=f"Worker<{type(self).__name__}>-{worker_idx}",
+            args=(worker_idx, worker_env_fn, child_pipe, parent_pipe)
+            + self._worker_args,
+            kwargs=worker_kwargs,
+        )
+
+        self.parent_pipes[worker_idx] = parent_pipe
+        self.processes[worker_idx] = process
+
+        process.daemon = self.daemon
+        process.start()
+        child_pipe.close()
+
+    def _send_to_worker(self, worker_idx: int, message: tuple[str, Any] | bytes):
+        """Sends a command (or the ``_STEP_MESSAGE``) to a worker, with ``respawn_workers`` a dead worker is respawned when receiving."""
+        self._worker_messages[worker_idx] = message
+        try:
+            if isinstance(message, bytes):
+                self.parent_pipes[worker_idx].send_bytes(message)
+            else:
+                self.parent_pipes[worker_idx].send(message)
+        except (BrokenPipeError, ConnectionResetError):
+            if not self.respawn_workers:
+                raise
+
+    def _recv_from_worker(self, worker_idx: int, raw: bool = False) -> Any:
+        """Receives the result of a worker (the bytes if ``raw``), respawning the worker if it died and ``respawn_workers``."""
+        pipe = self.parent_pipes[worker_idx]
+        try:
+            return pipe.recv_bytes() if raw else pipe.recv()
+        except (EOFError, ConnectionResetError):
+            if not self.respawn_workers:
+                raise
+
+        result = self._respawn_worker(worker_idx)
+        return ForkingPickler.dumps(result) if raw else result
+
+    def _respawn_worker(self, worker_idx: int) -> tuple[Any, bool]:
+        """Restarts a dead worker, resets its sub-environments and returns the result of the last command sent to it.
+
+        A step is answered by the reset of the sub-environments, truncated with a reward of 0 (see ``_respawned_step``),
+        a ``reset-noop`` by their reset. Other commands are sent again to the new worker, if it dies again the error is raised.
+        """
+        process = self.processes[worker_idx]
+        if process.is_alive():
+            process.kill()
+        process.join()
+        self.parent_pipes[worker_idx].close()
+        logger.warn(
+            f"Worker-{worker_idx} died with exit code {process.exitcode}, respawning it and resetting its sub-environments."
+        )
+
+        self.worker_respawns[worker_idx] += 1
+        self._start_worker(worker_idx)
+
+        message = self._worker_messages[worker_idx]
+        env_indices = range(self.num_envs)[self._worker_slices[worker_idx]]
+        if message == _STEP_MESSAGE or message[0] == "step":
+            # The new worker answers like a step, such that it is in the same autoreset state as after a truncation
+            message = ("_respawned_step", None)
+        elif message[0] == "reset-noop":
+            seed = None if self.envs_per_worker == 1 else [None] * len(env_indices)
+            message = ("reset", {"seed": seed, "options": None})
+        elif message[0] == "reset" and "reset_mask" in message[1]:
+            # The new sub-environments are all reset, the seeds are only used for those of the reset mask
+            data = message[1]
+            seed = [
+                env_seed if env_reset else None
+                for env_seed, env_reset in zip(data["seed"], data["reset_mask"])
+            ]
+            message = ("reset", {"seed": seed, "options": data["options"]})
+
+        pipe = self.parent_pipes[worker_idx]
+        pipe.send(message)
+        result, success = pipe.recv()
+        if not success or message[0] != "reset":
+            return result, success
+
+        env_results = [result] if self.envs_per_worker == 1 else result
+        env_results = [
+            (observation, {**info, "worker_respawned": True})
+            for observation, info in env_results
+        ]
+        return (env_results[0] if self.envs_per_worker == 1 else env_results), True
+
+    def _split_by_worker(self, values: Any) -> Any:
+        """Splits per environment values into the value (or list of values) sent to each worker."""
+        if self.envs_per_worker == 1:
+            return values
+        values = list(values)
+        return [values[worker_slice] for worker_slice in self._worker_slices]
+
+    def _join_worker_results(self, results: Sequence[Any]) -> list[Any]:
+        """Joins the results of every worker back into a list with one result per environment."""
+        if self.envs_per_worker == 1:
+            return list(results)
+        return [result for worker_results in results for result in worker_results]
+
+    def _next_observations(self) -> ObsType:
+        """The batched observation the sub-environment observations are concatenated into without shared memory."""
+        if self._observation_buffers is None:
+            return self.observations
+        return self._observation_buffers.next()
+
+    def _read_shared_observations(self):
+        """Reads the observations from shared memory again if they are not views of it."""
+        if self._reread_observations:
+            self.observations = read_from_shared_memory(
+                self.single_observation_space, self._obs_buffer, n=self.num_envs
+            )
+
+    def _output_observations(self) -> ObsType:
+        """The batched observation returned by :meth:`reset` and :meth:`step`, copied or as a read-only view if requested."""
+        self._read_shared_observations()
+        if self._observation_buffers is None:
+            observations = (
+                deepcopy(self.observations) if self.copy else self.observations
+            )
+        elif self.shared_memory:
+            observations = copy_observations(
+                self.observations, self._observation_buffers.next()
+            )
+        else:
+            observations = self.observations
+        return read_only_view(observations) if self.read_only else observations
+
+    def _worker_env_items(self, worker_idx: int, worker_results: Any):
+        """The ``(env_idx, result)`` pairs in the results of a worker."""
+        if self.envs_per_worker == 1:
+            return ((worker_idx, worker_results),)
+        worker_slice = self._worker_slices[worker_idx]
+        return zip(range(worker_slice.start, worker_slice.stop), worker_results)
+
     def _check_spaces(self):
         self._assert_is_running()
 
-        for pipe in self.parent_pipes:
-            pipe.send(
+        for worker_idx in range(self.num_workers):
+            self._send_to_worker(
+                worker_idx,
                 (
                     "_check_spaces",
                     (
@@ -661,10 +1266,12 @@ class AsyncVectorEnv(VectorEnv):
                         self.single_observation_space,
                         self.single_action_space,
                     ),
-                )
+                ),
             )
 
-        results, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        results, successes = zip(
+            *[self._recv_from_worker(idx) for idx in range(self.num_workers)]
+        )
         self._raise_if_errors(successes)
         same_observation_spaces, same_action_spaces = zip(*results)
 
@@ -694,7 +1301,7 @@ class AsyncVectorEnv(VectorEnv):
         if all(successes):
             return
 
-        num_errors = self.num_envs - sum(successes)
+        num_errors = len(successes) - sum(successes)
         assert num_errors > 0
         for i in range(num_errors):
             index, exctype, value, trace = self.error_queue.get()
@@ -718,6 +1325,143 @@ class AsyncVectorEnv(VectorEnv):
             self.close(terminate=True)
 
 
+def _write_batch_to_shared_actions(
+    shared_actions: Any, actions: Any, env_ids: np.ndarray | None = None
+):
+    """Writes a batch of actions (for all environments or ``env_ids``) into the (possibly nested) shared action arrays."""
+    if isinstance(shared_actions, dict):
+        for key, shared in shared_actions.items():
+            _write_batch_to_shared_actions(shared, actions[key], env_ids)
+    elif isinstance(shared_actions, tuple):
+        for shared, sub_actions in zip(shared_actions, actions, strict=True):
+            _write_batch_to_shared_actions(shared, sub_actions, env_ids)
+    elif env_ids is None:
+        shared_actions[...] = np.reshape(actions, shared_actions.shape)
+    else:
+        shared_actions[env_ids] = np.reshape(
+            actions, (len(env_ids),) + shared_actions.shape[1:]
+        )
+
+
+def _is_shared_memory_view(space: Space) -> bool:
+    """If the observations read from shared memory are views of it, unlike strings, graphs and sequences that are built once read."""
+    if isinstance(space, Dict):
+        return all(
+            _is_shared_memory_view(subspace) for subspace in space.spaces.values()
+        )
+    elif isinstance(space, Tuple):
+        return all(_is_shared_memory_view(subspace) for subspace in space.spaces)
+    return isinstance(space, (Box, Discrete, MultiDiscrete, MultiBinary))
+
+
+def _take_from_batch(space: Space, batch: Any, env_ids: np.ndarray) -> Any:
+    """Copies the elements ``env_ids`` of a batch of samples of ``space`` into a smaller batch."""
+    if isinstance(space, Dict):
+        return {
+            key: _take_from_batch(subspace, batch[key], env_ids)
+            for key, subspace in space.spaces.items()
+        }
+    elif isinstance(space, Tuple):
+        return tuple(
+            _take_from_batch(subspace, sub_batch, env_ids)
+            for subspace, sub_batch in zip(space.spaces, batch)
+        )
+    elif isinstance(batch, np.ndarray):
+        return batch[env_ids]
+    else:
+        return tuple(batch[env_id] for env_id in env_ids)
+
+
+def _read_action_from_shared_actions(shared_actions: Any, index: int) -> Any:
+    """Reads a copy of the action of environment ``index`` from the (possibly nested) shared action arrays."""
+    if isinstance(shared_actions, dict):
+        return {
+            key: _read_action_from_shared_actions(shared, index)
+            for key, shared in shared_actions.items()
+        }
+    elif isinstance(shared_actions, tuple):
+        return tuple(
+            _read_action_from_shared_actions(shared, index) for shared in shared_actions
+        )
+    else:
+        return shared_actions[index].copy()
+
+
+class _WorkerMonitor:
+    """The heartbeat and step latency histogram of a worker in the shared buffers of ``monitor_workers=True``."""
+
+    def __init__(self, index: int, monitor_buffers: tuple[Any, Any]):
+        heartbeat_buffer, histogram_buffer = monitor_buffers
+        self.index = index
+        self.heartbeats = np.frombuffer(heartbeat_buffer.get_obj(), dtype=np.float64)
+        self.histogram = np.frombuffer(
+            histogram_buffer.get_obj(), dtype=np.int64
+        ).reshape(len(self.heartbeats), -1)[index]
+
+    def beat(self):
+        self.heartbeats[self.index] = time.time()
+
+    def record_step(self, latency: float):
+        self.histogram[
+            np.searchsorted(_LATENCY_BIN_EDGES, latency, side="right") - 1
+        ] += 1
+        self.beat()
+
+
+def _step_env(
+    env: Env, action: Any, autoreset: bool, autoreset_mode: AutoresetMode
+) -> tuple[Any, Any, bool, bool, dict[str, Any], bool]:
+    """Steps (or autoresets) a sub-environment, returns the step data and if the next step should autoreset."""
+    if autoreset_mode == AutoresetMode.NEXT_STEP:
+        if autoreset:
+            observation, info = env.reset()
+            reward, terminated, truncated = 0, False, False
+        else:
+            observation, reward, terminated, truncated, info = env.step(action)
+        autoreset = terminated or truncated
+    elif autoreset_mode == AutoresetMode.SAME_STEP:
+        observation, reward, terminated, truncated, info = env.step(action)
+
+        if terminated or truncated:
+            reset_observation, reset_info = env.reset()
+
+            info = {
+                "final_info": info,
+                "final_obs": observation,
+                **reset_info,
+            }
+            observation = reset_observation
+    elif autoreset_mode == AutoresetMode.DISABLED:
+        assert autoreset is False
+        observation, reward, terminated, truncated, info = env.step(action)
+    else:
+        raise ValueError(f"Unexpected autoreset_mode: {autoreset_mode}")
+
+    return observation, reward, terminated, truncated, info, autoreset
+
+
+def _respawned_step(
+    env: Env, autoreset_mode: AutoresetMode
+) -> tuple[Any, Any, bool, bool, dict[str, Any], bool]:
+    """Resets a sub-environment of a respawned worker as the result of the step it died in, like :func:`_step_env`.
+
+    The step is truncated with a reward of 0, the next step then autoresets the sub-environment for ``NEXT_STEP``.
+    For ``SAME_STEP``, the last observation was lost with the worker, so ``final_obs`` is the reset observation.
+    """
+    observation, info = env.reset()
+    info = {**info, "worker_respawned": True}
+    if autoreset_mode == AutoresetMode.SAME_STEP:
+        info = {"final_info": {}, "final_obs": observation, **info}
+    return (
+        observation,
+        0.0,
+        False,
+        True,
+        info,
+        autoreset_mode == AutoresetMode.NEXT_STEP,
+    )
+
+
 def _async_worker(
     index: int,
     env_fn: Callable,
@@ -726,6 +1470,9 @@ def _async_worker(
     shared_memory: SynchronizedArray | dict[str, Any] | tuple[Any, ...],
     error_queue: Queue,
     autoreset_mode: AutoresetMode,
+    step_buffers: tuple[Any, ...] | None = None,
+    *,
+    monitor_buffers: tuple[Any, Any] | None = None,
 ):
     env = env_fn()
     observation_space = env.observation_space
@@ -733,11 +1480,37 @@ def _async_worker(
     autoreset = False
     observation = None
 
+    if step_buffers is not None:
+        action_buffer, reward_buffer, termination_buffer, truncation_buffer = (
+            step_buffers
+        )
+        shared_actions = read_from_shared_memory(
+            action_space, action_buffer, n=len(reward_buffer)
+        )
+        shared_rewards = np.frombuffer(reward_buffer.get_obj(), dtype=np.float64)
+        shared_terminations = np.frombuffer(
+            termination_buffer.get_obj(), dtype=np.bool_
+        )
+        shared_truncations = np.frombuffer(truncation_buffer.get_obj(), dtype=np.bool_)
+
+    monitor = (
+        None if monitor_buffers is None else _WorkerMonitor(index, monitor_buffers)
+    )
     parent_pipe.close()
 
     try:
         while True:
-            command, data = pipe.recv()
+            if step_buffers is None:
+                command, data = pipe.recv()
+            else:
+                message = pipe.recv_bytes()
+                if message == _STEP_MESSAGE:
+                    command = "step"
+                    data = _read_action_from_shared_actions(shared_actions, index)
+                else:
+                    command, data = ForkingPickler.loads(message)
+            if monitor is not None:
+                monitor.beat()
 
             if command == "reset":
                 observation, info = env.reset(**data)
@@ -750,57 +1523,37 @@ def _async_worker(
                 pipe.send(((observation, info), True))
             elif command == "reset-noop":
                 pipe.send(((observation, {}), True))
-            elif command == "step":
-                if autoreset_mode == AutoresetMode.NEXT_STEP:
-                    if autoreset:
-                        observation, info = env.reset()
-                        reward, terminated, truncated = 0, False, False
-                    else:
-                        (
-                            observation,
-                            reward,
-                            terminated,
-                            truncated,
-                            info,
-                        ) = env.step(data)
-                    autoreset = terminated or truncated
-                elif autoreset_mode == AutoresetMode.SAME_STEP:
-                    (
-                        observation,
-                        reward,
-                        terminated,
-                        truncated,
-                        info,
-                    ) = env.step(data)
-
-                    if terminated or truncated:
-                        reset_observation, reset_info = env.reset()
-
-                        info = {
-                            "final_info": info,
-                            "final_obs": observation,
-                            **reset_info,
-                        }
-                        observation = reset_observation
-                elif autoreset_mode == AutoresetMode.DISABLED:
-                    assert autoreset is False
-                    (
-                        observation,
-                        reward,
-                        terminated,
-                        truncated,
-                        info,
-                    ) = env.step(data)
+            elif command in ("step", "_respawned_step"):
+                step_start = time.perf_counter()
+                if command == "step":
+                    observation, reward, terminated, truncated, info, autoreset = (
+                        _step_env(env, data, autoreset, autoreset_mode)
+                    )
                 else:
-                    raise ValueError(f"Unexpected autoreset_mode: {autoreset_mode}")
+                    observation, reward, terminated, truncated, info, autoreset = (
+                        _respawned_step(env, autoreset_mode)
+                    )
 
                 if shared_memory:
                     write_to_shared_memory(
                         observation_space, index, observation, shared_memory
                     )
                     observation = None
-
-                pipe.send(((observation, reward, terminated, truncated, info), True))
+                if monitor is not None:
+                    monitor.record_step(time.perf_counter() - step_start)
+
+                if step_buffers is not None:
+                    shared_rewards[index] = reward
+                    shared_terminations[index] = terminated
+                    shared_truncations[index] = truncated
+                    if info:
+                        pipe.send((info, True))
+                    else:
+                        pipe.send_bytes(b"")
+                else:
+                    pipe.send(
+                        ((observation, reward, terminated, truncated, info), True)
+                    )
             elif command == "close":
                 pipe.send((None, True))
                 break
@@ -850,3 +1603,184 @@ def _async_worker(
         pipe.send((None, False))
     finally:
         env.close()
+
+
+def _async_batch_worker(
+    index: int,
+    env_fns: list[Callable],
+    pipe: Connection,
+    parent_pipe: Connection,
+    shared_memory: SynchronizedArray | dict[str, Any] | tuple[Any, ...],
+    error_queue: Queue,
+    autoreset_mode: AutoresetMode,
+    step_buffers: tuple[Any, ...] | None = None,
+    *,
+    env_slice: slice,
+    num_envs: int,
+    monitor_buffers: tuple[Any, Any] | None = None,
+):
+    """Worker running the sub-environments ``env_slice`` one after the other, used for ``envs_per_worker > 1``.
+
+    The commands are the same as for ``_async_worker`` except that their data and results are lists
+    with one element per sub-environment of the worker.
+    """
+    envs = [env_fn() for env_fn in env_fns]
+    observation_space = envs[0].observation_space
+    action_space = envs[0].action_space
+    env_indices = range(env_slice.start, env_slice.stop)
+    autoresets = [False for _ in envs]
+    observations = [None for _ in envs]
+
+    if step_buffers is not None:
+        action_buffer, reward_buffer, termination_buffer, truncation_buffer = (
+            step_buffers
+        )
+        shared_actions = read_from_shared_memory(
+            action_space, action_buffer, n=num_envs
+        )
+        shared_rewards = np.frombuffer(reward_buffer.get_obj(), dtype=np.float64)
+        shared_terminations = np.frombuffer(
+            termination_buffer.get_obj(), dtype=np.bool_
+        )
+        shared_truncations = np.frombuffer(truncation_buffer.get_obj(), dtype=np.bool_)
+
+    monitor = (
+        None if monitor_buffers is None else _WorkerMonitor(index, monitor_buffers)
+    )
+    parent_pipe.close()
+
+    try:
+        while True:
+            if step_buffers is None:
+                command, data = pipe.recv()
+            else:
+                message = pipe.recv_bytes()
+                if message == _STEP_MESSAGE:
+                    command = "step"
+                    data = [
+                        _read_action_from_shared_actions(shared_actions, env_idx)
+                        for env_idx in env_indices
+                    ]
+                else:
+                    command, data = ForkingPickler.loads(message)
+            if monitor is not None:
+                monitor.beat()
+
+            if command == "reset":
+                reset_mask = data.get("reset_mask")
+                infos = []
+                for i, (env, env_idx) in enumerate(zip(envs, env_indices)):
+                    if reset_mask is not None and not reset_mask[i]:
+                        infos.append({})
+                        continue
+
+                    observation, info = env.reset(
+                        seed=data["seed"][i], options=data["options"]
+                    )
+                    if shared_memory:
+                        write_to_shared_memory(
+                            observation_space, env_idx, observation, shared_memory
+                        )
+                        observation = None
+                    observations[i] = observation
+                    autoresets[i] = False
+                    infos.append(info)
+                pipe.send((list(zip(observations, infos)), True))
+            elif command == "reset-noop":
+                pipe.send(([(observation, {}) for observation in observations], True))
+            elif command in ("step", "_respawned_step"):
+                step_start = time.perf_counter()
+                step_returns = []
+                actions = data if command == "step" else [None for _ in envs]
+                for i, (env, env_idx, action) in enumerate(
+                    zip(envs, env_indices, actions)
+                ):
+                    if command == "step":
+                        step_data = _step_env(
+                            env, action, autoresets[i], autoreset_mode
+                        )
+                    else:
+                        step_data = _respawned_step(env, autoreset_mode)
+                    observation, reward, terminated, truncated, info, autoresets[i] = (
+                        step_data
+                    )
+
+                    if shared_memory:
+                        write_to_shared_memory(
+                            observation_space, env_idx, observation, shared_memory
+                        )
+                        observation = None
+                    observations[i] = observation
+
+                    if step_buffers is not None:
+                        shared_rewards[env_idx] = reward
+                        shared_terminations[env_idx] = terminated
+                        shared_truncations[env_idx] = truncated
+                        step_returns.append(info)
+                    else:
+                        step_returns.append(
+                            (observation, reward, terminated, truncated, info)
+                        )
+
+                if monitor is not None:
+                    monitor.record_step(time.perf_counter() - step_start)
+                if step_buffers is not None and not any(step_returns):
+                    pipe.send_bytes(b"")
+                else:
+                    pipe.send((step_returns, True))
+            elif command == "close":
+                pipe.send((None, True))
+                break
+            elif command == "_call":
+                name, args, kwargs = data
+                if name in ["reset", "step", "close", "_setattr", "_check_spaces"]:
+                    raise ValueError(
+                        f"Trying to call function `{name}` with `call`, use `{name}` directly instead."
+                    )
+
+                results = []
+                for env in envs:
+                    attr = env.get_wrapper_attr(name)
+                    results.append(attr(*args, **kwargs) if callable(attr) else attr)
+                pipe.send((results, True))
+            elif command == "_setattr":
+                name, values = data
+                for env, value in zip(envs, values):
+                    env.set_wrapper_attr(name, value)
+                pipe.send((None, True))
+            elif command == "_check_spaces":
+                obs_mode, single_obs_space, single_action_space = data
+
+                pipe.send(
+                    (
+                        (
+                            all(
+                                (
+                                    single_obs_space == env.observation_space
+                                    if obs_mode == "same"
+                                    else is_space_dtype_shape_equiv(
+                                        single_obs_space, env.observation_space
+                                    )
+                                )
+                                for env in envs
+                            ),
+                            all(
+                                single_action_space == env.action_space for env in envs
+                            ),
+                        ),
+                        True,
+                    )
+                )
+            else:
+                raise RuntimeError(
+                    f"Received unknown command `{command}`. Must be one of [`reset`, `step`, `close`, `_call`, `_setattr`, `_check_spaces`]."
+                )
+    except (KeyboardInterrupt, Exception):
+        error_type, error_message, _ = sys.exc_info()
+        trace = traceback.format_exc()
+
+        error_queue.put((index, error_type, error_message, trace))
+        pipe.send((None, False))
+    finally:
+        for env in envs:
+            env.close()
@@ -12,11 +12,12 @@ from gymnasium import Env, Space
 from gymnasium.core import ActType, ObsType, RenderFrame
 from gymnasium.spaces.utils import is_space_dtype_shape_equiv
 from gymnasium.vector.utils import (
+    ObservationBuffers,
+    SpacePlan,
     batch_differing_spaces,
     batch_space,
-    concatenate,
     create_empty_array,
-    iterate,
+    read_only_view,
 )
 from gymnasium.vector.vector_env import ArrayType, AutoresetMode, VectorEnv
 
@@ -67,6 +68,8 @@ class SyncVectorEnv(VectorEnv):
         copy: bool = True,
         observation_mode: str | Space = "same",
         autoreset_mode: str | AutoresetMode = AutoresetMode.NEXT_STEP,
+        observation_buffers: int = 1,
+        read_only: bool = False,
     ):
         """Vectorized environment that serially runs multiple environments.
 
@@ -77,15 +80,22 @@ class SyncVectorEnv(VectorEnv):
                 'different' defines that there can be multiple observation spaces with the same length but different high/low values batched together. Passing a ``Space`` object
                 allows the user to set some custom observation space mode not covered by 'same' or 'different.'
             autoreset_mode: The Autoreset Mode used, see https://farama.org/Vector-Autoreset-Mode for more information.
+            observation_buffers: If more than 1, the batched observations are written into this many buffers in turn
+                and returned without a copy (``copy`` is ignored). An observation is only overwritten by the ``observation_buffers``-th
+                following call to :meth:`reset` or :meth:`step`, i.e., with ``2`` the previous and current observations never alias.
+            read_only: If ``True``, then the :meth:`reset` and :meth:`step` methods return read-only views of the observations.
 
         Raises:
             RuntimeError: If the observation space of some sub-environment does not match observation_space
                 (or, by default, the observation space of the first sub-environment).
+            ValueError: If ``observation_buffers`` is less than 1.
         """
         super().__init__()
 
         self.env_fns = env_fns
         self.copy = copy
+        self.observation_buffers = observation_buffers
+        self.read_only = read_only
         self.observation_mode = observation_mode
         self.autoreset_mode = (
             autoreset_mode
@@ -142,10 +152,23 @@ class SyncVectorEnv(VectorEnv):
             ), f"Sub-environment action space doesn't make the `single_action_space`, action_space={env.action_space}, single_action_space={self.single_action_space}"
 
         # Initialise attributes used in `step` and `reset`
+        self._action_plan = SpacePlan(self.single_action_space, self.num_envs)
+        self._observation_plan = SpacePlan(self.single_observation_space, self.num_envs)
         self._env_obs = [None for _ in range(self.num_envs)]
-        self._observations = create_empty_array(
-            self.single_observation_space, n=self.num_envs, fn=np.zeros
-        )
+        if observation_buffers < 1:
+            raise ValueError(
+                f"Expected `observation_buffers` to be at least 1, actual got {observation_buffers}"
+            )
+        elif observation_buffers == 1:
+            self._observation_buffers = None
+            self._observations = create_empty_array(
+                self.single_observation_space, n=self.num_envs, fn=np.zeros
+            )
+        else:
+            self._observation_buffers = ObservationBuffers(
+                self.single_observation_space, self.num_envs, observation_buffers
+            )
+            self._observations = self._observation_buffers.current
         self._rewards = np.zeros((self.num_envs,), dtype=np.float64)
         self._terminations = np.zeros((self.num_envs,), dtype=np.bool_)
         self._truncations = np.zeros((self.num_envs,), dtype=np.bool_)
@@ -207,34 +230,23 @@ class SyncVectorEnv(VectorEnv):
             self._truncations[reset_mask] = False
             self._autoreset_envs[reset_mask] = False
 
-            infos = {}
-            for i, (env, single_seed, env_mask) in enumerate(
-                zip(self.envs, seed, reset_mask)
-            ):
-                if env_mask:
-                    self._env_obs[i], env_info = env.reset(
-                        seed=single_seed, options=options
-                    )
-
-                    infos = self._add_info(infos, env_info, i)
+            env_indices = np.flatnonzero(reset_mask).tolist()
         else:
             self._terminations = np.zeros((self.num_envs,), dtype=np.bool_)
             self._truncations = np.zeros((self.num_envs,), dtype=np.bool_)
             self._autoreset_envs = np.zeros((self.num_envs,), dtype=np.bool_)
 
-            infos = {}
-            for i, (env, single_seed) in enumerate(zip(self.envs, seed)):
-                self._env_obs[i], env_info = env.reset(
-                    seed=single_seed, options=options
-                )
+            env_indices = list(range(self.num_envs))
 
-                infos = self._add_info(infos, env_info, i)
+        self._rotate_observations()
+        env_infos = self._run_envs(
+            self._reset_env, [(i, seed[i], options) for i in env_indices]
+        )
+        infos = self._batch_infos(zip(env_indices, env_infos))
 
         # Concatenate the observations
-        self._observations = concatenate(
-            self.single_observation_space, self._env_obs, self._observations
-        )
-        return deepcopy(self._observations) if self.copy else self._observations, infos
+        self._observations = self._batch_observations()
+        return self._output_observations(), infos
 
     def step(
         self, actions: ActType
@@ -244,71 +256,107 @@ class SyncVectorEnv(VectorEnv):
         Returns:
             The batched environment step results
         """
-        actions = iterate(self.action_space, actions)
-
-        infos = {}
-        for i, (action, _) in enumerate(zip(actions, self.envs, strict=True)):
-            if self.autoreset_mode == AutoresetMode.NEXT_STEP:
-                if self._autoreset_envs[i]:
-                    self._env_obs[i], env_info = self.envs[i].reset()
-
-                    self._rewards[i] = 0.0
-                    self._terminations[i] = False
-                    self._truncations[i] = False
-                else:
-                    (
-                        self._env_obs[i],
-                        self._rewards[i],
-                        self._terminations[i],
-                        self._truncations[i],
-                        env_info,
-                    ) = self.envs[i].step(action)
-            elif self.autoreset_mode == AutoresetMode.DISABLED:
-                # assumes that the user has correctly autoreset
-                assert not self._autoreset_envs[i], f"{self._autoreset_envs=}"
-                (
-                    self._env_obs[i],
-                    self._rewards[i],
-                    self._terminations[i],
-                    self._truncations[i],
-                    env_info,
-                ) = self.envs[i].step(action)
-            elif self.autoreset_mode == AutoresetMode.SAME_STEP:
-                (
-                    self._env_obs[i],
-                    self._rewards[i],
-                    self._terminations[i],
-                    self._truncations[i],
-                    env_info,
-                ) = self.envs[i].step(action)
-
-                if self._terminations[i] or self._truncations[i]:
-                    infos = self._add_info(
-                        infos,
-                        {"final_obs": self._env_obs[i], "final_info": env_info},
-                        i,
-                    )
-
-                    self._env_obs[i], env_info = self.envs[i].reset()
-            else:
-                raise ValueError(f"Unexpected autoreset mode, {self.autoreset_mode}")
+        actions = self._action_plan.iterate(actions)
 
-            infos = self._add_info(infos, env_info, i)
+        self._rotate_observations()
+        env_infos = self._run_envs(
+            self._step_env, list(enumerate(zip(actions, self.envs, strict=True)))
+        )
+        infos = self._batch_infos(
+            (i, info) for i, env_info in enumerate(env_infos) for info in env_info
+        )
 
         # Concatenate the observations
-        self._observations = concatenate(
-            self.single_observation_space, self._env_obs, self._observations
-        )
+        self._observations = self._batch_observations()
         self._autoreset_envs = np.logical_or(self._terminations, self._truncations)
 
         return (
-            deepcopy(self._observations) if self.copy else self._observations,
+            self._output_observations(),
             np.copy(self._rewards),
             np.copy(self._terminations),
             np.copy(self._truncations),
             infos,
         )
 
+    def _run_envs(
+        self, function: Callable[..., Any], arguments: list[tuple[Any, ...]]
+    ) -> list[Any]:
+        """Calls ``function`` for each tuple of arguments, in order, and returns the results."""
+        return [function(*args) for args in arguments]
+
+    def _reset_env(
+        self, i: int, seed: int | None, options: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Resets the sub-environment ``i`` and returns its info."""
+        self._env_obs[i], env_info = self.envs[i].reset(seed=seed, options=options)
+        return env_info
+
+    def _step_env(
+        self, i: int, action_and_env: tuple[Any, Env]
+    ) -> tuple[dict[str, Any], ...]:
+        """Steps (or autoresets) the sub-environment ``i`` and returns the infos to add for it, in order."""
+        action, env = action_and_env
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP:
+            if self._autoreset_envs[i]:
+                self._env_obs[i], env_info = env.reset()
+
+                self._rewards[i] = 0.0
+                self._terminations[i] = False
+                self._truncations[i] = False
+            else:
+                (
+                    self._env_obs[i],
+                    self._rewards[i],
+                    self._terminations[i],
+                    self._truncations[i],
+                    env_info,
+                ) = env.step(action)
+        elif self.autoreset_mode == AutoresetMode.DISABLED:
+            # assumes that the user has correctly autoreset
+            assert not self._autoreset_envs[i], f"{self._autoreset_envs=}"
+            (
+                self._env_obs[i],
+                self._rewards[i],
+                self._terminations[i],
+                self._truncations[i],
+                env_info,
+            ) = env.step(action)
+        elif self.autoreset_mode == AutoresetMode.SAME_STEP:
+            (
+                self._env_obs[i],
+                self._rewards[i],
+                self._terminations[i],
+                self._truncations[i],
+                env_info,
+            ) = env.step(action)
+
+            if self._terminations[i] or self._truncations[i]:
+                final_info = {"final_obs": self._env_obs[i], "final_info": env_info}
+
+                self._env_obs[i], env_info = env.reset()
+                return final_info, env_info
+        else:
+            raise ValueError(f"Unexpected autoreset mode, {self.autoreset_mode}")
+
+        return (env_info,)
+
+    def _rotate_observations(self):
+        """Moves to the next observation buffer (if any) before the sub-environments reset or step."""
+        if self._observation_buffers is not None:
+            self._observations = self._observation_buffers.next()
+
+    def _output_observations(self) -> ObsType:
+        """The batched observation returned by :meth:`reset` and :meth:`step`, copied or as a read-only view if requested."""
+        if self._observation_buffers is None and self.copy:
+            observations = deepcopy(self._observations)
+        else:
+            observations = self._observations
+        return read_only_view(observations) if self.read_only else observations
+
+    def _batch_observations(self) -> ObsType:
+        """Concatenates the sub-environment observations into the batched observation."""
+        return self._observation_plan.concatenate(self._env_obs, self._observations)
+
     def render(self) -> tuple[RenderFrame, ...] | None:
         """Returns the rendered frames from the environments."""
         return tuple(env.render() for env in self.envs)
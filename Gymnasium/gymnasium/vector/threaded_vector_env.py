@@ -0,0 +1,198 @@
+"""Implementation of a vectorization method running the environments on a pool of threads."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from gymnasium import Env, Space
+from gymnasium.core import ObsType
+from gymnasium.spaces import Box, Dict, Discrete, MultiBinary, MultiDiscrete, Tuple
+from gymnasium.vector.sync_vector_env import SyncVectorEnv
+from gymnasium.vector.utils import copy_observations
+from gymnasium.vector.vector_env import AutoresetMode
+
+
+__all__ = ["ThreadedVectorEnv"]
+
+
+class ThreadedVectorEnv(SyncVectorEnv):
+    """Vectorized environment that runs multiple environments on a persistent pool of threads.
+
+    The sub-environments are split into ``num_threads`` contiguous chunks, each chunk is stepped on its own thread.
+    This speeds up environments that release the GIL while stepping (e.g. MuJoCo, Box2D or NumPy heavy environments)
+    and any environment on a free-threaded Python build, without the pickling and process overhead of :class:`AsyncVectorEnv`.
+    As all the sub-environments live in the same process, they must not share (non thread-safe) state.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> envs = gym.make_vec("Pendulum-v1", num_envs=2, vectorization_mode="threaded")
+        >>> envs
+        ThreadedVectorEnv(Pendulum-v1, num_envs=2)
+        >>> obs, infos = envs.reset(seed=42)
+        >>> obs
+        array([[-0.14995256,  0.9886932 , -0.12224312],
+               [ 0.5760367 ,  0.8174238 , -0.91244936]], dtype=float32)
+        >>> _ = envs.action_space.seed(42)
+        >>> obs, rewards, terminates, truncates, infos = envs.step(envs.action_space.sample())
+        >>> obs
+        array([[-0.18856704,  0.9820603 ,  0.7836504 ],
+               [ 0.5896897 ,  0.8076299 , -0.3360544 ]], dtype=float32)
+        >>> envs.close()
+    """
+
+    def __init__(
+        self,
+        env_fns: Iterator[Callable[[], Env]] | Sequence[Callable[[], Env]],
+        copy: bool = True,
+        observation_mode: str | Space = "same",
+        autoreset_mode: str | AutoresetMode = AutoresetMode.NEXT_STEP,
+        num_threads: int | None = None,
+        observation_buffers: int = 1,
+        read_only: bool = False,
+    ):
+        """Vectorized environment that runs multiple environments on a pool of threads.
+
+        Args:
+            env_fns: iterable of callable functions that create the environments.
+            copy: If ``True``, then the :meth:`reset` and :meth:`step` methods return a copy of the observations.
+            observation_mode: Defines how environment observation spaces should be batched, see :class:`SyncVectorEnv`.
+            autoreset_mode: The Autoreset Mode used, see https://farama.org/Vector-Autoreset-Mode for more information.
+            num_threads: The number of threads, by default the number of environments or CPUs, whichever is smaller.
+            observation_buffers: The number of batched observation buffers written in turn, see :class:`SyncVectorEnv`.
+            read_only: If ``True``, then the :meth:`reset` and :meth:`step` methods return read-only views of the observations.
+
+        Raises:
+            ValueError: If ``num_threads`` or ``observation_buffers`` is less than 1.
+        """
+        super().__init__(
+            env_fns,
+            copy=copy,
+            observation_mode=observation_mode,
+            autoreset_mode=autoreset_mode,
+            observation_buffers=observation_buffers,
+            read_only=read_only,
+        )
+
+        if num_threads is None:
+            num_threads = min(self.num_envs, os.cpu_count() or 1)
+        elif num_threads < 1:
+            raise ValueError(
+                f"Expected `num_threads` to be at least 1, actual got {num_threads}"
+            )
+        self.num_threads = min(num_threads, self.num_envs)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.num_threads,
+            thread_name_prefix=type(self).__name__,
+        )
+
+        # Observations of spaces batched as NumPy arrays are written straight into the batched observation by each thread
+        self._write_in_place = _is_array_batched(self.single_observation_space)
+        self._partial_reset = False
+
+    def _run_envs(
+        self, function: Callable[..., Any], arguments: list[tuple[Any, ...]]
+    ) -> list[Any]:
+        """Calls ``function`` for each tuple of arguments on the thread pool, one contiguous chunk per thread."""
+        if len(arguments) <= 1 or self.num_threads == 1:
+            return [function(*args) for args in arguments]
+
+        chunk_size = -(-len(arguments) // self.num_threads)
+        futures = [
+            self._pool.submit(
+                _run_chunk, function, arguments[start : start + chunk_size]
+            )
+            for start in range(0, len(arguments), chunk_size)
+        ]
+        # `result` re-raises any exception of the sub-environments in the main thread
+        return [result for future in futures for result in future.result()]
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int | None] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[ObsType, dict[str, Any]]:
+        """Resets the sub-environments, see :meth:`SyncVectorEnv.reset`."""
+        # The sub-environments not reset by `reset_mask` don't write their observations into the next observation buffer
+        self._partial_reset = (
+            options is not None
+            and "reset_mask" in options
+            and not np.all(options["reset_mask"])
+        )
+        try:
+            return super().reset(seed=seed, options=options)
+        finally:
+            self._partial_reset = False
+
+    def _rotate_observations(self):
+        """Moves to the next observation buffer, which keeps the observations of the environments that are not reset."""
+        previous_observations = self._observations
+        super()._rotate_observations()
+        if (
+            self._write_in_place
+            and self._partial_reset
+            and self._observations is not previous_observations
+        ):
+            copy_observations(previous_observations, self._observations)
+
+    def _reset_env(
+        self, i: int, seed: int | None, options: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Resets the sub-environment ``i``, writing its observation into the batch, and returns its info."""
+        env_info = super()._reset_env(i, seed, options)
+        if self._write_in_place:
+            _write_observation(self._observations, i, self._env_obs[i])
+        return env_info
+
+    def _step_env(
+        self, i: int, action_and_env: tuple[Any, Env]
+    ) -> tuple[dict[str, Any], ...]:
+        """Steps the sub-environment ``i``, writing its observation into the batch, and returns its infos."""
+        env_infos = super()._step_env(i, action_and_env)
+        if self._write_in_place:
+            _write_observation(self._observations, i, self._env_obs[i])
+        return env_infos
+
+    def _batch_observations(self) -> ObsType:
+        """Returns the batched observation, only concatenating if the observations were not written in place."""
+        if self._write_in_place:
+            return self._observations
+        return super()._batch_observations()
+
+    def close_extras(self, **kwargs: Any):
+        """Close the environments and shut down the thread pool."""
+        if hasattr(self, "_pool"):
+            self._pool.shutdown(wait=True)
+        super().close_extras(**kwargs)
+
+
+def _run_chunk(
+    function: Callable[..., Any], arguments: list[tuple[Any, ...]]
+) -> list[Any]:
+    return [function(*args) for args in arguments]
+
+
+def _is_array_batched(space: Space) -> bool:
+    """If the batch of ``space`` is a NumPy array (or a dict / tuple of them) that observations can be written into."""
+    if isinstance(space, Dict):
+        return all(_is_array_batched(subspace) for subspace in space.spaces.values())
+    elif isinstance(space, Tuple):
+        return all(_is_array_batched(subspace) for subspace in space.spaces)
+    return isinstance(space, (Box, Discrete, MultiBinary, MultiDiscrete))
+
+
+def _write_observation(batch: Any, index: int, observation: Any):
+    """Writes ``observation`` at ``index`` of the (possibly nested) batched observation."""
+    if isinstance(batch, dict):
+        for key, sub_batch in batch.items():
+            _write_observation(sub_batch, index, observation[key])
+    elif isinstance(batch, tuple):
+        for sub_batch, sub_observation in zip(batch, observation):
+            _write_observation(sub_batch, index, sub_observation)
+    else:
+        batch[index] = observation
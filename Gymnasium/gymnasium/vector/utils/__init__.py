@@ -1,11 +1,18 @@
 """Module for gymnasium experimental vector utility functions."""
 
+from gymnasium.vector.utils.batched_info import InfoBatcher, add_info, unbatch_info
 from gymnasium.vector.utils.misc import CloudpickleWrapper, clear_mpi_env_vars
+from gymnasium.vector.utils.observation_buffers import (
+    ObservationBuffers,
+    copy_observations,
+    read_only_view,
+)
 from gymnasium.vector.utils.shared_memory import (
     create_shared_memory,
     read_from_shared_memory,
     write_to_shared_memory,
 )
+from gymnasium.vector.utils.space_plan import SpacePlan
 from gymnasium.vector.utils.space_utils import (
     batch_differing_spaces,
     batch_space,
@@ -13,6 +20,7 @@ from gymnasium.vector.utils.space_utils import (
     create_empty_array,
     iterate,
 )
+from gymnasium.vector.utils.worker_pool import WorkerLease, WorkerPool
 
 
 __all__ = [
@@ -21,9 +29,18 @@ __all__ = [
     "iterate",
     "concatenate",
     "create_empty_array",
+    "SpacePlan",
     "create_shared_memory",
     "read_from_shared_memory",
     "write_to_shared_memory",
+    "InfoBatcher",
+    "add_info",
+    "unbatch_info",
+    "ObservationBuffers",
+    "read_only_view",
+    "copy_observations",
+    "WorkerPool",
+    "WorkerLease",
     "CloudpickleWrapper",
     "clear_mpi_env_vars",
 ]
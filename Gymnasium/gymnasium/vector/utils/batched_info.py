@@ -0,0 +1,295 @@
+"""Batching of sub-environment infos into the dictionary info format of vector environments (and back to a list)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from operator import itemgetter
+from typing import Any
+
+import numpy as np
+
+
+__all__ = ["InfoBatcher", "add_info", "unbatch_info"]
+
+
+_OBJECT_COLUMN = (np.dtype(object), ())
+
+
+def add_info(
+    vector_infos: dict[str, Any], env_info: dict[str, Any], env_num: int, num_envs: int
+) -> dict[str, Any]:
+    """Add env info to the info dictionary of the vectorized environment.
+
+    Given the `info` of a single environment add it to the `infos` dictionary
+    which represents all the infos of the vectorized environment.
+    Every `key` of `info` is paired with a boolean mask `_key` representing
+    whether or not the i-indexed environment has this `info`.
+
+    Args:
+        vector_infos (dict): the infos of the vectorized environment
+        env_info (dict): the info coming from the single environment
+        env_num (int): the index of the single environment
+        num_envs (int): the number of environments of the vectorized environment
+
+    Returns:
+        infos (dict): the (updated) infos of the vectorized environment
+    """
+    for key, value in env_info.items():
+        # It is easier for users to access their `final_obs` in the unbatched array of `obs` objects
+        if key == "final_obs":
+            if "final_obs" in vector_infos:
+                array = vector_infos["final_obs"]
+            else:
+                array = np.full(num_envs, fill_value=None, dtype=object)
+            array[env_num] = value
+        # If value is a dictionary, then we apply the `add_info` recursively.
+        elif isinstance(value, dict):
+            array = add_info(vector_infos.get(key, {}), value, env_num, num_envs)
+        # Otherwise, we are a base case to group the data
+        else:
+            # If the key doesn't exist in the vector infos, then we can create an array of that batch type
+            if key not in vector_infos:
+                if type(value) in [int, float, bool] or issubclass(
+                    type(value), np.number
+                ):
+                    array = np.zeros(num_envs, dtype=type(value))
+                elif isinstance(value, np.ndarray):
+                    # We assume that all instances of the np.array info are of the same shape
+                    array = np.zeros((num_envs, *value.shape), dtype=value.dtype)
+                else:
+                    # For unknown objects, we use a Numpy object array
+                    array = np.full(num_envs, fill_value=None, dtype=object)
+            # Otherwise, just use the array that already exists
+            else:
+                array = vector_infos[key]
+
+            # Assign the data in the `env_num` position
+            #   We only want to run this for the base-case data (not recursive data forcing the ugly function structure)
+            array[env_num] = value
+
+        # Get the array mask and if it doesn't already exist then create a zero bool array
+        array_mask = vector_infos.get(f"_{key}", np.zeros(num_envs, dtype=np.bool_))
+        array_mask[env_num] = True
+
+        # Update the vector info with the updated data and mask information
+        vector_infos[key], vector_infos[f"_{key}"] = array, array_mask
+    return vector_infos
+
+
+def _column_type(key: str, value: Any) -> tuple[np.dtype, tuple[int, ...]] | None:
+    """The dtype and shape of the array :func:`add_info` creates for the first ``value`` of ``key``, ``None`` for a nested info."""
+    if key == "final_obs":
+        return _OBJECT_COLUMN
+    elif isinstance(value, dict):
+        return None
+    elif type(value) in [int, float, bool] or issubclass(type(value), np.number):
+        return np.dtype(type(value)), ()
+    elif isinstance(value, np.ndarray):
+        return value.dtype, value.shape
+    return _OBJECT_COLUMN
+
+
+class InfoBatcher:
+    """Batches the infos of the sub-environments column by column into the vector info dictionary.
+
+    Rather than adding the infos one environment at a time (:func:`add_info`), the values of every key are first
+    gathered across the environments, then each key gets a single data array and ``_key`` mask that are filled at once.
+    Steps where every info is empty return straight away.
+
+    The column type (dtype and shape) of a key is inferred from its first value, as :func:`add_info` does, and kept per key.
+    With ``reuse_buffers=True``, the data and mask arrays of a key are allocated once and overwritten by every call
+    while the type of the key does not change, such that the returned infos are only valid until the next call.
+
+    The batched infos are identical to folding the infos with :func:`add_info`, irregular infos (a key that is nested
+    for one environment but not another or that collides with the mask of another key) are batched with :func:`add_info`.
+
+    Example:
+        >>> from gymnasium.vector.utils import InfoBatcher
+        >>> batcher = InfoBatcher(num_envs=3)
+        >>> batcher([(0, {"a": 1}), (2, {"a": 2, "b": {"c": 0.5}})])
+        {'a': array([1, 0, 2]), '_a': array([ True, False,  True]), 'b': {'c': array([0. , 0. , 0.5]), '_c': array([False, False,  True])}, '_b': array([False, False,  True])}
+        >>> batcher([(0, {}), (1, {})])
+        {}
+    """
+
+    def __init__(self, num_envs: int, reuse_buffers: bool = False):
+        """Initialises the info batcher.
+
+        Args:
+            num_envs: The number of environments, the length of the batched arrays.
+            reuse_buffers: If to reuse the data and mask arrays of each key between calls.
+        """
+        self.num_envs = num_envs
+        self.reuse_buffers = reuse_buffers
+
+        # Key path -> (column type, data array, mask array)
+        self._buffers: dict[
+            tuple[str, ...], tuple[Any, np.ndarray | None, np.ndarray]
+        ] = {}
+
+    def __call__(
+        self, env_infos: Iterable[tuple[int, dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Batches the ``(env_num, info)`` pairs, a later info of the same environment overwrites the earlier values.
+
+        Args:
+            env_infos: The environment index and info of each sub-environment
+
+        Returns:
+            The vector infos
+        """
+        return self._batch([(env_num, info) for env_num, info in env_infos if info], ())
+
+    def _batch(
+        self, env_infos: list[tuple[int, dict[str, Any]]], path: tuple[str, ...]
+    ) -> dict[str, Any]:
+        if len(env_infos) == 0:
+            return {}
+
+        # Key -> (environment indices, values)
+        columns: dict[str, tuple[list[int], list[Any]]] = {}
+        keys = env_infos[0][1].keys()
+        if all(info.keys() == keys for _, info in env_infos):
+            # Every info has the same keys, so the infos are transposed at once
+            env_nums = [env_num for env_num, _ in env_infos]
+            rows = map(itemgetter(*keys), (info for _, info in env_infos))
+            if len(keys) == 1:
+                rows = ((value,) for value in rows)
+            for key, values in zip(keys, zip(*rows)):
+                columns[key] = (env_nums, list(values))
+        else:
+            for env_num, info in env_infos:
+                for key, value in info.items():
+                    if key in columns:
+                        env_nums, values = columns[key]
+                        env_nums.append(env_num)
+                        values.append(value)
+                    else:
+                        columns[key] = ([env_num], [value])
+
+        value_types = {
+            key: set(map(type, values)) for key, (_, values) in columns.items()
+        }
+        if not self._is_regular(columns, value_types):
+            vector_infos = {}
+            for env_num, info in env_infos:
+                vector_infos = add_info(vector_infos, info, env_num, self.num_envs)
+            return vector_infos
+
+        vector_infos = {}
+        for key, (env_nums, values) in columns.items():
+            column_type = _column_type(key, values[0])
+            data, mask = self._get_buffers(path + (key,), column_type)
+
+            if column_type is None:
+                data = self._batch(
+                    [
+                        (env_num, value)
+                        for env_num, value in zip(env_nums, values)
+                        if value
+                    ],
+                    path + (key,),
+                )
+            elif (
+                column_type[1] == ()
+                and column_type is not _OBJECT_COLUMN
+                and len(value_types[key]) == 1
+            ):
+                # Values of a single scalar type are converted at once
+                data[env_nums] = np.array(values, dtype=column_type[0])
+            else:
+                for env_num, value in zip(env_nums, values):
+                    data[env_num] = value
+
+            mask[env_nums] = True
+            vector_infos[key], vector_infos[f"_{key}"] = data, mask
+        return vector_infos
+
+    @staticmethod
+    def _is_regular(
+        columns: dict[str, tuple[list[int], list[Any]]],
+        value_types: dict[str, set[type]],
+    ) -> bool:
+        """If every key is either nested or not for all environments and no key collides with the mask of another key."""
+        for key, types in value_types.items():
+            if key.startswith("_") and key[1:] in columns:
+                return False
+            elif key != "final_obs":
+                nested = [issubclass(value_type, dict) for value_type in types]
+                if any(nested) and not all(nested):
+                    return False
+        return True
+
+    def _get_buffers(
+        self,
+        path: tuple[str, ...],
+        column_type: tuple[np.dtype, tuple[int, ...]] | None,
+    ) -> tuple[np.ndarray | None, np.ndarray]:
+        """Returns the cleared data array (``None`` for nested infos) and mask of the key at ``path``."""
+        if self.reuse_buffers and path in self._buffers:
+            cached_type, data, mask = self._buffers[path]
+            if cached_type == column_type:
+                if data is not None:
+                    data.fill(None if data.dtype == object else 0)
+                mask.fill(False)
+                return data, mask
+
+        if column_type is None:
+            data = None
+        elif column_type is _OBJECT_COLUMN:
+            data = np.full(self.num_envs, fill_value=None, dtype=object)
+        else:
+            data = np.zeros((self.num_envs, *column_type[1]), dtype=column_type[0])
+        mask = np.zeros(self.num_envs, dtype=np.bool_)
+
+        if self.reuse_buffers:
+            self._buffers[path] = (column_type, data, mask)
+        return data, mask
+
+
+def unbatch_info(vector_infos: dict[str, Any], num_envs: int) -> list[dict[str, Any]]:
+    """Converts the dictionary info of a vectorized environment into a list with the info of each sub-environment.
+
+    Each key is split at once, only visiting the environments set in its ``_key`` mask.
+
+    Args:
+        vector_infos: The vector infos, every key paired with a boolean mask ``_key``
+        num_envs: The number of sub-environments
+
+    Returns:
+        The list of infos, the i-th dictionary is the info of the i-th sub-environment
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.vector.utils import unbatch_info
+        >>> unbatch_info({"k": np.array([0., 0., 0.5]), "_k": np.array([False, False, True])}, num_envs=3)
+        [{}, {}, {'k': np.float64(0.5)}]
+    """
+    list_info = [{} for _ in range(num_envs)]
+
+    for key, value in vector_infos.items():
+        if key.startswith("_"):
+            continue
+
+        if isinstance(value, dict):
+            value = unbatch_info(value, num_envs)
+        else:
+            assert isinstance(value, np.ndarray)
+        assert (
+            len(value) == num_envs
+        ), f"Expects {value} to have length equal to the num-envs ({num_envs}), actual length is {len(value)}"
+
+        binary_key = f"_{key}"
+        if binary_key in vector_infos:
+            mask = vector_infos[binary_key]
+            assert (
+                len(mask) == num_envs
+            ), f"Expects {mask} to have length equal to the num-envs ({num_envs}), actual length is {len(mask)}"
+            env_nums = np.flatnonzero(mask).tolist()
+        else:
+            env_nums = range(num_envs)
+
+        for env_num in env_nums:
+            list_info[env_num][key] = value[env_num]
+
+    return list_info
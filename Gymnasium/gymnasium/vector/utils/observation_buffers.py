@@ -0,0 +1,107 @@
+"""Rotating batched observation buffers and read-only views, alternatives to deep copying the batched observations."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any
+
+import numpy as np
+
+from gymnasium.spaces import Space
+from gymnasium.vector.utils.space_utils import create_empty_array
+
+
+__all__ = ["ObservationBuffers", "read_only_view", "copy_observations"]
+
+
+class ObservationBuffers:
+    """A ring of batched observations of a space, written to in turn (double or triple buffering).
+
+    A vector environment writing every batched observation into the next buffer can return it without a copy:
+    the observation returned by one call is only overwritten ``num_buffers`` calls later,
+    so with two buffers ``obs`` and ``next_obs`` never alias each other.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.spaces import Box
+        >>> from gymnasium.vector.utils import ObservationBuffers
+        >>> buffers = ObservationBuffers(Box(0, 255, (84, 84), dtype=np.uint8), n=4, num_buffers=2)
+        >>> first, second, third = buffers.next(), buffers.next(), buffers.next()
+        >>> first is third, first is second
+        (True, False)
+    """
+
+    def __init__(self, space: Space, n: int, num_buffers: int = 2):
+        """Allocates the batched observation buffers.
+
+        Args:
+            space: The (single) observation space of the sub-environments
+            n: The number of sub-environments
+            num_buffers: The number of buffers, at least 2
+
+        Raises:
+            ValueError: If ``num_buffers`` is less than 2.
+        """
+        if num_buffers < 2:
+            raise ValueError(
+                f"Expected `num_buffers` to be at least 2, actual got {num_buffers}"
+            )
+
+        self.buffers = tuple(
+            create_empty_array(space, n=n, fn=np.zeros) for _ in range(num_buffers)
+        )
+        self._index = 0
+
+    @property
+    def current(self) -> Any:
+        """The buffer last returned by :meth:`next`."""
+        return self.buffers[self._index]
+
+    def next(self) -> Any:
+        """Moves to the next buffer and returns it, the buffer returned ``num_buffers`` calls earlier."""
+        self._index = (self._index + 1) % len(self.buffers)
+        return self.buffers[self._index]
+
+
+def read_only_view(batch: Any) -> Any:
+    """Returns read-only views of the (possibly nested) NumPy arrays of a batched observation without copying them.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.vector.utils import read_only_view
+        >>> view = read_only_view({"pixels": np.zeros((2, 3), dtype=np.uint8)})
+        >>> view["pixels"][0, 0] = 1
+        Traceback (most recent call last):
+            ...
+        ValueError: assignment destination is read-only
+    """
+    if isinstance(batch, np.ndarray):
+        view = batch.view()
+        view.flags.writeable = False
+        return view
+    elif isinstance(batch, dict):
+        return {key: read_only_view(value) for key, value in batch.items()}
+    elif type(batch) is tuple:
+        return tuple(read_only_view(value) for value in batch)
+    return batch
+
+
+def copy_observations(batch: Any, out: Any) -> Any:
+    """Copies a (possibly nested) batched observation into ``out`` with :func:`numpy.copyto`.
+
+    Batches that are not NumPy arrays (e.g. of :class:`Graph` spaces) are deep copied instead, as are arrays
+    whose shape or dtype differs from ``out`` (e.g. the stacked samples of a :class:`Sequence` space).
+
+    Returns:
+        The copy of ``batch``, ``out`` for NumPy arrays of the same shape and dtype
+    """
+    if isinstance(batch, np.ndarray) and isinstance(out, np.ndarray):
+        if batch.shape != out.shape or batch.dtype != out.dtype:
+            return batch.copy()
+        np.copyto(out, batch)
+        return out
+    elif isinstance(batch, dict) and isinstance(out, dict):
+        return {key: copy_observations(value, out[key]) for key, value in batch.items()}
+    elif type(batch) is tuple and type(out) is tuple and len(batch) == len(out):
+        return tuple(copy_observations(value, o) for value, o in zip(batch, out))
+    return deepcopy(batch)
@@ -25,23 +25,35 @@ from gymnasium.spaces import (
     Tuple,
     flatten,
 )
+from gymnasium.spaces.graph import GraphInstance
+from gymnasium.vector.utils.space_utils import iterate
 
 
 __all__ = ["create_shared_memory", "read_from_shared_memory", "write_to_shared_memory"]
 
 
+# The default maximum number of nodes and edges of a graph or elements of a sequence (per environment)
+DEFAULT_CAPACITY = 128
+
+
 @singledispatch
 def create_shared_memory(
-    space: Space[Any], n: int = 1, ctx=mp
+    space: Space[Any], n: int = 1, ctx=mp, capacity: int | None = None
 ) -> dict[str, Any] | tuple[Any, ...] | SynchronizedArray:
     """Create a shared memory object, to be shared across processes.
 
     This eventually contains the observations from the vectorized environment.
 
+    The dynamically sized samples of :class:`Graph` and :class:`Sequence` spaces are stored in a fixed size arena:
+    every environment has a slab of ``capacity`` nodes and edges (or elements) and a table with the
+    lengths of its sample, the samples are then read as views of their slab.
+
     Args:
         space: Observation space of a single environment in the vectorized environment.
         n: Number of environments in the vectorized environment (i.e. the number of processes).
         ctx: The multiprocess module
+        capacity: The maximum number of nodes and edges of a :class:`Graph` sample or elements of a :class:`Sequence` sample,
+            by default ``DEFAULT_CAPACITY`` (128).
 
     Returns:
         shared_memory for the shared object across processes.
@@ -64,7 +76,10 @@ def create_shared_memory(
 @create_shared_memory.register(MultiDiscrete)
 @create_shared_memory.register(MultiBinary)
 def _create_base_shared_memory(
-    space: Box | Discrete | MultiDiscrete | MultiBinary, n: int = 1, ctx=mp
+    space: Box | Discrete | MultiDiscrete | MultiBinary,
+    n: int = 1,
+    ctx=mp,
+    capacity: int | None = None,
 ):
     assert space.dtype is not None
     dtype = space.dtype.char
@@ -74,37 +89,90 @@ def _create_base_shared_memory(
 
 
 @create_shared_memory.register(Tuple)
-def _create_tuple_shared_memory(space: Tuple, n: int = 1, ctx=mp):
+def _create_tuple_shared_memory(
+    space: Tuple, n: int = 1, ctx=mp, capacity: int | None = None
+):
     return tuple(
-        create_shared_memory(subspace, n=n, ctx=ctx) for subspace in space.spaces
+        create_shared_memory(subspace, n=n, ctx=ctx, capacity=capacity)
+        for subspace in space.spaces
     )
 
 
 @create_shared_memory.register(Dict)
-def _create_dict_shared_memory(space: Dict, n: int = 1, ctx=mp):
+def _create_dict_shared_memory(
+    space: Dict, n: int = 1, ctx=mp, capacity: int | None = None
+):
     return {
-        key: create_shared_memory(subspace, n=n, ctx=ctx)
+        key: create_shared_memory(subspace, n=n, ctx=ctx, capacity=capacity)
         for (key, subspace) in space.spaces.items()
     }
 
 
 @create_shared_memory.register(Text)
-def _create_text_shared_memory(space: Text, n: int = 1, ctx=mp):
+def _create_text_shared_memory(
+    space: Text, n: int = 1, ctx=mp, capacity: int | None = None
+):
     return ctx.Array(np.dtype(np.int32).char, n * space.max_length)
 
 
 @create_shared_memory.register(OneOf)
-def _create_oneof_shared_memory(space: OneOf, n: int = 1, ctx=mp):
+def _create_oneof_shared_memory(
+    space: OneOf, n: int = 1, ctx=mp, capacity: int | None = None
+):
     return (ctx.Array(np.dtype(np.int64).char, n),) + tuple(
-        create_shared_memory(subspace, n=n, ctx=ctx) for subspace in space.spaces
+        create_shared_memory(subspace, n=n, ctx=ctx, capacity=capacity)
+        for subspace in space.spaces
     )
 
 
+def _create_header(
+    n: int, columns: int, ctx, capacity: int | None
+) -> SynchronizedArray:
+    """The capacity followed by a table of ``columns`` lengths for each environment."""
+    if capacity is None:
+        capacity = DEFAULT_CAPACITY
+    elif capacity < 1:
+        raise ValueError(f"Expected `capacity` to be at least 1, actual got {capacity}")
+
+    header = ctx.Array(np.dtype(np.int64).char, 1 + n * columns)
+    header[0] = capacity
+    return header
+
+
+def _read_header(header, columns: int) -> tuple[int, np.ndarray]:
+    """The capacity and the lengths table of the (flat) header, one row per environment."""
+    data = np.frombuffer(header.get_obj(), dtype=np.int64)
+    return int(data[0]), data[1:].reshape(-1, columns)
+
+
 @create_shared_memory.register(Graph)
+def _create_graph_shared_memory(
+    space: Graph, n: int = 1, ctx=mp, capacity: int | None = None
+):
+    # The lengths table holds the number of nodes, edges and edge links of each graph, -1 for `None` edges or edge links
+    header = _create_header(n, 3, ctx, capacity)
+    capacity = header[0]
+
+    nodes = create_shared_memory(space.node_space, n=n * capacity, ctx=ctx)
+    if space.edge_space is None:
+        return header, nodes, None, None
+    return (
+        header,
+        nodes,
+        create_shared_memory(space.edge_space, n=n * capacity, ctx=ctx),
+        ctx.Array(np.dtype(np.int32).char, n * capacity * 2),
+    )
+
+
 @create_shared_memory.register(Sequence)
-def _create_dynamic_shared_memory(space: Graph | Sequence, n: int = 1, ctx=mp):
-    raise TypeError(
-        f"As {space} has a dynamic shape so its not possible to make a static shared memory. For `AsyncVectorEnv`, disable `shared_memory`."
+def _create_sequence_shared_memory(
+    space: Sequence, n: int = 1, ctx=mp, capacity: int | None = None
+):
+    header = _create_header(n, 1, ctx, capacity)
+    capacity = header[0]
+
+    return header, create_shared_memory(
+        space.feature_space, n=n * capacity, ctx=ctx, capacity=capacity
     )
 
 
@@ -205,6 +273,80 @@ def _read_one_of_from_shared_memory(
     )
 
 
+def _take_from_batch(space: Space, batch: Any, key: int | slice) -> Any:
+    """Indexes (or slices) the (possibly nested) batch of samples of ``space``."""
+    if isinstance(space, Dict):
+        return {
+            name: _take_from_batch(subspace, batch[name], key)
+            for name, subspace in space.spaces.items()
+        }
+    elif isinstance(space, Tuple):
+        return tuple(
+            _take_from_batch(subspace, sub_batch, key)
+            for subspace, sub_batch in zip(space.spaces, batch)
+        )
+    return batch[key]
+
+
+@read_from_shared_memory.register(Graph)
+def _read_graph_from_shared_memory(
+    space: Graph, shared_memory, n: int = 1
+) -> tuple[GraphInstance, ...]:
+    header, nodes, edges, edge_links = shared_memory
+    capacity, lengths = _read_header(header, 3)
+
+    nodes = read_from_shared_memory(space.node_space, nodes, n=n * capacity)
+    if edges is not None:
+        edges = read_from_shared_memory(space.edge_space, edges, n=n * capacity)
+        edge_links = np.frombuffer(edge_links.get_obj(), dtype=np.int32).reshape(
+            (n * capacity, 2)
+        )
+
+    graphs = []
+    for index, (num_nodes, num_edges, num_edge_links) in enumerate(
+        lengths[:n].tolist()
+    ):
+        start = index * capacity
+        graph_edges = graph_edge_links = None
+        if edges is not None and num_edges >= 0:
+            graph_edges = edges[start : start + num_edges]
+        if edges is not None and num_edge_links >= 0:
+            graph_edge_links = edge_links[start : start + num_edge_links]
+        graphs.append(
+            GraphInstance(
+                nodes[start : start + num_nodes], graph_edges, graph_edge_links
+            )
+        )
+    return tuple(graphs)
+
+
+@read_from_shared_memory.register(Sequence)
+def _read_sequence_from_shared_memory(
+    space: Sequence, shared_memory, n: int = 1
+) -> tuple[Any, ...]:
+    header, elements = shared_memory
+    capacity, lengths = _read_header(header, 1)
+
+    batch = read_from_shared_memory(space.feature_space, elements, n=n * capacity)
+    samples = []
+    for index, (length,) in enumerate(lengths[:n].tolist()):
+        start = index * capacity
+        if space.stack:
+            samples.append(
+                _take_from_batch(
+                    space.feature_space, batch, slice(start, start + length)
+                )
+            )
+        else:
+            samples.append(
+                tuple(
+                    _take_from_batch(space.feature_space, batch, i)
+                    for i in range(start, start + length)
+                )
+            )
+    return tuple(samples)
+
+
 @singledispatch
 def write_to_shared_memory(
     space: Space,
@@ -291,3 +433,90 @@ def _write_oneof_to_shared_memory(
     write_to_shared_memory(
         space.spaces[subspace_idx], index, space_value, shared_memory[1 + subspace_idx]
     )
+
+
+def _write_to_slab(
+    shared_memory,
+    dtype: np.dtype,
+    shape: tuple[int, ...],
+    start: int,
+    capacity: int,
+    values: Any,
+    name: str,
+) -> int:
+    """Copies the rows of ``values`` into the slab of ``capacity`` rows starting at ``start``, returning the number of rows."""
+    values = np.asarray(values, dtype=dtype).reshape((-1,) + shape)
+    if len(values) > capacity:
+        raise ValueError(
+            f"Expected the number of {name} to be at most the shared memory capacity ({capacity}), actual got {len(values)}. "
+            "Increase the `capacity` of `create_shared_memory` (`AsyncVectorEnv(..., shared_memory_capacity=...)`)."
+        )
+
+    destination = np.frombuffer(shared_memory.get_obj(), dtype=dtype).reshape(
+        (-1,) + shape
+    )
+    np.copyto(destination[start : start + len(values)], values)
+    return len(values)
+
+
+@write_to_shared_memory.register(Graph)
+def _write_graph_to_shared_memory(
+    space: Graph, index: int, value: GraphInstance, shared_memory
+):
+    header, nodes, edges, edge_links = shared_memory
+    capacity, lengths = _read_header(header, 3)
+    start = index * capacity
+
+    num_nodes = _write_to_slab(
+        nodes,
+        space.node_space.dtype,
+        space.node_space.shape,
+        start,
+        capacity,
+        value.nodes,
+        "nodes",
+    )
+    num_edges = num_edge_links = -1
+    if edges is not None and value.edges is not None:
+        num_edges = _write_to_slab(
+            edges,
+            space.edge_space.dtype,
+            space.edge_space.shape,
+            start,
+            capacity,
+            value.edges,
+            "edges",
+        )
+    if edge_links is not None and value.edge_links is not None:
+        num_edge_links = _write_to_slab(
+            edge_links,
+            np.dtype(np.int32),
+            (2,),
+            start,
+            capacity,
+            value.edge_links,
+            "edge links",
+        )
+
+    lengths[index] = num_nodes, num_edges, num_edge_links
+
+
+@write_to_shared_memory.register(Sequence)
+def _write_sequence_to_shared_memory(
+    space: Sequence, index: int, values: tuple[Any, ...] | Any, shared_memory
+):
+    header, elements = shared_memory
+    capacity, lengths = _read_header(header, 1)
+
+    if space.stack:
+        values = tuple(iterate(space.stacked_feature_space, values))
+    if len(values) > capacity:
+        raise ValueError(
+            f"Expected the number of elements to be at most the shared memory capacity ({capacity}), actual got {len(values)}. "
+            "Increase the `capacity` of `create_shared_memory` (`AsyncVectorEnv(..., shared_memory_capacity=...)`)."
+        )
+
+    start = index * capacity
+    for i, value in enumerate(values):
+        write_to_shared_memory(space.feature_space, start + i, value, elements)
+    lengths[index] = len(values)
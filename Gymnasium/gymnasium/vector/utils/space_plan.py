@@ -0,0 +1,200 @@
+"""Space plans, a (nested) space compiled once into a flat layout of its leaves to concatenate and iterate batches quickly."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import count
+from operator import itemgetter
+from typing import Any
+
+import numpy as np
+
+from gymnasium.spaces import (
+    Box,
+    Dict,
+    Discrete,
+    MultiBinary,
+    MultiDiscrete,
+    Space,
+    Tuple,
+)
+from gymnasium.vector.utils.space_utils import (
+    _concatenate_base,
+    _concatenate_dict,
+    _concatenate_tuple,
+    batch_space,
+    concatenate,
+    iterate,
+)
+
+
+__all__ = ["SpacePlan"]
+
+
+class SpacePlan:
+    """A (single) space compiled into a flat layout of its leaves, an alternative to :func:`concatenate` and :func:`iterate`.
+
+    :func:`concatenate` and :func:`iterate` dispatch on the space type and recurse into :class:`Dict` and :class:`Tuple`
+    spaces on every call, for deeply nested spaces this overhead can be larger than stepping the environments.
+    A space plan walks the space once, recording the path, dtype and shape of every leaf space, such that
+
+    * :meth:`concatenate` stacks the values of each leaf of the samples straight into the preallocated leaf array of ``out``,
+    * :meth:`iterate` zips the leaf arrays of the batch, whose rows are views, and rebuilds each sample with a
+      precompiled function.
+
+    Only :class:`Dict` and :class:`Tuple` spaces of :class:`Box`, :class:`Discrete`, :class:`MultiDiscrete`
+    and :class:`MultiBinary` spaces are compiled (``compiled`` is ``True``), otherwise (e.g. for :class:`Graph` spaces
+    or spaces with custom registered functions) the plan calls :func:`concatenate` and :func:`iterate`.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.spaces import Box, Dict, Discrete
+        >>> from gymnasium.vector.utils import SpacePlan, create_empty_array
+        >>> space = Dict(position=Box(0, 1, shape=(2,), dtype=np.float32), agent=Dict(id=Discrete(3)))
+        >>> plan = SpacePlan(space, n=2)
+        >>> plan.paths
+        (('position',), ('agent', 'id'))
+        >>> out = plan.concatenate(
+        ...     [{"position": np.zeros(2), "agent": {"id": 1}}, {"position": np.ones(2), "agent": {"id": 2}}],
+        ...     create_empty_array(space, n=2),
+        ... )
+        >>> out["agent"]["id"]
+        array([1, 2])
+        >>> list(plan.iterate(out))
+        [{'position': array([0., 0.], dtype=float32), 'agent': {'id': np.int64(1)}}, {'position': array([1., 1.], dtype=float32), 'agent': {'id': np.int64(2)}}]
+    """
+
+    def __init__(self, space: Space, n: int = 1):
+        """Compiles the space plan.
+
+        Args:
+            space: The (single) space of each sample, e.g. ``single_observation_space``.
+            n: The number of samples in a batch, only used to batch ``space`` for :func:`iterate` if not compiled.
+        """
+        self.space = space
+        self.n = n
+
+        leaves: list[tuple[tuple[str | int, ...], Space]] = []
+        self.compiled = _compile_leaves(space, (), leaves)
+        self.paths = tuple(path for path, _ in leaves)
+        self.dtypes = tuple(leaf.dtype for _, leaf in leaves)
+        self.shapes = tuple(leaf.shape for _, leaf in leaves)
+
+        if self.compiled:
+            self._getters = tuple(_compile_getter(path) for path in self.paths)
+            self._build = _compile_builder(space)
+            # A space that is a single leaf is concatenated and iterated as an array
+            self._is_leaf = self.paths == ((),)
+            self.batched_space = None
+        else:
+            self.batched_space = batch_space(space, n)
+
+    def concatenate(self, items: Iterable, out: Any) -> Any:
+        """Concatenates the samples into ``out``, equivalent to :func:`concatenate` with the plan's space.
+
+        Args:
+            items: The samples of the space
+            out: The batch to write to (e.g. generated by :func:`create_empty_array`)
+
+        Returns:
+            The batch, ``out`` if the plan is compiled
+        """
+        if not self.compiled:
+            return concatenate(self.space, items, out)
+        elif self._is_leaf:
+            return np.stack(items, axis=0, out=out)
+
+        # Each leaf is stacked as `concatenate` does, which checks the shape and (same kind) dtype of the values
+        items = list(items)
+        for get in self._getters:
+            np.stack([get(item) for item in items], axis=0, out=get(out))
+        return out
+
+    def iterate(self, batch: Any) -> Iterator:
+        """Iterates over the samples of the batch, equivalent to :func:`iterate` with the batched space.
+
+        Args:
+            batch: The batched samples
+
+        Returns:
+            An iterator over the samples, leaf arrays are views of the batch
+        """
+        if not self.compiled:
+            return iterate(self.batched_space, batch)
+        elif self._is_leaf:
+            return iter(batch)
+        return map(self._build, zip(*[get(batch) for get in self._getters]))
+
+
+def _compile_leaves(
+    space: Space,
+    path: tuple[str | int, ...],
+    leaves: list[tuple[tuple[str | int, ...], Space]],
+) -> bool:
+    """Appends the path and space of each leaf of ``space`` in order, returning if every leaf and container is compilable."""
+    if isinstance(space, Dict):
+        if concatenate.dispatch(type(space)) is not _concatenate_dict:
+            return False
+        return all(
+            [
+                _compile_leaves(subspace, path + (key,), leaves)
+                for key, subspace in space.spaces.items()
+            ]
+        )
+    elif isinstance(space, Tuple):
+        if concatenate.dispatch(type(space)) is not _concatenate_tuple:
+            return False
+        return all(
+            [
+                _compile_leaves(subspace, path + (i,), leaves)
+                for i, subspace in enumerate(space.spaces)
+            ]
+        )
+
+    leaves.append((path, space))
+    return (
+        isinstance(space, (Box, Discrete, MultiDiscrete, MultiBinary))
+        and concatenate.dispatch(type(space)) is _concatenate_base
+    )
+
+
+def _compile_getter(path: tuple[str | int, ...]) -> Callable[[Any], Any]:
+    """A function returning the value at ``path`` of a (nested) sample or batch, a composition of item getters."""
+    if len(path) == 0:
+        return lambda value: value
+
+    get = itemgetter(path[0])
+    for key in path[1:]:
+        get = _compose(get, itemgetter(key))
+    return get
+
+
+def _compose(
+    first: Callable[[Any], Any], second: Callable[[Any], Any]
+) -> Callable[[Any], Any]:
+    """A function calling ``second`` with the value returned by ``first``."""
+    return lambda value: second(first(value))
+
+
+def _compile_builder(space: Space) -> Callable[[tuple], Any]:
+    """A function building a (nested) sample of ``space`` from the tuple of its leaf values, a closure per container."""
+    leaf_index = count()
+
+    def _compile(subspace: Space) -> Callable[[tuple], Any]:
+        if isinstance(subspace, Dict):
+            items = tuple(
+                (key, _compile(value_space))
+                for key, value_space in subspace.spaces.items()
+            )
+            return lambda values: {key: build(values) for key, build in items}
+        elif isinstance(subspace, Tuple):
+            if len(subspace.spaces) > 1 and not any(
+                isinstance(s, (Dict, Tuple)) for s in subspace.spaces
+            ):
+                # An item getter of several indices returns the tuple of their values
+                return itemgetter(*[next(leaf_index) for _ in subspace.spaces])
+            builders = tuple(_compile(s) for s in subspace.spaces)
+            return lambda values: tuple([build(values) for build in builders])
+        return itemgetter(next(leaf_index))
+
+    return _compile(space)
@@ -0,0 +1,183 @@
+"""A pool of worker processes started from a prewarmed fork server, shared by several :class:`AsyncVectorEnv`."""
+
+from __future__ import annotations
+
+import multiprocessing
+import multiprocessing.forkserver
+import threading
+from collections.abc import Sequence
+from multiprocessing.context import BaseContext
+
+from gymnasium import logger
+
+
+__all__ = ["WorkerPool", "WorkerLease"]
+
+
+# The modules imported by the fork server, if it was started by a worker pool
+_forkserver_preload: tuple[str, ...] | None = None
+
+
+def _start_forkserver(preload: tuple[str, ...]):
+    """Starts the fork server of the Python process with ``preload``, warning if it is already running with other modules."""
+    global _forkserver_preload
+
+    if multiprocessing.forkserver._forkserver._forkserver_pid is None:
+        multiprocessing.set_forkserver_preload(list(preload))
+        multiprocessing.forkserver.ensure_running()
+        _forkserver_preload = preload
+    elif preload != _forkserver_preload:
+        logger.warn(
+            f"The fork server is already running, so the worker pool can't preload {preload}, "
+            f"the server preloaded {'unknown modules' if _forkserver_preload is None else _forkserver_preload}."
+        )
+
+
+class WorkerPool:
+    """A pool of worker processes that vector environments and evaluation jobs lease from.
+
+    With the ``spawn`` context, every worker of an :class:`AsyncVectorEnv` starts a fresh interpreter that
+    re-imports gymnasium, NumPy and the modules of the environments (e.g. pygame or Box2D) before creating its environments.
+    A pool instead uses the ``forkserver`` context: the fork server imports the ``preload`` modules once,
+    then every worker is forked from the server with these modules already imported. The server is started
+    when the pool is created, rather than by the first worker, and is reused by every vector environment of the pool.
+
+    The number of leased workers is limited to ``max_workers``, such that several vector environments
+    (e.g. training and evaluation jobs) can share a machine without oversubscribing its cores,
+    :meth:`lease` blocks until enough workers are released.
+
+    The pool only speeds up and limits the startup of worker processes, it doesn't reuse them: every vector environment
+    starts its own workers, which run its environment functions until it is closed.
+    The fork server is shared by the whole Python process, so ``preload`` only applies to the first pool
+    (or ``forkserver`` context) to start it, a warning is raised if the running server imported other modules.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from gymnasium.vector.utils import WorkerPool
+        >>> pool = WorkerPool(max_workers=4, preload=["gymnasium", "gymnasium.envs.classic_control"])
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=4, vectorization_mode="async", vector_kwargs={"worker_pool": pool})
+        >>> pool.num_leased
+        4
+        >>> envs.close()
+        >>> pool.num_leased
+        0
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        preload: Sequence[str] | None = None,
+        context: str = "forkserver",
+    ):
+        """Starts the (fork server of the) worker pool.
+
+        Args:
+            max_workers: The maximum number of leased workers, if ``None`` then the number of leased workers is not limited.
+            preload: The modules imported by the fork server, ``"__main__"`` imports the main script (like the default
+                of :mod:`multiprocessing`). Modules that fail to import are ignored.
+                If ``None``, then ``("__main__", "gymnasium")`` with the ``"forkserver"`` context.
+            context: The :mod:`multiprocessing` context of the workers, other contexts than ``"forkserver"``
+                only limit the number of leased workers (e.g. to compare the startup time) and don't use ``preload``.
+
+        Raises:
+            ValueError: If ``max_workers`` is less than 1.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(
+                f"Expected `max_workers` to be at least 1, actual got {max_workers}"
+            )
+
+        self.max_workers = max_workers
+        self.context = multiprocessing.get_context(context)
+        self.preload = ()
+        if self.context.get_start_method() == "forkserver":
+            self.preload = (
+                ("__main__", "gymnasium") if preload is None else tuple(preload)
+            )
+            _start_forkserver(self.preload)
+        elif preload is not None:
+            logger.warn(
+                f"The `preload` modules of a worker pool are only imported with the 'forkserver' context, actual context is {context!r}."
+            )
+
+        self._num_leased = 0
+        self._condition = threading.Condition()
+
+    @property
+    def num_leased(self) -> int:
+        """The number of currently leased workers."""
+        return self._num_leased
+
+    def lease(self, num_workers: int, timeout: float | None = None) -> WorkerLease:
+        """Leases ``num_workers`` workers, waiting for other leases to be released if more than ``max_workers`` would be leased.
+
+        Args:
+            num_workers: The number of workers (processes) to lease
+            timeout: Number of seconds to wait for the workers. If ``None``, then it waits until they are released.
+
+        Returns:
+            The lease, that must be released (or used as a context manager) once its processes are closed
+
+        Raises:
+            ValueError: If ``num_workers`` is more than ``max_workers``.
+            TimeoutError: If the workers were not released within ``timeout`` seconds.
+        """
+        if self.max_workers is not None and num_workers > self.max_workers:
+            raise ValueError(
+                f"Expected `num_workers` to be at most the `max_workers` of the pool ({self.max_workers}), actual got {num_workers}"
+            )
+
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self.max_workers is None
+                or self._num_leased + num_workers <= self.max_workers,
+                timeout,
+            ):
+                raise multiprocessing.TimeoutError(
+                    f"Leasing {num_workers} workers timed-out after {timeout} seconds, {self._num_leased} of {self.max_workers} workers are leased."
+                )
+            self._num_leased += num_workers
+        return WorkerLease(self, num_workers)
+
+    def _release(self, num_workers: int):
+        with self._condition:
+            self._num_leased -= num_workers
+            self._condition.notify_all()
+
+    def __repr__(self) -> str:
+        """Returns the string representation of the worker pool."""
+        return f"WorkerPool(max_workers={self.max_workers}, context={self.context.get_start_method()!r}, num_leased={self._num_leased})"
+
+
+class WorkerLease:
+    """Workers leased from a :class:`WorkerPool`, their processes are started with the :attr:`context` of the pool."""
+
+    def __init__(self, pool: WorkerPool, num_workers: int):
+        """Initialises the lease, use :meth:`WorkerPool.lease` rather than this constructor.
+
+        Args:
+            pool: The pool of the leased workers
+            num_workers: The number of leased workers
+        """
+        self.pool = pool
+        self.num_workers = num_workers
+        self.released = False
+
+    @property
+    def context(self) -> BaseContext:
+        """The multiprocessing context to start the worker processes with."""
+        return self.pool.context
+
+    def release(self):
+        """Returns the workers to the pool, releasing a lease more than once has no effect."""
+        if not self.released:
+            self.released = True
+            self.pool._release(self.num_workers)
+
+    def __enter__(self) -> WorkerLease:
+        """Returns the lease."""
+        return self
+
+    def __exit__(self, *args):
+        """Releases the lease."""
+        self.release()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
@@ -11,6 +12,7 @@ import gymnasium as gym
 from gymnasium.core import ActType, ObsType, RenderFrame
 from gymnasium.logger import warn
 from gymnasium.utils import seeding
+from gymnasium.vector.utils.batched_info import InfoBatcher, add_info
 
 
 if TYPE_CHECKING:
@@ -291,50 +293,37 @@ class VectorEnv(Generic[ObsType, ActType, ArrayType]):
         Returns:
             infos (dict): the (updated) infos of the vectorized environment
         """
-        for key, value in env_info.items():
-            # It is easier for users to access their `final_obs` in the unbatched array of `obs` objects
-            if key == "final_obs":
-                if "final_obs" in vector_infos:
-                    array = vector_infos["final_obs"]
-                else:
-                    array = np.full(self.num_envs, fill_value=None, dtype=object)
-                array[env_num] = value
-            # If value is a dictionary, then we apply the `_add_info` recursively.
-            elif isinstance(value, dict):
-                array = self._add_info(vector_infos.get(key, {}), value, env_num)
-            # Otherwise, we are a base case to group the data
-            else:
-                # If the key doesn't exist in the vector infos, then we can create an array of that batch type
-                if key not in vector_infos:
-                    if type(value) in [int, float, bool] or issubclass(
-                        type(value), np.number
-                    ):
-                        array = np.zeros(self.num_envs, dtype=type(value))
-                    elif isinstance(value, np.ndarray):
-                        # We assume that all instances of the np.array info are of the same shape
-                        array = np.zeros(
-                            (self.num_envs, *value.shape), dtype=value.dtype
-                        )
-                    else:
-                        # For unknown objects, we use a Numpy object array
-                        array = np.full(self.num_envs, fill_value=None, dtype=object)
-                # Otherwise, just use the array that already exists
-                else:
-                    array = vector_infos[key]
-
-                # Assign the data in the `env_num` position
-                #   We only want to run this for the base-case data (not recursive data forcing the ugly function structure)
-                array[env_num] = value
-
-            # Get the array mask and if it doesn't already exist then create a zero bool array
-            array_mask = vector_infos.get(
-                f"_{key}", np.zeros(self.num_envs, dtype=np.bool_)
-            )
-            array_mask[env_num] = True
+        return add_info(vector_infos, env_info, env_num, self.num_envs)
+
+    def _batch_infos(
+        self,
+        env_infos: Iterable[tuple[int, dict[str, Any]]],
+        num_envs: int | None = None,
+    ) -> dict[str, Any]:
+        """Batches the info of each sub-environment into the info dictionary of the vectorized environment.
+
+        This gives the same infos as adding each ``(env_num, info)`` pair in turn with :meth:`_add_info`,
+        but batches every key at once with an :class:`InfoBatcher`. Vector environments with ``copy=False``
+        reuse the info arrays between calls.
 
-            # Update the vector info with the updated data and mask information
-            vector_infos[key], vector_infos[f"_{key}"] = array, array_mask
-        return vector_infos
+        Args:
+            env_infos: The index and info of each sub-environment
+            num_envs: The length of the batched infos, by default :attr:`num_envs` (e.g. the batch size of a partial batch)
+
+        Returns:
+            infos (dict): the infos of the vectorized environment
+        """
+        if num_envs is None:
+            num_envs = self.num_envs
+
+        batchers = getattr(self, "_info_batchers", None)
+        if batchers is None:
+            batchers = self._info_batchers = {}
+        if num_envs not in batchers:
+            batchers[num_envs] = InfoBatcher(
+                num_envs, reuse_buffers=not getattr(self, "copy", True)
+            )
+        return batchers[num_envs](env_infos)
 
     def __del__(self):
         """Closes the vector environment."""
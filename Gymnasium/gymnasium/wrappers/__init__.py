@@ -58,6 +58,7 @@ from gymnasium.wrappers.common import (
     RecordEpisodeStatistics,
     TimeLimit,
 )
+from gymnasium.wrappers.fused_transform import FusedTransform, fuse_transforms
 from gymnasium.wrappers.rendering import (
     AddWhiteNoise,
     HumanRendering,
@@ -131,6 +132,8 @@ __all__ = [
     "PassiveEnvChecker",
     "OrderEnforcing",
     "RecordEpisodeStatistics",
+    "FusedTransform",
+    "fuse_transforms",
     # --- Rendering ---
     "AddWhiteNoise",
     "ObstructView",
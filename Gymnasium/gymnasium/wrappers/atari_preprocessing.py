@@ -18,7 +18,8 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
     """Implements the common preprocessing techniques for Atari environments (excluding frame stacking).
 
     For frame stacking use :class:`gymnasium.wrappers.FrameStackObservation`.
-    No vector version of the wrapper exists
+    A vector version of the wrapper exists :class:`gymnasium.wrappers.vector.AtariPreprocessing`,
+    that max-pools, resizes and scales the ``raw_frames`` of the sub-environments as a batch.
 
     This class follows the guidelines in Machado et al. (2018),
     "Revisiting the Arcade Learning Environment: Evaluation Protocols and Open Problems for General Agents".
@@ -48,6 +49,7 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
 
     Change logs:
      * Added in gym v0.12.2 (gym #1455)
+     * v1.3.0 - Added ``raw_frames`` for :class:`gymnasium.wrappers.vector.AtariPreprocessing`
     """
 
     def __init__(
@@ -60,6 +62,7 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
         grayscale_obs: bool = True,
         grayscale_newaxis: bool = False,
         scale_obs: bool = False,
+        raw_frames: bool = False,
     ):
         """Wrapper for Atari 2600 preprocessing.
 
@@ -76,6 +79,10 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
                 grayscale observations to make them 3-dimensional.
             scale_obs (bool): if True, then observation normalized in range [0,1) is returned. It also limits memory
                 optimization benefits of FrameStack Wrapper.
+            raw_frames (bool): if True, then the observation is the last two frames of the frame skip (stacked on the
+                first axis) that are not max-pooled, resized or scaled, to preprocess as a batch with
+                :class:`gymnasium.wrappers.vector.AtariPreprocessing`, ``screen_size``, ``grayscale_newaxis``
+                and ``scale_obs`` are ignored.
 
         Raises:
             DependencyNotInstalled: opencv-python package not installed
@@ -90,6 +97,7 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
             grayscale_obs=grayscale_obs,
             grayscale_newaxis=grayscale_newaxis,
             scale_obs=scale_obs,
+            raw_frames=raw_frames,
         )
         gym.Wrapper.__init__(self, env)
 
@@ -125,6 +133,7 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
         self.grayscale_obs = grayscale_obs
         self.grayscale_newaxis = grayscale_newaxis
         self.scale_obs = scale_obs
+        self.raw_frames = raw_frames
 
         # buffer of most recent two observations for max pooling
         assert isinstance(env.observation_space, Box)
@@ -138,6 +147,8 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
                 np.empty(env.observation_space.shape, dtype=np.uint8),
                 np.empty(env.observation_space.shape, dtype=np.uint8),
             ]
+        # the replaced most recent observation, to pool stale raw frames as `_get_obs` would pool in-place
+        self._previous_frame = np.empty_like(self.obs_buffer[1])
 
         self.lives = 0
         self.game_over = False
@@ -146,6 +157,9 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
         _shape = (self.screen_size[1], self.screen_size[0], 1 if grayscale_obs else 3)
         if grayscale_obs and not grayscale_newaxis:
             _shape = _shape[:-1]  # Remove channel axis
+        if raw_frames:
+            _low, _high, _dtype = 0, 255, np.uint8
+            _shape = (2,) + self.obs_buffer[0].shape
         self.observation_space = Box(low=_low, high=_high, shape=_shape, dtype=_dtype)
 
     @property
@@ -173,6 +187,11 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
             if terminated or truncated:
                 break
             if t == self.frame_skip - 2:
+                if self.raw_frames:
+                    self.obs_buffer[1], self._previous_frame = (
+                        self._previous_frame,
+                        self.obs_buffer[1],
+                    )
                 if self.grayscale_obs:
                     self.ale.getScreenGrayscale(self.obs_buffer[1])
                 else:
@@ -182,6 +201,16 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
                     self.ale.getScreenGrayscale(self.obs_buffer[0])
                 else:
                     self.ale.getScreenRGB(self.obs_buffer[0])
+
+        # The max-pooling of `_get_obs` is in-place, if the episode ended on the last frame then the (not updated)
+        #   first buffer must be pooled with the replaced second buffer for the raw frames to pool equivalently
+        if (
+            self.raw_frames
+            and self.frame_skip > 1
+            and (terminated or truncated)
+            and t == self.frame_skip - 1
+        ):
+            np.maximum(self.obs_buffer[0], self._previous_frame, out=self.obs_buffer[0])
         return self._get_obs(), total_reward, terminated, truncated, info
 
     def reset(
@@ -212,6 +241,9 @@ class AtariPreprocessing(gym.Wrapper, gym.utils.RecordConstructorArgs):
         return self._get_obs(), reset_info
 
     def _get_obs(self):
+        if self.raw_frames:
+            return np.stack(self.obs_buffer)
+
         if self.frame_skip > 1:  # more efficient in-place pooling
             np.maximum(self.obs_buffer[0], self.obs_buffer[1], out=self.obs_buffer[0])
 
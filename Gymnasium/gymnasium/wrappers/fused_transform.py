@@ -0,0 +1,288 @@
+"""A wrapper fusing a chain of stateless transform wrappers into a single wrapper.
+
+* ``FusedTransform`` - Applies the transforms of a chain of transform wrappers with one wrapper
+* ``fuse_transforms`` - Replaces every chain of transform wrappers of an environment with a ``FusedTransform``
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, SupportsFloat
+
+import numpy as np
+
+import gymnasium as gym
+from gymnasium.core import ActType, ObsType
+from gymnasium.envs.registration import EnvSpec
+from gymnasium.wrappers.transform_action import ClipAction, TransformAction
+from gymnasium.wrappers.transform_observation import (
+    DtypeObservation,
+    GrayscaleObservation,
+    ResizeObservation,
+    TransformObservation,
+)
+from gymnasium.wrappers.transform_reward import TransformReward
+
+
+__all__ = ["FusedTransform", "fuse_transforms"]
+
+
+# The transform wrappers and the method that applies their `func`
+_TRANSFORM_METHODS = {
+    TransformObservation: "observation",
+    TransformAction: "action",
+    TransformReward: "reward",
+}
+
+
+class FusedTransform(gym.Wrapper[ObsType, ActType, Any, Any]):
+    """Applies the transforms of a chain of stateless transform wrappers with a single wrapper.
+
+    Each layer of a wrapper stack adds Python calls to every ``step`` and ``reset``, and each transform allocates a new array.
+    For a chain of :class:`TransformObservation`, :class:`TransformAction` and :class:`TransformReward` wrappers
+    (and their subclasses, e.g. :class:`ClipAction`, :class:`ResizeObservation`, :class:`GrayscaleObservation` or :class:`ClipReward`),
+    this wrapper calls the environment below the chain directly and applies the ``func`` of the wrappers with one function per channel,
+    the observation and reward transforms in the order of the wrappers from the inner most and the action transforms from the outer most.
+    The intermediate arrays of :class:`ClipAction`, :class:`ResizeObservation`, :class:`GrayscaleObservation` and
+    :class:`DtypeObservation` are written into preallocated buffers, the returned observations and actions are never a buffer.
+
+    The chain of wrappers is kept (as :attr:`env`), such that the spaces, :meth:`render`, :meth:`close` and attributes are those of
+    the wrapper stack, and :attr:`spec` is the spec of the chain, such that :func:`gymnasium.make` recreates the (unfused) wrapper stack.
+    The ``func`` of the wrappers are read when the wrapper is created.
+
+    Use :func:`fuse_transforms` to fuse every chain of transform wrappers of an environment.
+
+    No vector version of the wrapper exists.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from gymnasium.wrappers import ClipAction, ClipReward, FusedTransform, RescaleAction
+        >>> env = ClipReward(ClipAction(RescaleAction(gym.make("Pendulum-v1"), 0, 1)), 0, 1)
+        >>> env = FusedTransform(env)
+        >>> env
+        <FusedTransform<ClipReward<ClipAction<RescaleAction<TimeLimit<OrderEnforcing<PassiveEnvChecker<PendulumEnv<Pendulum-v1>>>>>>>>>
+        >>> env.num_fused_wrappers
+        3
+        >>> env.transformed_env
+        <TimeLimit<OrderEnforcing<PassiveEnvChecker<PendulumEnv<Pendulum-v1>>>>>
+
+    Change logs:
+     * v1.3.0 - Initially added
+    """
+
+    def __init__(self, env: gym.Env[ObsType, ActType], num_wrappers: int | None = None):
+        """Fuses the chain of transform wrappers starting at ``env``.
+
+        Args:
+            env: The outer most wrapper of the chain of transform wrappers
+            num_wrappers: The maximum number of wrappers to fuse, if ``None`` then the whole chain is fused
+
+        Raises:
+            ValueError: If ``env`` is not a transform wrapper that can be fused.
+        """
+        gym.Wrapper.__init__(self, env)
+
+        chain = _transform_chain(env, num_wrappers)
+        if len(chain) == 0:
+            raise ValueError(
+                f"Expected `env` to be a transform wrapper (e.g. `TransformObservation`), actual type: {type(env)}"
+            )
+
+        self.fused_wrappers: tuple[gym.Wrapper, ...] = tuple(chain)
+        self.transformed_env: gym.Env = chain[-1].env
+
+        # The observations and rewards are transformed from the inner most wrapper, the actions from the outer most
+        self._observation_fn = _fuse(
+            [w for w in reversed(chain) if isinstance(w, TransformObservation)]
+        )
+        self._action_fn = _fuse([w for w in chain if isinstance(w, TransformAction)])
+        self._reward_fn = _fuse(
+            [w for w in reversed(chain) if isinstance(w, TransformReward)]
+        )
+
+    @property
+    def num_fused_wrappers(self) -> int:
+        """The number of fused transform wrappers."""
+        return len(self.fused_wrappers)
+
+    @property
+    def spec(self) -> EnvSpec | None:
+        """Returns the spec of the fused wrappers, such that the fusion isn't part of the environment spec."""
+        return self.env.spec
+
+    def step(
+        self, action: ActType
+    ) -> tuple[Any, SupportsFloat, bool, bool, dict[str, Any]]:
+        """Steps the environment below the fused wrappers, transforming the action, observation and reward."""
+        if self._action_fn is not None:
+            action = self._action_fn(action)
+        obs, reward, terminated, truncated, info = self.transformed_env.step(action)
+        if self._observation_fn is not None:
+            obs = self._observation_fn(obs)
+        if self._reward_fn is not None:
+            reward = self._reward_fn(reward)
+        return obs, reward, terminated, truncated, info
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[Any, dict[str, Any]]:
+        """Resets the environment below the fused wrappers, transforming the observation."""
+        obs, info = self.transformed_env.reset(seed=seed, options=options)
+        if self._observation_fn is not None:
+            obs = self._observation_fn(obs)
+        return obs, info
+
+
+def fuse_transforms(env: gym.Env, min_wrappers: int = 2) -> gym.Env:
+    """Replaces every chain of at least ``min_wrappers`` transform wrappers of the environment with a :class:`FusedTransform`.
+
+    Wrappers that can't be fused (e.g. :class:`NormalizeObservation` or :class:`TimeLimit`) end a chain, the wrapper
+    above a fused chain is updated to wrap the :class:`FusedTransform`.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from gymnasium.wrappers import ClipAction, ClipReward, NormalizeObservation, RescaleAction, fuse_transforms
+        >>> env = ClipReward(NormalizeObservation(ClipAction(RescaleAction(gym.make("Pendulum-v1"), 0, 1))), 0, 1)
+        >>> fuse_transforms(env)
+        <ClipReward<NormalizeObservation<FusedTransform<ClipAction<RescaleAction<TimeLimit<OrderEnforcing<PassiveEnvChecker<PendulumEnv<Pendulum-v1>>>>>>>>>>
+
+    Args:
+        env: The environment whose wrappers are fused
+        min_wrappers: The minimum number of transform wrappers in a chain to fuse it
+
+    Returns:
+        The environment with the chains of transform wrappers fused, ``env`` unless its outer most wrapper is fused
+    """
+    root, outer, current = env, None, env
+    while isinstance(current, gym.Wrapper):
+        chain = _transform_chain(current)
+        if len(chain) >= min_wrappers:
+            fused = FusedTransform(current, len(chain))
+            if outer is None:
+                root = fused
+            else:
+                outer.env = fused
+            outer = chain[-1]
+        else:
+            outer = current
+        current = outer.env
+    return root
+
+
+def _transform_chain(env: gym.Env, max_length: int | None = None) -> list[gym.Wrapper]:
+    """Returns the chain of transform wrappers (from the outer most) that only transform through their ``func``."""
+    chain = []
+    while max_length is None or len(chain) < max_length:
+        for wrapper_type, method in _TRANSFORM_METHODS.items():
+            if isinstance(env, wrapper_type):
+                break
+        else:
+            break
+
+        # Subclasses that override how the transform is applied are not fused
+        if any(
+            getattr(type(env), name) is not getattr(wrapper_type, name)
+            for name in ("step", "reset", method)
+        ):
+            break
+        chain.append(env)
+        env = env.env
+    return chain
+
+
+def _fuse(wrappers: list[gym.Wrapper]) -> Callable[[Any], Any] | None:
+    """Composes the transforms of the wrappers (in order) into one function, ``None`` if there are no wrappers."""
+    funcs = []
+    for index, wrapper in enumerate(wrappers):
+        # The output of a transform is written into a buffer if the next transform doesn't keep (or return) its input
+        buffered = index + 1 < len(wrappers) and _returns_new_array(wrappers[index + 1])
+        funcs.append(_transform_function(wrapper, buffered))
+
+    if len(funcs) == 0:
+        return None
+    elif len(funcs) == 1:
+        return funcs[0]
+
+    def _fused(value: Any) -> Any:
+        for func in funcs:
+            value = func(value)
+        return value
+
+    return _fused
+
+
+def _returns_new_array(wrapper: gym.Wrapper) -> bool:
+    """Returns if the wrapper's ``func`` always returns a new array, such that its input can be a reused buffer."""
+    if type(wrapper) in {ClipAction, GrayscaleObservation, ResizeObservation}:
+        return True
+    elif type(wrapper) is DtypeObservation:
+        # Casting to the dtype of the observation returns the observation itself
+        return np.dtype(wrapper.dtype) != wrapper.env.observation_space.dtype
+    return False
+
+
+def _transform_function(wrapper: gym.Wrapper, buffered: bool) -> Callable[[Any], Any]:
+    """Returns a function equivalent to the wrapper's ``func``, that writes its result into a preallocated buffer if ``buffered``."""
+    if type(wrapper) is ClipAction:
+        low, high = wrapper.env.action_space.low, wrapper.env.action_space.high
+        out = np.empty_like(low) if buffered else None
+
+        def _clip(action: Any) -> Any:
+            if (
+                out is not None
+                and isinstance(action, np.ndarray)
+                and action.dtype == out.dtype
+                and action.shape == out.shape
+            ):
+                return np.clip(action, low, high, out=out)
+            return np.clip(action, low, high)
+
+        return _clip
+
+    elif type(wrapper) is GrayscaleObservation:
+        rgb_shape = wrapper.env.observation_space.shape
+        weights = np.array([0.2125, 0.7154, 0.0721])
+        weighted = np.empty(rgb_shape, dtype=np.float64)
+        summed = np.empty(rgb_shape[:2], dtype=np.float64)
+        out = np.empty(rgb_shape[:2], dtype=np.uint8) if buffered else None
+        keep_dim = wrapper.keep_dim
+
+        def _grayscale(obs: Any) -> Any:
+            if not isinstance(obs, np.ndarray) or obs.shape != rgb_shape:
+                return wrapper.func(obs)
+
+            np.multiply(obs, weights, out=weighted)
+            np.sum(weighted, axis=-1, out=summed)
+            gray = np.empty(summed.shape, dtype=np.uint8) if out is None else out
+            np.copyto(gray, summed, casting="unsafe")
+            return np.expand_dims(gray, axis=-1) if keep_dim else gray
+
+        return _grayscale
+
+    elif type(wrapper) is ResizeObservation and buffered:
+        import cv2
+
+        # `cv2.resize` drops the channel axis of single channel images, so does `ResizeObservation.func`
+        shape = wrapper.observation_space.shape
+        out = np.empty(shape[:2] if shape[2:] == (1,) else shape, dtype=np.uint8)
+
+        def _resize(obs: Any) -> Any:
+            return cv2.resize(
+                obs, wrapper.cv2_shape, dst=out, interpolation=cv2.INTER_AREA
+            )
+
+        return _resize
+
+    elif type(wrapper) is DtypeObservation and buffered:
+        shape, dtype = wrapper.observation_space.shape, wrapper.observation_space.dtype
+        out = np.empty(shape, dtype=dtype)
+
+        def _dtype(obs: Any) -> Any:
+            if isinstance(obs, np.ndarray) and obs.shape == shape:
+                np.copyto(out, obs, casting="unsafe")
+                return out
+            return wrapper.func(obs)
+
+        return _dtype
+
+    return wrapper.func
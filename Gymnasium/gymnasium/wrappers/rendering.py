@@ -13,7 +13,7 @@ import gc
 import os
 from collections.abc import Callable
 from copy import deepcopy
-from typing import Any, Generic, SupportsFloat
+from typing import TYPE_CHECKING, Any, Generic, SupportsFloat
 
 import numpy as np
 
@@ -23,6 +23,9 @@ from gymnasium.core import ActType, ObsType, RenderFrame
 from gymnasium.error import DependencyNotInstalled, InvalidProbability
 
 
+if TYPE_CHECKING:
+    from gymnasium.utils.save_video import VideoEncoder
+
 __all__ = [
     "RenderCollection",
     "RecordVideo",
@@ -182,6 +185,12 @@ class RecordVideo(
     However, you can also create recordings of fixed length (possibly spanning several episodes)
     by passing a strictly positive value for ``video_length``.
 
+    The frames are not kept in memory, they are streamed to a :class:`VideoEncoder` that encodes the video with ffmpeg
+    in a background thread, and the video files are finalized in the background, :meth:`close` waits for every video to be saved.
+    If the encoder is slower than the environment, at most ``max_queue_size`` frames are queued and ``backpressure``
+    selects if the environment waits for the encoder (``"block"``), or frames are dropped (``"drop"``) or
+    every second frame is dropped (``"downsample"``).
+
     Examples - Run the environment for 50 episodes, and save the video every 10 episodes starting from the 0th:
         >>> import os
         >>> import gymnasium as gym
@@ -232,6 +241,7 @@ class RecordVideo(
 
     Change logs:
      * v0.25.0 - Initially added to replace ``wrappers.monitoring.VideoRecorder``
+     * v1.3.0 - Frames are streamed to a background video encoder, added ``max_queue_size`` and ``backpressure``
     """
 
     def __init__(
@@ -245,6 +255,8 @@ class RecordVideo(
         fps: int | None = None,
         disable_logger: bool = True,
         gc_trigger: Callable[[int], bool] | None = lambda episode: True,
+        max_queue_size: int = 128,
+        backpressure: str = "block",
     ):
         """Wrapper records videos of rollouts.
 
@@ -258,8 +270,10 @@ class RecordVideo(
             name_prefix (str): Will be prepended to the filename of the recordings
             fps (int): The frame per second in the video. Provides a custom video fps for environment, if ``None`` then
                 the environment metadata ``render_fps`` key is used if it exists, otherwise a default value of 30 is used.
-            disable_logger (bool): Whether to disable moviepy logger or not, default it is disabled
+            disable_logger (bool): Whether to disable the message printed when a video is saved or not, default it is disabled
             gc_trigger: Function that accepts an integer and returns ``True`` iff garbage collection should be performed after this episode
+            max_queue_size (int): The maximum number of frames waiting to be encoded
+            backpressure (str): What to do with a frame when the encoder queue is full, options: "block", "drop" or "downsample"
         """
         gym.utils.RecordConstructorArgs.__init__(
             self,
@@ -269,6 +283,8 @@ class RecordVideo(
             video_length=video_length,
             name_prefix=name_prefix,
             disable_logger=disable_logger,
+            max_queue_size=max_queue_size,
+            backpressure=backpressure,
         )
         gym.Wrapper.__init__(self, env)
 
@@ -277,6 +293,14 @@ class RecordVideo(
                 f"Render mode is {env.render_mode}, which is incompatible with RecordVideo.",
                 "Initialize your environment with a render_mode that returns an image, such as rgb_array.",
             )
+        if max_queue_size < 1:
+            raise ValueError(
+                f"Expected `max_queue_size` to be at least 1, actual got {max_queue_size}"
+            )
+        if backpressure not in {"block", "drop", "downsample"}:
+            raise ValueError(
+                f"Unexpected `backpressure`, expected 'block', 'drop' or 'downsample', actual value: {backpressure!r}"
+            )
 
         if episode_trigger is None and step_trigger is None:
             from gymnasium.utils.save_video import capped_cubic_video_schedule
@@ -287,6 +311,8 @@ class RecordVideo(
         self.step_trigger = step_trigger
         self.disable_logger = disable_logger
         self.gc_trigger = gc_trigger
+        self.max_queue_size = max_queue_size
+        self.backpressure = backpressure
 
         self.video_folder = os.path.abspath(video_folder)
         if os.path.isdir(self.video_folder):
@@ -303,7 +329,9 @@ class RecordVideo(
         self._video_name: str | None = None
         self.video_length: int = video_length if video_length != 0 else float("inf")
         self.recording: bool = False
-        self.recorded_frames: list[RenderFrame] = []
+        self.num_recorded_frames: int = 0
+        self.video_encoder: VideoEncoder | None = None
+        self.pending_encoders: list[VideoEncoder] = []
         self.render_history: list[RenderFrame] = []
 
         self.step_id = -1
@@ -330,13 +358,27 @@ class RecordVideo(
             frame = frame[-1]
 
         if isinstance(frame, np.ndarray):
-            self.recorded_frames.append(frame)
+            self._record_frame(frame)
         else:
             self.stop_recording()
             logger.warn(
                 f"Recording stopped: expected type of frame returned by render to be a numpy array, got instead {type(frame)}."
             )
 
+    def _record_frame(self, frame: RenderFrame):
+        if self.video_encoder is None:
+            from gymnasium.utils.save_video import VideoEncoder
+
+            self.video_encoder = VideoEncoder(
+                os.path.join(self.video_folder, f"{self._video_name}.mp4"),
+                self.frames_per_sec,
+                max_queue_size=self.max_queue_size,
+                backpressure=self.backpressure,
+                verbose=not self.disable_logger,
+            )
+        self.video_encoder.write(frame)
+        self.num_recorded_frames += 1
+
     def reset(
         self, *, seed: int | None = None, options: dict[str, Any] | None = None
     ) -> tuple[ObsType, dict[str, Any]]:
@@ -351,7 +393,7 @@ class RecordVideo(
             self.start_recording(f"{self.name_prefix}-episode-{self.episode_id}")
         if self.recording:
             self._capture_frame()
-            if len(self.recorded_frames) > self.video_length:
+            if self.num_recorded_frames > self.video_length:
                 self.stop_recording()
 
         return obs, info
@@ -368,7 +410,7 @@ class RecordVideo(
         if self.recording:
             self._capture_frame()
 
-            if len(self.recorded_frames) > self.video_length:
+            if self.num_recorded_frames > self.video_length:
                 self.stop_recording()
 
         return obs, rew, terminated, truncated, info
@@ -377,7 +419,8 @@ class RecordVideo(
         """Compute the render frames as specified by render_mode attribute during initialization of the environment."""
         render_out = super().render()
         if self.recording and isinstance(render_out, list):
-            self.recorded_frames += render_out
+            for frame in render_out:
+                self._record_frame(frame)
 
         if len(self.render_history) > 0:
             tmp_history = self.render_history
@@ -387,11 +430,15 @@ class RecordVideo(
             return render_out
 
     def close(self):
-        """Closes the wrapper then the video recorder."""
+        """Closes the wrapper then the video recorder, waiting for the videos to be saved."""
         super().close()
         if self.recording:
             self.stop_recording()
 
+        pending_encoders, self.pending_encoders = self.pending_encoders, []
+        for encoder in pending_encoders:
+            encoder.wait()
+
     def start_recording(self, video_name: str):
         """Start a new recording. If it is already recording, stops the current recording before starting the new one."""
         if self.recording:
@@ -401,36 +448,39 @@ class RecordVideo(
         self._video_name = video_name
 
     def stop_recording(self):
-        """Stop current recording and saves the video."""
+        """Stop current recording, the video is saved in the background (see :meth:`close`)."""
         assert self.recording, "stop_recording was called, but no recording was started"
 
-        if len(self.recorded_frames) == 0:
-            logger.warn("Ignored saving a video as there were zero frames to save.")
-        else:
-            try:
-                from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
-            except ImportError as e:
-                raise error.DependencyNotInstalled(
-                    'MoviePy is not installed, run `pip install "gymnasium[other]"`'
-                ) from e
-
-            clip = ImageSequenceClip(self.recorded_frames, fps=self.frames_per_sec)
-            moviepy_logger = None if self.disable_logger else "bar"
-            path = os.path.join(self.video_folder, f"{self._video_name}.mp4")
-            clip.write_videofile(path, logger=moviepy_logger)
-            del clip
-
-        del self.recorded_frames
-        self.recorded_frames = []
+        video_encoder = self.video_encoder
+        self.video_encoder = None
+        self.num_recorded_frames = 0
         self.recording = False
         self._video_name = None
 
+        if video_encoder is None:
+            logger.warn("Ignored saving a video as there were zero frames to save.")
+        else:
+            video_encoder.close()
+            self.pending_encoders.append(video_encoder)
+
+        # The videos already saved are dropped before raising their errors, such that the recorder can continue
+        pending_encoders, self.pending_encoders = self.pending_encoders, []
+        saved_encoders = []
+        for encoder in pending_encoders:
+            if encoder.done:
+                saved_encoders.append(encoder)
+            else:
+                self.pending_encoders.append(encoder)
+
         if self.gc_trigger and self.gc_trigger(self.episode_id):
             gc.collect()
 
+        for encoder in saved_encoders:
+            encoder.wait()
+
     def __del__(self):
         """Warn the user in case last video wasn't saved."""
-        if len(self.recorded_frames) > 0:
+        if getattr(self, "video_encoder", None) is not None:
             logger.warn("Unable to save last video! Did you call close()?")
 
 
@@ -19,8 +19,13 @@ import gymnasium as gym
 import gymnasium.spaces as spaces
 from gymnasium.core import ActType, ObsType, WrapperActType, WrapperObsType
 from gymnasium.spaces import Box, Dict, Tuple
-from gymnasium.vector.utils import batch_space, concatenate, create_empty_array
-from gymnasium.wrappers.utils import RunningMeanStd, create_zero_array
+from gymnasium.vector.utils import (
+    SpacePlan,
+    batch_space,
+    concatenate,
+    create_empty_array,
+)
+from gymnasium.wrappers.utils import FrameBuffer, RunningMeanStd, create_zero_array
 
 
 __all__ = [
@@ -313,7 +318,14 @@ class FrameStackObservation(
      * "zero" - A "zero"-like instance of the observation space
      * custom - An instance of the observation space
 
-    No vector version of the wrapper exists.
+    For observation spaces of NumPy arrays (:class:`Box`, :class:`Discrete`, :class:`MultiDiscrete` and :class:`MultiBinary`
+    spaces, possibly nested in :class:`Dict` and :class:`Tuple` spaces), each observation is written once into a
+    :class:`gymnasium.wrappers.utils.FrameBuffer` whose last ``stack_size`` frames are a contiguous window of the buffer.
+    By default, the window is copied, with ``copy=False`` it is returned as a view that is only overwritten by the second
+    following step (``obs`` and ``next_obs`` never alias), so must be copied to be kept longer (e.g. in a replay buffer).
+    Other observation spaces are stacked with :func:`concatenate`.
+
+    A vector version of the wrapper exists :class:`gymnasium.wrappers.vector.FrameStackObservation`.
 
     Example:
         >>> import gymnasium as gym
@@ -355,6 +367,7 @@ class FrameStackObservation(
      * v0.15.0 - Initially add as ``FrameStack`` with support for lz4
      * v1.0.0 - Rename to ``FrameStackObservation`` and remove lz4 and ``LazyFrame`` support
                 along with adding the ``padding_type`` parameter
+     * v1.3.0 - Stack the observations in a ``FrameBuffer`` and add the ``copy`` parameter
 
     """
 
@@ -364,6 +377,7 @@ class FrameStackObservation(
         stack_size: int,
         *,
         padding_type: str | ObsType = "reset",
+        copy: bool = True,
     ):
         """Observation wrapper that stacks the observations in a rolling manner.
 
@@ -371,9 +385,10 @@ class FrameStackObservation(
             env: The environment to apply the wrapper
             stack_size: The number of frames to stack.
             padding_type: The padding type to use when stacking the observations, options: "reset", "zero", custom obs
+            copy: If to return a copy of the stacked observations rather than a view of the frame buffer.
         """
         gym.utils.RecordConstructorArgs.__init__(
-            self, stack_size=stack_size, padding_type=padding_type
+            self, stack_size=stack_size, padding_type=padding_type, copy=copy
         )
         gym.Wrapper.__init__(self, env)
 
@@ -405,11 +420,21 @@ class FrameStackObservation(
         self.observation_space = batch_space(env.observation_space, n=stack_size)
         self.stack_size: Final[int] = stack_size
         self.padding_type: Final[str] = padding_type
+        self.copy: Final[bool] = copy
 
-        self.obs_queue = deque(
-            [self.padding_value for _ in range(self.stack_size)], maxlen=self.stack_size
-        )
-        self.stacked_obs = create_empty_array(env.observation_space, n=self.stack_size)
+        if SpacePlan(env.observation_space).compiled:
+            self.frame_buffer: FrameBuffer | None = FrameBuffer(
+                env.observation_space, self.stack_size
+            )
+        else:
+            self.frame_buffer = None
+            self.obs_queue = deque(
+                [self.padding_value for _ in range(self.stack_size)],
+                maxlen=self.stack_size,
+            )
+            self.stacked_obs = create_empty_array(
+                env.observation_space, n=self.stack_size
+            )
 
     def step(
         self, action: WrapperActType
@@ -423,8 +448,11 @@ class FrameStackObservation(
             Stacked observations, reward, terminated, truncated, and info from the environment
         """
         obs, reward, terminated, truncated, info = self.env.step(action)
-        self.obs_queue.append(obs)
+        if self.frame_buffer is not None:
+            self.frame_buffer.push(obs)
+            return self._stacked_frames(), reward, terminated, truncated, info
 
+        self.obs_queue.append(obs)
         updated_obs = deepcopy(
             concatenate(self.env.observation_space, self.obs_queue, self.stacked_obs)
         )
@@ -446,6 +474,13 @@ class FrameStackObservation(
 
         if self.padding_type == "reset":
             self.padding_value = obs
+        if self.frame_buffer is not None:
+            # The stacked observations returned as views before the reset are kept in the previous buffer
+            if not self.copy:
+                self.frame_buffer.renew()
+            self.frame_buffer.reset(obs, self.padding_value)
+            return self._stacked_frames(), info
+
         for _ in range(self.stack_size - 1):
             self.obs_queue.append(self.padding_value)
         self.obs_queue.append(obs)
@@ -455,6 +490,10 @@ class FrameStackObservation(
         )
         return updated_obs, info
 
+    def _stacked_frames(self) -> WrapperObsType:
+        stacked = self.frame_buffer.stacked
+        return deepcopy(stacked) if self.copy else stacked
+
 
 class NormalizeObservation(
     gym.ObservationWrapper[WrapperObsType, ActType, ObsType],
@@ -466,6 +505,10 @@ class NormalizeObservation(
     statistics. If ``True`` (default), the ``RunningMeanStd`` will get updated every time ``step`` or ``reset`` is called.
     If ``False``, the calculated statistics are used but not updated anymore; this may be used during evaluation.
 
+    The statistics can be shared by the wrappers of several environments, e.g. the sub-environments of a vector environment,
+    by passing the same ``obs_rms``, see :class:`gymnasium.wrappers.utils.RunningMeanStd` to share it with
+    the workers of :class:`gymnasium.vector.AsyncVectorEnv`.
+
     A vector version of the wrapper exists :class:`gymnasium.wrappers.vector.NormalizeObservation`.
 
     Note:
@@ -496,14 +539,21 @@ class NormalizeObservation(
      * v0.21.0 - Initially add
      * v1.0.0 - Add `update_running_mean` attribute to allow disabling of updating the running mean / standard, particularly useful for evaluation time.
         Casts all observations to `np.float32` and sets the observation space with low/high of `-np.inf` and `np.inf` and dtype as `np.float32`
+     * v1.3.0 - Add `obs_rms` to share the running statistics, the statistics are updated in-place
     """
 
-    def __init__(self, env: gym.Env[ObsType, ActType], epsilon: float = 1e-8):
+    def __init__(
+        self,
+        env: gym.Env[ObsType, ActType],
+        epsilon: float = 1e-8,
+        obs_rms: RunningMeanStd | None = None,
+    ):
         """This wrapper will normalize observations such that each observation is centered with unit variance.
 
         Args:
             env (Env): The environment to apply the wrapper
             epsilon: A stability parameter that is used when scaling the observations.
+            obs_rms: The running statistics of the observations, if ``None`` then new statistics are created.
         """
         gym.utils.RecordConstructorArgs.__init__(self, epsilon=epsilon)
         gym.ObservationWrapper.__init__(self, env)
@@ -516,9 +566,15 @@ class NormalizeObservation(
             dtype=np.float32,
         )
 
-        self.obs_rms = RunningMeanStd(
-            shape=self.observation_space.shape, dtype=self.observation_space.dtype
-        )
+        if obs_rms is None:
+            obs_rms = RunningMeanStd(
+                shape=self.observation_space.shape, dtype=self.observation_space.dtype
+            )
+        elif obs_rms.shape != self.observation_space.shape:
+            raise ValueError(
+                f"Expected the shape of `obs_rms` to be the observation shape {self.observation_space.shape}, actual shape: {obs_rms.shape}"
+            )
+        self.obs_rms = obs_rms
         self.epsilon = epsilon
         self._update_running_mean = True
 
@@ -535,10 +591,8 @@ class NormalizeObservation(
     def observation(self, observation: ObsType) -> WrapperObsType:
         """Normalises the observation using the running mean and variance of the observations."""
         if self._update_running_mean:
-            self.obs_rms.update(np.array([observation]))
-        return np.float32(
-            (observation - self.obs_rms.mean) / np.sqrt(self.obs_rms.var + self.epsilon)
-        )
+            self.obs_rms.update_from_moments(observation, 0.0, 1)
+        return self.obs_rms.normalize(observation, self.epsilon, dtype=np.float32)
 
 
 class MaxAndSkipObservation(
@@ -72,6 +72,7 @@ class NormalizeReward(
     Change logs:
      * v0.21.0 - Initially added
      * v1.0.0 - Add `update_running_mean` attribute to allow disabling of updating the running mean / standard
+     * v1.3.0 - Add `return_rms` to share the running statistics, the statistics are updated in-place
     """
 
     def __init__(
@@ -79,6 +80,7 @@ class NormalizeReward(
         env: gym.Env[ObsType, ActType],
         gamma: float = 0.99,
         epsilon: float = 1e-8,
+        return_rms: RunningMeanStd | None = None,
     ):
         """This wrapper will normalize immediate rewards s.t. their exponential moving average has an approximately fixed variance.
 
@@ -86,11 +88,13 @@ class NormalizeReward(
             env (env): The environment to apply the wrapper
             epsilon (float): A stability parameter
             gamma (float): The discount factor that is used in the exponential moving average.
+            return_rms: The running statistics of the discounted rewards, if ``None`` then new statistics are created.
+                Sharing the statistics between environments, see :class:`gymnasium.wrappers.utils.RunningMeanStd`.
         """
         gym.utils.RecordConstructorArgs.__init__(self, gamma=gamma, epsilon=epsilon)
         gym.Wrapper.__init__(self, env)
 
-        self.return_rms = RunningMeanStd(shape=())
+        self.return_rms = RunningMeanStd(shape=()) if return_rms is None else return_rms
         self.discounted_reward = np.array([0.0])
         self.gamma = gamma
         self.epsilon = epsilon
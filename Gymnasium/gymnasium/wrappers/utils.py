@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import multiprocessing.context
+import multiprocessing.heap
 from collections.abc import Callable
+from contextlib import nullcontext
 from functools import singledispatch
+from multiprocessing.reduction import ForkingPickler
+from typing import Any
 
 import numpy as np
 
@@ -23,33 +29,181 @@ from gymnasium.spaces import (
     Tuple,
 )
 from gymnasium.spaces.space import T_cov
+from gymnasium.vector.utils import batch_space, create_empty_array
 
 
-__all__ = ["RunningMeanStd", "update_mean_var_count_from_moments", "create_zero_array"]
+__all__ = [
+    "RunningMeanStd",
+    "update_mean_var_count_from_moments",
+    "create_zero_array",
+    "FrameBuffer",
+]
 
 
 class RunningMeanStd:
-    """Tracks the mean, variance and count of values."""
+    """Tracks the mean, variance and count of values, updating the statistics in-place.
+
+    The statistics can be shared by several wrappers, e.g. every sub-environment of a vector environment, with
+    ``shared=True`` they are allocated in shared memory such that the wrappers of :class:`AsyncVectorEnv` workers
+    update the same statistics (the statistics must be created, with the ``context`` of the vector environment,
+    before the workers are started, e.g. captured by the environment functions). Statistics of distributed workers can be combined with :meth:`merge` and
+    :meth:`freeze` returns a copy that can't be updated, e.g. to normalize at inference.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.wrappers.utils import RunningMeanStd
+        >>> rms, worker_rms = RunningMeanStd(shape=(2,)), RunningMeanStd(shape=(2,))
+        >>> rms.update(np.array([[0.0, 1.0], [2.0, 3.0]]))
+        >>> worker_rms.update(np.array([[4.0, 5.0]]))
+        >>> rms.merge(worker_rms)
+        >>> rms.mean.round(3), rms.var.round(3)
+        (array([2., 3.]), array([2.667, 2.667]))
+    """
 
     # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm
-    def __init__(self, epsilon=1e-4, shape=(), dtype=np.float64):
-        """Tracks the mean, variance and count of values."""
-        self.mean = np.zeros(shape, dtype=dtype)
-        self.var = np.ones(shape, dtype=dtype)
-        self.count = epsilon
+    def __init__(
+        self,
+        epsilon=1e-4,
+        shape=(),
+        dtype=np.float64,
+        shared: bool = False,
+        context: str | None = None,
+    ):
+        """Tracks the mean, variance and count of values.
+
+        Args:
+            epsilon: The initial count of the statistics
+            shape: The shape of the values
+            dtype: The dtype of the mean and variance, if not a floating dtype then ``np.float64`` is used
+            shared: If to allocate the statistics in shared memory, updates are then synchronized with a lock
+            context: The :mod:`multiprocessing` context of the shared memory, if ``None`` then the default context is used
+        """
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.float64
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.frozen = False
+
+        if shared:
+            # A dedicated arena, such that its file descriptor is only passed once to a spawned worker
+            # with the shared memory of the vector environment that is allocated in the default heap
+            ctx = multiprocessing.get_context(context)
+            arena = multiprocessing.heap.Arena(
+                8 + 2 * self.dtype.itemsize * int(np.prod(self.shape))
+            )
+            self._shared_memory: tuple[Any, multiprocessing.heap.Arena] | None = (
+                ctx.Lock(),
+                arena,
+            )
+            self._create_views()
+        else:
+            self._shared_memory = None
+            self._lock = nullcontext()
+            self.mean = np.zeros(self.shape, dtype=self.dtype)
+            self._count = np.zeros((), dtype=np.float64)
+            self.var = np.zeros(self.shape, dtype=self.dtype)
+        self.var.fill(1)
+        self._count.fill(epsilon)
+
+    @property
+    def count(self) -> float:
+        """The number of values, including the initial ``epsilon``."""
+        return float(self._count)
+
+    @count.setter
+    def count(self, count: float):
+        """Sets the number of values."""
+        self._count.fill(count)
+
+    @property
+    def shared(self) -> bool:
+        """If the statistics are allocated in shared memory."""
+        return self._shared_memory is not None
 
     def update(self, x):
         """Updates the mean, var and count from a batch of samples."""
-        batch_mean = np.mean(x, axis=0)
-        batch_var = np.var(x, axis=0)
-        batch_count = x.shape[0]
-        self.update_from_moments(batch_mean, batch_var, batch_count)
+        x = np.asarray(x)
+        if x.shape[0] == 1:
+            self.update_from_moments(x[0], 0.0, 1)
+        else:
+            self.update_from_moments(np.mean(x, axis=0), np.var(x, axis=0), x.shape[0])
 
     def update_from_moments(self, batch_mean, batch_var, batch_count):
         """Updates from batch mean, variance and count moments."""
-        self.mean, self.var, self.count = update_mean_var_count_from_moments(
-            self.mean, self.var, self.count, batch_mean, batch_var, batch_count
+        if self.frozen:
+            raise ValueError("Cannot update frozen running mean std statistics.")
+
+        with self._lock:
+            count = float(self._count)
+            delta = batch_mean - self.mean
+            tot_count = count + batch_count
+
+            # Computes `update_mean_var_count_from_moments` in-place
+            self.var *= count
+            self.var += batch_var * batch_count
+            self.var += np.square(delta) * count * batch_count / tot_count
+            self.var /= tot_count
+            self.mean += delta * batch_count / tot_count
+            self._count.fill(tot_count)
+
+    def merge(self, other: RunningMeanStd):
+        """Merges the statistics of ``other``, e.g. of another worker, as if its values were used to update these statistics."""
+        with other._lock:
+            mean, var, count = other.mean.copy(), other.var.copy(), other.count
+        self.update_from_moments(mean, var, count)
+
+    def normalize(self, x, epsilon: float = 1e-8, dtype=None) -> np.ndarray:
+        """Normalizes ``x`` to be centered at the mean with unit variance, computed in ``dtype`` (by default, the dtype of the statistics)."""
+        dtype = self.dtype if dtype is None else dtype
+        normalized = np.subtract(x, self.mean, dtype=dtype)
+        normalized /= np.sqrt(self.var + epsilon, dtype=dtype)
+        return normalized
+
+    def freeze(self) -> RunningMeanStd:
+        """Returns a (not shared) copy of the statistics that raises an error if updated, e.g. to export for inference."""
+        frozen = RunningMeanStd(shape=self.shape, dtype=self.dtype)
+        with self._lock:
+            frozen.mean[...] = self.mean
+            frozen.var[...] = self.var
+            frozen.count = self.count
+        frozen.frozen = True
+        return frozen
+
+    def _create_views(self):
+        self._lock, arena = self._shared_memory
+        size = int(np.prod(self.shape))
+        self._count = np.frombuffer(arena.buffer, dtype=np.float64, count=1).reshape(())
+        moments = np.frombuffer(
+            arena.buffer, dtype=self.dtype, count=2 * size, offset=8
         )
+        self.mean = moments[:size].reshape(self.shape)
+        self.var = moments[size:].reshape(self.shape)
+        self._pickled_shared_memory = (None, b"")
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the state to pickle, the shared memory can only be pickled when starting a process."""
+        state = self.__dict__.copy()
+        if self._shared_memory is not None:
+            for name in ("mean", "var", "_count", "_lock", "_pickled_shared_memory"):
+                del state[name]
+
+            # The environment functions of `AsyncVectorEnv` are pickled with cloudpickle that can't pickle
+            # the shared memory, it is pickled once per spawned process (each pickle duplicates the arena file descriptor)
+            popen = multiprocessing.context.get_spawning_popen()
+            if popen is None or self._pickled_shared_memory[0] is not popen:
+                self._pickled_shared_memory = (
+                    popen,
+                    bytes(ForkingPickler.dumps(self._shared_memory)),
+                )
+            state["_shared_memory"] = self._pickled_shared_memory[1]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restores the state, creating the views of the shared memory."""
+        self.__dict__.update(state)
+        if self._shared_memory is not None:
+            self._shared_memory = ForkingPickler.loads(self._shared_memory)
+            self._create_views()
 
 
 def update_mean_var_count_from_moments(
@@ -69,6 +223,144 @@ def update_mean_var_count_from_moments(
     return new_mean, new_var, new_count
 
 
+class FrameBuffer:
+    """A ring buffer of frames whose last ``stack_size`` frames are a contiguous window (view) of the buffer.
+
+    The frames of a space are written in turn into a preallocated buffer of ``2 * stack_size`` frames (created with
+    :func:`create_empty_array`), once it is full the last ``stack_size - 1`` frames are moved to its start.
+    Each push therefore writes a single frame (plus the occasional move), rather than concatenating all the stacked frames.
+    With ``num_envs``, the frames of every sub-environment are stacked in one buffer of shape ``(num_envs, 2 * stack_size, ...)``.
+
+    The stacked frames returned by :attr:`stacked` are only modified by the second following :meth:`push`, or by :meth:`reset`
+    unless :meth:`renew` is called first. :meth:`renew` alternates between the buffer and a preallocated spare buffer,
+    such that it only overwrites the stacked frames returned before the previous :meth:`renew`. Only spaces of NumPy arrays are supported, (nested) :class:`Dict` and :class:`Tuple` spaces
+    of :class:`Box`, :class:`Discrete`, :class:`MultiDiscrete` and :class:`MultiBinary` spaces.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.spaces import Box
+        >>> from gymnasium.wrappers.utils import FrameBuffer
+        >>> frames = FrameBuffer(Box(0, 10, shape=(2,), dtype=np.int64), stack_size=3)
+        >>> frames.reset(np.array([1, 1]), padding=np.array([0, 0]))
+        >>> frames.push(np.array([2, 2]))
+        >>> frames.stacked
+        array([[0, 0],
+               [1, 1],
+               [2, 2]])
+    """
+
+    def __init__(self, space: Space, stack_size: int, num_envs: int | None = None):
+        """Allocates the frame buffer.
+
+        Args:
+            space: The space of a frame, the single observation space for ``num_envs``
+            stack_size: The number of stacked frames
+            num_envs: If set, the number of sub-environments whose frames are stacked, each frame is then a batch
+        """
+        self.space = space
+        self.stack_size = stack_size
+        self.num_envs = num_envs
+
+        self.buffer = self._create_buffer()
+        # The buffer that the stacked frames are moved to by `renew`, allocated by its first call
+        self._spare_buffer = None
+        # The index of the newest frame in the buffer
+        self.end = stack_size - 1
+
+    @property
+    def stacked(self) -> Any:
+        """The last ``stack_size`` frames, views of the buffer."""
+        window = self._index(slice(self.end - self.stack_size + 1, self.end + 1))
+        return _map_leaves(lambda leaf: leaf[window], self.buffer)
+
+    def push(self, frame: Any):
+        """Appends the frame (or batch of frames for ``num_envs``) to the stacked frames, dropping the oldest frame."""
+        if self.end + 1 == 2 * self.stack_size:
+            last = self._index(slice(self.stack_size + 1, 2 * self.stack_size))
+            start = self._index(slice(0, self.stack_size - 1))
+
+            def _move(leaf: np.ndarray):
+                leaf[start] = leaf[last]
+
+            _map_leaves(_move, self.buffer)
+            self.end = self.stack_size - 2
+
+        self.end += 1
+        newest = self._index(self.end)
+
+        def _push(leaf: np.ndarray, value: Any):
+            leaf[newest] = value
+
+        _map_leaves(_push, self.buffer, frame)
+
+    def reset(self, frame: Any, padding: Any, mask: np.ndarray | None = None):
+        """Overwrites the stacked frames with ``stack_size - 1`` frames of ``padding`` followed by ``frame``.
+
+        Args:
+            frame: The newest frame, a batch of frames for ``num_envs``
+            padding: The frame repeated before ``frame``, a batch of frames for ``num_envs``
+            mask: For ``num_envs``, the sub-environments to reset, by default every sub-environment
+        """
+        rows = slice(None) if mask is None else mask
+        older = self._index(slice(self.end - self.stack_size + 1, self.end), rows)
+        newest = self._index(self.end, rows)
+
+        def _reset(leaf: np.ndarray, value: Any, pad: Any):
+            if self.num_envs is None:
+                leaf[older] = pad
+                leaf[newest] = value
+            else:
+                leaf[older] = np.expand_dims(np.asarray(pad)[rows], 1)
+                leaf[newest] = np.asarray(value)[rows]
+
+        _map_leaves(_reset, self.buffer, frame, padding)
+
+    def renew(self):
+        """Moves the stacked frames to the spare buffer, so the stacked frames returned since the previous :meth:`renew` are not modified.
+
+        The current buffer becomes the spare buffer, no buffer is allocated after the first call.
+        """
+        stacked = self.stacked
+        if self._spare_buffer is None:
+            self._spare_buffer = self._create_buffer()
+        self.buffer, self._spare_buffer = self._spare_buffer, self.buffer
+        self.end = self.stack_size - 1
+        window = self._index(slice(0, self.stack_size))
+
+        def _copy(leaf: np.ndarray, value: np.ndarray):
+            leaf[window] = value
+
+        _map_leaves(_copy, self.buffer, stacked)
+
+    def _create_buffer(self) -> Any:
+        if self.num_envs is None:
+            return create_empty_array(self.space, n=2 * self.stack_size, fn=np.zeros)
+        return create_empty_array(
+            batch_space(self.space, n=2 * self.stack_size),
+            n=self.num_envs,
+            fn=np.zeros,
+        )
+
+    def _index(self, frames: int | slice, rows: Any = slice(None)) -> Any:
+        """The index of ``frames`` in the frame axis (the second axis for ``num_envs``, of the ``rows`` sub-environments)."""
+        return frames if self.num_envs is None else (rows, frames)
+
+
+def _map_leaves(fn: Callable[..., Any], tree: Any, *others: Any) -> Any:
+    """Applies ``fn`` to each leaf of a nested dict or tuple together with the matching leaves of ``others``."""
+    if isinstance(tree, dict):
+        return {
+            key: _map_leaves(fn, value, *(other[key] for other in others))
+            for key, value in tree.items()
+        }
+    elif isinstance(tree, tuple):
+        return tuple(
+            _map_leaves(fn, value, *(other[i] for other in others))
+            for i, value in enumerate(tree)
+        )
+    return fn(tree, *others)
+
+
 @singledispatch
 def create_zero_array(space: Space[T_cov]) -> T_cov:
     """Creates a zero-based array of a space, this is similar to ``create_empty_array`` except all arrays are valid samples from the space.
@@ -3,10 +3,14 @@
 # pyright: reportUnsupportedDunderAll=false
 import importlib
 
+from gymnasium.wrappers.vector.atari_preprocessing import AtariPreprocessing
 from gymnasium.wrappers.vector.common import RecordEpisodeStatistics
 from gymnasium.wrappers.vector.dict_info_to_list import DictInfoToList
 from gymnasium.wrappers.vector.rendering import HumanRendering, RecordVideo
-from gymnasium.wrappers.vector.stateful_observation import NormalizeObservation
+from gymnasium.wrappers.vector.stateful_observation import (
+    FrameStackObservation,
+    NormalizeObservation,
+)
 from gymnasium.wrappers.vector.stateful_reward import NormalizeReward
 from gymnasium.wrappers.vector.vectorize_action import (
     ClipAction,
@@ -39,6 +43,7 @@ __all__ = [
     "VectorizeTransformReward",
     "DictInfoToList",
     # --- Observation wrappers ---
+    "AtariPreprocessing",
     "TransformObservation",
     "FilterObservation",
     "FlattenObservation",
@@ -50,7 +55,7 @@ __all__ = [
     "NormalizeObservation",
     # "RenderObservation",
     # "TimeAwareObservation",
-    # "FrameStackObservation",
+    "FrameStackObservation",
     # "DelayObservation",
     # --- Action Wrappers ---
     "TransformAction",
@@ -0,0 +1,252 @@
+"""Implementation of the Atari 2600 Preprocessing for vector environments, preprocessing the batch of frames."""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Any
+
+import numpy as np
+
+import gymnasium as gym
+from gymnasium.core import ObsType
+from gymnasium.error import DependencyNotInstalled
+from gymnasium.spaces import Box
+from gymnasium.vector import VectorEnv, VectorObservationWrapper
+from gymnasium.vector.utils import batch_space
+
+
+__all__ = ["AtariPreprocessing"]
+
+
+class AtariPreprocessing(VectorObservationWrapper, gym.utils.RecordConstructorArgs):
+    """Implements the common preprocessing techniques for Atari environments as a batch, see :class:`gymnasium.wrappers.AtariPreprocessing`.
+
+    Every sub-environment must be wrapped with ``AtariPreprocessing(env, raw_frames=True)``, such that the noop reset,
+    frame skipping, termination on life loss and grayscale (from the ALE screen) are applied by the sub-environments,
+    which return the last two frames of the frame skip. This wrapper then preprocesses the batch of frames with
+    vectorized kernels in preallocated buffers:
+
+    - Max-pooling: Pools over the last two frames of every sub-environment with a single ``np.maximum``.
+    - Resize: Resizes the pooled frames with ``cv2.resize``. If the frame height is a (dyadic) multiple of the screen height,
+      e.g. 210 to 84, then the frames are stacked vertically and resized with a single call, as the interpolation
+      coefficients of every frame are then the same as resizing it alone. Otherwise, each frame is resized into the batch buffer.
+    - Scale observation: Scales the batch between [0, 1), not scaled by default.
+
+    The observations are identical to the observations of :class:`gymnasium.wrappers.AtariPreprocessing`
+    with the same parameters. ``noop_max`` and ``terminal_on_life_loss`` can be set for every sub-environment
+    with an array (or a mask), which is set on the ``AtariPreprocessing`` of the sub-environments.
+
+    Example:
+        >>> import numpy as np
+        >>> import gymnasium as gym
+        >>> import ale_py
+        >>> gym.register_envs(ale_py)
+        >>> envs = gym.make_vec(
+        ...     "ALE/Pong-v5", num_envs=4, vectorization_mode="async", frameskip=1,
+        ...     wrappers=[lambda env: gym.wrappers.AtariPreprocessing(env, raw_frames=True)],
+        ... )
+        >>> envs.single_observation_space
+        Box(0, 255, (2, 210, 160), uint8)
+        >>> envs = AtariPreprocessing(
+        ...     envs, screen_size=84, noop_max=np.array([30, 30, 0, 0]),
+        ...     terminal_on_life_loss=np.array([True, False, True, False]),
+        ... )
+        >>> envs.single_observation_space
+        Box(0, 255, (84, 84), uint8)
+        >>> obs, info = envs.reset(seed=123)
+        >>> obs.shape
+        (4, 84, 84)
+        >>> envs.close()
+
+    Change logs:
+     * v1.3.0 - Initially added
+    """
+
+    def __init__(
+        self,
+        env: VectorEnv,
+        screen_size: int | tuple[int, int] = 84,
+        grayscale_newaxis: bool = False,
+        scale_obs: bool = False,
+        noop_max: int | np.ndarray | None = None,
+        terminal_on_life_loss: bool | np.ndarray | None = None,
+        copy: bool = True,
+    ):
+        """Wrapper for Atari 2600 preprocessing of the batched raw frames.
+
+        Args:
+            env: The vector environment whose sub-environments are wrapped with ``AtariPreprocessing(env, raw_frames=True)``
+            screen_size: resize Atari frame.
+            grayscale_newaxis: if True and the frames are grayscale, then a channel axis is added to the grayscale
+                observations to make them 3-dimensional.
+            scale_obs: if True, then observation normalized in range [0,1) is returned.
+            noop_max: For No-op reset, the max number no-ops actions are taken at reset for every sub-environment (an int
+                or an array of ``num_envs``), if ``None`` then the ``noop_max`` of the sub-environments is kept.
+            terminal_on_life_loss: if True, then :meth:`step()` returns `terminated=True` whenever a life is lost,
+                for every sub-environment (a bool or a mask of ``num_envs``), if ``None`` then the sub-environments are kept.
+            copy: If to return a new array of observations, otherwise the preallocated output buffer is returned,
+                that is overwritten by the next :meth:`step` and :meth:`reset`.
+
+        Raises:
+            DependencyNotInstalled: opencv-python package not installed
+            ValueError: If the sub-environment observations are not the raw frames of ``AtariPreprocessing``,
+                or ``noop_max`` or ``terminal_on_life_loss`` are not a scalar or an array of ``num_envs``.
+        """
+        gym.utils.RecordConstructorArgs.__init__(
+            self,
+            screen_size=screen_size,
+            grayscale_newaxis=grayscale_newaxis,
+            scale_obs=scale_obs,
+            noop_max=noop_max,
+            terminal_on_life_loss=terminal_on_life_loss,
+            copy=copy,
+        )
+        VectorObservationWrapper.__init__(self, env)
+
+        try:
+            import cv2  # noqa: F401
+        except ImportError:
+            raise DependencyNotInstalled(
+                'opencv-python package not installed, run `pip install "gymnasium[other]"` to get dependencies for atari'
+            )
+
+        assert (isinstance(screen_size, int) and screen_size > 0) or (
+            isinstance(screen_size, tuple)
+            and len(screen_size) == 2
+            and all(isinstance(size, int) and size > 0 for size in screen_size)
+        ), f"Expect the `screen_size` to be positive, actually: {screen_size}"
+
+        frames_space = self.env.single_observation_space
+        if (
+            not isinstance(frames_space, Box)
+            or frames_space.dtype != np.uint8
+            or len(frames_space.shape) not in {3, 4}
+            or frames_space.shape[0] != 2
+            or (len(frames_space.shape) == 4 and frames_space.shape[-1] != 3)
+        ):
+            raise ValueError(
+                f"Expected the sub-environments to be `AtariPreprocessing(env, raw_frames=True)` with observations of shape (2, height, width) or (2, height, width, 3), actual observation space: {frames_space}"
+            )
+
+        if noop_max is not None:
+            noop_max = self._sub_env_array("noop_max", noop_max, np.int64)
+            if np.any(noop_max < 0):
+                raise ValueError(
+                    f"Expected `noop_max` to be at least 0, actual got {noop_max}"
+                )
+            if np.any(noop_max > 0):
+                assert all(
+                    meanings[0] == "NOOP"
+                    for meanings in self.env.call("get_action_meanings")
+                )
+            self.env.set_attr("noop_max", [int(noops) for noops in noop_max])
+        if terminal_on_life_loss is not None:
+            terminal_on_life_loss = self._sub_env_array(
+                "terminal_on_life_loss", terminal_on_life_loss, np.bool_
+            )
+            self.env.set_attr(
+                "terminal_on_life_loss",
+                [bool(life_loss) for life_loss in terminal_on_life_loss],
+            )
+
+        self.noop_max = noop_max
+        self.terminal_on_life_loss = terminal_on_life_loss
+        self.screen_size: tuple[int, int] = (
+            screen_size
+            if isinstance(screen_size, tuple)
+            else (screen_size, screen_size)
+        )
+        self.grayscale_obs = len(frames_space.shape) == 3
+        self.grayscale_newaxis = grayscale_newaxis
+        self.scale_obs = scale_obs
+        self.copy = copy
+
+        frame_shape = frames_space.shape[1:]
+        frame_height, frame_width = frame_shape[:2]
+        screen_width, screen_height = self.screen_size
+        resized_shape = (screen_height, screen_width) + frame_shape[2:]
+
+        self._pooled = np.empty((self.num_envs,) + frame_shape, dtype=np.uint8)
+        self._resized = np.empty((self.num_envs,) + resized_shape, dtype=np.uint8)
+        self._scaled = (
+            np.empty((self.num_envs,) + resized_shape, dtype=np.float32)
+            if scale_obs
+            else None
+        )
+
+        # Resizing the vertically stacked frames is equivalent to resizing each frame if the coefficients of each frame
+        #   are computed exactly, i.e. the area interpolation is used (downscaling) and the scale (as computed by OpenCV)
+        #   is the exact ratio of the heights, then the row positions of every frame are exact multiples of the scale.
+        self._stacked_resize = (
+            frame_height >= screen_height
+            and frame_width >= screen_width
+            and Fraction(1 / (screen_height / frame_height))
+            == Fraction(frame_height, screen_height)
+        )
+
+        _low, _high, _dtype = (0, 1, np.float32) if scale_obs else (0, 255, np.uint8)
+        _shape = resized_shape
+        if self.grayscale_obs and grayscale_newaxis:
+            _shape = _shape + (1,)  # Add channel axis
+        self.single_observation_space = Box(
+            low=_low, high=_high, shape=_shape, dtype=_dtype
+        )
+        self.observation_space = batch_space(
+            self.single_observation_space, self.num_envs
+        )
+
+    def _sub_env_array(self, name: str, value: Any, dtype: type) -> np.ndarray:
+        """Returns the value for every sub-environment as an array of ``num_envs``."""
+        array = np.asarray(value, dtype=dtype)
+        if array.ndim == 0:
+            return np.full(self.num_envs, array)
+        elif array.shape != (self.num_envs,):
+            raise ValueError(
+                f"Expected `{name}` to be a scalar or an array of shape ({self.num_envs},), actual shape: {array.shape}"
+            )
+        return array
+
+    def observations(self, observations: ObsType) -> ObsType:
+        """Max-pools, resizes and scales the batch of raw frames.
+
+        Args:
+            observations: The last two frames of every sub-environment
+
+        Returns:
+            The preprocessed observations
+        """
+        import cv2
+
+        np.maximum(observations[:, 0], observations[:, 1], out=self._pooled)
+
+        if self.copy and not self.scale_obs:
+            resized = np.empty_like(self._resized)
+        else:
+            resized = self._resized
+
+        screen_width, screen_height = self.screen_size
+        if self._stacked_resize:
+            cv2.resize(
+                self._pooled.reshape((-1,) + self._pooled.shape[2:]),
+                (screen_width, screen_height * self.num_envs),
+                dst=resized.reshape((-1,) + resized.shape[2:]),
+                interpolation=cv2.INTER_AREA,
+            )
+        else:
+            for frame, resized_frame in zip(self._pooled, resized):
+                cv2.resize(
+                    frame,
+                    self.screen_size,
+                    dst=resized_frame,
+                    interpolation=cv2.INTER_AREA,
+                )
+
+        if self.scale_obs:
+            obs = np.empty_like(self._scaled) if self.copy else self._scaled
+            np.divide(resized, 255.0, out=obs, dtype=np.float32)
+        else:
+            obs = resized
+
+        if self.grayscale_obs and self.grayscale_newaxis:
+            obs = obs[..., np.newaxis]  # Add a channel axis
+        return obs
@@ -4,9 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
-import numpy as np
-
 from gymnasium.core import ActType, ObsType
+from gymnasium.vector.utils import unbatch_info
 from gymnasium.vector.vector_env import ArrayType, VectorEnv, VectorWrapper
 
 
@@ -111,48 +110,4 @@ class DictInfoToList(VectorWrapper):
         Returns:
             list_info (list): converted info.
         """
-        list_info = [{} for _ in range(self.num_envs)]
-
-        for key, value in vector_infos.items():
-            if key.startswith("_"):
-                continue
-
-            binary_key = f"_{key}"
-            if isinstance(value, dict):
-                value_list_info = self._convert_info_to_list(value)
-                assert (
-                    len(value_list_info) == self.num_envs
-                ), f"Expects {value_list_info} to have length equal to the num-envs ({self.num_envs}), actual length is {len(value_list_info)}"
-
-                if binary_key in vector_infos:
-                    assert (
-                        len(vector_infos[binary_key]) == self.num_envs
-                    ), f"Expects {vector_infos[binary_key]} to have length equal to the num-envs ({self.num_envs}), actual length is {len(vector_infos[binary_key])}"
-
-                    for env_num, (env_info, has_info) in enumerate(
-                        zip(value_list_info, vector_infos[binary_key])
-                    ):
-                        if has_info:
-                            list_info[env_num][key] = env_info
-                else:
-                    for env_num, sub_value in enumerate(value_list_info):
-                        list_info[env_num][key] = sub_value
-            else:
-                assert isinstance(value, np.ndarray)
-                assert (
-                    len(value) == self.num_envs
-                ), f"Expects {value} to have length equal to the num-envs ({self.num_envs}), actual length is {len(value)}"
-
-                if binary_key in vector_infos:
-                    assert (
-                        len(vector_infos[binary_key]) == self.num_envs
-                    ), f"Expects {vector_infos[binary_key]} to have length equal to the num-envs ({self.num_envs}), actual length is {len(vector_infos[binary_key])}"
-
-                    for env_num, has_info in enumerate(vector_infos[binary_key]):
-                        if has_info:
-                            list_info[env_num][key] = value[env_num]
-                else:
-                    for env_num, sub_value in enumerate(value):
-                        list_info[env_num][key] = sub_value
-
-        return list_info
+        return unbatch_info(vector_infos, self.num_envs)
@@ -6,7 +6,7 @@ import gc
 import os
 from collections.abc import Callable, Sequence
 from copy import deepcopy
-from typing import Any, SupportsFloat
+from typing import TYPE_CHECKING, Any, SupportsFloat
 
 import numpy as np
 
@@ -19,6 +19,10 @@ from gymnasium.vector import VectorEnv, VectorWrapper
 from gymnasium.vector.vector_env import ArrayType
 
 
+if TYPE_CHECKING:
+    from gymnasium.utils.save_video import VideoEncoder
+
+
 class HumanRendering(VectorWrapper, gym.utils.RecordConstructorArgs):
     """Adds support for Human-based Rendering for Vector-based environments."""
 
@@ -201,6 +205,8 @@ class RecordVideo(
     expects multiple frames when rendering the environment (one for each
     environment of the VectorEnv). Frames are concatenated into one frame such
     that its aspect ratio is as close as possible to the desired one.
+    As for the single environment wrapper, the frames are streamed to a background video encoder,
+    see ``max_queue_size`` and ``backpressure``.
 
     Examples - Run 5 environments for 200 timesteps, and save the video every 5 episodes:
     >>> import os
@@ -236,6 +242,8 @@ class RecordVideo(
         fps: int | None = None,
         disable_logger: bool = True,
         gc_trigger: Callable[[int], bool] | None = lambda episode: True,
+        max_queue_size: int = 128,
+        backpressure: str = "block",
     ):
         """Wrapper records videos of environment rollouts.
 
@@ -252,8 +260,10 @@ class RecordVideo(
             name_prefix (str): Will be prepended to the filename of the recordings
             fps (int): The frame per second in the video. Provides a custom video fps for environment, if ``None`` then
                 the environment metadata ``render_fps`` key is used if it exists, otherwise a default value of 30 is used.
-            disable_logger (bool): Whether to disable moviepy logger or not, default it is disabled
+            disable_logger (bool): Whether to disable the message printed when a video is saved or not, default it is disabled
             gc_trigger: Function that accepts an integer and returns ``True`` iff garbage collection should be performed after this episode
+            max_queue_size (int): The maximum number of frames waiting to be encoded
+            backpressure (str): What to do with a frame when the encoder queue is full, options: "block", "drop" or "downsample"
 
         Note:
             For vector environments that use same-step autoreset (see https://farama.org/Vector-Autoreset-Mode for more details)
@@ -268,6 +278,8 @@ class RecordVideo(
             video_length=video_length,
             name_prefix=name_prefix,
             disable_logger=disable_logger,
+            max_queue_size=max_queue_size,
+            backpressure=backpressure,
         )
 
         if env.render_mode in {None, "human", "ansi"}:
@@ -275,6 +287,14 @@ class RecordVideo(
                 f"Render mode is {env.render_mode}, which is incompatible with RecordVideo.",
                 "Initialize your environment with a render_mode that returns an image, such as rgb_array.",
             )
+        if max_queue_size < 1:
+            raise ValueError(
+                f"Expected `max_queue_size` to be at least 1, actual got {max_queue_size}"
+            )
+        if backpressure not in {"block", "drop", "downsample"}:
+            raise ValueError(
+                f"Unexpected `backpressure`, expected 'block', 'drop' or 'downsample', actual value: {backpressure!r}"
+            )
 
         if episode_trigger is None and step_trigger is None:
             from gymnasium.utils.save_video import capped_cubic_video_schedule
@@ -299,6 +319,8 @@ class RecordVideo(
         self.step_trigger = step_trigger
         self.disable_logger = disable_logger
         self.gc_trigger = gc_trigger
+        self.max_queue_size = max_queue_size
+        self.backpressure = backpressure
 
         self.record_first_only = record_first_only
         self.video_aspect_ratio = video_aspect_ratio
@@ -320,7 +342,9 @@ class RecordVideo(
         self._video_name: str | None = None
         self.video_length: int = video_length if video_length != 0 else float("inf")
         self.recording: bool = False
-        self.recorded_frames: list[np.ndarray] = []
+        self.num_recorded_frames: int = 0
+        self.video_encoder: VideoEncoder | None = None
+        self.pending_encoders: list[VideoEncoder] = []
         self.render_history: list[np.ndarray] = []
 
         self.step_id = -1
@@ -382,7 +406,21 @@ class RecordVideo(
             self._get_concat_frame_shape(n_frames, h, w)
 
         concatenated_envs_frame = self._concat_frames(envs_frame)
-        self.recorded_frames.append(concatenated_envs_frame)
+        self._record_frame(concatenated_envs_frame)
+
+    def _record_frame(self, frame: np.ndarray):
+        if self.video_encoder is None:
+            from gymnasium.utils.save_video import VideoEncoder
+
+            self.video_encoder = VideoEncoder(
+                os.path.join(self.video_folder, f"{self._video_name}.mp4"),
+                self.frames_per_sec,
+                max_queue_size=self.max_queue_size,
+                backpressure=self.backpressure,
+                verbose=not self.disable_logger,
+            )
+        self.video_encoder.write(frame)
+        self.num_recorded_frames += 1
 
     def reset(
         self, *, seed: int | None = None, options: dict[str, Any] | None = None
@@ -401,7 +439,7 @@ class RecordVideo(
 
         if self.recording:
             self._capture_frame()
-            if len(self.recorded_frames) > self.video_length:
+            if self.num_recorded_frames > self.video_length:
                 self.stop_recording()
 
         self.has_autoreset = False
@@ -442,7 +480,7 @@ class RecordVideo(
         if self.recording:
             self._capture_frame()
 
-            if len(self.recorded_frames) > self.video_length:
+            if self.num_recorded_frames > self.video_length:
                 self.stop_recording()
 
         return obs, rewards, terminations, truncations, info
@@ -451,7 +489,8 @@ class RecordVideo(
         """Compute the render frames as specified by render_mode attribute during initialization of the environment."""
         render_out = super().render()
         if self.recording and isinstance(render_out, list):
-            self.recorded_frames += render_out
+            for frame in render_out:
+                self._record_frame(frame)
 
         if len(self.render_history) > 0:
             tmp_history = self.render_history
@@ -461,11 +500,15 @@ class RecordVideo(
             return render_out
 
     def close(self):
-        """Closes the wrapper then the video recorder."""
+        """Closes the wrapper then the video recorder, waiting for the videos to be saved."""
         super().close()
         if self.recording:
             self.stop_recording()
 
+        pending_encoders, self.pending_encoders = self.pending_encoders, []
+        for encoder in pending_encoders:
+            encoder.wait()
+
     def start_recording(self, video_name: str):
         """Start a new recording. If it is already recording, stops the current recording before starting the new one."""
         if self.recording:
@@ -475,31 +518,36 @@ class RecordVideo(
         self._video_name = video_name
 
     def stop_recording(self):
-        """Stop current recording and saves the video."""
+        """Stop current recording, the video is saved in the background (see :meth:`close`)."""
         assert self.recording, "stop_recording was called, but no recording was started"
-        if len(self.recorded_frames) == 0:
-            logger.warn("Ignored saving a video as there were zero frames to save.")
-        else:
-            try:
-                from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
-            except ImportError as e:
-                raise error.DependencyNotInstalled(
-                    'MoviePy is not installed, run `pip install "gymnasium[other]"`'
-                ) from e
-
-            clip = ImageSequenceClip(self.recorded_frames, fps=self.frames_per_sec)
-            moviepy_logger = None if self.disable_logger else "bar"
-            path = os.path.join(self.video_folder, f"{self._video_name}.mp4")
-            clip.write_videofile(path, logger=moviepy_logger)
-
-        self.recorded_frames = []
+        video_encoder = self.video_encoder
+        self.video_encoder = None
+        self.num_recorded_frames = 0
         self.recording = False
         self._video_name = None
 
+        if video_encoder is None:
+            logger.warn("Ignored saving a video as there were zero frames to save.")
+        else:
+            video_encoder.close()
+            self.pending_encoders.append(video_encoder)
+
+        # The videos already saved are dropped before raising their errors, such that the recorder can continue
+        pending_encoders, self.pending_encoders = self.pending_encoders, []
+        saved_encoders = []
+        for encoder in pending_encoders:
+            if encoder.done:
+                saved_encoders.append(encoder)
+            else:
+                self.pending_encoders.append(encoder)
+
         if self.gc_trigger and self.gc_trigger(self.episode_id):
             gc.collect()
 
+        for encoder in saved_encoders:
+            encoder.wait()
+
     def __del__(self):
         """Warn the user in case last video wasn't saved."""
-        if len(self.recorded_frames) > 0:
+        if getattr(self, "video_encoder", None) is not None:
             logger.warn("Unable to save last video! Did you call close()?")
@@ -1,26 +1,36 @@
 """A collection of stateful observation wrappers.
 
 * ``NormalizeObservation`` - Normalize the observations
+* ``FrameStackObservation`` - Frame stack the observations
 """
 
 from __future__ import annotations
 
-from typing import Any
+from copy import deepcopy
+from typing import Any, Final
 
 import numpy as np
 
 import gymnasium as gym
-from gymnasium.core import ObsType
+from gymnasium.core import ActType, ObsType
 from gymnasium.logger import warn
+from gymnasium.vector.utils import (
+    SpacePlan,
+    batch_space,
+    concatenate,
+    create_empty_array,
+)
 from gymnasium.vector.vector_env import (
+    ArrayType,
     AutoresetMode,
     VectorEnv,
     VectorObservationWrapper,
+    VectorWrapper,
 )
-from gymnasium.wrappers.utils import RunningMeanStd
+from gymnasium.wrappers.utils import FrameBuffer, RunningMeanStd, create_zero_array
 
 
-__all__ = ["NormalizeObservation"]
+__all__ = ["NormalizeObservation", "FrameStackObservation"]
 
 
 class NormalizeObservation(VectorObservationWrapper, gym.utils.RecordConstructorArgs):
@@ -30,6 +40,9 @@ class NormalizeObservation(VectorObservationWrapper, gym.utils.RecordConstructor
     statistics. If `True` (default), the `RunningMeanStd` will get updated every step and reset call.
     If `False`, the calculated statistics are used but not updated anymore; this may be used during evaluation.
 
+    The statistics are updated once per step with the batch of observations, ``obs_rms`` allows sharing them,
+    e.g. between the training and evaluation vector environments.
+
     Note:
         The normalization depends on past trajectories and observations will not be normalized correctly if the wrapper was
         newly instantiated or the policy was changed recently.
@@ -62,12 +75,18 @@ class NormalizeObservation(VectorObservationWrapper, gym.utils.RecordConstructor
         >>> envs.close()
     """
 
-    def __init__(self, env: VectorEnv, epsilon: float = 1e-8):
+    def __init__(
+        self,
+        env: VectorEnv,
+        epsilon: float = 1e-8,
+        obs_rms: RunningMeanStd | None = None,
+    ):
         """This wrapper will normalize observations s.t. each coordinate is centered with unit variance.
 
         Args:
             env (Env): The environment to apply the wrapper
             epsilon: A stability parameter that is used when scaling the observations.
+            obs_rms: The running statistics of the observations, if ``None`` then new statistics are created.
         """
         gym.utils.RecordConstructorArgs.__init__(self, epsilon=epsilon)
         VectorObservationWrapper.__init__(self, env)
@@ -79,10 +98,16 @@ class NormalizeObservation(VectorObservationWrapper, gym.utils.RecordConstructor
         else:
             assert self.env.metadata["autoreset_mode"] in {AutoresetMode.NEXT_STEP}
 
-        self.obs_rms = RunningMeanStd(
-            shape=self.single_observation_space.shape,
-            dtype=self.single_observation_space.dtype,
-        )
+        if obs_rms is None:
+            obs_rms = RunningMeanStd(
+                shape=self.single_observation_space.shape,
+                dtype=self.single_observation_space.dtype,
+            )
+        elif obs_rms.shape != self.single_observation_space.shape:
+            raise ValueError(
+                f"Expected the shape of `obs_rms` to be the observation shape {self.single_observation_space.shape}, actual shape: {obs_rms.shape}"
+            )
+        self.obs_rms = obs_rms
         self.epsilon = epsilon
         self._update_running_mean = True
 
@@ -121,6 +146,160 @@ class NormalizeObservation(VectorObservationWrapper, gym.utils.RecordConstructor
         """
         if self._update_running_mean:
             self.obs_rms.update(observations)
-        return (observations - self.obs_rms.mean) / np.sqrt(
-            self.obs_rms.var + self.epsilon
+        return self.obs_rms.normalize(observations, self.epsilon)
+
+
+class FrameStackObservation(VectorWrapper, gym.utils.RecordConstructorArgs):
+    """Stacks the observations from the last ``N`` time steps of every sub-environment in a rolling manner.
+
+    The batched observations are written once per step into a single :class:`gymnasium.wrappers.utils.FrameBuffer`
+    of shape ``(num_envs, 2 * stack_size, ...)``, the stacked observations are a window of it with shape ``(num_envs, stack_size, ...)``.
+    This avoids stacking the observations of each sub-environment with :class:`gymnasium.wrappers.FrameStackObservation`.
+    By default, the window is copied, with ``copy=False`` it is returned as a view that is only overwritten by the second following step.
+
+    The frames of a sub-environment that is reset (on autoreset or with ``options["reset_mask"]``) are replaced with the padding,
+    options are the same as :class:`gymnasium.wrappers.FrameStackObservation`:
+
+     * "reset" (default) - The reset value is repeated
+     * "zero" - A "zero"-like instance of the observation space
+     * custom - An instance of the (single) observation space
+
+    Only observation spaces of NumPy arrays are supported, (nested) :class:`Dict` and :class:`Tuple` spaces of
+    :class:`Box`, :class:`Discrete`, :class:`MultiDiscrete` and :class:`MultiBinary` spaces.
+    The vector environment must use the ``AutoresetMode.NEXT_STEP`` autoreset mode or disable autoresets.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from gymnasium.wrappers.vector import FrameStackObservation
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=3, vectorization_mode="sync")
+        >>> envs = FrameStackObservation(envs, stack_size=4, padding_type="zero")
+        >>> envs.single_observation_space.shape
+        (4, 4)
+        >>> obs, _ = envs.reset(seed=123)
+        >>> obs.shape
+        (3, 4, 4)
+        >>> obs[0]
+        array([[ 0.        ,  0.        ,  0.        ,  0.        ],
+               [ 0.        ,  0.        ,  0.        ,  0.        ],
+               [ 0.        ,  0.        ,  0.        ,  0.        ],
+               [ 0.01823519, -0.0446179 , -0.02796401, -0.03156282]],
+              dtype=float32)
+        >>> envs.close()
+    """
+
+    def __init__(
+        self,
+        env: VectorEnv,
+        stack_size: int,
+        *,
+        padding_type: str | ObsType = "reset",
+        copy: bool = True,
+    ):
+        """Observation wrapper that stacks the observations of every sub-environment in a rolling manner.
+
+        Args:
+            env: The vector environment to apply the wrapper
+            stack_size: The number of frames to stack.
+            padding_type: The padding type to use when stacking the observations, options: "reset", "zero", custom obs
+            copy: If to return a copy of the stacked observations rather than a view of the frame buffer.
+        """
+        gym.utils.RecordConstructorArgs.__init__(
+            self, stack_size=stack_size, padding_type=padding_type, copy=copy
         )
+        VectorWrapper.__init__(self, env)
+
+        if not np.issubdtype(type(stack_size), np.integer):
+            raise TypeError(
+                f"The stack_size is expected to be an integer, actual type: {type(stack_size)}"
+            )
+        if not 0 < stack_size:
+            raise ValueError(
+                f"The stack_size needs to be greater than zero, actual value: {stack_size}"
+            )
+        if not SpacePlan(env.single_observation_space).compiled:
+            raise ValueError(
+                f"Expected the observation space to be a space of NumPy arrays, actual space: {env.single_observation_space}"
+            )
+
+        if "autoreset_mode" not in self.env.metadata:
+            warn(
+                f"{self} is missing `autoreset_mode` data. Assuming that the vector environment it follows the `NextStep` autoreset api or autoreset is disabled. Read https://farama.org/Vector-Autoreset-Mode for more details."
+            )
+        else:
+            assert self.env.metadata["autoreset_mode"] in {
+                AutoresetMode.NEXT_STEP,
+                AutoresetMode.DISABLED,
+            }
+
+        if isinstance(padding_type, str) and (
+            padding_type == "reset" or padding_type == "zero"
+        ):
+            padding_value = create_zero_array(env.single_observation_space)
+        elif padding_type in env.single_observation_space:
+            padding_value = padding_type
+            padding_type = "_custom"
+        else:
+            raise ValueError(
+                f"Unexpected `padding_type`, expected 'reset', 'zero' or a custom observation space, actual value: {padding_type!r}"
+            )
+        # The padding of every sub-environment, the reset observations are used for "reset"
+        self.padding_value = concatenate(
+            env.single_observation_space,
+            [padding_value for _ in range(self.num_envs)],
+            create_empty_array(env.single_observation_space, n=self.num_envs),
+        )
+
+        self.single_observation_space = batch_space(
+            env.single_observation_space, n=stack_size
+        )
+        self.observation_space = batch_space(
+            self.single_observation_space, n=self.num_envs
+        )
+        self.stack_size: Final[int] = stack_size
+        self.padding_type: Final[str] = padding_type
+        self.copy: Final[bool] = copy
+
+        self.frame_buffer = FrameBuffer(
+            env.single_observation_space, stack_size, num_envs=self.num_envs
+        )
+        self._autoreset = np.zeros(self.num_envs, dtype=np.bool_)
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[ObsType, dict[str, Any]]:
+        """Resets the (masked) sub-environments, replacing their stacked observations with the padding and reset observations."""
+        reset_mask = None if options is None else options.get("reset_mask")
+        observations, infos = self.env.reset(seed=seed, options=options)
+
+        self._reset_frames(observations, reset_mask)
+        if reset_mask is None:
+            self._autoreset[:] = False
+        else:
+            self._autoreset[reset_mask] = False
+        return self._stacked_frames(), infos
+
+    def step(
+        self, actions: ActType
+    ) -> tuple[ObsType, ArrayType, ArrayType, ArrayType, dict[str, Any]]:
+        """Steps through the sub-environments, appending the observations to the frame buffer."""
+        observations, rewards, terminations, truncations, infos = self.env.step(actions)
+
+        self.frame_buffer.push(observations)
+        if np.any(self._autoreset):
+            self._reset_frames(observations, self._autoreset)
+        self._autoreset = np.logical_or(terminations, truncations)
+        return self._stacked_frames(), rewards, terminations, truncations, infos
+
+    def _reset_frames(self, observations: ObsType, reset_mask: np.ndarray | None):
+        # The stacked observations returned as views before the reset are kept in the previous buffer
+        if not self.copy:
+            self.frame_buffer.renew()
+        padding = observations if self.padding_type == "reset" else self.padding_value
+        self.frame_buffer.reset(observations, padding, mask=reset_mask)
+
+    def _stacked_frames(self) -> ObsType:
+        stacked = self.frame_buffer.stacked
+        return deepcopy(stacked) if self.copy else stacked
@@ -70,6 +70,7 @@ class NormalizeReward(VectorWrapper, gym.utils.RecordConstructorArgs):
         env: VectorEnv,
         gamma: float = 0.99,
         epsilon: float = 1e-8,
+        return_rms: RunningMeanStd | None = None,
     ):
         """This wrapper will normalize immediate rewards s.t. their exponential moving average has an approximately fixed variance.
 
@@ -77,11 +78,13 @@ class NormalizeReward(VectorWrapper, gym.utils.RecordConstructorArgs):
             env (env): The environment to apply the wrapper
             epsilon (float): A stability parameter
             gamma (float): The discount factor that is used in the exponential moving average.
+            return_rms: The running statistics of the discounted rewards, if ``None`` then new statistics are created.
+                Sharing the statistics between environments, see :class:`gymnasium.wrappers.utils.RunningMeanStd`.
         """
         gym.utils.RecordConstructorArgs.__init__(self, gamma=gamma, epsilon=epsilon)
         VectorWrapper.__init__(self, env)
 
-        self.return_rms = RunningMeanStd(shape=())
+        self.return_rms = RunningMeanStd(shape=()) if return_rms is None else return_rms
         self.accumulated_reward = np.zeros((self.num_envs,), dtype=np.float32)
         self.gamma = gamma
         self.epsilon = epsilon
@@ -10,7 +10,7 @@ import gymnasium as gym
 from gymnasium import VectorizeMode, error, wrappers
 from gymnasium.envs.classic_control import CartPoleEnv
 from gymnasium.envs.classic_control.cartpole import CartPoleVectorEnv
-from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv, VectorEnv
+from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv, ThreadedVectorEnv, VectorEnv
 from gymnasium.wrappers import TimeLimit, TransformObservation
 from tests.wrappers.utils import has_wrapper
 
@@ -24,7 +24,9 @@ def test_make_vec_env_id():
 
 
 @pytest.mark.parametrize("num_envs", [1, 3, 10])
-@pytest.mark.parametrize("vectorization_mode", ["vector_entry_point", "async", "sync"])
+@pytest.mark.parametrize(
+    "vectorization_mode", ["vector_entry_point", "async", "sync", "threaded"]
+)
 def test_make_vec_num_envs(num_envs, vectorization_mode):
     """Test that the `gym.make_vec` num_envs parameter works."""
     env = gym.make_vec(
@@ -85,6 +87,14 @@ def test_make_vec_vectorization_mode():
     assert isinstance(env, SyncVectorEnv)
     env.close()
 
+    env = gym.make_vec("CartPole-v1", vectorization_mode="threaded")
+    assert isinstance(env, ThreadedVectorEnv)
+    env.close()
+
+    env = gym.make_vec("CartPole-v1", vectorization_mode=VectorizeMode.THREADED)
+    assert isinstance(env, ThreadedVectorEnv)
+    env.close()
+
     # Test environment with only a vector entry point and no entry point
     gym.register("VecOnlyEnv-v0", vector_entry_point=CartPoleVectorEnv)
     env_spec = gym.spec("VecOnlyEnv-v0")
@@ -103,7 +113,7 @@ def test_make_vec_vectorization_mode():
     with pytest.raises(
         ValueError,
         match=re.escape(
-            "Invalid vectorization mode: 'invalid', valid modes: ['async', 'sync', 'vector_entry_point']"
+            "Invalid vectorization mode: 'invalid', valid modes: ['async', 'sync', 'threaded', 'vector_entry_point']"
         ),
     ):
         gym.make_vec("CartPole-v1", vectorization_mode="invalid")
@@ -111,7 +121,7 @@ def test_make_vec_vectorization_mode():
     with pytest.raises(
         ValueError,
         match=re.escape(
-            "Invalid vectorization mode: 123, valid modes: ['async', 'sync', 'vector_entry_point']"
+            "Invalid vectorization mode: 123, valid modes: ['async', 'sync', 'threaded', 'vector_entry_point']"
         ),
     ):
         gym.make_vec("CartPole-v1", vectorization_mode=123)
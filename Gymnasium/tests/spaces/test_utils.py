@@ -200,14 +200,7 @@ def test_all_space_pairs_for_is_space_dtype_shape_equiv(space_1):
         compatible = is_space_dtype_shape_equiv(space_1, space_2)
 
         if compatible:
-            try:
-                shared_memory = create_shared_memory(space_1, n=2)
-            except TypeError as err:
-                assert (
-                    "has a dynamic shape so its not possible to make a static shared memory."
-                    in str(err)
-                )
-                continue
+            shared_memory = create_shared_memory(space_1, n=2)
 
             batched_space = batch_space(space_1, n=2)
 
@@ -1,10 +1,17 @@
 import os
 import shutil
+import threading
 
 import numpy as np
+import pytest
 
 import gymnasium as gym
-from gymnasium.utils.save_video import capped_cubic_video_schedule, save_video
+import gymnasium.utils.save_video
+from gymnasium.utils.save_video import (
+    VideoEncoder,
+    capped_cubic_video_schedule,
+    save_video,
+)
 
 
 def test_record_video_using_default_trigger():
@@ -118,3 +125,100 @@ def test_record_video_within_vector():
     mp4_files = [file for file in os.listdir("videos") if file.endswith(".mp4")]
     shutil.rmtree("videos")
     assert len(mp4_files) == expected_video
+
+
+class BlockingVideoWriter:
+    """A video writer that records the written frames, blocking until `unblock` is set."""
+
+    started = threading.Event()
+    unblock = threading.Event()
+    frames: list
+
+    def __init__(self, filename, size, fps):
+        self.frames = []
+        BlockingVideoWriter.instance = self
+
+    def write_frame(self, frame):
+        BlockingVideoWriter.started.set()
+        BlockingVideoWriter.unblock.wait()
+        self.frames.append(frame)
+
+    def close(self):
+        pass
+
+
+def test_video_encoder(tmp_path):
+    """Tests that the video encoder writes the video in the background."""
+    path = str(tmp_path / "video.mp4")
+    encoder = VideoEncoder(path, fps=30, max_queue_size=4)
+    for i in range(20):
+        encoder.write(np.full((32, 48, 3), i, dtype=np.uint8))
+    encoder.close()
+    encoder.wait()
+
+    assert encoder.done
+    assert encoder.written_frames == 20 and encoder.dropped_frames == 0
+    assert os.path.getsize(path) > 0
+
+    with pytest.raises(ValueError, match="is closed"):
+        encoder.write(np.zeros((32, 48, 3), dtype=np.uint8))
+
+
+@pytest.mark.parametrize(
+    "backpressure, expected_dropped", [("block", 0), ("drop", 1), ("downsample", 3)]
+)
+def test_video_encoder_backpressure(
+    monkeypatch, tmp_path, backpressure, expected_dropped, n_frames=10
+):
+    """Tests the frames dropped by each backpressure option while the encoder is blocked."""
+    monkeypatch.setattr(
+        gymnasium.utils.save_video, "FFMPEG_VideoWriter", BlockingVideoWriter
+    )
+    BlockingVideoWriter.started.clear()
+    BlockingVideoWriter.unblock.clear()
+
+    encoder = VideoEncoder(
+        str(tmp_path / "video.mp4"),
+        fps=30,
+        max_queue_size=8,
+        backpressure=backpressure,
+    )
+    encoder.write(np.zeros((4, 4, 3), dtype=np.uint8))
+    assert BlockingVideoWriter.started.wait(timeout=5)
+
+    if backpressure == "block":
+        threading.Timer(0.1, BlockingVideoWriter.unblock.set).start()
+    for _ in range(n_frames - 1):
+        encoder.write(np.zeros((4, 4, 3), dtype=np.uint8))
+    BlockingVideoWriter.unblock.set()
+    encoder.wait(timeout=5)
+
+    assert encoder.written_frames == n_frames
+    assert encoder.dropped_frames == expected_dropped
+    assert len(BlockingVideoWriter.instance.frames) == n_frames - expected_dropped
+
+
+def test_video_encoder_error(tmp_path):
+    """Tests that the errors of the encoder are raised by `wait` and invalid arguments."""
+    encoder = VideoEncoder(str(tmp_path / "video.mp4"), fps=30)
+    encoder.write(np.zeros((4, 4, 3), dtype=np.uint8))
+    encoder.write(np.zeros((8, 4, 3), dtype=np.uint8))
+    encoder.close()
+    with pytest.raises(ValueError, match="to have the shape"):
+        encoder.wait(timeout=5)
+
+    with pytest.raises(ValueError, match="Expected `max_queue_size` to be at least 1"):
+        VideoEncoder(str(tmp_path / "video.mp4"), fps=30, max_queue_size=0)
+    with pytest.raises(ValueError, match="Unexpected `backpressure`"):
+        VideoEncoder(str(tmp_path / "video.mp4"), fps=30, backpressure="skip")
+
+
+def test_save_video_background(tmp_path):
+    """Tests that `save_video` with `background=True` returns the encoders of the videos being saved."""
+    frames = [np.zeros((16, 16, 3), dtype=np.uint8) for _ in range(10)]
+    encoders = save_video(
+        frames, str(tmp_path), fps=10, episode_trigger=lambda i: True, background=True
+    )
+    assert len(encoders) == 1
+    encoders[0].wait()
+    assert os.listdir(tmp_path) == ["rl-video-episode-0.mp4"]
@@ -1,6 +1,8 @@
 """Test the `SyncVectorEnv` implementation."""
 
+import math
 import re
+import time
 import warnings
 from multiprocessing import TimeoutError
 
@@ -12,8 +14,19 @@ from gymnasium.error import (
     ClosedEnvironmentError,
     NoAsyncCallError,
 )
-from gymnasium.spaces import Box, Discrete, MultiDiscrete, Tuple
-from gymnasium.vector import AsyncVectorEnv
+from gymnasium.spaces import (
+    Box,
+    Dict,
+    Discrete,
+    Graph,
+    MultiDiscrete,
+    Sequence,
+    Text,
+    Tuple,
+)
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AsyncVectorEnv, AutoresetMode, SyncVectorEnv
+from gymnasium.vector.async_vector_env import _async_batch_worker
 from tests.testing_env import GenericTestEnv
 from tests.vector.testing_utils import (
     CustomSpace,
@@ -434,3 +447,443 @@ def test_async_vector_subenv_error():
         caught_warnings[4].message.args[0]
         == "\x1b[31mERROR: Raising the last exception back to the main process.\x1b[0m"
     )
+
+
+@pytest.mark.parametrize("env_id", ["CartPole-v1", "Pendulum-v1", "FrozenLake-v1"])
+@pytest.mark.parametrize(
+    "autoreset_mode",
+    [AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP, AutoresetMode.DISABLED],
+)
+def test_shared_step_memory_async_vector_env(env_id, autoreset_mode):
+    """Test that the shared step memory transport returns the same results as the pipes."""
+    env_fns = [make_env(env_id, i) for i in range(4)]
+    pipe_envs = AsyncVectorEnv(env_fns, autoreset_mode=autoreset_mode)
+    shared_envs = AsyncVectorEnv(
+        env_fns, autoreset_mode=autoreset_mode, shared_step_memory=True
+    )
+    assert shared_envs.shared_step_memory
+
+    pipe_envs.action_space.seed(123)
+    pipe_obs, pipe_info = pipe_envs.reset(seed=123)
+    shared_obs, shared_info = shared_envs.reset(seed=123)
+    data_equivalence(pipe_obs, shared_obs)
+    data_equivalence(pipe_info, shared_info)
+
+    for _ in range(50):
+        actions = pipe_envs.action_space.sample()
+        pipe_step = pipe_envs.step(actions)
+        shared_step = shared_envs.step(actions)
+        assert data_equivalence(pipe_step, shared_step)
+
+        if autoreset_mode == AutoresetMode.DISABLED and np.any(
+            pipe_step[2] | pipe_step[3]
+        ):
+            reset_mask = pipe_step[2] | pipe_step[3]
+            pipe_obs, pipe_info = pipe_envs.reset(options={"reset_mask": reset_mask})
+            shared_obs, shared_info = shared_envs.reset(
+                options={"reset_mask": reset_mask}
+            )
+            data_equivalence(pipe_obs, shared_obs)
+
+    pipe_envs.close()
+    shared_envs.close()
+
+
+def test_shared_step_memory_nested_action_space():
+    """Test the shared step memory transport with a nested action space."""
+    action_space = Dict(
+        {"move": Discrete(3), "force": Tuple((Box(-1, 1, (2,)), Discrete(2)))}
+    )
+
+    def step_func(self, action):
+        assert action in self.action_space
+        reward = (
+            action["move"]
+            + action["force"][1]
+            + np.sum(action["force"][0], dtype=np.float64)
+        )
+        return self.observation_space.sample(), float(reward), False, False, {}
+
+    envs = AsyncVectorEnv(
+        [lambda: GenericTestEnv(action_space=action_space, step_func=step_func)] * 3,
+        shared_step_memory=True,
+    )
+    envs.reset(seed=0)
+    actions = envs.action_space.sample()
+    _, rewards, _, _, _ = envs.step(actions)
+    envs.close()
+
+    expected_rewards = (
+        actions["move"]
+        + actions["force"][1]
+        + np.sum(actions["force"][0], axis=1, dtype=np.float64)
+    )
+    assert np.allclose(rewards, expected_rewards)
+
+
+def test_shared_step_memory_requires_shared_memory():
+    """Test that the shared step memory transport requires the shared observation memory."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(2)]
+    with pytest.raises(ValueError, match="requires `shared_memory=True`"):
+        AsyncVectorEnv(env_fns, shared_memory=False, shared_step_memory=True)
+
+
+def test_shared_step_memory_subenv_error():
+    """Test that errors raised in a step are still reported with the shared step memory transport."""
+    envs = AsyncVectorEnv(
+        [
+            lambda: GenericTestEnv(
+                reset_func=raise_error_reset, step_func=raise_error_step
+            )
+        ]
+        * 3,
+        shared_step_memory=True,
+    )
+    envs.reset(seed=[0, 0, 0])
+
+    with warnings.catch_warnings(record=True):
+        with pytest.raises(ValueError, match="Error in step"):
+            envs.step([0, 1, 0])
+
+    envs.close()
+
+
+@pytest.mark.parametrize("envs_per_worker", [2, 3, 8])
+@pytest.mark.parametrize(
+    "shared_memory, shared_step_memory", [(True, True), (True, False), (False, False)]
+)
+@pytest.mark.parametrize(
+    "autoreset_mode",
+    [AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP, AutoresetMode.DISABLED],
+)
+def test_envs_per_worker_async_vector_env(
+    envs_per_worker, shared_memory, shared_step_memory, autoreset_mode
+):
+    """Test that running several sub-environments per worker gives the same results as `SyncVectorEnv`."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(7)]
+    sync_envs = SyncVectorEnv(env_fns, autoreset_mode=autoreset_mode)
+    async_envs = AsyncVectorEnv(
+        env_fns,
+        shared_memory=shared_memory,
+        shared_step_memory=shared_step_memory,
+        autoreset_mode=autoreset_mode,
+        envs_per_worker=envs_per_worker,
+    )
+    assert (
+        async_envs.num_workers
+        == len(async_envs.processes)
+        == math.ceil(7 / envs_per_worker)
+    )
+
+    sync_envs.action_space.seed(123)
+    assert data_equivalence(sync_envs.reset(seed=123), async_envs.reset(seed=123))
+
+    for _ in range(50):
+        actions = sync_envs.action_space.sample()
+        sync_step = sync_envs.step(actions)
+        async_step = async_envs.step(actions)
+        assert data_equivalence(sync_step, async_step)
+
+        if autoreset_mode == AutoresetMode.DISABLED and np.any(
+            sync_step[2] | sync_step[3]
+        ):
+            reset_mask = sync_step[2] | sync_step[3]
+            assert data_equivalence(
+                sync_envs.reset(options={"reset_mask": reset_mask}),
+                async_envs.reset(options={"reset_mask": reset_mask}),
+            )
+
+    async_envs.set_attr("gamma", [0.1 * i for i in range(7)])
+    assert async_envs.get_attr("gamma") == tuple(0.1 * i for i in range(7))
+    assert async_envs.call("get_wrapper_attr", "spec") == sync_envs.call(
+        "get_wrapper_attr", "spec"
+    )
+
+    sync_envs.close()
+    async_envs.close()
+
+
+def test_envs_per_worker_subenv_error():
+    """Test that an error in any sub-environment of a worker is raised in the main process."""
+    envs = AsyncVectorEnv(
+        [
+            lambda: GenericTestEnv(
+                reset_func=raise_error_reset, step_func=raise_error_step
+            )
+        ]
+        * 4,
+        envs_per_worker=2,
+    )
+    envs.reset(seed=[0, 0, 0, 0])
+
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        with pytest.raises(ValueError, match="Error in step"):
+            envs.step([0, 0, 1, 0])
+
+    envs.close()
+
+    assert re.match(
+        r"\x1b\[31mERROR: Received the following error from Worker-1 - Shutting it down\x1b\[0m",
+        caught_warnings[0].message.args[0],
+    )
+
+
+def _custom_batch_worker(index, env_fns, *args, env_slice, num_envs, **kwargs):
+    assert isinstance(env_fns, list) and len(env_fns) == len(range(num_envs)[env_slice])
+    return _async_batch_worker(
+        index, env_fns, *args, env_slice=env_slice, num_envs=num_envs, **kwargs
+    )
+
+
+def test_envs_per_worker_custom_worker():
+    """Test that a custom worker receives the environment functions, `env_slice` and `num_envs` of its sub-environments."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(5)]
+    envs = AsyncVectorEnv(env_fns, worker=_custom_batch_worker, envs_per_worker=2)
+    reference_envs = AsyncVectorEnv(env_fns, envs_per_worker=2)
+    assert envs.num_workers == 3
+
+    observations, _ = envs.reset(seed=1)
+    reference_observations, _ = reference_envs.reset(seed=1)
+    assert data_equivalence(observations, reference_observations)
+
+    envs.close()
+    reference_envs.close()
+
+
+def test_envs_per_worker_invalid():
+    """Test that `envs_per_worker` must be positive."""
+    with pytest.raises(ValueError, match="envs_per_worker"):
+        AsyncVectorEnv([make_env("CartPole-v1", 0)], envs_per_worker=0)
+
+
+@pytest.mark.parametrize(
+    "shared_memory, shared_step_memory", [(True, True), (True, False), (False, False)]
+)
+def test_send_recv_full_batch(shared_memory, shared_step_memory):
+    """Test that `send` and `recv` for all sub-environments give the same results as `step`."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    sync_envs = SyncVectorEnv(env_fns)
+    async_envs = AsyncVectorEnv(
+        env_fns, shared_memory=shared_memory, shared_step_memory=shared_step_memory
+    )
+
+    sync_envs.reset(seed=123)
+    async_envs.reset(seed=123)
+    sync_envs.action_space.seed(123)
+    for _ in range(50):
+        actions = sync_envs.action_space.sample()
+        sync_obs, sync_rewards, sync_terminations, sync_truncations, _ = sync_envs.step(
+            actions
+        )
+
+        async_envs.send(actions)
+        obs, rewards, terminations, truncations, infos = async_envs.recv()
+        order = np.argsort(infos["env_id"])
+        assert np.all(infos["env_id"][order] == np.arange(4))
+        assert np.all(obs[order] == sync_obs)
+        assert np.all(rewards[order] == sync_rewards)
+        assert np.all(terminations[order] == sync_terminations)
+        assert np.all(truncations[order] == sync_truncations)
+
+    sync_envs.close()
+    async_envs.close()
+
+
+@pytest.mark.parametrize(
+    "shared_memory, shared_step_memory", [(True, True), (True, False), (False, False)]
+)
+def test_send_recv_partial_batch(shared_memory, shared_step_memory):
+    """Test that with `batch_size < num_envs`, every sub-environment follows its own trajectory."""
+    num_envs, batch_size = 5, 2
+    env_fns = [make_env("CartPole-v1", i) for i in range(num_envs)]
+    # each sub-environment always takes the action `env_id % 2`
+    env_actions = np.arange(num_envs) % 2
+
+    sync_envs = SyncVectorEnv(env_fns)
+    sync_envs.reset(seed=123)
+    expected_obs = [sync_envs.step(env_actions)[0] for _ in range(100)]
+    sync_envs.close()
+
+    async_envs = AsyncVectorEnv(
+        env_fns,
+        shared_memory=shared_memory,
+        shared_step_memory=shared_step_memory,
+        batch_size=batch_size,
+    )
+    async_envs.reset(seed=123)
+    async_envs.send(env_actions)
+
+    num_steps = np.zeros(num_envs, dtype=np.int64)
+    for _ in range(50):
+        obs, rewards, terminations, truncations, infos = async_envs.recv()
+        env_ids = infos["env_id"]
+        assert obs.shape == (batch_size, 4)
+        assert rewards.shape == terminations.shape == truncations.shape == (batch_size,)
+        assert len(np.unique(env_ids)) == batch_size
+
+        for env_obs, env_id in zip(obs, env_ids):
+            assert np.all(env_obs == expected_obs[num_steps[env_id]][env_id])
+            num_steps[env_id] += 1
+        async_envs.send(env_actions[env_ids], env_ids)
+
+    # the last `recv` returns the single sub-environment left
+    assert [len(async_envs.recv()[4]["env_id"]) for _ in range(3)] == [2, 2, 1]
+    async_envs.close()
+
+
+def test_send_recv_partial_batch_infos(num_envs=5, batch_size=2):
+    """Test that the infos of a partial batch have the batch size and are ordered as `env_id`."""
+
+    def make_info_env(env_id):
+        def step_func(self, action):
+            info = (
+                {"env_num": env_id, "odd": True} if env_id % 2 else {"env_num": env_id}
+            )
+            return self.observation_space.sample(), 0, False, False, info
+
+        return lambda: GenericTestEnv(step_func=step_func)
+
+    envs = AsyncVectorEnv(
+        [make_info_env(i) for i in range(num_envs)], batch_size=batch_size
+    )
+    envs.reset(seed=0)
+    envs.send(np.zeros((num_envs, 1), dtype=np.float32))
+
+    for expected_batch_size in [2, 2, 1]:
+        obs, *_, infos = envs.recv()
+        env_ids = infos["env_id"]
+        assert len(obs) == len(env_ids) == expected_batch_size
+        assert infos["env_num"].shape == infos["_env_num"].shape == env_ids.shape
+        np.testing.assert_array_equal(infos["env_num"], env_ids)
+        assert np.all(infos["_env_num"])
+        if "odd" in infos:
+            assert infos["odd"].shape == infos["_odd"].shape == env_ids.shape
+            np.testing.assert_array_equal(infos["_odd"], env_ids % 2 == 1)
+    envs.close()
+
+
+def test_send_recv_straggler():
+    """Test that a slow sub-environment does not stall the batch returned by `recv`."""
+
+    def make_delayed_env(delay):
+        def step_func(self, action):
+            time.sleep(delay)
+            return self.observation_space.sample(), 0, False, False, {}
+
+        return lambda: GenericTestEnv(step_func=step_func)
+
+    envs = AsyncVectorEnv(
+        [make_delayed_env(1.0)] + [make_delayed_env(0) for _ in range(3)],
+        batch_size=2,
+    )
+    envs.reset(seed=0)
+    envs.send(envs.action_space.sample())
+
+    start = time.perf_counter()
+    *_, infos = envs.recv()
+    assert time.perf_counter() - start < 0.5
+    assert 0 not in infos["env_id"]
+    envs.send(np.zeros((2, 1), dtype=np.float32), infos["env_id"])
+
+    *_, infos = envs.recv()
+    assert 0 not in infos["env_id"]
+
+    # closing waits for the slow sub-environment to finish
+    with warnings.catch_warnings(record=True):
+        envs.close()
+
+
+def test_send_recv_errors():
+    """Test the pending call errors of `send` and `recv`."""
+    envs = AsyncVectorEnv([make_env("CartPole-v1", i) for i in range(4)], batch_size=2)
+    envs.reset(seed=0)
+
+    with pytest.raises(NoAsyncCallError):
+        envs.recv()
+
+    envs.send(np.zeros(2, dtype=np.int64), [0, 1])
+    with pytest.raises(AlreadyPendingCallError):
+        envs.send(np.zeros(2, dtype=np.int64), [1, 2])
+    with pytest.raises(AlreadyPendingCallError):
+        envs.step(np.zeros(4, dtype=np.int64))
+    with pytest.raises(AlreadyPendingCallError):
+        envs.reset()
+
+    *_, infos = envs.recv()
+    assert sorted(infos["env_id"]) == [0, 1]
+
+    # no sub-environment is pending anymore, so the usual API can be used again
+    envs.step(np.zeros(4, dtype=np.int64))
+    envs.close()
+
+    with pytest.raises(ValueError, match="batch_size"):
+        AsyncVectorEnv([make_env("CartPole-v1", i) for i in range(4)], batch_size=5)
+    with pytest.raises(ValueError, match="envs_per_worker=1"):
+        AsyncVectorEnv(
+            [make_env("CartPole-v1", i) for i in range(4)],
+            batch_size=2,
+            envs_per_worker=2,
+        )
+
+
+@pytest.mark.parametrize(
+    "observation_space",
+    [
+        Text(8),
+        Graph(node_space=Box(-1, 1, shape=(2,)), edge_space=Discrete(3)),
+        Graph(node_space=Discrete(4), edge_space=None),
+        Sequence(Box(-1, 1, shape=(3,))),
+        Sequence(Dict(a=Discrete(3), b=Box(0, 1, shape=(2,))), stack=True),
+        Dict(
+            graph=Graph(node_space=Box(-1, 1, shape=(2,)), edge_space=Discrete(3)),
+            position=Box(-1, 1, shape=(2,)),
+        ),
+    ],
+)
+def test_dynamic_space_shared_memory(observation_space, n_steps=5):
+    """Test that the observations of dynamic spaces are the same with or without shared memory at every step."""
+    env_fns = [
+        lambda: GenericTestEnv(observation_space=observation_space) for _ in range(3)
+    ]
+    shared_envs = AsyncVectorEnv(env_fns, shared_memory=True)
+    envs = AsyncVectorEnv(env_fns, shared_memory=False)
+
+    assert data_equivalence(shared_envs.reset(seed=1), envs.reset(seed=1))
+    for _ in range(n_steps):
+        actions = envs.action_space.sample()
+        shared_step = shared_envs.step(actions)
+        assert shared_step[0] in shared_envs.observation_space
+        assert data_equivalence(shared_step, envs.step(actions))
+
+    shared_envs.close()
+    envs.close()
+
+
+def test_shared_memory_capacity():
+    """Test that observations larger than the shared memory capacity raise an error."""
+    observation_space = Graph(node_space=Box(-1, 1, shape=(2,)), edge_space=None)
+    env_fns = [
+        lambda: GenericTestEnv(observation_space=observation_space) for _ in range(2)
+    ]
+
+    # Graph samples have 10 nodes
+    envs = AsyncVectorEnv(env_fns, shared_memory_capacity=10)
+    observations, _ = envs.reset(seed=1)
+    assert all(len(graph.nodes) == 10 for graph in observations)
+    envs.close()
+
+    envs = AsyncVectorEnv(env_fns, shared_memory_capacity=4)
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Expected the number of nodes to be at most the shared memory capacity (4), actual got 10."
+        ),
+    ):
+        envs.reset(seed=1)
+    envs.close(terminate=True)
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape("Expected `capacity` to be at least 1, actual got 0"),
+    ):
+        AsyncVectorEnv(env_fns, shared_memory_capacity=0)
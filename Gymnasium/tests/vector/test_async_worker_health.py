@@ -0,0 +1,152 @@
+"""Test the `respawn_workers` and `monitor_workers` parameters of `AsyncVectorEnv`."""
+
+import os
+import re
+
+import numpy as np
+import pytest
+
+from gymnasium.spaces import Box, Discrete
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AsyncVectorEnv, AutoresetMode
+from tests.testing_env import GenericTestEnv, basic_reset_func
+
+
+def _crashing_step_func(self, action):
+    """Kills the worker process on action 1."""
+    if action == 1:
+        os._exit(1)
+    return self.observation_space.sample(), 1.0, False, False, {}
+
+
+def _make_crashing_env():
+    return GenericTestEnv(
+        action_space=Discrete(2),
+        observation_space=Box(0, 1, shape=(2,)),
+        reset_func=basic_reset_func,
+        step_func=_crashing_step_func,
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"shared_memory": True},
+        {"shared_memory": False},
+        {"shared_step_memory": True},
+        {"envs_per_worker": 2},
+        {"envs_per_worker": 2, "shared_step_memory": True},
+    ],
+    ids=["shared", "no-shared", "shared-step", "batch", "batch-shared-step"],
+)
+@pytest.mark.parametrize(
+    "autoreset_mode", [AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP]
+)
+def test_respawn_workers(kwargs, autoreset_mode, n_steps=3):
+    """Test that a crashed worker is respawned with its step reported as truncated, followed by the autoreset mode's next step."""
+    envs = AsyncVectorEnv(
+        [_make_crashing_env for _ in range(4)],
+        respawn_workers=True,
+        autoreset_mode=autoreset_mode,
+        **kwargs,
+    )
+    envs.reset(seed=1)
+    # The sub-environments of the crashed worker
+    respawned = np.arange(4) < kwargs.get("envs_per_worker", 1)
+
+    with pytest.warns(UserWarning, match=re.escape("Worker-0 died")):
+        observations, rewards, terminations, truncations, infos = envs.step(
+            np.array([1, 0, 0, 0])
+        )
+    assert observations in envs.observation_space
+    assert np.all(rewards == np.where(respawned, 0, 1))
+    assert np.all(truncations == respawned) and not np.any(terminations)
+    assert np.all(infos["_worker_respawned"] == respawned)
+    assert np.all(infos["worker_respawned"][respawned])
+    assert np.all(envs.worker_respawns == [1] + [0] * (envs.num_workers - 1))
+    if autoreset_mode == AutoresetMode.SAME_STEP:
+        # The episode of the respawned sub-environments ends, with the reset observation as the last observation
+        assert np.all(infos["_final_obs"] == respawned)
+        assert np.all(infos["_final_info"] == respawned)
+        assert data_equivalence(
+            list(infos["final_obs"][respawned]), list(observations[respawned])
+        )
+    else:
+        assert "final_obs" not in infos
+
+    # With the next-step autoreset, the step after the truncation resets the respawned sub-environments
+    observations, rewards, terminations, truncations, infos = envs.step(
+        np.zeros(4, dtype=np.int64)
+    )
+    if autoreset_mode == AutoresetMode.NEXT_STEP:
+        assert np.all(rewards == np.where(respawned, 0, 1))
+    else:
+        assert np.all(rewards == 1)
+    assert not np.any(terminations) and not np.any(truncations)
+    assert "worker_respawned" not in infos
+
+    # The respawned worker keeps stepping
+    for _ in range(n_steps):
+        observations, rewards, *_ = envs.step(np.zeros(4, dtype=np.int64))
+        assert observations in envs.observation_space
+        assert np.all(rewards == 1)
+    envs.close()
+
+
+def test_respawn_workers_call():
+    """Test that a respawned worker answers calls and resets as normal."""
+    envs = AsyncVectorEnv([_make_crashing_env for _ in range(2)], respawn_workers=True)
+    envs.reset(seed=1)
+
+    with pytest.warns(UserWarning, match=re.escape("Worker-1 died")):
+        envs.step(np.array([0, 1]))
+    assert envs.get_attr("action_space") == (Discrete(2), Discrete(2))
+
+    observations, infos = envs.reset(seed=2)
+    assert observations in envs.observation_space
+    assert "worker_respawned" not in infos
+    envs.close()
+
+
+def test_no_respawn_workers():
+    """Test that without `respawn_workers` a crashed worker raises and the vector environment still closes."""
+    envs = AsyncVectorEnv([_make_crashing_env for _ in range(2)])
+    envs.reset(seed=1)
+
+    with pytest.raises((EOFError, ConnectionResetError)):
+        envs.step(np.array([1, 0]))
+    envs.close()
+    assert envs.closed
+
+
+@pytest.mark.parametrize("envs_per_worker", [1, 2])
+def test_monitor_workers(envs_per_worker, n_steps=5):
+    """Test the worker heartbeats and step latency histograms of `monitor_workers`."""
+    envs = AsyncVectorEnv(
+        [_make_crashing_env for _ in range(4)],
+        monitor_workers=True,
+        envs_per_worker=envs_per_worker,
+    )
+    envs.reset(seed=1)
+    heartbeats = envs.worker_heartbeats
+    assert heartbeats.shape == (envs.num_workers,) and np.all(heartbeats > 0)
+
+    for _ in range(n_steps):
+        envs.step(np.zeros(4, dtype=np.int64))
+
+    counts, bin_edges = envs.step_latency_histograms
+    assert counts.shape == (envs.num_workers, len(bin_edges) - 1)
+    assert np.all(counts.sum(axis=1) == n_steps)
+    assert bin_edges[0] == 0 and bin_edges[-1] == np.inf
+    assert np.all(envs.worker_heartbeats >= heartbeats)
+    envs.close()
+
+
+def test_monitor_workers_disabled():
+    """Test that the monitoring properties raise without `monitor_workers`."""
+    envs = AsyncVectorEnv([_make_crashing_env for _ in range(2)])
+    with pytest.raises(ValueError, match="monitor_workers=True"):
+        envs.worker_heartbeats
+    with pytest.raises(ValueError, match="monitor_workers=True"):
+        envs.step_latency_histograms
+    envs.close()
@@ -0,0 +1,163 @@
+"""Test the `observation_buffers` and `read_only` parameters of the vector environments."""
+
+import re
+from copy import deepcopy
+from functools import partial
+
+import numpy as np
+import pytest
+
+from gymnasium.spaces import Box, Dict, Discrete, Graph, Sequence
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import (
+    AsyncVectorEnv,
+    AutoresetMode,
+    SyncVectorEnv,
+    ThreadedVectorEnv,
+)
+from tests.testing_env import GenericTestEnv
+from tests.vector.testing_utils import make_env
+
+
+VECTOR_ENVS = [
+    SyncVectorEnv,
+    partial(ThreadedVectorEnv, num_threads=2),
+    partial(AsyncVectorEnv, shared_memory=True),
+    partial(AsyncVectorEnv, shared_memory=False),
+]
+VECTOR_ENV_IDS = ["sync", "threaded", "async-shared", "async"]
+
+
+def _leaves(observations):
+    if isinstance(observations, dict):
+        return [leaf for value in observations.values() for leaf in _leaves(value)]
+    return [observations]
+
+
+@pytest.mark.parametrize("vector_env_fn", VECTOR_ENVS, ids=VECTOR_ENV_IDS)
+@pytest.mark.parametrize("observation_buffers", [2, 3])
+def test_observation_buffers(vector_env_fn, observation_buffers, n_steps=6):
+    """Tests that rotating observation buffers give the same observations, only aliased every `observation_buffers` steps."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(3)]
+    copy_envs = vector_env_fn(env_fns)
+    buffered_envs = vector_env_fn(env_fns, observation_buffers=observation_buffers)
+
+    observations = [buffered_envs.reset(seed=1)[0]]
+    copy_observations = [copy_envs.reset(seed=1)[0]]
+
+    copy_envs.action_space.seed(1)
+    for _ in range(n_steps):
+        actions = copy_envs.action_space.sample()
+        copy_observations.append(copy_envs.step(actions)[0])
+        observations.append(buffered_envs.step(actions)[0])
+
+        # The last `observation_buffers` observations are distinct and unchanged
+        for observation, copy_observation in zip(
+            observations[-observation_buffers:],
+            copy_observations[-observation_buffers:],
+        ):
+            assert data_equivalence(observation, copy_observation)
+        if len(observations) > observation_buffers:
+            assert observations[-1] is observations[-observation_buffers - 1]
+
+    copy_envs.close()
+    buffered_envs.close()
+
+
+@pytest.mark.parametrize("vector_env_fn", VECTOR_ENVS, ids=VECTOR_ENV_IDS)
+@pytest.mark.parametrize(
+    "observation_space",
+    [
+        Sequence(Box(0, 1, shape=(2,)), stack=True),
+        Sequence(Box(0, 1, shape=(2,))),
+        Graph(node_space=Box(0, 1, shape=(2,)), edge_space=Discrete(3)),
+    ],
+    ids=["stacked-sequence", "sequence", "graph"],
+)
+def test_observation_buffers_dynamic_spaces(
+    vector_env_fn, observation_space, n_steps=4
+):
+    """Tests that the observation buffers keep the (ragged) observations of sequence and graph spaces."""
+    # Every sub-environment has its own copy of the space, as the space is seeded on reset
+    env_fns = [
+        lambda: GenericTestEnv(observation_space=deepcopy(observation_space))
+        for _ in range(2)
+    ]
+    copy_envs = vector_env_fn(env_fns)
+    buffered_envs = vector_env_fn(env_fns, observation_buffers=2)
+
+    observations = [buffered_envs.reset(seed=1)[0]]
+    copy_observations = [copy_envs.reset(seed=1)[0]]
+    for _ in range(n_steps):
+        actions = copy_envs.action_space.sample()
+        copy_observations.append(copy_envs.step(actions)[0])
+        observations.append(buffered_envs.step(actions)[0])
+
+        assert data_equivalence(observations[-2:], copy_observations[-2:])
+
+    copy_envs.close()
+    buffered_envs.close()
+
+
+@pytest.mark.parametrize("vector_env_fn", VECTOR_ENVS, ids=VECTOR_ENV_IDS)
+@pytest.mark.parametrize("observation_buffers", [1, 2])
+def test_read_only(vector_env_fn, observation_buffers):
+    """Tests that `read_only=True` returns read-only observations that are equal to the copied observations."""
+    observation_space = Dict(
+        pixels=Box(0, 255, (4, 4, 3), dtype=np.uint8), id=Discrete(5)
+    )
+    # Every sub-environment has its own copy of the space, as the space is seeded on reset
+    env_fns = [
+        lambda: GenericTestEnv(observation_space=deepcopy(observation_space))
+        for _ in range(2)
+    ]
+    envs = vector_env_fn(
+        env_fns, copy=False, observation_buffers=observation_buffers, read_only=True
+    )
+
+    observations, _ = envs.reset(seed=1)
+    assert all(not leaf.flags.writeable for leaf in _leaves(observations))
+    with pytest.raises(ValueError, match="read-only"):
+        observations["pixels"][0] = 0
+
+    observations, *_ = envs.step(envs.action_space.sample())
+    assert all(not leaf.flags.writeable for leaf in _leaves(observations))
+    assert observations in envs.observation_space
+    envs.close()
+
+
+@pytest.mark.parametrize("vector_env_fn", VECTOR_ENVS, ids=VECTOR_ENV_IDS)
+def test_observation_buffers_partial_reset(vector_env_fn):
+    """Tests that the observations of the sub-environments that are not reset are kept with `observation_buffers`."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(3)]
+    copy_envs = vector_env_fn(env_fns, autoreset_mode=AutoresetMode.DISABLED)
+    buffered_envs = vector_env_fn(
+        env_fns, autoreset_mode=AutoresetMode.DISABLED, observation_buffers=2
+    )
+
+    copy_envs.reset(seed=1)
+    buffered_envs.reset(seed=1)
+    actions = copy_envs.action_space.sample()
+    copy_envs.step(actions)
+    buffered_envs.step(actions)
+
+    reset_mask = np.array([True, False, True])
+    assert data_equivalence(
+        copy_envs.reset(options={"reset_mask": reset_mask}),
+        buffered_envs.reset(options={"reset_mask": reset_mask}),
+    )
+
+    copy_envs.close()
+    buffered_envs.close()
+
+
+@pytest.mark.parametrize("vector_env_fn", VECTOR_ENVS, ids=VECTOR_ENV_IDS)
+def test_invalid_observation_buffers(vector_env_fn):
+    """Tests that `observation_buffers` must be at least 1."""
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Expected `observation_buffers` to be at least 1, actual got 0"
+        ),
+    ):
+        vector_env_fn([make_env("CartPole-v1", 0)], observation_buffers=0)
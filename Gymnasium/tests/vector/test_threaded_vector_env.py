@@ -0,0 +1,173 @@
+"""Test the `ThreadedVectorEnv` implementation."""
+
+import copy
+import re
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.spaces import Box, Dict, Discrete, Graph
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AutoresetMode, SyncVectorEnv, ThreadedVectorEnv
+from tests.testing_env import GenericTestEnv
+from tests.vector.testing_utils import make_custom_space_env, make_env
+
+
+def test_create_threaded_vector_env():
+    """Tests creating the threaded vector environment."""
+    env_fns = [make_env("FrozenLake-v1", i) for i in range(8)]
+    envs = ThreadedVectorEnv(env_fns, num_threads=3)
+
+    assert envs.num_envs == 8
+    assert envs.num_threads == 3
+    envs.close()
+
+    # The number of threads is capped by the number of environments
+    envs = ThreadedVectorEnv(
+        [make_env("CartPole-v1", i) for i in range(2)], num_threads=4
+    )
+    assert envs.num_threads == 2
+    envs.close()
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape("Expected `num_threads` to be at least 1, actual got 0"),
+    ):
+        ThreadedVectorEnv([make_env("CartPole-v1", 0)], num_threads=0)
+
+
+@pytest.mark.parametrize("env_id", ["CartPole-v1", "FrozenLake-v1", "Blackjack-v1"])
+@pytest.mark.parametrize("autoreset_mode", list(AutoresetMode))
+@pytest.mark.parametrize("num_threads", [1, 3])
+@pytest.mark.parametrize("observation_buffers", [1, 2])
+def test_threaded_sync_equivalence(
+    env_id, autoreset_mode, num_threads, observation_buffers, n_steps=50
+):
+    """Tests that the threaded and sync vector environments produce the same results."""
+    sync_envs = SyncVectorEnv(
+        [make_env(env_id, i) for i in range(5)],
+        autoreset_mode=autoreset_mode,
+        observation_buffers=observation_buffers,
+    )
+    threaded_envs = ThreadedVectorEnv(
+        [make_env(env_id, i) for i in range(5)],
+        autoreset_mode=autoreset_mode,
+        num_threads=num_threads,
+        observation_buffers=observation_buffers,
+    )
+
+    assert data_equivalence(sync_envs.reset(seed=123), threaded_envs.reset(seed=123))
+
+    sync_envs.action_space.seed(123)
+    for _ in range(n_steps):
+        actions = sync_envs.action_space.sample()
+        sync_step = sync_envs.step(actions)
+        threaded_step = threaded_envs.step(actions)
+        assert data_equivalence(sync_step, threaded_step)
+
+        if autoreset_mode == AutoresetMode.DISABLED:
+            reset_mask = np.logical_or(sync_step[2], sync_step[3])
+            if np.any(reset_mask):
+                assert data_equivalence(
+                    sync_envs.reset(options={"reset_mask": reset_mask}),
+                    threaded_envs.reset(options={"reset_mask": reset_mask}),
+                )
+
+    sync_envs.close()
+    threaded_envs.close()
+
+
+@pytest.mark.parametrize(
+    "observation_space",
+    [
+        Dict(
+            position=Box(low=-1, high=1, shape=(2,)),
+            tile=Discrete(4),
+        ),
+        Graph(node_space=Box(low=-1, high=1, shape=(3,)), edge_space=Discrete(2)),
+    ],
+)
+def test_threaded_observation_spaces(observation_space):
+    """Tests that nested and non-array observations are batched the same as the sync vector environment."""
+
+    def make_test_env(seed):
+        def _make():
+            env = GenericTestEnv(observation_space=copy.deepcopy(observation_space))
+            env.observation_space.seed(seed)
+            return env
+
+        return _make
+
+    sync_envs = SyncVectorEnv([make_test_env(i) for i in range(4)])
+    threaded_envs = ThreadedVectorEnv(
+        [make_test_env(i) for i in range(4)], num_threads=2
+    )
+
+    assert data_equivalence(sync_envs.reset(seed=1), threaded_envs.reset(seed=1))
+    for _ in range(5):
+        actions = sync_envs.action_space.sample()
+        assert data_equivalence(sync_envs.step(actions), threaded_envs.step(actions))
+
+    sync_envs.close()
+    threaded_envs.close()
+
+
+def test_threaded_copy():
+    """Tests that observations are written in place and only copied if `copy=True`."""
+    envs = ThreadedVectorEnv(
+        [make_env("CartPole-v1", i) for i in range(4)], num_threads=2
+    )
+    obs, _ = envs.reset(seed=0)
+    next_obs, *_ = envs.step(envs.action_space.sample())
+    assert not np.shares_memory(obs, next_obs)
+    envs.close()
+
+    envs = ThreadedVectorEnv(
+        [make_env("CartPole-v1", i) for i in range(4)], copy=False, num_threads=2
+    )
+    obs, _ = envs.reset(seed=0)
+    next_obs, *_ = envs.step(envs.action_space.sample())
+    assert np.shares_memory(obs, next_obs)
+    envs.close()
+
+
+def test_threaded_call_attr():
+    """Tests the `call`, `get_attr` and `set_attr` functions."""
+    envs = ThreadedVectorEnv(
+        [make_custom_space_env(i) for i in range(4)], num_threads=2
+    )
+    envs.reset()
+
+    envs.set_attr("value", [1, 2, 3, 4])
+    assert envs.get_attr("value") == (1, 2, 3, 4)
+    assert envs.call("get_wrapper_attr", "value") == (1, 2, 3, 4)
+    envs.close()
+
+
+def test_threaded_step_error():
+    """Tests that an exception raised in a sub-environment is re-raised by `step`."""
+
+    def step_func(self, action):
+        raise ValueError("Error in step")
+
+    envs = ThreadedVectorEnv(
+        [lambda: GenericTestEnv(step_func=step_func) for _ in range(4)], num_threads=2
+    )
+    envs.reset()
+    with pytest.raises(ValueError, match="Error in step"):
+        envs.step(envs.action_space.sample())
+    envs.close()
+
+
+def test_threaded_make_vec():
+    """Tests the threaded vectorization mode of `gym.make_vec`."""
+    envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=3,
+        vectorization_mode="threaded",
+        vector_kwargs={"num_threads": 2},
+    )
+    assert isinstance(envs, ThreadedVectorEnv)
+    assert envs.num_threads == 2
+    envs.close()
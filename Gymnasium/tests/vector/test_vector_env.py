@@ -89,23 +89,16 @@ def debug_step_func(self, action: ActType) -> tuple[ObsType, float, bool, bool,
 )
 @pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
 def test_vector_obs_action_spaces(vectoriser, space, num_envs=3):
-    try:
-        envs = vectoriser(
-            [
-                lambda: GenericTestEnv(
-                    action_space=space,
-                    observation_space=space,
-                    step_func=debug_step_func,
-                )
-                for _ in range(num_envs)
-            ]
-        )
-    except TypeError as err:
-        assert (
-            "has a dynamic shape so its not possible to make a static shared memory."
-            in str(err)
-        )
-        pytest.skip("Skipping space with dynamic shape")
+    envs = vectoriser(
+        [
+            lambda: GenericTestEnv(
+                action_space=space,
+                observation_space=space,
+                step_func=debug_step_func,
+            )
+            for _ in range(num_envs)
+        ]
+    )
 
     assert envs.observation_space == envs.action_space
 
@@ -0,0 +1,109 @@
+"""Tests the info batching of `gymnasium.vector.utils.batched_info`."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from gymnasium.spaces import Discrete
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector.utils import InfoBatcher, add_info, unbatch_info
+
+
+NUM_ENVS = 4
+
+env_infos_list = [
+    [],
+    [(0, {}), (1, {}), (2, {}), (3, {})],
+    [(i, {"a": i, "b": float(i), "c": None}) for i in range(NUM_ENVS)],
+    [(1, {"a": 1, "d": np.ones((2, 3), dtype=np.float32)}), (3, {"e": Discrete(2)})],
+    # Mixed value types are cast to the type of the first value
+    [(0, {"a": np.int32(1)}), (1, {"a": 2.7}), (2, {"a": True})],
+    [(0, {"a": np.float32(0.5)}), (2, {"a": np.float32(1.5)})],
+    [(0, {"a": "x"}), (1, {"a": 1}), (3, {"a": [1, 2]})],
+    # Nested infos, including the `final_obs` and `final_info` of same-step autoreset
+    [
+        (0, {"final_obs": np.zeros(2), "final_info": {"a": 1, "b": {"c": 2}}}),
+        (0, {"reset": True}),
+        (2, {"final_obs": (1, 2), "final_info": {}}),
+        (2, {"reset": False}),
+    ],
+    [(0, {"episode": {"r": 1.0, "l": 3}}), (1, {"episode": {}})],
+    # A later info of the same environment overwrites the earlier values
+    [(1, {"a": 1, "b": {"c": 1}}), (1, {"a": 2, "b": {"c": 3}})],
+    # Irregular infos
+    [(0, {"a": {"b": 1}}), (1, {"a": 2})],
+    [(0, {"a": "x"}), (3, {"a": {"b": 1}})],
+    [(0, {"a": 1, "_a": 2})],
+]
+
+
+def _assert_identical(batched: dict[str, Any], expected: dict[str, Any]):
+    assert list(batched.keys()) == list(expected.keys())
+    for key, value in expected.items():
+        if isinstance(value, dict):
+            _assert_identical(batched[key], value)
+        else:
+            assert type(batched[key]) is type(value)
+            assert getattr(batched[key], "dtype", None) == getattr(value, "dtype", None)
+            assert data_equivalence(batched[key], value)
+
+
+@pytest.mark.parametrize("env_infos", env_infos_list)
+@pytest.mark.parametrize("reuse_buffers", [False, True])
+def test_info_batcher(env_infos, reuse_buffers):
+    """Tests that the info batcher is identical to folding the infos with `add_info`."""
+    batcher = InfoBatcher(NUM_ENVS, reuse_buffers=reuse_buffers)
+
+    expected = {}
+    try:
+        for env_num, info in env_infos:
+            expected = add_info(expected, info, env_num, NUM_ENVS)
+    except Exception as error:
+        with pytest.raises(type(error)):
+            batcher(env_infos)
+        return
+
+    _assert_identical(batcher(env_infos), expected)
+    # The second call reuses the inferred column types (and buffers)
+    _assert_identical(batcher(env_infos), expected)
+
+
+def test_info_batcher_reuse_buffers():
+    """Tests that the info arrays are only reused (and cleared) with `reuse_buffers=True`."""
+    batcher = InfoBatcher(NUM_ENVS, reuse_buffers=True)
+    first = batcher([(0, {"a": 1, "b": "x"}), (1, {"a": 2})])
+    second = batcher([(2, {"a": 3})])
+    assert first["a"] is second["a"] and first["_a"] is second["_a"]
+    assert data_equivalence(
+        second,
+        {"a": np.array([0, 0, 3, 0]), "_a": np.array([False, False, True, False])},
+    )
+
+    # A change of the column type allocates a new array
+    third = batcher([(1, {"a": 0.5})])
+    assert third["a"] is not second["a"] and third["a"].dtype == np.float64
+
+    batcher = InfoBatcher(NUM_ENVS)
+    first = batcher([(0, {"a": 1})])
+    second = batcher([(0, {"a": 1})])
+    assert first["a"] is not second["a"]
+
+
+@pytest.mark.parametrize("env_infos", env_infos_list[:-3])
+def test_unbatch_info(env_infos):
+    """Tests that `unbatch_info` recovers the info of each environment."""
+    expected = [{} for _ in range(NUM_ENVS)]
+    for env_num, info in env_infos:
+        expected[env_num].update(info)
+
+    list_info = unbatch_info(InfoBatcher(NUM_ENVS)(env_infos), NUM_ENVS)
+    assert len(list_info) == NUM_ENVS
+    for env_info, expected_info in zip(list_info, expected):
+        assert env_info.keys() == expected_info.keys()
+        assert (
+            env_info.get("final_info", {}).keys()
+            == expected_info.get("final_info", {}).keys()
+        )
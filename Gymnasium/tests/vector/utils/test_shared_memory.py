@@ -34,14 +34,7 @@ def test_shared_memory_create_read_write(space, num, ctx):
     ctx = _ctx
 
     batched_space = batch_space(space, n=num)
-    try:
-        shared_memory = create_shared_memory(space, n=num, ctx=ctx)
-    except TypeError as err:
-        assert (
-            "has a dynamic shape so its not possible to make a static shared memory."
-            in str(err)
-        )
-        pytest.skip("Skipping space with dynamic shape")
+    shared_memory = create_shared_memory(space, n=num, ctx=ctx)
 
     samples = [space.sample() for _ in range(num)]
     for i, sample in enumerate(samples):
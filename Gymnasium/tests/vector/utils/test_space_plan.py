@@ -0,0 +1,104 @@
+"""Tests the `SpacePlan` of `gymnasium.vector.utils.space_plan`."""
+
+import numpy as np
+import pytest
+
+from gymnasium.spaces import Box, Dict, Discrete, Graph, MultiBinary, Space, Tuple
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import SyncVectorEnv
+from gymnasium.vector.utils import (
+    SpacePlan,
+    batch_space,
+    concatenate,
+    create_empty_array,
+    iterate,
+)
+from tests.spaces.utils import TESTING_SPACES, TESTING_SPACES_IDS
+from tests.testing_env import GenericTestEnv
+from tests.vector.testing_utils import CustomSpace
+
+
+@pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
+@pytest.mark.parametrize("n", [1, 4])
+def test_space_plan(space: Space, n: int):
+    """Tests that the space plan concatenates and iterates the same as `concatenate` and `iterate`."""
+    plan = SpacePlan(space, n)
+
+    samples = [space.sample() for _ in range(n)]
+    expected = concatenate(space, samples, create_empty_array(space, n))
+    assert data_equivalence(
+        plan.concatenate(samples, create_empty_array(space, n)), expected
+    )
+
+    batched_space = batch_space(space, n)
+    batch = batched_space.sample()
+    assert data_equivalence(
+        list(plan.iterate(batch)), list(iterate(batched_space, batch))
+    )
+
+
+def test_space_plan_layout():
+    """Tests the leaf layout of a compiled space plan and that `concatenate` writes into `out`."""
+    space = Dict(
+        a=Dict(b=Box(0, 1, shape=(2,)), c=Tuple((Discrete(3), MultiBinary(4)))),
+        d=Box(0, 255, shape=(3, 3), dtype=np.uint8),
+    )
+    plan = SpacePlan(space, n=2)
+
+    assert plan.compiled
+    assert plan.paths == (("a", "b"), ("a", "c", 0), ("a", "c", 1), ("d",))
+    assert plan.dtypes == (np.float32, np.int64, np.int8, np.uint8)
+    assert plan.shapes == ((2,), (), (4,), (3, 3))
+
+    out = create_empty_array(space, n=2)
+    assert plan.concatenate([space.sample(), space.sample()], out) is out
+
+    batch = batch_space(space, 2).sample()
+    for index, sample in enumerate(plan.iterate(batch)):
+        assert np.shares_memory(sample["d"], batch["d"])
+        assert data_equivalence(sample["a"]["c"][1], batch["a"]["c"][1][index])
+
+
+@pytest.mark.parametrize(
+    "space",
+    [
+        Graph(node_space=Box(0, 1, shape=(2,)), edge_space=None),
+        Dict(a=Box(0, 1), b=Tuple((Discrete(2), CustomSpace()))),
+    ],
+)
+def test_space_plan_fallback(space: Space):
+    """Tests that spaces with dynamic or custom leaves are not compiled."""
+    assert not SpacePlan(space, n=2).compiled
+
+
+@pytest.mark.parametrize(
+    "sample, error",
+    [
+        ({"a": np.zeros(1, dtype=np.float32), "b": 1}, ValueError),
+        ({"a": np.zeros(3, dtype=np.float32), "b": 1.7}, TypeError),
+    ],
+    ids=["shape", "dtype"],
+)
+def test_space_plan_invalid_samples(sample, error):
+    """Tests that the space plan raises for samples with an invalid shape or dtype, as `concatenate` does."""
+    space = Dict(a=Box(0, 1, shape=(3,)), b=Discrete(3))
+    plan = SpacePlan(space, n=2)
+    valid_sample = {"a": np.zeros(3, dtype=np.float32), "b": 1}
+
+    with pytest.raises(error):
+        concatenate(space, [valid_sample, sample], create_empty_array(space, n=2))
+    with pytest.raises(error):
+        plan.concatenate([valid_sample, sample], create_empty_array(space, n=2))
+
+    # The vector environments concatenate the observations with a space plan
+    envs = SyncVectorEnv(
+        [
+            lambda: GenericTestEnv(
+                observation_space=space, reset_func=lambda self, **_: (sample, {})
+            )
+        ]
+        * 2
+    )
+    with pytest.raises(error):
+        envs.reset()
+    envs.close()
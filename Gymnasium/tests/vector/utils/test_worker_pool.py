@@ -0,0 +1,137 @@
+"""Tests the `WorkerPool` of `gymnasium.vector.utils.worker_pool`."""
+
+import re
+import warnings
+from multiprocessing import TimeoutError
+
+import pytest
+
+import gymnasium as gym
+from gymnasium.vector import AsyncVectorEnv
+from gymnasium.vector.utils import WorkerPool
+from tests.vector.testing_utils import make_env
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """A worker pool of 4 workers using a fork server."""
+    return WorkerPool(max_workers=4)
+
+
+def test_worker_pool_lease(pool):
+    """Tests that leases are counted and limited to `max_workers`."""
+    assert pool.context.get_start_method() == "forkserver"
+
+    with pool.lease(3) as lease:
+        assert pool.num_leased == 3 and lease.context is pool.context
+        with pytest.raises(TimeoutError):
+            pool.lease(2, timeout=0.01)
+        with pool.lease(1):
+            assert pool.num_leased == 4
+    assert pool.num_leased == 0
+
+    lease.release()
+    assert pool.num_leased == 0
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Expected `num_workers` to be at most the `max_workers` of the pool (4), actual got 5"
+        ),
+    ):
+        pool.lease(5)
+
+
+@pytest.mark.parametrize("envs_per_worker", [1, 2])
+def test_worker_pool_async_vector_env(pool, envs_per_worker):
+    """Tests that an `AsyncVectorEnv` leases its workers from the pool until it is closed."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(4)]
+    envs = AsyncVectorEnv(env_fns, worker_pool=pool, envs_per_worker=envs_per_worker)
+    assert pool.num_leased == envs.num_workers
+
+    reference_envs = AsyncVectorEnv(env_fns, envs_per_worker=envs_per_worker)
+    observations, _ = envs.reset(seed=1)
+    reference_observations, _ = reference_envs.reset(seed=1)
+    assert (observations == reference_observations).all()
+    envs.step(envs.action_space.sample())
+
+    envs.close()
+    reference_envs.close()
+    assert pool.num_leased == 0
+
+
+def test_worker_pool_make_vec(pool):
+    """Tests that `make_vec` passes the worker pool to `AsyncVectorEnv`."""
+    envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=2,
+        vectorization_mode="async",
+        vector_kwargs={"worker_pool": pool},
+    )
+    assert pool.num_leased == 2
+    envs.reset(seed=1)
+    envs.close()
+    assert pool.num_leased == 0
+
+
+def test_worker_pool_errors(pool):
+    """Tests the errors of invalid worker pool arguments."""
+    with pytest.raises(
+        ValueError,
+        match=re.escape("Expected `max_workers` to be at least 1, actual got 0"),
+    ):
+        WorkerPool(max_workers=0)
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Expected `context` to be None with a `worker_pool`, actual got 'spawn'"
+        ),
+    ):
+        AsyncVectorEnv([make_env("CartPole-v1", 0)], context="spawn", worker_pool=pool)
+
+
+def test_worker_pool_preload(pool):
+    """Tests the warnings if the `preload` of a worker pool is not imported by the fork server."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        WorkerPool(max_workers=1, preload=pool.preload)
+        WorkerPool(max_workers=1, context="spawn")
+
+    # The fork server of the process is already running
+    with pytest.warns(
+        UserWarning,
+        match=re.escape(
+            "The fork server is already running, so the worker pool can't preload ('gymnasium.envs.classic_control',), "
+            "the server preloaded ('__main__', 'gymnasium')."
+        ),
+    ):
+        WorkerPool(max_workers=1, preload=["gymnasium.envs.classic_control"])
+
+    with pytest.warns(
+        UserWarning,
+        match=re.escape(
+            "The `preload` modules of a worker pool are only imported with the 'forkserver' context, actual context is 'spawn'."
+        ),
+    ):
+        WorkerPool(max_workers=1, preload=["gymnasium"], context="spawn")
+
+
+def test_worker_pool_release_on_error(pool):
+    """Tests that the lease times out with `worker_pool_timeout` and is released if the workers fail to start."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(2)]
+    with pool.lease(3):
+        with pytest.raises(TimeoutError):
+            AsyncVectorEnv(env_fns, worker_pool=pool, worker_pool_timeout=0.01)
+        assert pool.num_leased == 3
+    assert pool.num_leased == 0
+
+    # The observation space of the second sub-environment differs, so checking the spaces fails.
+    #   The lease is released without waiting for the environment to be garbage collected (the traceback references it)
+    env_fns = [make_env("CartPole-v1", 0), make_env("MountainCar-v0", 1)]
+    with pytest.raises(
+        RuntimeError, match="observation spaces are not equivalent"
+    ) as exc_info:
+        AsyncVectorEnv(env_fns, worker_pool=pool)
+    assert pool.num_leased == 0
+    assert isinstance(exc_info.value, RuntimeError)
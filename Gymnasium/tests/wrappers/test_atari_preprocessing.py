@@ -58,6 +58,16 @@ pytest.importorskip("ale_py")
             ),
             (210, 160, 3),
         ),
+        (
+            AtariPreprocessing(
+                gym.make("ALE/Pong-v5"),
+                grayscale_obs=True,
+                frame_skip=1,
+                noop_max=0,
+                raw_frames=True,
+            ),
+            (2, 210, 160),
+        ),
     ],
 )
 def test_atari_preprocessing_grayscale(env, expected_obs_shape):
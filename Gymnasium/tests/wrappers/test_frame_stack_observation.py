@@ -157,3 +157,28 @@ def test_stack_size_failures():
         ),
     ):
         FrameStackObservation(env, stack_size=3, padding_type=invalid_padding)
+
+
+def test_frame_stack_no_copy(stack_size: int = 3, num_steps: int = 50):
+    """Test that with `copy=False`, the stacked observations are views that are equal to the copies and kept for a step."""
+    env = FrameStackObservation(gym.make("CartPole-v1"), stack_size, copy=False)
+    copy_env = FrameStackObservation(gym.make("CartPole-v1"), stack_size)
+
+    obs, _ = env.reset(seed=SEED)
+    copy_obs, _ = copy_env.reset(seed=SEED)
+    assert np.shares_memory(obs, env.frame_buffer.buffer)
+    env.action_space.seed(SEED)
+    for _ in range(num_steps):
+        action = env.action_space.sample()
+        next_obs, _, terminated, truncated, _ = env.step(action)
+        next_copy_obs, *_ = copy_env.step(action)
+        assert data_equivalence(next_obs, next_copy_obs)
+        assert data_equivalence(obs, copy_obs)
+        obs, copy_obs = next_obs, next_copy_obs
+
+        if terminated or truncated:
+            reset_obs, _ = env.reset()
+            reset_copy_obs, _ = copy_env.reset()
+            assert data_equivalence(reset_obs, reset_copy_obs)
+            assert data_equivalence(obs, copy_obs)
+            obs, copy_obs = reset_obs, reset_copy_obs
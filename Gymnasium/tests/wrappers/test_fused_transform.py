@@ -0,0 +1,161 @@
+"""Test suite for the FusedTransform wrapper and `fuse_transforms`."""
+
+import re
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.spaces import Box
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.wrappers import (
+    ClipAction,
+    ClipReward,
+    DtypeObservation,
+    FusedTransform,
+    GrayscaleObservation,
+    NormalizeObservation,
+    RescaleAction,
+    ResizeObservation,
+    TransformObservation,
+    fuse_transforms,
+)
+from tests.testing_env import GenericTestEnv
+
+
+def _image_reset(self: gym.Env, seed=None, options=None):
+    super(GenericTestEnv, self).reset(seed=seed)
+    shape = self.observation_space.shape
+    return self.np_random.integers(0, 256, size=shape, dtype=np.uint8), {}
+
+
+def _image_step(self: gym.Env, action):
+    obs = self.np_random.integers(
+        0, 256, size=self.observation_space.shape, dtype=np.uint8
+    )
+    reward = self.np_random.normal(scale=2.0)
+    return obs, reward, False, False, {"action": np.copy(action)}
+
+
+def _make_base_image_env(channels: int = 3) -> gym.Env:
+    return GenericTestEnv(
+        action_space=Box(-2, 2, shape=(2,), dtype=np.float32),
+        observation_space=Box(0, 255, shape=(32, 24, channels), dtype=np.uint8),
+        reset_func=_image_reset,
+        step_func=_image_step,
+    )
+
+
+def _make_image_env(chain: str) -> gym.Env:
+    if chain == "single-channel":
+        env = ClipAction(RescaleAction(_make_base_image_env(channels=1), 0, 1))
+        env = ResizeObservation(env, (5, 6))
+    else:
+        env = ClipAction(RescaleAction(_make_base_image_env(), 0, 1))
+        if chain == "grayscale-resize":
+            env = GrayscaleObservation(env, keep_dim=True)
+            env = ResizeObservation(env, (5, 6))
+        else:
+            env = ResizeObservation(env, (16, 12))
+            env = GrayscaleObservation(
+                env, keep_dim=chain == "resize-grayscale-keep-dim"
+            )
+    env = DtypeObservation(env, np.float32)
+    return ClipReward(env, -1, 1)
+
+
+@pytest.mark.parametrize(
+    "chain",
+    [
+        "resize-grayscale",
+        "resize-grayscale-keep-dim",
+        "grayscale-resize",
+        "single-channel",
+    ],
+)
+def test_fused_transform_equivalence(chain: str):
+    """Tests that the fused wrapper returns the same observations, rewards and actions as the wrapper stack."""
+    env = _make_image_env(chain)
+    fused_env = FusedTransform(_make_image_env(chain))
+    assert fused_env.num_fused_wrappers == (5 if chain == "single-channel" else 6)
+    assert fused_env.observation_space == env.observation_space
+    assert fused_env.action_space == env.action_space
+
+    obs, info = env.reset(seed=123)
+    fused_obs, fused_info = fused_env.reset(seed=123)
+    assert data_equivalence(obs, fused_obs, exact=True)
+
+    previous_obs = fused_obs
+    for action in np.linspace(-0.5, 1.5, num=10, dtype=np.float32):
+        action = np.full(2, action, dtype=np.float32)
+        step = env.step(action)
+        fused_step = fused_env.step(action)
+        assert data_equivalence(step, fused_step, exact=True)
+        if chain not in {"grayscale-resize", "single-channel"}:
+            # `ResizeObservation` drops the channel axis of its single channel observation space
+            assert fused_step[0] in fused_env.observation_space
+
+        # The returned observations are not overwritten by the next step
+        assert not np.shares_memory(fused_step[0], previous_obs)
+        previous_obs = fused_step[0]
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.float32])
+def test_fused_transform_no_aliasing(dtype):
+    """Tests that the observations are not overwritten by the next step, including with a no-op dtype cast."""
+    env = ResizeObservation(_make_base_image_env(), (4, 4))
+    fused_env = FusedTransform(DtypeObservation(env, dtype))
+
+    obs, _ = fused_env.reset(seed=123)
+    expected_obs = obs.copy()
+    next_obs, *_ = fused_env.step(fused_env.action_space.sample())
+
+    assert next_obs is not obs and not np.shares_memory(next_obs, obs)
+    assert data_equivalence(obs, expected_obs, exact=True)
+
+
+def test_fused_transform_spec():
+    """Tests that the spec of the fused wrapper is that of the wrapper stack, such that it can be recreated."""
+    env = ClipAction(RescaleAction(gym.make("Pendulum-v1"), 0, 1))
+    fused_env = FusedTransform(env)
+
+    assert fused_env.spec == env.spec
+    assert [wrapper.name for wrapper in fused_env.spec.additional_wrappers] == [
+        "RescaleAction",
+        "ClipAction",
+    ]
+    assert gym.make(fused_env.spec).spec == env.spec
+
+
+def test_fuse_transforms():
+    """Tests that `fuse_transforms` only fuses the chains of transform wrappers."""
+    env = GenericTestEnv(observation_space=Box(0, 1, shape=(2,)))
+    env = TransformObservation(env, lambda obs: obs + 1, None)
+    env = TransformObservation(env, lambda obs: obs * 2, None)
+    env = NormalizeObservation(env)
+    env = TransformObservation(env, lambda obs: obs - 1, None)
+    env = ClipReward(env, 0, 1)
+    env = ClipReward(env, 0, 1)
+
+    fused_env = fuse_transforms(env)
+    assert isinstance(fused_env, FusedTransform)
+    assert fused_env.num_fused_wrappers == 3
+    assert isinstance(fused_env.transformed_env, NormalizeObservation)
+
+    inner_fused_env = fused_env.transformed_env.env
+    assert isinstance(inner_fused_env, FusedTransform)
+    assert inner_fused_env.num_fused_wrappers == 2
+    assert isinstance(inner_fused_env.transformed_env, GenericTestEnv)
+
+    # A single transform wrapper isn't fused with the default `min_wrappers`
+    single_env = ClipReward(NormalizeObservation(GenericTestEnv()), 0, 1)
+    assert fuse_transforms(single_env) is single_env
+
+
+def test_fused_transform_invalid_env():
+    """Tests that only transform wrappers can be fused."""
+    with pytest.raises(
+        ValueError,
+        match=re.escape("Expected `env` to be a transform wrapper"),
+    ):
+        FusedTransform(NormalizeObservation(gym.make("CartPole-v1")))
@@ -46,13 +46,13 @@ def test_update_running_mean_property():
     assert wrapped_env.update_running_mean
 
     wrapped_env.reset()
-    rms_var_init = wrapped_env.obs_rms.var
-    rms_mean_init = wrapped_env.obs_rms.mean
+    rms_var_init = wrapped_env.obs_rms.var.copy()
+    rms_mean_init = wrapped_env.obs_rms.mean.copy()
 
     # Statistics are updated when env.step()
     wrapped_env.step(None)
-    rms_var_updated = wrapped_env.obs_rms.var
-    rms_mean_updated = wrapped_env.obs_rms.mean
+    rms_var_updated = wrapped_env.obs_rms.var.copy()
+    rms_mean_updated = wrapped_env.obs_rms.mean.copy()
     assert rms_var_init != rms_var_updated
     assert rms_mean_init != rms_mean_updated
 
@@ -138,6 +138,75 @@ def test_video_length(video_length: int = 10):
     shutil.rmtree("videos")
 
 
+@pytest.mark.parametrize("backpressure", ["block", "drop", "downsample"])
+def test_background_encoding(backpressure, n_steps: int = 30):
+    """Test that RecordVideo streams the frames to the video encoders and waits for the videos on close."""
+    env = gym.make("CartPole-v1", render_mode="rgb_array")
+    env = RecordVideo(
+        env,
+        "videos",
+        step_trigger=lambda x: x % 10 == 0,
+        video_length=5,
+        max_queue_size=2,
+        backpressure=backpressure,
+    )
+    env.reset(seed=123)
+    env.action_space.seed(123)
+    for _ in range(n_steps):
+        _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+        assert env.num_recorded_frames <= 6
+        if terminated or truncated:
+            env.reset()
+    env.close()
+
+    assert env.video_encoder is None and env.pending_encoders == []
+    mp4_files = {file for file in os.listdir("videos") if file.endswith(".mp4")}
+    assert mp4_files == {f"rl-video-step-{i}.mp4" for i in range(0, n_steps, 10)}
+    assert all(os.path.getsize(f"videos/{file}") > 0 for file in mp4_files)
+    shutil.rmtree("videos")
+
+
+def test_invalid_backpressure():
+    """Test that RecordVideo raises for an invalid `max_queue_size` and `backpressure`."""
+    env = gym.make("CartPole-v1", render_mode="rgb_array")
+    with pytest.raises(ValueError, match="Expected `max_queue_size` to be at least 1"):
+        RecordVideo(env, "videos", max_queue_size=0)
+    with pytest.raises(ValueError, match="Unexpected `backpressure`"):
+        RecordVideo(env, "videos", backpressure="skip")
+    env.close()
+
+
+def test_failed_video_encoder():
+    """Test that the recorder is reset and the failed video dropped before raising the error of the video encoder."""
+    env = RecordVideo(
+        gym.make("CartPole-v1", render_mode="rgb_array"),
+        "videos",
+        episode_trigger=lambda x: False,
+    )
+    env.reset(seed=123)
+    env.start_recording("failed-video")
+    # The frame is not an RGB array, so encoding the video fails
+    env._record_frame(np.zeros((4, 4), dtype=np.uint8))
+    encoder = env.video_encoder
+    encoder.close()
+    with pytest.raises(ValueError):
+        encoder.wait()
+
+    with pytest.raises(ValueError, match="Expected the frames to be RGB arrays"):
+        env.stop_recording()
+    assert not env.recording
+    assert env.video_encoder is None and env.num_recorded_frames == 0
+    assert env.pending_encoders == []
+
+    # The recorder can still save the next videos
+    env.start_recording("video")
+    env.step(env.action_space.sample())
+    env.close()
+
+    assert os.listdir("videos") == ["video.mp4"]
+    shutil.rmtree("videos")
+
+
 def test_with_rgb_array_list(n_steps: int = 10):
     """Test if `env.render` works with RenderCollection and RecordVideo."""
     # fyi, can't work as a `pytest.mark.parameterize`
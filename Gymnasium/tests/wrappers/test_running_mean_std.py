@@ -0,0 +1,129 @@
+"""Test suite for the in-place, shared, mergeable `RunningMeanStd` statistics."""
+
+import pickle
+import re
+from functools import partial
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv
+from gymnasium.wrappers import NormalizeObservation
+from gymnasium.wrappers.utils import RunningMeanStd
+
+
+def test_update_in_place():
+    """Tests that the statistics are updated in-place to the mean and variance of all the values."""
+    rng = np.random.default_rng(123)
+    values = rng.normal(2.0, 3.0, size=(100, 3))
+
+    rms = RunningMeanStd(epsilon=0, shape=(3,))
+    mean, var = rms.mean, rms.var
+    rms.update(values[:1])
+    for batch in np.split(values[1:], 11):
+        rms.update(batch)
+
+    assert rms.mean is mean and rms.var is var
+    assert rms.count == 100
+    np.testing.assert_allclose(rms.mean, np.mean(values, axis=0))
+    np.testing.assert_allclose(rms.var, np.var(values, axis=0))
+
+
+def test_merge():
+    """Tests that merging the statistics of workers is equivalent to updating with all of their values."""
+    rng = np.random.default_rng(123)
+    values = [rng.normal(i, i + 1, size=(20 * (i + 1), 2)) for i in range(3)]
+
+    expected_rms = RunningMeanStd(shape=(2,))
+    expected_rms.update(np.concatenate(values))
+
+    rms = RunningMeanStd(shape=(2,))
+    rms.update(values[0])
+    for worker_values in values[1:]:
+        worker_rms = RunningMeanStd(epsilon=0, shape=(2,))
+        worker_rms.update(worker_values)
+        rms.merge(worker_rms)
+
+    assert rms.count == pytest.approx(expected_rms.count)
+    np.testing.assert_allclose(rms.mean, expected_rms.mean)
+    np.testing.assert_allclose(rms.var, expected_rms.var)
+
+
+def test_freeze():
+    """Tests that the frozen statistics are a copy that can't be updated."""
+    rms = RunningMeanStd(shape=(2,), shared=True)
+    rms.update(np.array([[1.0, 2.0], [3.0, 4.0]]))
+
+    frozen = rms.freeze()
+    assert frozen.frozen and not frozen.shared
+    np.testing.assert_equal(frozen.mean, rms.mean)
+    assert frozen.count == rms.count
+    with pytest.raises(ValueError, match="Cannot update frozen"):
+        frozen.update(np.array([[1.0, 2.0]]))
+
+    rms.update(np.array([[5.0, 6.0]]))
+    assert not np.array_equal(frozen.mean, rms.mean)
+
+
+def test_normalize_dtype():
+    """Tests that the values are normalized in the dtype of the statistics, without upcasting."""
+    rms = RunningMeanStd(epsilon=0, shape=(2,), dtype=np.float32)
+    rms.update(np.array([[1.0, 2.0], [3.0, 6.0]], dtype=np.float64))
+    assert rms.mean.dtype == rms.var.dtype == np.float32
+
+    normalized = rms.normalize(np.array([2.0, 4.0]))
+    assert normalized.dtype == np.float32
+    np.testing.assert_allclose(normalized, [0.0, 0.0], atol=1e-6)
+
+    assert RunningMeanStd(dtype=np.uint8).dtype == np.float64
+
+
+def _make_normalized_env(obs_rms: RunningMeanStd) -> gym.Env:
+    return NormalizeObservation(gym.make("CartPole-v1"), obs_rms=obs_rms)
+
+
+@pytest.mark.parametrize(
+    "vector_env_fn, context",
+    [
+        (SyncVectorEnv, None),
+        (partial(AsyncVectorEnv, context="spawn"), "spawn"),
+        (partial(AsyncVectorEnv, context="spawn", envs_per_worker=3), "spawn"),
+        (AsyncVectorEnv, None),
+    ],
+    ids=["sync", "async-spawn", "async-spawn-envs-per-worker", "async"],
+)
+def test_shared_statistics(vector_env_fn, context, num_envs=3, n_steps=5):
+    """Tests that the sub-environments (and workers) update the same shared statistics."""
+    obs_rms = RunningMeanStd(shape=(4,), dtype=np.float32, shared=True, context=context)
+    envs = vector_env_fn([partial(_make_normalized_env, obs_rms)] * num_envs)
+
+    envs.reset(seed=123)
+    for _ in range(n_steps):
+        envs.step(envs.action_space.sample())
+    envs.close()
+
+    assert obs_rms.count == pytest.approx(1e-4 + num_envs * (n_steps + 1))
+    assert np.all(obs_rms.var != 1)
+
+
+def test_shared_statistics_pickle():
+    """Tests that the shared statistics can only be pickled when starting a process."""
+    with pytest.raises(RuntimeError, match="through inheritance"):
+        pickle.dumps(RunningMeanStd(shared=True))
+
+    rms = pickle.loads(pickle.dumps(RunningMeanStd(shape=(2,))))
+    rms.update(np.ones((2, 2)))
+
+
+def test_invalid_obs_rms_shape():
+    """Tests that the statistics must have the shape of the observations."""
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Expected the shape of `obs_rms` to be the observation shape (4,), actual shape: (2,)"
+        ),
+    ):
+        NormalizeObservation(
+            gym.make("CartPole-v1"), obs_rms=RunningMeanStd(shape=(2,))
+        )
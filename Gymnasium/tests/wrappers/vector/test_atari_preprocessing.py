@@ -0,0 +1,194 @@
+"""Test suite for vector AtariPreprocessing wrapper."""
+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.spaces import Box, Discrete
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv
+from gymnasium.wrappers import AtariPreprocessing
+from gymnasium.wrappers.vector import AtariPreprocessing as VectorAtariPreprocessing
+
+
+pytest.importorskip("cv2")
+
+
+class FakeAtariEnv(gym.Env):
+    """An environment with the (frame skip, screen and lives) interface of the ALE used by `AtariPreprocessing`."""
+
+    def __init__(self, life_loss_prob: float = 0.05, terminate_prob: float = 0.02):
+        self.observation_space = Box(0, 255, shape=(210, 160, 3), dtype=np.uint8)
+        self.action_space = Discrete(4)
+        self.life_loss_prob = life_loss_prob
+        self.terminate_prob = terminate_prob
+
+        self._frameskip = 1
+        self.ale = self
+        self._screen = np.zeros(self.observation_space.shape, dtype=np.uint8)
+        self._lives = 0
+
+    def get_action_meanings(self) -> list[str]:
+        return ["NOOP", "FIRE", "RIGHT", "LEFT"]
+
+    def lives(self) -> int:
+        return self._lives
+
+    def getScreenRGB(self, out: np.ndarray):
+        np.copyto(out, self._screen)
+
+    def getScreenGrayscale(self, out: np.ndarray):
+        np.copyto(out, self._screen[..., 1])
+
+    def _update_screen(self, action: int):
+        # A smooth background with a random object, such that the resizing averages different values
+        self._screen[:] = (np.arange(210)[:, None, None] + 40 * action) % 256
+        row, col = self.np_random.integers(0, (200, 150))
+        self._screen[row : row + 10, col : col + 10] = self.np_random.integers(
+            0, 256, size=3, dtype=np.uint8
+        )
+
+    def reset(self, *, seed: int | None = None, options: dict | None = None):
+        super().reset(seed=seed)
+        self._lives = 3
+        self._update_screen(0)
+        return self._screen.copy(), {"lives": self._lives}
+
+    def step(self, action: int):
+        self._update_screen(action)
+        if self.np_random.random() < self.life_loss_prob:
+            self._lives -= 1
+        terminated = self._lives == 0 or self.np_random.random() < self.terminate_prob
+        reward = float(self.np_random.integers(-1, 2))
+        return self._screen.copy(), reward, terminated, False, {"lives": self._lives}
+
+
+@pytest.mark.parametrize("vector_env_cls", [SyncVectorEnv, AsyncVectorEnv])
+@pytest.mark.parametrize(
+    "frame_skip, screen_size, grayscale_obs, grayscale_newaxis, scale_obs",
+    [
+        (4, 84, True, False, False),
+        (4, 84, False, False, True),
+        (1, 84, True, True, False),
+        (3, (120, 100), True, False, True),
+        (4, (64, 105), False, False, False),
+    ],
+)
+def test_vector_atari_preprocessing(
+    vector_env_cls,
+    frame_skip,
+    screen_size,
+    grayscale_obs,
+    grayscale_newaxis,
+    scale_obs,
+    num_envs=4,
+    n_steps=60,
+):
+    """Tests that the vector wrapper returns the same observations as the single environment wrapper."""
+    noop_max = np.array([0, 5, 30, 10])
+    terminal_on_life_loss = np.array([True, False, True, False])
+    kwargs = dict(
+        frame_skip=frame_skip,
+        screen_size=screen_size,
+        grayscale_obs=grayscale_obs,
+        grayscale_newaxis=grayscale_newaxis,
+        scale_obs=scale_obs,
+    )
+
+    envs = [
+        AtariPreprocessing(
+            FakeAtariEnv(),
+            noop_max=int(noop_max[i]),
+            terminal_on_life_loss=bool(terminal_on_life_loss[i]),
+            **kwargs,
+        )
+        for i in range(num_envs)
+    ]
+    vector_envs = vector_env_cls(
+        [lambda: AtariPreprocessing(FakeAtariEnv(), raw_frames=True, **kwargs)]
+        * num_envs
+    )
+    vector_envs = VectorAtariPreprocessing(
+        vector_envs,
+        screen_size=screen_size,
+        grayscale_newaxis=grayscale_newaxis,
+        scale_obs=scale_obs,
+        noop_max=noop_max,
+        terminal_on_life_loss=terminal_on_life_loss,
+    )
+    assert vector_envs.single_observation_space == envs[0].observation_space
+
+    vector_obs, _ = vector_envs.reset(seed=list(range(num_envs)))
+    obs = [env.reset(seed=i)[0] for i, env in enumerate(envs)]
+    assert data_equivalence(vector_obs, np.stack(obs), exact=True)
+
+    autoreset = np.zeros(num_envs, dtype=bool)
+    rng = np.random.default_rng(123)
+    for _ in range(n_steps):
+        actions = rng.integers(0, 4, size=num_envs)
+        vector_obs, vector_rewards, vector_terminations, vector_truncations, _ = (
+            vector_envs.step(actions)
+        )
+        assert vector_obs in vector_envs.observation_space
+
+        # The vector environment autoresets the sub-environments on the next step
+        for i, env in enumerate(envs):
+            if autoreset[i]:
+                obs[i], _ = env.reset()
+                reward, terminated, truncated = 0.0, False, False
+            else:
+                obs[i], reward, terminated, truncated, _ = env.step(actions[i])
+
+            assert data_equivalence(vector_obs[i], obs[i], exact=True)
+            assert vector_rewards[i] == reward
+            assert vector_terminations[i] == terminated
+            assert vector_truncations[i] == truncated
+            autoreset[i] = terminated or truncated
+    vector_envs.close()
+
+
+def test_vector_atari_preprocessing_copy(num_envs=2):
+    """Tests that the output buffer is returned without copying."""
+    vector_envs = SyncVectorEnv(
+        [lambda: AtariPreprocessing(FakeAtariEnv(), raw_frames=True)] * num_envs
+    )
+    vector_envs = VectorAtariPreprocessing(vector_envs, copy=False)
+    assert vector_envs._stacked_resize
+
+    obs, _ = vector_envs.reset(seed=123)
+    next_obs, *_ = vector_envs.step(np.zeros(num_envs, dtype=np.int64))
+    assert next_obs is obs
+    vector_envs.close()
+
+
+def test_vector_atari_preprocessing_invalid(num_envs=2):
+    """Tests that the sub-environments must return raw frames and the masks the number of sub-environments."""
+    vector_envs = SyncVectorEnv([FakeAtariEnv] * num_envs)
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Expected the sub-environments to be `AtariPreprocessing(env, raw_frames=True)`"
+        ),
+    ):
+        VectorAtariPreprocessing(vector_envs)
+
+    vector_envs = SyncVectorEnv(
+        [lambda: AtariPreprocessing(FakeAtariEnv(), raw_frames=True)] * num_envs
+    )
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Expected `terminal_on_life_loss` to be a scalar or an array of shape (2,), actual shape: (3,)"
+        ),
+    ):
+        VectorAtariPreprocessing(
+            vector_envs, terminal_on_life_loss=np.array([True, False, True])
+        )
+    with pytest.raises(
+        ValueError, match=re.escape("Expected `noop_max` to be at least 0")
+    ):
+        VectorAtariPreprocessing(vector_envs, noop_max=np.array([1, -1]))
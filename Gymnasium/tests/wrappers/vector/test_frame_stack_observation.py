@@ -0,0 +1,131 @@
+"""Test suite for vector FrameStackObservation wrapper."""
+
+import re
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.spaces import Text
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AutoresetMode, SyncVectorEnv
+from gymnasium.wrappers import FrameStackObservation
+from gymnasium.wrappers.vector import FrameStackObservation as VectorFrameStack
+from tests.testing_env import GenericTestEnv
+
+
+@pytest.mark.parametrize("copy", [True, False])
+@pytest.mark.parametrize("padding_type", ["reset", "zero"])
+def test_frame_stack_equivalence(copy, padding_type, num_envs=3, num_steps=60):
+    """Test that the vector wrapper stacks the same observations as the wrapper in every sub-environment, including autoresets."""
+    envs = VectorFrameStack(
+        gym.make_vec("CartPole-v1", num_envs=num_envs, vectorization_mode="sync"),
+        stack_size=4,
+        padding_type=padding_type,
+        copy=copy,
+    )
+    env_wrapper_envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=num_envs,
+        vectorization_mode="sync",
+        wrappers=(
+            lambda env: FrameStackObservation(
+                env, stack_size=4, padding_type=padding_type
+            ),
+        ),
+    )
+
+    obs, _ = envs.reset(seed=123)
+    expected_obs, _ = env_wrapper_envs.reset(seed=123)
+    assert data_equivalence(obs, expected_obs)
+
+    envs.action_space.seed(123)
+    for _ in range(num_steps):
+        actions = envs.action_space.sample()
+        next_obs, *_ = envs.step(actions)
+        expected_next_obs, *_ = env_wrapper_envs.step(actions)
+        assert data_equivalence(next_obs, expected_next_obs)
+        # The previous stacked observations are kept even as views of the frame buffer
+        assert data_equivalence(obs, expected_obs)
+        obs, expected_obs = next_obs, expected_next_obs
+
+    envs.close()
+    env_wrapper_envs.close()
+
+
+def test_frame_stack_no_allocation(num_envs=16, num_steps=100):
+    """Test that with `copy=False`, the autoresets alternate between two frame buffers rather than allocating new ones."""
+    envs = VectorFrameStack(
+        gym.make_vec("CartPole-v1", num_envs=num_envs, vectorization_mode="sync"),
+        stack_size=4,
+        copy=False,
+    )
+    envs.reset(seed=123)
+    buffers = [envs.frame_buffer.buffer]
+    num_autoresets = 0
+    for _ in range(num_steps):
+        # Always pushing left terminates the episodes within a few steps, such that some sub-environment autoresets most steps
+        _, _, terminations, truncations, _ = envs.step(
+            np.zeros(num_envs, dtype=np.int64)
+        )
+        num_autoresets += np.any(terminations | truncations)
+        if not any(buffer is envs.frame_buffer.buffer for buffer in buffers):
+            buffers.append(envs.frame_buffer.buffer)
+
+    assert num_autoresets > num_steps // 2
+    assert len(buffers) == 2
+    envs.close()
+
+
+def test_frame_stack_reset_mask(num_envs=3):
+    """Test that only the sub-environments in the `reset_mask` are padded."""
+    envs = VectorFrameStack(
+        SyncVectorEnv(
+            [lambda: gym.make("CartPole-v1") for _ in range(num_envs)],
+            autoreset_mode=AutoresetMode.DISABLED,
+        ),
+        stack_size=3,
+        padding_type="zero",
+    )
+    envs.reset(seed=123)
+    for _ in range(3):
+        obs, *_ = envs.step(np.zeros(num_envs, dtype=np.int64))
+
+    reset_mask = np.array([True, False, True])
+    reset_obs, _ = envs.reset(options={"reset_mask": reset_mask})
+    assert np.all(reset_obs[reset_mask, :2] == 0)
+    assert np.all(reset_obs[reset_mask, 2] != obs[reset_mask, 2])
+    assert data_equivalence(reset_obs[~reset_mask], obs[~reset_mask])
+    envs.close()
+
+
+def test_frame_stack_errors():
+    """Test the errors raised by the vector FrameStackObservation."""
+    envs = gym.make_vec("CartPole-v1", num_envs=2)
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "The stack_size needs to be greater than zero, actual value: 0"
+        ),
+    ):
+        VectorFrameStack(envs, stack_size=0)
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Unexpected `padding_type`, expected 'reset', 'zero' or a custom observation space, actual value: 'unknown'"
+        ),
+    ):
+        VectorFrameStack(envs, stack_size=3, padding_type="unknown")
+
+    text_envs = SyncVectorEnv(
+        [lambda: GenericTestEnv(observation_space=Text(5)) for _ in range(2)]
+    )
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Expected the observation space to be a space of NumPy arrays, actual space: Text(1, 5, charset=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz)"
+        ),
+    ):
+        VectorFrameStack(text_envs, stack_size=3)
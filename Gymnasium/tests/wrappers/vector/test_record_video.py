@@ -206,3 +206,67 @@ def test_video_length(autoreset_mode, video_length: int = 10, n_envs=10):
     mp4_files = [file for file in os.listdir("videos") if file.endswith(".mp4")]
     shutil.rmtree("videos")
     assert len(mp4_files) == 1
+
+
+@pytest.mark.parametrize("backpressure", ["block", "drop"])
+def test_background_encoding(backpressure, n_steps: int = 30, n_envs: int = 4):
+    """Test that RecordVideo streams the concatenated frames to the video encoders and waits for the videos on close."""
+    envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=n_envs,
+        render_mode="rgb_array",
+        vectorization_mode=gym.VectorizeMode.SYNC,
+    )
+    envs = RecordVideo(
+        envs,
+        "videos",
+        step_trigger=lambda x: x % 10 == 0,
+        video_length=5,
+        max_queue_size=2,
+        backpressure=backpressure,
+    )
+    envs.reset(seed=123)
+    envs.action_space.seed(123)
+    for _ in range(n_steps):
+        envs.step(envs.action_space.sample())
+        assert envs.num_recorded_frames <= 6
+    envs.close()
+
+    assert envs.video_encoder is None and envs.pending_encoders == []
+    mp4_files = {file for file in os.listdir("videos") if file.endswith(".mp4")}
+    shutil.rmtree("videos")
+    assert mp4_files == {f"rl-video-step-{i}.mp4" for i in range(0, n_steps, 10)}
+
+
+def test_failed_video_encoder(n_envs: int = 2):
+    """Test that the recorder is reset and the failed video dropped before raising the error of the video encoder."""
+    envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=n_envs,
+        render_mode="rgb_array",
+        vectorization_mode=gym.VectorizeMode.SYNC,
+    )
+    envs = RecordVideo(envs, "videos", episode_trigger=lambda x: False)
+    envs.reset(seed=123)
+    envs.start_recording("failed-video")
+    # The frame is not an RGB array, so encoding the video fails
+    envs._record_frame(np.zeros((4, 4), dtype=np.uint8))
+    encoder = envs.video_encoder
+    encoder.close()
+    with pytest.raises(ValueError):
+        encoder.wait()
+
+    with pytest.raises(ValueError, match="Expected the frames to be RGB arrays"):
+        envs.stop_recording()
+    assert not envs.recording
+    assert envs.video_encoder is None and envs.num_recorded_frames == 0
+    assert envs.pending_encoders == []
+
+    # The recorder can still save the next videos
+    envs.start_recording("video")
+    envs.step(envs.action_space.sample())
+    envs.close()
+
+    mp4_files = os.listdir("videos")
+    shutil.rmtree("videos")
+    assert mp4_files == ["video.mp4"]
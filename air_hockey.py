@@ -4,6 +4,7 @@ import os
 import pygame
 import numpy as np
 from air_hockey_env import AirHockeyEnv 
+from air_hockey_selfplay import flip_observations
 
 MODEL_PATH = "air_hockey_ppo.zip"
 
@@ -51,19 +52,8 @@ def play_game():
             running = False
             break
 
-        # 1. AI 動作
-        w, h = env.width, env.height
-        bx, by = env.ball.body.position
-        bvx, bvy = env.ball.body.velocity
-        ai_pos = env.ai_paddle.body.position
-        player_pos = env.agent_paddle.body.position
-
-        fake_obs = np.array([
-            bx/w, 1 - (by/h),
-            bvx/1000, -bvy/1000,
-            ai_pos.x/w, 1 - (ai_pos.y/h),
-            player_pos.x/w, 1 - (player_pos.y/h)
-        ], dtype=np.float32)
+        # 1. AI 動作 (觀測上下翻轉，見 air_hockey_selfplay.flip_observations)
+        fake_obs = flip_observations(env._get_obs())
 
         action, _ = model.predict(fake_obs)
         env._apply_action(env.ai_paddle, action)
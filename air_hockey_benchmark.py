@@ -0,0 +1,121 @@
+'''
+空氣曲棍球環境的效能測試
+- vector: 比較 AirHockeyVectorEnv (NumPy 批次物理) 和 SyncVectorEnv (每張球桌一個 pymunk Space) 每秒可以跑幾步
+- fast:   檢查 AirHockeyEnv(fast=True) 的軌跡跟一般模式完全相同，並比較 step / _get_obs / 限制球拍的速度
+
+執行方式：
+    python air_hockey_benchmark.py vector --num-envs 1 8 64 --duration 5
+    python air_hockey_benchmark.py fast --duration 5
+'''
+import argparse
+import time
+import timeit
+
+import gymnasium as gym
+import numpy as np
+from gymnasium.utils.performance import benchmark_step
+
+import air_hockey_env  # noqa: F401  (註冊 air-hockey-v0)
+from air_hockey_env import AirHockeyEnv
+
+
+def benchmark_vector_env(env, target_duration=5, seed=None):
+    """量測 vector env 的吞吐量，回傳每秒總共前進幾個 env step (steps × num_envs)。"""
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+
+    steps = 0
+    start = time.perf_counter()
+    while True:
+        env.step(env.action_space.sample())
+        steps += 1
+        if time.perf_counter() - start > target_duration:
+            break
+    length = time.perf_counter() - start
+
+    return steps * env.num_envs / length
+
+
+def compare_vectorization(num_envs_list, target_duration=5, seed=0):
+    results = []
+    for num_envs in num_envs_list:
+        row = {"num_envs": num_envs}
+        for mode in ("vector_entry_point", "sync"):
+            env = gym.make_vec("air-hockey-v0", num_envs=num_envs, vectorization_mode=mode)
+            row[mode] = benchmark_vector_env(env, target_duration, seed)
+            env.close()
+        row["speedup"] = row["vector_entry_point"] / row["sync"]
+        results.append(row)
+        print(
+            f"num_envs={num_envs:5d} | numpy: {row['vector_entry_point']:12.0f} steps/s"
+            f" | pymunk sync: {row['sync']:10.0f} steps/s | x{row['speedup']:.1f}"
+        )
+    return results
+
+
+def rollout(env, seed, num_steps):
+    """用固定的種子跑一段隨機動作，回傳 (observations, rewards, dones)。"""
+    obs, _ = env.reset(seed=seed)
+    rng = np.random.default_rng(seed)
+
+    observations = [np.array(obs)]
+    rewards, dones = [], []
+    for _ in range(num_steps):
+        action = rng.uniform(-1, 1, size=2).astype(np.float32)
+        obs, reward, terminated, truncated, _ = env.step(action)
+        observations.append(np.array(obs))
+        rewards.append(reward)
+        dones.append((terminated, truncated))
+        if terminated or truncated:
+            obs, _ = env.reset()
+            observations.append(np.array(obs))
+    return np.array(observations), np.array(rewards), np.array(dones)
+
+
+def check_fast_trajectories(seeds=(0, 1, 2), num_steps=3000):
+    """確認 fast=True (包含 zero-copy) 跟一般模式在同樣種子下的軌跡逐位元相同。"""
+    for seed in seeds:
+        expected = rollout(AirHockeyEnv(), seed, num_steps)
+        for copy_obs in (True, False):
+            actual = rollout(AirHockeyEnv(fast=True, copy_obs=copy_obs), seed, num_steps)
+            for name, a, b in zip(("observations", "rewards", "dones"), expected, actual):
+                assert np.array_equal(a, b), f"seed={seed}, copy_obs={copy_obs}: {name} differ"
+    print(f"fast mode trajectories match for seeds {list(seeds)} ({num_steps} steps each)")
+
+
+def compare_fast_mode(target_duration=5, seed=0, number=20000):
+    results = {}
+    for name, kwargs in (
+        ("default", {}),
+        ("fast", {"fast": True}),
+        ("fast zero-copy", {"fast": True, "copy_obs": False}),
+    ):
+        env = AirHockeyEnv(**kwargs)
+        env.action_space.seed(seed)
+        steps_per_sec = benchmark_step(env, target_duration, seed)
+        constrain = env._constrain_paddle_movement_fast if env.fast else env._constrain_paddle_movement
+        obs_us = timeit.timeit(env._get_obs, number=number) / number * 1e6
+        constrain_us = timeit.timeit(constrain, number=number) / number * 1e6
+        results[name] = (steps_per_sec, obs_us, constrain_us)
+        print(
+            f"{name:15s} | step: {steps_per_sec:8.0f} steps/s"
+            f" | _get_obs: {obs_us:6.2f} us | constrain: {constrain_us:6.2f} us"
+        )
+        env.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Air hockey benchmarks")
+    parser.add_argument('suite', nargs='?', choices=['vector', 'fast', 'all'], default='all', help='Which benchmarks to run')
+    parser.add_argument('--num-envs', type=int, nargs='+', default=[1, 8, 64, 256], help='Number of tables to step at once')
+    parser.add_argument('--duration', type=float, default=5, help='Seconds per measurement')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for reset and action sampling')
+
+    args = parser.parse_args()
+
+    if args.suite in ('vector', 'all'):
+        compare_vectorization(args.num_envs, args.duration, args.seed)
+    if args.suite in ('fast', 'all'):
+        check_fast_trajectories()
+        compare_fast_mode(args.duration, args.seed)
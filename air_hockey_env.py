@@ -3,11 +3,22 @@ import numpy as np
 import pygame
 import pymunk
 from gymnasium import spaces
+from gymnasium.envs.registration import register
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space
+
+# 註冊成 gym 環境，gym.make / gym.make_vec 都可以直接用這個 id
+# make_vec 預設會走 vector_entry_point (AirHockeyVectorEnv)，一次模擬 N 張球桌
+register(
+    id='air-hockey-v0',
+    entry_point='air_hockey_env:AirHockeyEnv',
+    vector_entry_point='air_hockey_env:AirHockeyVectorEnv',
+)
 
 class AirHockeyEnv(gym.Env):
     metadata = {"render_modes": ["human", "rgb_array"], "render_fps": 60}
 
-    def __init__(self, render_mode=None):
+    def __init__(self, render_mode=None, fast=False, copy_obs=True, reuse_space=False):
         self.width = 500
         self.height = 700 
         self.render_mode = render_mode
@@ -15,6 +26,10 @@ class AirHockeyEnv(gym.Env):
         # === 新增：是否開啟自動陪練對手 ===
         # 預設為 True (訓練時用)，遊玩時我們要把它關掉
         self.with_bot = True 
+
+        # === 新增：自我對戰模式 ===
+        # 為 True 時下方球拍不接滑鼠關節，改用 apply_opponent_action 跟上方一樣用力道控制
+        self.self_play = False
         
         self.action_space = spaces.Box(low=-1, high=1, shape=(2,), dtype=np.float32)
         self.observation_space = spaces.Box(low=-np.inf, high=np.inf, shape=(8,), dtype=np.float32)
@@ -27,8 +42,30 @@ class AirHockeyEnv(gym.Env):
         self.ball_radius = 15
         self.goal_width = 180
 
+        # === 新增：快速模式 (無畫面訓練用) ===
+        # fast=True 時重複使用同一個觀測 buffer、用純 float 運算做 clamp，並快取 body 參考，
+        # 避免 NumPy 對單一純量呼叫的額外開銷。軌跡跟一般模式完全相同。
+        # copy_obs=False 時直接回傳 buffer 本身 (zero-copy)，下一次 step/reset 會覆寫內容
+        self.fast = fast
+        self.copy_obs = copy_obs
+        self._obs_buf = np.zeros(8, dtype=np.float32)
+        r = self.paddle_radius
+        self._agent_bounds = (r, self.width - r, self.height/2 + r, self.height - r)
+        self._ai_bounds = (r, self.width - r, r, self.height/2 - r)
+
+        # === 新增：重複使用同一個 pymunk.Space ===
+        # reuse_space=True 時，第二次之後的 reset 只把球和球拍搬回起始位置，不重新建立 Space
+        self.reuse_space = reuse_space
+        self.space = None
+        self.steps = 0
+
     def reset(self, seed=None, options=None):
         super().reset(seed=seed)
+
+        if self.reuse_space and self.space is not None:
+            self._reposition_bodies()
+            return self._get_obs(), {}
+
         self.space = pymunk.Space()
         self.space.gravity = (0.0, 0.0)
         self.space.damping = 0.999 
@@ -38,7 +75,7 @@ class AirHockeyEnv(gym.Env):
         # === 修改點：依據模式決定球是否要亂跑 ===
         # 如果是訓練模式 (with_bot 為 True)，則 random_launch 開啟 (球會有隨機初速度)
         # 如果是遊玩模式 (with_bot 為 False)，則 random_launch 關閉 (球是靜止的)
-        is_training = self.with_bot
+        is_training = self.with_bot or self.self_play
         self.ball = self._create_ball(self.width/2, self.height/2, random_launch=is_training)
         # =====================================
         
@@ -50,23 +87,33 @@ class AirHockeyEnv(gym.Env):
         self.mouse_body.position = self.agent_paddle.body.position
         self.mouse_joint = pymunk.PivotJoint(self.mouse_body, self.agent_paddle.body, (0, 0), (0, 0))
         self.mouse_joint.max_force = 100000 
-        self.space.add(self.mouse_joint)
+        if not self.self_play:
+            self.space.add(self.mouse_joint)
+
+        # 快取 body 參考，快速模式每個 substep 都會用到
+        self._ball_body = self.ball.body
+        self._ai_body = self.ai_paddle.body
+        self._agent_body = self.agent_paddle.body
 
         self.steps = 0
         return self._get_obs(), {}
 
     def step(self, action):
         # 1. AI (上方) 動作
-        self._apply_action(self.ai_paddle, action)
+        if self.fast:
+            self._apply_action_fast(self._ai_body, action)
+        else:
+            self._apply_action(self.ai_paddle, action)
         
         # 2. 對手 (下方) 動作：如果是訓練模式，讓 Bot 自動跑
         if self.with_bot:
             self._move_bot()
 
         dt = 1.0 / 60.0
+        constrain = self._constrain_paddle_movement_fast if self.fast else self._constrain_paddle_movement
         for _ in range(10):
             self.space.step(dt/10)
-            self._constrain_paddle_movement()
+            constrain()
 
         self.steps += 1
         
@@ -74,7 +121,7 @@ class AirHockeyEnv(gym.Env):
         terminated = False
         truncated = False
 
-        ball_y = self.ball.body.position.y
+        ball_y = self._ball_body.position.y
 
         # 進球判定與獎勵 (為了讓訓練更有效，這裡可以稍微加重獎勵)
         if ball_y < 0: 
@@ -110,12 +157,18 @@ class AirHockeyEnv(gym.Env):
         
         if abs(diff) < speed_limit:
             new_x = ball_x
+        elif self.fast:
+            new_x = current_x + (speed_limit if diff > 0 else -speed_limit)
         else:
             # 往球的方向移動 speed_limit 的距離
             new_x = current_x + speed_limit * np.sign(diff)
             
         # 限制不要跑出牆壁
-        new_x = np.clip(new_x, self.paddle_radius, self.width - self.paddle_radius)
+        if self.fast:
+            x_min, x_max = self._agent_bounds[0], self._agent_bounds[1]
+            new_x = x_min if new_x < x_min else (x_max if new_x > x_max else new_x)
+        else:
+            new_x = np.clip(new_x, self.paddle_radius, self.width - self.paddle_radius)
         
         # 更新隱形滑鼠位置 (Y 軸保持在防守線上)
         self.mouse_body.position = (new_x, self.height - 100)
@@ -128,12 +181,7 @@ class AirHockeyEnv(gym.Env):
         body.position = x, y
         
         if random_launch:
-            # 隨機產生 X 和 Y 方向的初速度
-            # 範圍可以根據手感調整，這裡設為 -200 到 200
-            import random
-            rand_vx = random.uniform(-200, 200)
-            rand_vy = random.uniform(-200, 200)
-            body.velocity = (rand_vx, rand_vy)
+            body.velocity = self._launch_velocity()
             
         shape = pymunk.Circle(body, self.ball_radius)
         shape.elasticity = 1.0 
@@ -141,6 +189,62 @@ class AirHockeyEnv(gym.Env):
         self.space.add(body, shape)
         return shape
 
+    def _launch_velocity(self):
+        # 隨機產生 X 和 Y 方向的初速度
+        # 範圍可以根據手感調整，這裡設為 -200 到 200
+        # 使用 self.np_random，reset(seed=...) 之後每一局都可以重現
+        rand_vx, rand_vy = self.np_random.uniform(-200, 200, size=2)
+        return (float(rand_vx), float(rand_vy))
+
+    def _reposition_bodies(self):
+        # 把所有物體搬回開局位置，並清掉速度和外力
+        w, h = self.width, self.height
+        start = (
+            (self._ball_body, (w/2, h/2)),
+            (self._ai_body, (w/2, 100)),
+            (self._agent_body, (w/2, h - 100)),
+        )
+        for body, position in start:
+            body.position = position
+            body.velocity = (0, 0)
+            body.angle = 0
+            body.angular_velocity = 0
+            body.force = (0, 0)
+            body.torque = 0
+        if self.with_bot or self.self_play:
+            self._ball_body.velocity = self._launch_velocity()
+        self.mouse_body.position = self._agent_body.position
+        for body, _ in start:
+            self.space.reindex_shapes_for_body(body)
+        self.steps = 0
+
+    # === 新增：快照 / 還原 ===
+    # 狀態是一個 float64 陣列：
+    # [球 x, y, vx, vy, 上方球拍 x, y, vx, vy, 下方球拍 x, y, vx, vy, 滑鼠 x, y, 步數]
+    # 可以 pickle，也可以拿同一個快照分岔出很多條 rollout (MCTS、評估)，不用從 reset 重播
+    def get_state(self):
+        assert self.space is not None, "Call reset before using get_state method."
+        state = np.empty(15, dtype=np.float64)
+        for i, body in enumerate((self._ball_body, self._ai_body, self._agent_body)):
+            state[4*i:4*i + 2] = body.position
+            state[4*i + 2:4*i + 4] = body.velocity
+        state[12:14] = self.mouse_body.position
+        state[14] = self.steps
+        return state
+
+    def set_state(self, state):
+        assert self.space is not None, "Call reset before using set_state method."
+        state = np.asarray(state, dtype=np.float64)
+        assert state.shape == (15,), f"Expected a state of shape (15,), got {state.shape}"
+        for i, body in enumerate((self._ball_body, self._ai_body, self._agent_body)):
+            body.position = (float(state[4*i]), float(state[4*i + 1]))
+            body.velocity = (float(state[4*i + 2]), float(state[4*i + 3]))
+            body.force = (0, 0)
+            self.space.reindex_shapes_for_body(body)
+        self.mouse_body.position = (float(state[12]), float(state[13]))
+        self.steps = int(state[14])
+        return self._get_obs()
+
     def _create_paddle(self, x, y):
         mass = 20 
         inertia = pymunk.moment_for_circle(mass, 0, self.paddle_radius)
@@ -172,6 +276,14 @@ class AirHockeyEnv(gym.Env):
         action = np.clip(action, -1, 1)
         paddle.body.apply_force_at_local_point((action[0] * force_mult, action[1] * force_mult))
 
+    def _apply_action_fast(self, body, action):
+        # 跟 _apply_action 一樣，但用比較大小取代 np.clip (保留原本的 dtype，結果逐位元相同)
+        force_mult = 50000
+        ax, ay = action[0], action[1]
+        ax = -1.0 if ax < -1 else (1.0 if ax > 1 else ax)
+        ay = -1.0 if ay < -1 else (1.0 if ay > 1 else ay)
+        body.apply_force_at_local_point((ax * force_mult, ay * force_mult))
+
     def _constrain_paddle_movement(self):
         p = self.agent_paddle.body.position
         new_x = np.clip(p.x, self.paddle_radius, self.width - self.paddle_radius)
@@ -183,7 +295,19 @@ class AirHockeyEnv(gym.Env):
         new_ai_y = np.clip(p_ai.y, self.paddle_radius, self.height/2 - self.paddle_radius)
         self.ai_paddle.body.position = (new_ai_x, new_ai_y)
 
+    def _constrain_paddle_movement_fast(self):
+        for body, (x_min, x_max, y_min, y_max) in (
+            (self._agent_body, self._agent_bounds),
+            (self._ai_body, self._ai_bounds),
+        ):
+            x, y = body.position
+            new_x = x_min if x < x_min else (x_max if x > x_max else x)
+            new_y = y_min if y < y_min else (y_max if y > y_max else y)
+            body.position = (new_x, new_y)
+
     def _get_obs(self):
+        if self.fast:
+            return self._get_obs_fast()
         w, h = self.width, self.height
         bx, by = self.ball.body.position
         bvx, bvy = self.ball.body.velocity
@@ -191,9 +315,25 @@ class AirHockeyEnv(gym.Env):
         ox, oy = self.agent_paddle.body.position 
         return np.array([bx/w, by/h, bvx/1000, bvy/1000, ax/w, ay/h, ox/w, oy/h], dtype=np.float32)
 
+    def _get_obs_fast(self):
+        w, h = self.width, self.height
+        bx, by = self._ball_body.position
+        bvx, bvy = self._ball_body.velocity
+        ax, ay = self._ai_body.position
+        ox, oy = self._agent_body.position
+        self._obs_buf[:] = (bx/w, by/h, bvx/1000, bvy/1000, ax/w, ay/h, ox/w, oy/h)
+        return self._obs_buf.copy() if self.copy_obs else self._obs_buf
+
     def manual_move_agent(self, mouse_x, mouse_y):
         self.mouse_body.position = (mouse_x, mouse_y)
 
+    def apply_opponent_action(self, action):
+        # 自我對戰用：在 step 之前呼叫，下一次 step 時對下方球拍施力
+        if self.fast:
+            self._apply_action_fast(self._agent_body, action)
+        else:
+            self._apply_action(self.agent_paddle, action)
+
     def render_text(self, text, color=(0, 0, 0)):
         if self.screen is None: return
         if self.font is None:
@@ -242,4 +382,267 @@ class AirHockeyEnv(gym.Env):
     def close(self):
         if self.screen:
             pygame.quit()
-            self.screen = None
\ No newline at end of file
+            self.screen = None
+
+# === 批次版球桌：一次用 NumPy 模擬 num_envs 張球桌 ===
+# 參考 gymnasium 的 CartPoleVectorEnv。所有狀態都是 (num_envs, 2) 的陣列，
+# 碰撞、阻尼、進球判定、球拍限制跟追球機器人全部用陣列運算完成，不經過 pymunk。
+# 物理是照 pymunk 的流程 (先積分位置、再更新速度、最後解碰撞) 重寫的簡化版，
+# 規則跟 AirHockeyEnv 一樣，但碰撞是一次解完而不是反覆迭代，軌跡會跟 pymunk 的版本不同。
+class AirHockeyVectorEnv(VectorEnv):
+    metadata = {
+        "render_modes": ["rgb_array"],
+        "render_fps": 60,
+        "autoreset_mode": AutoresetMode.NEXT_STEP,
+    }
+
+    def __init__(self, num_envs=1, max_episode_steps=2000, render_mode=None):
+        self.num_envs = num_envs
+        self.max_episode_steps = max_episode_steps
+        self.render_mode = render_mode
+
+        # 跟 AirHockeyEnv 一樣的球桌參數
+        self.width = 500
+        self.height = 700
+        self.paddle_radius = 25
+        self.ball_radius = 15
+        self.goal_width = 180
+        self.wall_radius = 5
+
+        self.ball_mass = 1.0
+        self.paddle_mass = 20.0
+        self.force_mult = 50000
+        self.damping = 0.999
+        self.substeps = 10
+        self.dt = 1.0 / 60.0
+
+        # 追球機器人 (滑鼠關節) 的參數，對應 pymunk.PivotJoint 的預設值
+        self.bot_speed_limit = 8.0
+        self.joint_max_force = 100000
+        self.joint_error_bias = pow(1.0 - 0.1, 60.0)
+
+        # 牆壁線段的兩個端點，順序同 AirHockeyEnv._create_walls
+        w, h, gw = self.width, self.height, self.goal_width
+        walls = np.array([
+            [(0, 0), (0, h)],
+            [(w, 0), (w, h)],
+            [(0, 0), (w/2 - gw/2, 0)],
+            [(w/2 + gw/2, 0), (w, 0)],
+            [(0, h), (w/2 - gw/2, h)],
+            [(w/2 + gw/2, h), (w, h)],
+        ], dtype=np.float64)
+        self.wall_a = walls[:, 0]
+        self.wall_ab = walls[:, 1] - walls[:, 0]
+        self.wall_len2 = np.sum(self.wall_ab ** 2, axis=1)
+
+        # 球拍可以移動的範圍：[x_min, y_min], [x_max, y_max]
+        r = self.paddle_radius
+        self.ai_low = np.array([r, r])
+        self.ai_high = np.array([w - r, h/2 - r])
+        self.agent_low = np.array([r, h/2 + r])
+        self.agent_high = np.array([w - r, h - r])
+        self.paddle_low = np.stack((self.ai_low, self.agent_low))
+        self.paddle_high = np.stack((self.ai_high, self.agent_high))
+
+        # 球和兩支球拍的半徑，順序同 self.pos 的第二維
+        self.body_radius = np.array([self.ball_radius, r, r], dtype=np.float64)
+
+        self.single_action_space = spaces.Box(low=-1, high=1, shape=(2,), dtype=np.float32)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+        self.single_observation_space = spaces.Box(low=-np.inf, high=np.inf, shape=(8,), dtype=np.float32)
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+        self.obs_scale = np.array([w, h, 1000, 1000, w, h, w, h], dtype=np.float64)
+
+        self.ball_pos = None
+        self.steps = np.zeros(num_envs, dtype=np.int32)
+        self.prev_done = np.zeros(num_envs, dtype=np.bool_)
+
+        self.screens = None
+
+    def reset(self, *, seed=None, options=None):
+        super().reset(seed=seed)
+        n = self.num_envs
+        # 球、上方 AI 球拍、下方球拍疊成 (num_envs, 3, 2)，積分跟撞牆一次算完
+        # ball_pos 等屬性是指向同一塊記憶體的 view
+        self.pos = np.empty((n, 3, 2))
+        self.vel = np.empty((n, 3, 2))
+        self.ball_pos, self.ai_pos, self.agent_pos = self.pos[:, 0], self.pos[:, 1], self.pos[:, 2]
+        self.ball_vel, self.ai_vel, self.agent_vel = self.vel[:, 0], self.vel[:, 1], self.vel[:, 2]
+        self.mouse_pos = np.empty((n, 2))
+        self._reset_tables(np.ones(n, dtype=np.bool_))
+
+        self.steps = np.zeros(n, dtype=np.int32)
+        self.prev_done = np.zeros(n, dtype=np.bool_)
+        return self._get_obs(), {}
+
+    def step(self, action):
+        assert self.ball_pos is not None, "Call reset before using step method."
+
+        # 1. AI (上方) 動作：力只作用在第一個 substep，跟 pymunk 每步清空外力一樣
+        force = np.clip(np.asarray(action, dtype=np.float64), -1, 1) * self.force_mult
+
+        # 2. 對手 (下方) 動作：追球機器人
+        self._move_bot()
+
+        sub_dt = self.dt / self.substeps
+        for i in range(self.substeps):
+            self._substep(sub_dt, force if i == 0 else None)
+
+        self.steps += 1
+
+        # 進球判定與獎勵，跟 AirHockeyEnv.step 相同
+        ball_y = self.ball_pos[:, 1]
+        top_goal = ball_y < 0
+        bottom_goal = ball_y > self.height
+        reward = np.where(top_goal, 10.0, np.where(bottom_goal, -10.0, 0.0))
+        reward += np.where(ball_y < self.height / 2, 0.001, 0.0)
+        terminated = top_goal | bottom_goal
+        truncated = self.steps > self.max_episode_steps
+
+        # 上一步結束的球桌在這一步重置 (next-step autoreset)
+        if self.prev_done.any():
+            self._reset_tables(self.prev_done)
+            self.steps[self.prev_done] = 0
+            reward[self.prev_done] = 0.0
+            terminated[self.prev_done] = False
+            truncated[self.prev_done] = False
+
+        self.prev_done = terminated | truncated
+
+        return self._get_obs(), reward, terminated, truncated, {}
+
+    def _reset_tables(self, mask):
+        count = int(mask.sum())
+        w, h = self.width, self.height
+        self.ball_pos[mask] = (w/2, h/2)
+        # 訓練模式下球會有隨機初速度，範圍 -200 到 200
+        self.ball_vel[mask] = self.np_random.uniform(-200, 200, size=(count, 2))
+        self.ai_pos[mask] = (w/2, 100)
+        self.ai_vel[mask] = 0.0
+        self.agent_pos[mask] = (w/2, h - 100)
+        self.agent_vel[mask] = 0.0
+        self.mouse_pos[mask] = self.agent_pos[mask]
+
+    def _move_bot(self):
+        # 同 AirHockeyEnv._move_bot：每幀最多往球的 X 座標移動 speed_limit
+        ball_x = self.ball_pos[:, 0]
+        current_x = self.mouse_pos[:, 0]
+        diff = ball_x - current_x
+        new_x = np.where(
+            np.abs(diff) < self.bot_speed_limit,
+            ball_x,
+            current_x + self.bot_speed_limit * np.sign(diff),
+        )
+        self.mouse_pos[:, 0] = np.clip(new_x, self.paddle_radius, self.width - self.paddle_radius)
+        self.mouse_pos[:, 1] = self.height - 100
+
+    def _substep(self, dt, force):
+        # 1. 用目前的速度積分位置
+        self.pos += self.vel * dt
+
+        # 2. 更新速度：空氣阻尼 + 外力
+        self.vel *= self.damping ** dt
+        if force is not None:
+            self.ai_vel += force * (dt / self.paddle_mass)
+
+        # 3. 滑鼠關節：把下方球拍拉向隱形滑鼠，單步修正量受 max_force 限制
+        bias_coef = 1.0 - self.joint_error_bias ** dt
+        dv = (self.mouse_pos - self.agent_pos) * (bias_coef / dt) - self.agent_vel
+        max_dv = self.joint_max_force * dt / self.paddle_mass
+        dv_norm = np.sqrt(np.sum(dv ** 2, axis=1, keepdims=True))
+        self.agent_vel += dv * np.minimum(1.0, max_dv / np.maximum(dv_norm, 1e-12))
+
+        # 4. 碰撞：球和兩支球拍 vs 牆壁，球 vs 兩支球拍
+        self._collide_walls()
+        self._collide_paddle(self.ai_pos, self.ai_vel)
+        self._collide_paddle(self.agent_pos, self.agent_vel)
+
+        # 5. 限制球拍只能在自己的半場移動
+        self._clamp_paddles()
+
+    def _collide_walls(self):
+        # 圓 vs 線段：球和兩支球拍一次算 6 面牆，找線段上離圓心最近的點，重疊且往牆內走就反彈 (彈性係數 1)
+        # 牆壁是靜止的，所以碰到的球或球拍整個反彈
+        min_dist = self.body_radius[:, None] + self.wall_radius            # (3, 1)
+        rel = self.pos[:, :, None, :] - self.wall_a                        # (N, 3, 6, 2)
+        t = np.clip(np.sum(rel * self.wall_ab, axis=3) / self.wall_len2, 0.0, 1.0)
+        d = rel - t[..., None] * self.wall_ab
+        dist = np.sqrt(np.sum(d ** 2, axis=3))
+        penetration = np.maximum(min_dist - dist, 0.0)                    # 沒碰到就是 0
+        normal = d / np.maximum(dist, 1e-12)[..., None]
+        vn = np.sum(self.vel[:, :, None, :] * normal, axis=3)
+        bounce = np.where(penetration > 0, np.minimum(vn, 0.0), 0.0)
+
+        self.pos += np.sum(normal * penetration[..., None], axis=2)
+        self.vel -= 2.0 * np.sum(normal * bounce[..., None], axis=2)
+
+    def _clamp_paddles(self):
+        # 超出範圍的球拍夾回邊界，往邊界外的速度歸零，不然下一個 substep 會繼續往外衝
+        pos, vel = self.pos[:, 1:], self.vel[:, 1:]
+        vel[(pos < self.paddle_low) & (vel < 0)] = 0.0
+        vel[(pos > self.paddle_high) & (vel > 0)] = 0.0
+        np.clip(pos, self.paddle_low, self.paddle_high, out=pos)
+
+    def _collide_paddle(self, paddle_pos, paddle_vel):
+        # 圓 vs 圓：完全彈性碰撞，衝量依質量分配
+        min_dist = self.ball_radius + self.paddle_radius
+        d = self.ball_pos - paddle_pos
+        dist = np.sqrt(np.sum(d ** 2, axis=1, keepdims=True))
+        penetration = np.maximum(min_dist - dist, 0.0)
+        normal = d / np.maximum(dist, 1e-12)
+        vn = np.sum((self.ball_vel - paddle_vel) * normal, axis=1, keepdims=True)
+        approach = np.where(penetration > 0, np.minimum(vn, 0.0), 0.0)
+
+        inv_ball = 1.0 / self.ball_mass
+        inv_paddle = 1.0 / self.paddle_mass
+        inv_total = inv_ball + inv_paddle
+
+        correction = normal * penetration
+        self.ball_pos += correction * (inv_ball / inv_total)
+        paddle_pos -= correction * (inv_paddle / inv_total)
+
+        impulse = normal * (-2.0 * approach / inv_total)
+        self.ball_vel += impulse * inv_ball
+        paddle_vel -= impulse * inv_paddle
+
+    def _get_obs(self):
+        obs = np.concatenate(
+            (self.ball_pos, self.ball_vel, self.ai_pos, self.agent_pos), axis=1
+        )
+        return (obs / self.obs_scale).astype(np.float32)
+
+    def render(self):
+        if self.render_mode is None:
+            gym.logger.warn(
+                "You are calling render method without specifying any render mode. "
+                'You can specify the render_mode at initialization, e.g. render_mode="rgb_array"'
+            )
+            return
+
+        if self.screens is None:
+            pygame.init()
+            self.screens = [pygame.Surface((self.width, self.height)) for _ in range(self.num_envs)]
+
+        gw = self.goal_width
+        for i, screen in enumerate(self.screens):
+            screen.fill((255, 255, 255))
+            pygame.draw.line(screen, (200, 0, 0), (0, self.height//2), (self.width, self.height//2), 2)
+            bx, by = self.ball_pos[i]
+            pygame.draw.circle(screen, (255, 0, 0), (int(bx), int(by)), self.ball_radius)
+            ax, ay = self.ai_pos[i]
+            pygame.draw.circle(screen, (0, 0, 255), (int(ax), int(ay)), self.paddle_radius)
+            px, py = self.agent_pos[i]
+            pygame.draw.circle(screen, (0, 0, 255), (int(px), int(py)), self.paddle_radius)
+            pygame.draw.rect(screen, (0, 0, 0), (0, 0, self.width, self.height), 5)
+            pygame.draw.line(screen, (255,255,255), (self.width/2 - gw/2, 0), (self.width/2 + gw/2, 0), 5)
+            pygame.draw.line(screen, (255,255,255), (self.width/2 - gw/2, self.height), (self.width/2 + gw/2, self.height), 5)
+
+        return [
+            np.transpose(np.array(pygame.surfarray.pixels3d(screen)), axes=(1, 0, 2))
+            for screen in self.screens
+        ]
+
+    def close(self):
+        if self.screens is not None:
+            pygame.quit()
+            self.screens = None
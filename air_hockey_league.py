@@ -0,0 +1,176 @@
+'''
+空氣曲棍球 checkpoint 聯賽
+把所有 air_hockey_ppo_*.zip 兩兩對戰 (上下方各打一次)，比賽分散到多個 process 上跑，
+每打完一組就更新 Elo 排名。比賽結果會依 checkpoint 的 hash 存進快取，
+之後加入新的 checkpoint 時只需要補打缺少的對戰。
+
+執行方式：
+    python air_hockey_league.py air_hockey_ppo_*.zip --workers 4 --matches 8 --seconds 60
+'''
+import argparse
+import glob
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from air_hockey_selfplay import SelfPlayRunner, load_policy
+
+CACHE_PATH = "air_hockey_league.json"
+
+# 每個 worker process 只讀取一次所有 checkpoint
+_worker_models = {}
+
+
+def checkpoint_hash(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()[:16]
+
+
+def _init_worker(paths):
+    for path in paths:
+        _worker_models[path] = load_policy(path)
+
+
+def _play_pairing(top_path, bottom_path, num_matches, match_seconds, seed):
+    runner = SelfPlayRunner(
+        _worker_models[top_path], _worker_models[bottom_path],
+        num_matches=num_matches, match_seconds=match_seconds, seed=seed,
+    )
+    summary = runner.run()
+    runner.close()
+    return summary["scores"]
+
+
+def expected_score(rating_a, rating_b):
+    return 1 / (1 + 10 ** ((rating_b - rating_a) / 400))
+
+
+def compute_elo(results, players, k=16, initial=1000):
+    """依固定順序 (排序後的對戰 key) 計算 Elo，同一份結果永遠得到同樣的排名。
+
+    results: {(top_hash, bottom_hash): [(top_goals, bottom_goals), ...]}
+    """
+    ratings = {player: float(initial) for player in players}
+    for top, bottom in sorted(results):
+        if top not in ratings or bottom not in ratings:
+            continue
+        for top_goals, bottom_goals in results[(top, bottom)]:
+            score = 1.0 if top_goals > bottom_goals else (0.0 if top_goals < bottom_goals else 0.5)
+            delta = k * (score - expected_score(ratings[top], ratings[bottom]))
+            ratings[top] += delta
+            ratings[bottom] -= delta
+    return ratings
+
+
+class League:
+    """round-robin 聯賽，比賽結果以 (上方 hash, 下方 hash) 為 key 快取在 JSON 檔裡。"""
+
+    def __init__(self, checkpoints, num_matches=8, match_seconds=60, seed=0, cache_path=CACHE_PATH):
+        # 內容相同的 checkpoint 只算一個選手
+        self.paths = {}
+        for path in checkpoints:
+            self.paths.setdefault(checkpoint_hash(path), path)
+        self.num_matches = num_matches
+        self.match_seconds = match_seconds
+        self.seed = seed
+        self.cache_path = cache_path
+        self.results = self._load_cache()
+
+    def _settings_key(self):
+        return f"{self.num_matches}x{self.match_seconds}s-seed{self.seed}"
+
+    def _load_cache(self):
+        if self.cache_path is None or not os.path.exists(self.cache_path):
+            return {}
+        with open(self.cache_path) as f:
+            cache = json.load(f)
+        entries = cache.get(self._settings_key(), {})
+        return {tuple(key.split('|')): [tuple(score) for score in scores] for key, scores in entries.items()}
+
+    def _save_cache(self):
+        if self.cache_path is None:
+            return
+        cache = {}
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        cache[self._settings_key()] = {'|'.join(key): scores for key, scores in sorted(self.results.items())}
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, indent=1)
+        os.replace(tmp_path, self.cache_path)
+
+    def missing_pairings(self):
+        return [pair for pair in itertools.permutations(sorted(self.paths), 2) if pair not in self.results]
+
+    def ratings(self):
+        return compute_elo(self.results, self.paths)
+
+    def run(self, workers=None, on_result=None):
+        """補打所有缺少的對戰，每完成一組就寫入快取並呼叫 on_result(league, pairing)。"""
+        missing = self.missing_pairings()
+        if not missing:
+            return self.ratings()
+
+        needed = sorted({self.paths[h] for pair in missing for h in pair})
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(needed,)) as pool:
+            futures = {
+                pool.submit(
+                    _play_pairing, self.paths[top], self.paths[bottom],
+                    self.num_matches, self.match_seconds, self.seed,
+                ): (top, bottom)
+                for top, bottom in missing
+            }
+            for future in as_completed(futures):
+                pairing = futures[future]
+                self.results[pairing] = future.result()
+                self._save_cache()
+                if on_result is not None:
+                    on_result(self, pairing)
+        return self.ratings()
+
+    def print_table(self):
+        ratings = self.ratings()
+        print(f"{'checkpoint':40s} {'Elo':>8s} {'W':>4s} {'L':>4s} {'D':>4s}")
+        for player in sorted(ratings, key=ratings.get, reverse=True):
+            wins = losses = draws = 0
+            for (top, bottom), scores in self.results.items():
+                if player not in (top, bottom) or top not in ratings or bottom not in ratings:
+                    continue
+                for top_goals, bottom_goals in scores:
+                    mine, theirs = (top_goals, bottom_goals) if player == top else (bottom_goals, top_goals)
+                    wins += mine > theirs
+                    losses += mine < theirs
+                    draws += mine == theirs
+            name = os.path.basename(self.paths[player])
+            print(f"{name:40s} {ratings[player]:8.1f} {wins:4d} {losses:4d} {draws:4d}")
+
+
+def _print_progress(league, pairing):
+    top, bottom = (os.path.basename(league.paths[h]) for h in pairing)
+    done = len(league.results)
+    total = len(league.paths) * (len(league.paths) - 1)
+    print(f"[{done}/{total}] {top} (上) vs {bottom} (下): {league.results[pairing]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Air hockey checkpoint league")
+    parser.add_argument('checkpoints', nargs='*', help='Checkpoints to rank (defaults to air_hockey_ppo_*.zip)')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes')
+    parser.add_argument('--matches', type=int, default=8, help='Matches per pairing and side')
+    parser.add_argument('--seconds', type=float, default=60, help='Length of each match in game seconds')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the first match of every pairing')
+    parser.add_argument('--cache', default=CACHE_PATH, help='JSON file with cached match results')
+
+    args = parser.parse_args()
+    checkpoints = args.checkpoints or sorted(glob.glob("air_hockey_ppo_*.zip"))
+
+    league = League(checkpoints, num_matches=args.matches, match_seconds=args.seconds, seed=args.seed, cache_path=args.cache)
+    print(f"{len(league.paths)} 個 checkpoint，需要補打 {len(league.missing_pairings())} 組對戰")
+    league.run(workers=args.workers, on_result=_print_progress)
+    league.print_table()
@@ -0,0 +1,161 @@
+'''
+空氣曲棍球的自我對戰 / 評估工具
+一次開 M 場比賽 (每場一個無畫面的 AirHockeyEnv)，每一幀把所有球拍的觀測疊成一個 batch，
+只呼叫一次 model.predict，最後回報勝率、每分鐘進球數和推論延遲。
+
+執行方式：
+    python air_hockey_selfplay.py air_hockey_ppo_1000th.zip air_hockey_ppo_100th.zip --matches 16 --seconds 60
+'''
+import argparse
+import time
+
+import numpy as np
+
+from air_hockey_env import AirHockeyEnv
+
+# 觀測向量：[球 x, 球 y, 球 vx, 球 vy, 上方球拍 x, 上方球拍 y, 下方球拍 x, 下方球拍 y]
+# 上下翻轉球桌：y 變成 1 - y，vy 變號
+_FLIP_SCALE = np.array([1, -1, 1, -1, 1, -1, 1, -1], dtype=np.float32)
+_FLIP_OFFSET = np.array([0, 1, 0, 0, 0, 1, 0, 1], dtype=np.float32)
+# 換成下方球拍的視角：上下翻轉之後再交換兩支球拍的位置
+_MIRROR_ORDER = np.array([0, 1, 2, 3, 6, 7, 4, 5])
+# 下方球拍的動作要把 y 方向翻回來
+_ACTION_FLIP = np.array([1, -1], dtype=np.float32)
+
+
+def flip_observations(obs):
+    """上下翻轉球桌 (play_game 給 AI 的觀測)，obs 的形狀可以是 (8,) 或 (M, 8)。"""
+    return obs * _FLIP_SCALE + _FLIP_OFFSET
+
+
+def mirror_observations(obs):
+    """從下方球拍的視角看球桌：上下翻轉，並把自己放在「上方球拍」的位置，形狀同 flip_observations。"""
+    return flip_observations(obs[..., _MIRROR_ORDER])
+
+
+def mirror_actions(actions):
+    """把下方球拍視角的動作轉回球桌座標。"""
+    return actions * _ACTION_FLIP
+
+
+def load_policy(path):
+    # stable_baselines3 只有讀取 checkpoint 時才需要
+    from stable_baselines3 import PPO
+    return PPO.load(path, device="cpu")
+
+
+class SelfPlayRunner:
+    """同時跑 num_matches 場 top_model (上方) 對 bottom_model (下方) 的比賽。
+
+    兩邊是同一個模型時，上方和下方的觀測會合併成 (2M, 8) 的 batch，每一幀只做一次 forward。
+    每場比賽固定 match_seconds 秒 (遊戲時間)，進球或超過 2000 步都會重新開球。
+    """
+
+    def __init__(self, top_model, bottom_model=None, num_matches=8, match_seconds=60, deterministic=True, seed=0):
+        self.top_model = top_model
+        self.bottom_model = top_model if bottom_model is None else bottom_model
+        self.num_matches = num_matches
+        self.deterministic = deterministic
+        self.seed = seed
+
+        self.envs = []
+        for _ in range(num_matches):
+            env = AirHockeyEnv(render_mode=None, fast=True, copy_obs=False, reuse_space=True)
+            env.with_bot = False
+            env.self_play = True
+            self.envs.append(env)
+        self.fps = self.envs[0].metadata["render_fps"]
+        self.num_ticks = int(match_seconds * self.fps)
+
+    def _predict(self, model, obs):
+        actions, _ = model.predict(obs, deterministic=self.deterministic)
+        return np.asarray(actions, dtype=np.float32).reshape(len(obs), 2)
+
+    def _act(self, obs):
+        # 回傳 (上方動作, 下方動作)，兩者都是球桌座標
+        if self.top_model is self.bottom_model:
+            batch = np.concatenate((obs, mirror_observations(obs)))
+            actions = self._predict(self.top_model, batch)
+            top_actions, bottom_actions = actions[:self.num_matches], actions[self.num_matches:]
+        else:
+            top_actions = self._predict(self.top_model, obs)
+            bottom_actions = self._predict(self.bottom_model, mirror_observations(obs))
+        return top_actions, mirror_actions(bottom_actions)
+
+    def run(self):
+        obs = np.empty((self.num_matches, 8), dtype=np.float32)
+        for i, env in enumerate(self.envs):
+            obs[i] = env.reset(seed=self.seed + i)[0]
+
+        top_goals = np.zeros(self.num_matches, dtype=np.int64)
+        bottom_goals = np.zeros(self.num_matches, dtype=np.int64)
+        latencies = np.empty(self.num_ticks)
+
+        for tick in range(self.num_ticks):
+            start = time.perf_counter()
+            top_actions, bottom_actions = self._act(obs)
+            latencies[tick] = time.perf_counter() - start
+
+            for i, env in enumerate(self.envs):
+                env.apply_opponent_action(bottom_actions[i])
+                next_obs, _, terminated, truncated, _ = env.step(top_actions[i])
+                if terminated:
+                    # 球從上方球門出去 = 下方得分；從下方球門出去 = 上方得分
+                    if next_obs[1] < 0:
+                        bottom_goals[i] += 1
+                    else:
+                        top_goals[i] += 1
+                if terminated or truncated:
+                    next_obs, _ = env.reset()
+                obs[i] = next_obs
+
+        return self._summarize(top_goals, bottom_goals, latencies)
+
+    def _summarize(self, top_goals, bottom_goals, latencies):
+        minutes = self.num_ticks / self.fps / 60 * self.num_matches
+        latency_ms = np.percentile(latencies * 1000, [50, 90, 99])
+        return {
+            "matches": self.num_matches,
+            "top_wins": int(np.sum(top_goals > bottom_goals)),
+            "bottom_wins": int(np.sum(bottom_goals > top_goals)),
+            "draws": int(np.sum(top_goals == bottom_goals)),
+            "top_win_rate": float(np.mean(top_goals > bottom_goals)),
+            "top_goals": int(top_goals.sum()),
+            "bottom_goals": int(bottom_goals.sum()),
+            "goals_per_minute": float((top_goals.sum() + bottom_goals.sum()) / minutes),
+            "latency_ms": {"p50": latency_ms[0], "p90": latency_ms[1], "p99": latency_ms[2]},
+            # 每一場的比分 (上方, 下方)
+            "scores": [(int(t), int(b)) for t, b in zip(top_goals, bottom_goals)],
+        }
+
+    def close(self):
+        for env in self.envs:
+            env.close()
+
+
+def print_summary(summary):
+    print(f"比賽場數: {summary['matches']}")
+    print(f"上方勝 / 下方勝 / 平手: {summary['top_wins']} / {summary['bottom_wins']} / {summary['draws']}")
+    print(f"上方勝率: {summary['top_win_rate'] * 100:.1f}%")
+    print(f"進球數 (上方 : 下方): {summary['top_goals']} : {summary['bottom_goals']}")
+    print(f"每分鐘進球數: {summary['goals_per_minute']:.2f}")
+    latency = summary['latency_ms']
+    print(f"推論延遲 p50 / p90 / p99: {latency['p50']:.3f} / {latency['p90']:.3f} / {latency['p99']:.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Air hockey self-play evaluation")
+    parser.add_argument('top', help='Checkpoint for the top paddle')
+    parser.add_argument('bottom', nargs='?', default=None, help='Checkpoint for the bottom paddle (defaults to top)')
+    parser.add_argument('--matches', type=int, default=16, help='Number of matches played in parallel')
+    parser.add_argument('--seconds', type=float, default=60, help='Length of each match in game seconds')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the first match')
+
+    args = parser.parse_args()
+
+    top_model = load_policy(args.top)
+    bottom_model = top_model if args.bottom in (None, args.top) else load_policy(args.bottom)
+
+    runner = SelfPlayRunner(top_model, bottom_model, num_matches=args.matches, match_seconds=args.seconds, seed=args.seed)
+    print_summary(runner.run())
+    runner.close()
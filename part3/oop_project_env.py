@@ -2,18 +2,24 @@
 Custom Gym environment
 https://gymnasium.farama.org/tutorials/gymnasium_basics/environment_creation/
 '''
+import random
+
 import gymnasium as gym
 from gymnasium import spaces
 from gymnasium.envs.registration import register
 from gymnasium.utils.env_checker import check_env
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space
 
 import warehouse_robot  as wr
 import numpy as np
 
 # Register this module as a gym environment. Once registered, the id is usable in gym.make().
+# gym.make_vec() uses the vector_entry_point by default, which steps all robots with numpy.
 register(
     id='warehouse-robot-v0',                                # call it whatever you want
     entry_point='oop_project_env:WarehouseRobotEnv', # module_name:class_name
+    vector_entry_point='oop_project_env:WarehouseRobotVectorEnv',
 )
 
 # Implement our own gym env, must inherit from gym.Env
@@ -56,7 +62,8 @@ class WarehouseRobotEnv(gym.Env):
 
         # Construct the observation state:
         # [robot_row_pos, robot_col_pos, target_row_pos, target_col_pos]
-        obs = np.concatenate((self.warehouse_robot.robot_pos, self.warehouse_robot.target_pos))
+        # WarehouseRobot already keeps this as an int32 array, so a copy is all we need.
+        obs = self.warehouse_robot.state.copy()
         
         # Additional info to return. For debugging or whatever.
         info = {}
@@ -70,8 +77,8 @@ class WarehouseRobotEnv(gym.Env):
 
     # Gym required function (and parameters) to perform an action
     def step(self, action):
-        # Perform action
-        target_reached = self.warehouse_robot.perform_action(wr.RobotAction(action))
+        # Perform action (an int is accepted directly, no need to build a RobotAction every step)
+        target_reached = self.warehouse_robot.perform_action(int(action))
 
         # Determine reward and termination
         reward=0
@@ -82,7 +89,7 @@ class WarehouseRobotEnv(gym.Env):
 
         # Construct the observation state: 
         # [robot_row_pos, robot_col_pos, target_row_pos, target_col_pos]
-        obs = np.concatenate((self.warehouse_robot.robot_pos, self.warehouse_robot.target_pos))
+        obs = self.warehouse_robot.state.copy()
 
         # Additional info to return. For debugging or whatever.
         info = {}
@@ -99,6 +106,94 @@ class WarehouseRobotEnv(gym.Env):
     def render(self):
         self.warehouse_robot.render()
 
+# Vectorized version of WarehouseRobotEnv, modeled on gymnasium's CartPoleVectorEnv.
+# Robot and target positions for all num_envs robots live in one (num_envs, 4) int32 array,
+# so a step is one gather of the move deltas, one clamp and one comparison.
+# Each robot has its own random.Random for targets, seeded with seed + i like SyncVectorEnv does,
+# so the vector env reproduces exactly the same episodes as SyncVectorEnv(WarehouseRobotEnv).
+class WarehouseRobotVectorEnv(VectorEnv):
+    metadata = {"render_modes": [], "render_fps": 4, "autoreset_mode": AutoresetMode.NEXT_STEP}
+
+    def __init__(self, num_envs=1, grid_rows=4, grid_cols=5, max_episode_steps=None, render_mode=None):
+        self.num_envs = num_envs
+        self.grid_rows = grid_rows
+        self.grid_cols = grid_cols
+        self.max_episode_steps = max_episode_steps
+        self.render_mode = render_mode
+
+        self.single_action_space = spaces.Discrete(len(wr.RobotAction))
+        self.action_space = batch_space(self.single_action_space, num_envs)
+        self.single_observation_space = spaces.Box(
+            low=0,
+            high=np.array([self.grid_rows-1, self.grid_cols-1, self.grid_rows-1, self.grid_cols-1]),
+            shape=(4,),
+            dtype=np.int32
+        )
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+
+        # Move deltas indexed by action, and the largest (row, col) a robot can reach
+        self.move_deltas = np.array(wr.MOVE_DELTAS, dtype=np.int32)
+        self.max_pos = np.array([self.grid_rows-1, self.grid_cols-1], dtype=np.int32)
+
+        # [robot_row, robot_col, target_row, target_col] per robot
+        self.state = np.zeros((num_envs, 4), dtype=np.int32)
+        self.robot_pos = self.state[:, 0:2]
+        self.target_pos = self.state[:, 2:4]
+
+        self.target_rngs = None
+        self.steps = np.zeros(num_envs, dtype=np.int32)
+        self.prev_done = np.zeros(num_envs, dtype=np.bool_)
+
+    def reset(self, *, seed=None, options=None):
+        super().reset(seed=seed)
+
+        if seed is not None or self.target_rngs is None:
+            seeds = [None] * self.num_envs if seed is None else [seed + i for i in range(self.num_envs)]
+            self.target_rngs = [random.Random(s) for s in seeds]
+
+        self._reset_robots(np.arange(self.num_envs))
+        self.steps[:] = 0
+        self.prev_done[:] = False
+
+        return self.state.copy(), {}
+
+    def step(self, actions):
+        # Move every robot at once and keep it inside the grid
+        self.robot_pos += self.move_deltas[actions]
+        np.clip(self.robot_pos, 0, self.max_pos, out=self.robot_pos)
+
+        terminated = np.all(self.robot_pos == self.target_pos, axis=1)
+        reward = terminated.astype(np.float64)
+        self.steps += 1
+        if self.max_episode_steps is None:
+            truncated = np.zeros(self.num_envs, dtype=np.bool_)
+        else:
+            truncated = self.steps >= self.max_episode_steps
+
+        # Reset the robots that finished on the previous step
+        if self.prev_done.any():
+            self._reset_robots(np.flatnonzero(self.prev_done))
+            self.steps[self.prev_done] = 0
+            reward[self.prev_done] = 0
+            terminated[self.prev_done] = False
+            truncated[self.prev_done] = False
+
+        self.prev_done = terminated | truncated
+
+        return self.state.copy(), reward, terminated, truncated, {}
+
+    def _reset_robots(self, env_ids):
+        # Same sampling as WarehouseRobot.reset: target row first, then target column
+        targets = [
+            (rng.randint(1, self.grid_rows-1), rng.randint(1, self.grid_cols-1))
+            for rng in (self.target_rngs[i] for i in env_ids)
+        ]
+        self.robot_pos[env_ids] = 0
+        self.target_pos[env_ids] = targets
+
+    def render(self):
+        gym.logger.warn("WarehouseRobotVectorEnv does not support rendering, use gym.make('warehouse-robot-v0', render_mode='human').")
+
 # For unit testing
 if __name__=="__main__":
     env = gym.make('warehouse-robot-v0', render_mode='human')
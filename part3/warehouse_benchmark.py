@@ -0,0 +1,100 @@
+'''
+Benchmarks for the warehouse robot environment.
+- envs:   construction (+ first reset) and step throughput measured with gymnasium.utils.performance,
+          side by side with the built-in toy_text environments.
+- vector: total steps per second of WarehouseRobotVectorEnv vs SyncVectorEnv and AsyncVectorEnv,
+          after checking that the vector env replays exactly the same episodes as SyncVectorEnv.
+
+Usage:
+    python warehouse_benchmark.py envs --duration 5
+    python warehouse_benchmark.py vector --num-envs 16 1024 --duration 5
+'''
+import argparse
+import time
+
+import gymnasium as gym
+import numpy as np
+from gymnasium.utils.performance import benchmark_init, benchmark_step
+
+import oop_project_env  # noqa: F401  (registers warehouse-robot-v0)
+
+ENV_IDS = ['warehouse-robot-v0', 'FrozenLake-v1', 'CliffWalking-v1', 'Taxi-v3']
+
+def compare_envs(env_ids, target_duration=5, seed=0):
+    results = {}
+    for env_id in env_ids:
+        inits_per_sec = benchmark_init(lambda: gym.make(env_id), target_duration, seed)
+
+        env = gym.make(env_id)
+        env.action_space.seed(seed)
+        steps_per_sec = benchmark_step(env, target_duration, seed)
+        env.close()
+
+        results[env_id] = (inits_per_sec, steps_per_sec)
+        print(f"{env_id:20s} | init: {inits_per_sec:10.0f} /s | step: {steps_per_sec:10.0f} /s")
+    return results
+
+def rollout_vector(vectorization_mode, num_envs, seed, num_steps):
+    env = gym.make_vec('warehouse-robot-v0', num_envs=num_envs, vectorization_mode=vectorization_mode)
+    obs, _ = env.reset(seed=seed)
+    rng = np.random.default_rng(seed)
+    history = [obs]
+    for _ in range(num_steps):
+        obs, reward, terminated, truncated, _ = env.step(rng.integers(0, 4, size=num_envs))
+        history += [obs, reward, terminated, truncated]
+    env.close()
+    return history
+
+def check_vector_matches_sync(num_envs=8, seed=0, num_steps=500):
+    expected = rollout_vector('sync', num_envs, seed, num_steps)
+    actual = rollout_vector('vector_entry_point', num_envs, seed, num_steps)
+    assert all(np.array_equal(a, b) for a, b in zip(expected, actual)), "vector env diverged from SyncVectorEnv"
+    print(f"vector env matches SyncVectorEnv ({num_envs} envs, {num_steps} steps)")
+
+def benchmark_vector_env(env, target_duration=5, seed=None):
+    # Total env steps per second (steps x num_envs), actions are pre-sampled so only step() is timed
+    env.reset(seed=seed)
+    actions = np.random.default_rng(seed).integers(0, 4, size=(1024, env.num_envs))
+
+    steps = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < target_duration:
+        env.step(actions[steps % len(actions)])
+        steps += 1
+    length = time.perf_counter() - start
+
+    return steps * env.num_envs / length
+
+def compare_vectorization(num_envs_list, modes, target_duration=5, seed=0, max_async_envs=64):
+    results = []
+    for num_envs in num_envs_list:
+        row = {'num_envs': num_envs}
+        for mode in modes:
+            # AsyncVectorEnv starts one process per env, skip it for large batches
+            if mode == 'async' and num_envs > max_async_envs:
+                row[mode] = float('nan')
+                continue
+            env = gym.make_vec('warehouse-robot-v0', num_envs=num_envs, vectorization_mode=mode)
+            row[mode] = benchmark_vector_env(env, target_duration, seed)
+            env.close()
+        results.append(row)
+        print(f"num_envs={num_envs:5d} | " + " | ".join(f"{mode}: {row[mode]:12.0f} steps/s" for mode in modes))
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Warehouse robot benchmarks")
+    parser.add_argument('suite', nargs='?', choices=['envs', 'vector', 'all'], default='all', help='Which benchmarks to run')
+    parser.add_argument('--envs', nargs='+', default=ENV_IDS, help='Environment ids to benchmark')
+    parser.add_argument('--num-envs', type=int, nargs='+', default=[16, 256, 4096], help='Number of robots per vector env')
+    parser.add_argument('--modes', nargs='+', default=['vector_entry_point', 'sync', 'async'], help='Vectorization modes to compare')
+    parser.add_argument('--max-async-envs', type=int, default=64, help='Skip AsyncVectorEnv above this many envs')
+    parser.add_argument('--duration', type=float, default=5, help='Seconds per measurement')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for reset and action sampling')
+
+    args = parser.parse_args()
+
+    if args.suite in ('envs', 'all'):
+        compare_envs(args.envs, args.duration, args.seed)
+    if args.suite in ('vector', 'all'):
+        check_vector_matches_sync(seed=args.seed)
+        compare_vectorization(args.num_envs, args.modes, args.duration, args.seed, args.max_async_envs)
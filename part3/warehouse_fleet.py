@@ -0,0 +1,334 @@
+'''
+Extended version of warehouse_robot.py: many robots, shelving obstacles and several pick stations on a large grid.
+
+- Shelves and robots are tracked in occupancy grids, so checking whether a cell is free is a single array lookup.
+- All robots move at the same time. Conflicting moves (two robots entering the same cell, two robots swapping cells,
+  or moving into a robot that has to stay) are resolved in a batch, the losing robots simply stay where they are.
+- For every pick station a BFS distance field is computed once and cached. It gives shaped rewards
+  (progress towards the assigned station) and an oracle policy that always takes a shortest path.
+- Rendering only redraws the cells that changed since the previous frame.
+'''
+from collections import OrderedDict
+import sys
+
+import numpy as np
+import pygame
+
+import warehouse_robot as wr
+
+# Extra action on top of wr.RobotAction: stay in place
+WAIT = len(wr.RobotAction)
+FLEET_MOVE_DELTAS = np.array(wr.MOVE_DELTAS + ((0,0),), dtype=np.int32)
+
+FREE = -1           # occupancy value of a cell without a robot
+UNREACHABLE = np.iinfo(np.int32).max // 2
+
+def make_shelves(grid_rows, grid_cols, aisle_every=10):
+    '''Typical warehouse layout: pairs of shelf rows separated by one aisle row,
+    a cross aisle every `aisle_every` columns and a free ring around the border.'''
+    rows = np.arange(grid_rows)[:, None]
+    cols = np.arange(grid_cols)[None, :]
+    shelves = (rows % 3 != 0) & (cols % aisle_every != 0)
+    shelves[[0, -1], :] = False
+    shelves[:, [0, -1]] = False
+    return shelves
+
+def bfs_distance_field(free, start):
+    '''Number of moves from every cell to `start`, walking only over free cells. Unreachable cells get UNREACHABLE.
+    The BFS expands the whole frontier at once with array shifts, one layer per iteration.'''
+    dist = np.full(free.shape, UNREACHABLE, dtype=np.int32)
+    frontier = np.zeros(free.shape, dtype=np.bool_)
+    frontier[start] = True
+    dist[start] = 0
+    visited = frontier.copy()
+    d = 0
+    while frontier.any():
+        d += 1
+        grown = np.zeros_like(frontier)
+        grown[1:, :] |= frontier[:-1, :]
+        grown[:-1, :] |= frontier[1:, :]
+        grown[:, 1:] |= frontier[:, :-1]
+        grown[:, :-1] |= frontier[:, 1:]
+        frontier = grown & free & ~visited
+        visited |= frontier
+        dist[frontier] = d
+    return dist
+
+class WarehouseFleet:
+
+    # Pass in shelves (a bool array of shape (grid_rows, grid_cols)) to use a custom layout.
+    # Pygame is only initialized on the first call to render().
+    def __init__(self, grid_rows=50, grid_cols=50, num_robots=20, num_stations=10, shelves=None,
+                 fps=4, shaping=0.1, distance_cache_size=256, seed=None):
+        self.grid_rows = grid_rows
+        self.grid_cols = grid_cols
+        self.num_robots = num_robots
+        self.num_stations = num_stations
+        self.fps = fps
+        self.shaping = shaping
+
+        self.shelves = make_shelves(grid_rows, grid_cols) if shelves is None else np.asarray(shelves, dtype=np.bool_)
+        assert self.shelves.shape == (grid_rows, grid_cols), "shelves must have shape (grid_rows, grid_cols)"
+        self.free = ~self.shelves
+
+        # robot id in each cell, FREE if empty
+        self.occupancy = np.full((grid_rows, grid_cols), FREE, dtype=np.int32)
+
+        self._distance_cache = OrderedDict()
+        self.distance_cache_size = distance_cache_size
+
+        self.np_random = np.random.default_rng(seed)
+        self.stations = self._place_stations()
+        self.reset()
+
+        self.window_surface = None
+
+    def _place_stations(self):
+        # Pick stations are free cells right next to a shelf
+        padded = np.pad(self.shelves, 1)
+        next_to_shelf = padded[:-2, 1:-1] | padded[2:, 1:-1] | padded[1:-1, :-2] | padded[1:-1, 2:]
+        candidates = np.argwhere(self.free & next_to_shelf)
+        if len(candidates) == 0:
+            candidates = np.argwhere(self.free)
+        chosen = self.np_random.choice(len(candidates), size=self.num_stations, replace=False)
+        return candidates[np.sort(chosen)].astype(np.int32)
+
+    def distance_field(self, station):
+        '''Cached BFS distance field towards pick station number `station`.'''
+        key = tuple(self.stations[station])
+        if key in self._distance_cache:
+            self._distance_cache.move_to_end(key)
+        else:
+            self._distance_cache[key] = bfs_distance_field(self.free, key)
+            if len(self._distance_cache) > self.distance_cache_size:
+                self._distance_cache.popitem(last=False)
+        return self._distance_cache[key]
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.np_random = np.random.default_rng(seed)
+
+        # Robots start on distinct free cells
+        free_cells = np.argwhere(self.free)
+        chosen = self.np_random.choice(len(free_cells), size=self.num_robots, replace=False)
+        self.robot_pos = free_cells[chosen].astype(np.int32)
+        self.occupancy.fill(FREE)
+        self.occupancy[self.robot_pos[:, 0], self.robot_pos[:, 1]] = np.arange(self.num_robots)
+
+        self.assigned = self.np_random.integers(0, self.num_stations, size=self.num_robots)
+        self.distances = self._distances_to_assigned()
+        self.picks = 0
+        self.last_actions = np.full(self.num_robots, WAIT)
+        self._dirty = None  # everything is redrawn on the next render
+
+    def _distances_to_assigned(self, robots=None):
+        robots = np.arange(self.num_robots) if robots is None else robots
+        out = np.empty(len(robots), dtype=np.int32)
+        for station in np.unique(self.assigned[robots]):
+            mask = self.assigned[robots] == station
+            pos = self.robot_pos[robots[mask]]
+            out[mask] = self.distance_field(station)[pos[:, 0], pos[:, 1]]
+        return out
+
+    def _resolve_moves(self, proposed):
+        pos = self.robot_pos
+        ids = np.arange(self.num_robots)
+
+        # Moves off the grid or into a shelf are cancelled
+        inside = (
+            (proposed[:, 0] >= 0) & (proposed[:, 0] < self.grid_rows)
+            & (proposed[:, 1] >= 0) & (proposed[:, 1] < self.grid_cols)
+        )
+        target = np.where(inside[:, None], proposed, pos)
+        target = np.where(self.free[target[:, 0], target[:, 1]][:, None], target, pos)
+
+        while True:
+            staying = np.all(target == pos, axis=1)
+            cell = target[:, 0] * self.grid_cols + target[:, 1]
+
+            # Vertex conflicts: one winner per cell, robots that stay always win their own cell,
+            # otherwise the lowest robot id wins
+            order = np.lexsort((ids, ~staying, cell))
+            first = np.ones(self.num_robots, dtype=np.bool_)
+            first[1:] = cell[order][1:] != cell[order][:-1]
+            loses = np.zeros(self.num_robots, dtype=np.bool_)
+            loses[order[~first]] = True
+
+            # Swap conflicts: robot i moves into j's cell while j moves into i's cell
+            other = self.occupancy[target[:, 0], target[:, 1]]
+            has_other = (other != FREE) & (other != ids)
+            other_target = target[np.where(has_other, other, ids)]
+            loses |= has_other & np.all(other_target == pos, axis=1)
+
+            loses &= ~staying
+            if not loses.any():
+                return target
+            target[loses] = pos[loses]
+
+    def perform_actions(self, actions):
+        '''Move all robots at once. Returns (rewards, reached) arrays of shape (num_robots,).'''
+        actions = np.asarray(actions)
+        self.last_actions = actions
+        old_pos = self.robot_pos
+        new_pos = self._resolve_moves(old_pos + FLEET_MOVE_DELTAS[actions])
+
+        # Update the occupancy index: clear the old cells first, then mark the new ones
+        moved = np.flatnonzero(np.any(new_pos != old_pos, axis=1))
+        self.occupancy[old_pos[moved, 0], old_pos[moved, 1]] = FREE
+        self.occupancy[new_pos[moved, 0], new_pos[moved, 1]] = moved
+        self.robot_pos = new_pos
+
+        # Shaped reward: progress along the shortest path, plus 1 for reaching the station
+        new_distances = self._distances_to_assigned()
+        rewards = self.shaping * (self.distances - new_distances).astype(np.float64)
+        # Only robots that arrived count, not robots that were already at their station (e.g. with a single station)
+        reached = (new_distances == 0) & (self.distances > 0)
+        rewards[reached] += 1.0
+
+        changed_cells = [old_pos[moved], new_pos[moved]]
+        if reached.any():
+            # Robots that arrived pick up the package and get a new station, never the one they are at
+            done = np.flatnonzero(reached)
+            changed_cells.append(self.stations[self.assigned[done]])
+            self.picks += len(done)
+            if self.num_stations > 1:
+                new_stations = self.np_random.integers(0, self.num_stations - 1, size=len(done))
+                new_stations += new_stations >= self.assigned[done]
+                self.assigned[done] = new_stations
+            new_distances[done] = self._distances_to_assigned(done)
+        self.distances = new_distances
+
+        if self._dirty is not None:
+            self._dirty.update(map(tuple, np.concatenate(changed_cells).tolist()))
+
+        return rewards, reached
+
+    def oracle_actions(self):
+        '''Shortest-path actions from the distance fields. Robots at their station (or with no path) wait.'''
+        padded_pos = self.robot_pos + 1
+        neighbours = padded_pos[:, None, :] + FLEET_MOVE_DELTAS[None, :WAIT, :]
+        neighbour_dist = np.empty((self.num_robots, WAIT), dtype=np.int32)
+        for station in np.unique(self.assigned):
+            mask = self.assigned == station
+            field = np.pad(self.distance_field(station), 1, constant_values=UNREACHABLE)
+            n = neighbours[mask]
+            neighbour_dist[mask] = field[n[..., 0], n[..., 1]]
+
+        actions = np.argmin(neighbour_dist, axis=1)
+        improves = neighbour_dist[np.arange(self.num_robots), actions] < self.distances
+        return np.where(improves, actions, WAIT)
+
+    def _init_pygame(self):
+        pygame.init() # initialize pygame
+        pygame.display.init() # Initialize the display module
+
+        # Game clock
+        self.clock = pygame.time.Clock()
+
+        # Default font
+        self.action_font = pygame.font.SysFont("Calibre",30)
+        self.action_info_height = self.action_font.get_height()
+
+        # Cells shrink so that large grids still fit on screen
+        cell = max(2, min(64, 800 // max(self.grid_rows, self.grid_cols)))
+        self.cell_height = cell
+        self.cell_width = cell
+        self.cell_size = (self.cell_width, self.cell_height)
+
+        # Define game window size (width, height)
+        self.window_size = (self.cell_width * self.grid_cols, self.cell_height * self.grid_rows + self.action_info_height)
+
+        # Initialize game window
+        self.window_surface = pygame.display.set_mode(self.window_size)
+
+        # Load & resize sprites (shared with WarehouseRobot)
+        self.robot_img = wr.load_sprite("bot_blue.png", self.cell_size)
+        self.floor_img = wr.load_sprite("floor.png", self.cell_size)
+        self.goal_img = wr.load_sprite("package.png", self.cell_size)
+
+    def _draw_cell(self, r, c, station_cells):
+        pos = (c * self.cell_width, r * self.cell_height)
+        if self.shelves[r, c]:
+            # Draw shelf
+            self.window_surface.fill((90, 60, 30), pygame.Rect(pos, self.cell_size))
+            return
+        self.window_surface.blit(self.floor_img, pos)
+        if (r, c) in station_cells:
+            self.window_surface.blit(self.goal_img, pos)
+        if self.occupancy[r, c] != FREE:
+            self.window_surface.blit(self.robot_img, pos)
+
+    def render(self):
+        if self.window_surface is None:
+            self._init_pygame()
+
+        self._process_events()
+
+        station_cells = set(map(tuple, self.stations.tolist()))
+        if self._dirty is None:
+            # First frame (or after reset): draw every cell once
+            self.window_surface.fill((255,255,255))
+            for r in range(self.grid_rows):
+                for c in range(self.grid_cols):
+                    self._draw_cell(r, c, station_cells)
+            updated = [pygame.Rect((0, 0), self.window_size)]
+        else:
+            # Only redraw the cells robots left or entered since the last frame
+            updated = []
+            for r, c in self._dirty:
+                self._draw_cell(r, c, station_cells)
+                updated.append(pygame.Rect((c * self.cell_width, r * self.cell_height), self.cell_size))
+        self._dirty = set()
+
+        text_img = self.action_font.render(f'Picks: {self.picks}', True, (0,0,0), (255,255,255))
+        text_pos = (0, self.window_size[1] - self.action_info_height)
+        self.window_surface.fill((255,255,255), pygame.Rect(text_pos, (self.window_size[0], self.action_info_height)))
+        self.window_surface.blit(text_img, text_pos)
+        updated.append(pygame.Rect(text_pos, (self.window_size[0], self.action_info_height)))
+
+        pygame.display.update(updated)
+
+        # Limit frames per second
+        self.clock.tick(self.fps)
+
+    def _process_events(self):
+        # Process user events, key presses
+        for event in pygame.event.get():
+            # User clicked on X at the top right corner of window
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            if(event.type == pygame.KEYDOWN):
+                # User hit escape
+                if(event.key == pygame.K_ESCAPE):
+                    pygame.quit()
+                    sys.exit()
+
+def check_picks(num_steps=40, seed=0):
+    '''A robot waiting at its station must not be rewarded again, and a new station is never the current one.'''
+    for num_stations in (1, 2):
+        fleet = WarehouseFleet(grid_rows=12, grid_cols=12, num_robots=1, num_stations=num_stations, seed=seed)
+        picks = 0
+        for _ in range(num_steps):
+            station = fleet.assigned[0]
+            actions = fleet.oracle_actions()
+            _, reached = fleet.perform_actions(actions)
+            if reached[0]:
+                picks += 1
+                assert num_stations == 1 or fleet.assigned[0] != station, "reassigned to the station it is at"
+            elif fleet.distances[0] == 0:
+                assert actions[0] == WAIT
+        # one station: a single pick, then the robot waits there, two stations: it keeps going back and forth
+        assert picks == fleet.picks and (picks == 1 if num_stations == 1 else picks > 1), (num_stations, picks)
+    print("fleet picks: ok")
+
+# For unit testing: the oracle drives every robot
+if __name__=="__main__":
+    check_picks()
+    fleet = WarehouseFleet(grid_rows=60, grid_cols=60, num_robots=40, num_stations=12, fps=10, seed=0)
+    fleet.render()
+
+    while(True):
+        fleet.perform_actions(fleet.oracle_actions())
+        fleet.render()
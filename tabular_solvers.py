@@ -0,0 +1,238 @@
+'''
+Exact solvers for the toy_text environments (FrozenLake, Taxi, CliffWalking).
+Their `env.P[s][a]` is a list of (probability, next_state, reward, terminated); it is compiled once into NumPy arrays
+(cached per map and slipperiness) and solved with vectorized value iteration, policy iteration
+and modified policy iteration.
+
+Dense model:  T[s, a, s'] = P(s' | s, a) for transitions that do not terminate,  R[s, a] = E[r | s, a]
+              Q = R + γ * T @ V
+Sparse model: the same entries kept as flat (row = s * n_actions + a, next_state, probability) arrays,
+              Q = R + γ * bincount(row, probability * V[next_state])
+
+Usage:
+    python tabular_solvers.py frozen_lake --check part2/frozen_lake8x8.pkl
+    python tabular_solvers.py taxi --sparse
+'''
+import argparse
+import hashlib
+import pickle
+import time
+from collections import namedtuple
+from functools import partial
+
+import gymnasium as gym
+import numpy as np
+
+TabularModel = namedtuple('TabularModel', [
+    'n_states', 'n_actions', 'sparse',
+    'transitions',   # dense: (S, A, S') array, sparse: (rows, next_states, probabilities)
+    'rewards',       # (S, A) expected immediate reward
+    'initial_distribution',
+])
+
+# (env class, map, make() kwargs such as is_slippery and success_rate, sparse) -> TabularModel
+_model_cache = {}
+
+def _model_key(env, sparse):
+    if env.spec is None:
+        # without the make() kwargs the slipperiness is unknown (FrozenLakeEnv does not keep it), key on P itself
+        return (type(env).__name__, hashlib.sha1(pickle.dumps(env.P)).hexdigest(), sparse)
+    kwargs = dict(env.spec.kwargs)
+    for name in ('render_mode', 'desc', 'map_name'):
+        kwargs.pop(name, None)
+    desc = getattr(env, 'desc', None)
+    return (
+        type(env).__name__,
+        None if desc is None else (desc.shape, desc.tobytes()),
+        repr(sorted(kwargs.items())),
+        sparse,
+    )
+
+def compile_model(env, sparse=False):
+    '''Turn env.P into a TabularModel. `env` may be wrapped, the result is cached.'''
+    env = env.unwrapped
+    key = _model_key(env, sparse)
+    if key in _model_cache:
+        return _model_cache[key]
+
+    n_states, n_actions = env.observation_space.n, env.action_space.n
+    entries = [
+        (s * n_actions + a, next_state, prob, reward, terminated)
+        for s in range(n_states) for a in range(n_actions)
+        for prob, next_state, reward, terminated in env.P[s][a]
+    ]
+    rows, next_states, probs, rewards, terminated = (np.array(column) for column in zip(*entries))
+    rows, next_states = rows.astype(np.int64), next_states.astype(np.int64)
+    probs = probs.astype(np.float64)
+
+    expected_rewards = np.bincount(rows, probs * rewards, minlength=n_states * n_actions).reshape(n_states, n_actions)
+    # terminating transitions contribute their reward but no future value
+    keep = ~terminated.astype(bool)
+    rows, next_states, probs = rows[keep], next_states[keep], probs[keep]
+
+    if sparse:
+        transitions = (rows, next_states, probs)
+    else:
+        transitions = np.zeros((n_states * n_actions, n_states))
+        np.add.at(transitions, (rows, next_states), probs)
+        transitions = transitions.reshape(n_states, n_actions, n_states)
+
+    model = TabularModel(n_states, n_actions, sparse, transitions, expected_rewards,
+                         np.asarray(env.initial_state_distrib, dtype=np.float64))
+    _model_cache[key] = model
+    return model
+
+def expected_next_values(model, v):
+    '''E[V(s') | s, a] over non-terminating transitions, shape (S, A).'''
+    if model.sparse:
+        rows, next_states, probs = model.transitions
+        return np.bincount(rows, probs * v[next_states], minlength=model.n_states * model.n_actions).reshape(model.n_states, model.n_actions)
+    return model.transitions @ v
+
+def q_values(model, v, gamma):
+    return model.rewards + gamma * expected_next_values(model, v)
+
+def _policy_model(model, policy):
+    '''Rewards (S,) and a function v -> E[V(s') | s, policy[s]] for a deterministic policy.'''
+    states = np.arange(model.n_states)
+    r_pi = model.rewards[states, policy]
+    if model.sparse:
+        rows, next_states, probs = model.transitions
+        chosen = rows % model.n_actions == policy[rows // model.n_actions]
+        sources, next_states, probs = rows[chosen] // model.n_actions, next_states[chosen], probs[chosen]
+        return r_pi, lambda v: np.bincount(sources, probs * v[next_states], minlength=model.n_states)
+    p_pi = model.transitions[states, policy]
+    return r_pi, p_pi.__matmul__
+
+def evaluate_policy(model, policy, gamma, v=None, iterations=None, tol=1e-10):
+    '''V of a deterministic policy (array of actions).
+    iterations=None solves the Bellman equation exactly (dense) or iterates to `tol` (sparse);
+    an int runs that many backups from `v`, which with gamma=1 is the finite-horizon value.'''
+    if iterations is None and not model.sparse and gamma < 1:
+        states = np.arange(model.n_states)
+        p_pi = model.transitions[states, policy]
+        return np.linalg.solve(np.eye(model.n_states) - gamma * p_pi, model.rewards[states, policy])
+
+    r_pi, next_values = _policy_model(model, policy)
+
+    v = np.zeros(model.n_states) if v is None else v.copy()
+    step = 0
+    while iterations is None or step < iterations:
+        new_v = r_pi + gamma * next_values(v)
+        step += 1
+        converged = np.max(np.abs(new_v - v)) < tol
+        v = new_v
+        if iterations is None and converged:
+            break
+    return v
+
+def value_iteration(model, gamma=0.95, tol=1e-10, max_iterations=100000):
+    '''Returns (Q, V, iterations).'''
+    v = np.zeros(model.n_states)
+    for iteration in range(1, max_iterations + 1):
+        q = q_values(model, v, gamma)
+        new_v = q.max(axis=1)
+        if np.max(np.abs(new_v - v)) < tol:
+            v = new_v
+            break
+        v = new_v
+    return q_values(model, v, gamma), v, iteration
+
+def policy_iteration(model, gamma=0.95, max_iterations=1000):
+    '''Howard's policy iteration with exact evaluation. Returns (Q, V, iterations).'''
+    policy = np.zeros(model.n_states, dtype=np.int64)
+    for iteration in range(1, max_iterations + 1):
+        v = evaluate_policy(model, policy, gamma)
+        q = q_values(model, v, gamma)
+        # keep the current action on ties so the loop cannot cycle between equally good policies
+        best = q.max(axis=1)
+        current = q[np.arange(model.n_states), policy]
+        new_policy = np.where(current >= best - 1e-12, policy, q.argmax(axis=1))
+        if np.array_equal(new_policy, policy):
+            break
+        policy = new_policy
+    return q, v, iteration
+
+def modified_policy_iteration(model, gamma=0.95, evaluation_sweeps=20, tol=1e-10, max_iterations=100000):
+    '''Greedy improvement followed by `evaluation_sweeps` partial evaluation backups. Returns (Q, V, iterations).'''
+    v = np.zeros(model.n_states)
+    for iteration in range(1, max_iterations + 1):
+        q = q_values(model, v, gamma)
+        new_v = q.max(axis=1)
+        if np.max(np.abs(new_v - v)) < tol:
+            v = new_v
+            break
+        v = evaluate_policy(model, q.argmax(axis=1), gamma, new_v, evaluation_sweeps)
+    return q_values(model, v, gamma), v, iteration
+
+SOLVERS = {
+    'value_iteration': value_iteration,
+    'policy_iteration': policy_iteration,
+    'modified_policy_iteration': modified_policy_iteration,
+}
+
+def optimal_q(env, gamma=0.95, method='value_iteration', sparse=False):
+    '''Ground-truth optimal Q-table, e.g. to warm start VectorTabularTrainer(q_init=...).'''
+    q, _, _ = SOLVERS[method](compile_model(env, sparse), gamma)
+    return q
+
+def greedy_success_rate(model, q, horizon):
+    '''Probability that the greedy policy of `q` collects reward before `horizon` steps (FrozenLake: reaches the goal).'''
+    v = evaluate_policy(model, np.argmax(q, axis=1), 1.0, iterations=horizon)
+    return float(model.initial_distribution @ v)
+
+def check_model_cache(gamma=0.95):
+    '''Checks that the slippery and non-slippery versions of a map are compiled (and cached) as different models.'''
+    from gymnasium.envs.toy_text.frozen_lake import FrozenLakeEnv
+
+    # made with gym.make (keyed on the spec kwargs) and constructed directly (no spec, keyed on P)
+    for make in (partial(gym.make, 'FrozenLake-v1'), FrozenLakeEnv):
+        _model_cache.clear()
+        deterministic = compile_model(make(map_name="8x8", is_slippery=False))
+        slippery = compile_model(make(map_name="8x8", is_slippery=True))
+        assert deterministic is not slippery, "slippery and non-slippery maps share a cached model"
+        assert not np.array_equal(deterministic.transitions, slippery.transitions)
+        _, v, _ = value_iteration(slippery, gamma)
+        assert abs(slippery.initial_distribution @ v - 0.0482502) < 1e-6, "wrong V(start) of the slippery map"
+    _model_cache.clear()
+
+# Environments as used in this project
+ENVS = {
+    'frozen_lake': lambda: gym.make('FrozenLake-v1', map_name="8x8", is_slippery=True),
+    'taxi': lambda: gym.make('Taxi-v3'),
+    'cliff_walking': lambda: gym.make('CliffWalking-v1'),
+}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Exact solvers for the toy_text environments")
+    parser.add_argument('env', choices=list(ENVS), help='Environment to solve')
+    parser.add_argument('--gamma', type=float, default=0.95, help='Discount factor')
+    parser.add_argument('--sparse', action='store_true', help='Use the sparse transition model')
+    parser.add_argument('--check', default=None, help='Pickled Q-table to compare with the optimal one (FrozenLake)')
+    parser.add_argument('--check-cache', action='store_true', help='Check that slippery and non-slippery maps are cached apart')
+
+    args = parser.parse_args()
+    if args.check_cache:
+        check_model_cache()
+        print("model cache: ok")
+    env = ENVS[args.env]()
+
+    start = time.perf_counter()
+    model = compile_model(env, args.sparse)
+    print(f"compile: {(time.perf_counter() - start) * 1000:8.2f} ms ({model.n_states} states, {model.n_actions} actions)")
+
+    for name, solver in SOLVERS.items():
+        start = time.perf_counter()
+        q, v, iterations = solver(model, args.gamma)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{name:26s}: {elapsed:8.2f} ms | {iterations:5d} iterations | V(start) = {model.initial_distribution @ v:.6f}")
+
+    if args.check is not None:
+        with open(args.check, 'rb') as f:
+            learned = pickle.load(f)
+        horizon = env.spec.max_episode_steps
+        agreement = np.mean(np.argmax(learned, axis=1) == np.argmax(q, axis=1))
+        print(f"optimal policy success rate ({horizon} steps): {greedy_success_rate(model, q, horizon) * 100:.2f}%")
+        print(f"learned policy success rate ({horizon} steps): {greedy_success_rate(model, learned, horizon) * 100:.2f}%")
+        print(f"learned policy picks the optimal action in {agreement * 100:.1f}% of states")
+    env.close()
@@ -0,0 +1,212 @@
+'''
+Vectorized tabular trainer for the Part 1 (MountainCar) and Part 2 (FrozenLake) agents.
+Runs num_envs copies of the environment through gym.make_vec and updates one Q-table for all of them at once.
+
+Supported updates (s: state, a: action, s': next state, a': next action, α: learning rate, γ: discount):
+  Q-learning:     Q(s, a) += α * (r + γ * max(Q(s', A)) - Q(s, a))
+  SARSA:          Q(s, a) += α * (r + γ * Q(s', a') - Q(s, a))
+  Expected SARSA: Q(s, a) += α * (r + γ * ∑ π(a|s') * Q(s', a) - Q(s, a))   with π epsilon-greedy
+
+When several envs update the same (s, a) in one step, their updates are averaged (np.add.at + np.bincount).
+
+Usage:
+    python tabular_trainer.py frozen_lake --num-envs 16 --episodes 15000
+    python tabular_trainer.py mountain_car --num-envs 32 --episodes 5000 --save mountain_car.pkl
+    python tabular_trainer.py frozen_lake --compare
+    python tabular_trainer.py frozen_lake --q-init frozen_lake8x8.pkl   (warm start from a saved Q-table)
+'''
+import argparse
+import pickle
+import time
+
+import gymnasium as gym
+import numpy as np
+
+ALGORITHMS = ('q_learning', 'sarsa', 'expected_sarsa')
+
+# Epsilon schedules: functions of the number of finished episodes
+def constant_epsilon(epsilon):
+    return lambda episodes: epsilon
+
+def linear_epsilon(start=1.0, decay=1e-4, end=0.0):
+    return lambda episodes: max(start - decay * episodes, end)
+
+def exponential_epsilon(start=1.0, rate=0.999, end=0.01):
+    return lambda episodes: max(start * rate ** episodes, end)
+
+def grid_discretizer(low, high, bins):
+    '''Same binning as part1/mountain_car.py (np.linspace + np.digitize per dimension),
+    flattened into one state index. Returns (discretize, n_states).'''
+    edges = [np.linspace(l, h, bins) for l, h in zip(low, high)]
+    n_dims = len(edges)
+
+    def discretize(obs):
+        index = np.zeros(len(obs), dtype=np.int64)
+        for d in range(n_dims):
+            index = index * bins + np.minimum(np.digitize(obs[:, d], edges[d]), bins - 1)
+        return index
+
+    return discretize, bins ** n_dims
+
+class VectorTabularTrainer:
+
+    def __init__(self, env_id, num_envs=16, algorithm='q_learning', learning_rate=0.9, discount_factor=0.9,
+                 epsilon_schedule=None, discretize=None, n_states=None, q_init=0.0,
+                 failure_discount=None, final_learning_rate=None,
+                 vectorization_mode=None, env_kwargs=None, seed=None):
+        assert algorithm in ALGORITHMS, f"algorithm must be one of {ALGORITHMS}, got {algorithm!r}"
+        self.algorithm = algorithm
+        self.learning_rate = learning_rate
+        self.discount_factor = discount_factor
+        self.epsilon_schedule = linear_epsilon() if epsilon_schedule is None else epsilon_schedule
+        # Part 2 tweaks: shrink Q(s, a) when an episode ends without reward, and switch to a tiny learning rate once epsilon is 0
+        self.failure_discount = failure_discount
+        self.final_learning_rate = final_learning_rate
+
+        self.env = gym.make_vec(env_id, num_envs=num_envs, vectorization_mode=vectorization_mode, **(env_kwargs or {}))
+        self.num_envs = num_envs
+        self.n_actions = self.env.single_action_space.n
+
+        if discretize is None:
+            self.discretize = lambda obs: np.asarray(obs, dtype=np.int64)
+            self.n_states = self.env.single_observation_space.n
+        else:
+            self.discretize = discretize
+            self.n_states = n_states
+
+        # q_init is a scalar or a full Q-table (warm start, e.g. tabular_solvers.optimal_q)
+        self.q = np.array(np.broadcast_to(q_init, (self.n_states, self.n_actions)), dtype=np.float64)
+        self.rng = np.random.default_rng(seed)
+        self.seed = seed
+
+    def _epsilon_greedy(self, states, epsilon):
+        greedy = np.argmax(self.q[states], axis=1)
+        explore = self.rng.random(self.num_envs) < epsilon
+        random_actions = self.rng.integers(0, self.n_actions, size=self.num_envs)
+        return np.where(explore, random_actions, greedy)
+
+    def _update(self, states, actions, targets, mask, learning_rate):
+        states, actions, targets = states[mask], actions[mask], targets[mask]
+        flat = states * self.n_actions + actions
+        td = targets - self.q.ravel()[flat]
+        counts = np.bincount(flat, minlength=self.q.size)
+        np.add.at(self.q.ravel(), flat, learning_rate * td / counts[flat])
+
+    def train(self, episodes):
+        '''Train until `episodes` episodes (summed over all envs) have finished.
+        Returns the undiscounted return of each finished episode, in completion order.'''
+        obs, _ = self.env.reset(seed=self.seed)
+        states = self.discretize(obs)
+        epsilon = self.epsilon_schedule(0)
+        actions = self._epsilon_greedy(states, epsilon)
+
+        returns = np.zeros(self.num_envs)
+        finished = []
+        # with next-step autoreset the step after an episode end only resets the env, no update is made for it
+        autoreset = np.zeros(self.num_envs, dtype=np.bool_)
+
+        while len(finished) < episodes:
+            next_obs, rewards, terminated, truncated, _ = self.env.step(actions)
+            next_states = self.discretize(next_obs)
+            done = terminated | truncated
+            valid = ~autoreset
+
+            epsilon = self.epsilon_schedule(len(finished))
+            learning_rate = self.learning_rate
+            if self.final_learning_rate is not None and epsilon == 0:
+                learning_rate = self.final_learning_rate
+
+            next_q = self.q[next_states]
+            next_actions = self._epsilon_greedy(next_states, epsilon)
+            if self.algorithm == 'q_learning':
+                bootstrap = next_q.max(axis=1)
+            elif self.algorithm == 'sarsa':
+                bootstrap = next_q[np.arange(self.num_envs), next_actions]
+            else:
+                bootstrap = (1 - epsilon) * next_q.max(axis=1) + epsilon * next_q.mean(axis=1)
+            targets = rewards + self.discount_factor * bootstrap * ~terminated
+            self._update(states, actions, targets, valid, learning_rate)
+
+            if self.failure_discount is not None:
+                failed = valid & terminated & (rewards <= 0)
+                self.q[states[failed], actions[failed]] *= self.failure_discount
+
+            returns += np.where(valid, rewards, 0)
+            ended = np.flatnonzero(valid & done)
+            finished.extend(returns[ended].tolist())
+            returns[ended] = 0
+
+            autoreset = valid & done
+            states, actions = next_states, next_actions
+
+        return np.array(finished[:episodes])
+
+    def close(self):
+        self.env.close()
+
+# Settings from part1/mountain_car.py and part2/frozen_lake.py
+def make_trainer(preset, num_envs, episodes, algorithm=None, seed=None, q_init=None):
+    if preset == 'frozen_lake':
+        return VectorTabularTrainer(
+            'FrozenLake-v1', num_envs=num_envs, algorithm=algorithm or 'expected_sarsa',
+            learning_rate=0.9, discount_factor=0.95, q_init=0.001 if q_init is None else q_init,
+            epsilon_schedule=linear_epsilon(1.0, 0.0001), failure_discount=0.5, final_learning_rate=0.0001,
+            env_kwargs={'map_name': '8x8', 'is_slippery': True}, seed=seed,
+        )
+    elif preset == 'mountain_car':
+        env = gym.make('MountainCar-v0')
+        low, high = env.observation_space.low, env.observation_space.high
+        env.close()
+        discretize, n_states = grid_discretizer(low, high, 20)
+        return VectorTabularTrainer(
+            'MountainCar-v0', num_envs=num_envs, algorithm=algorithm or 'q_learning',
+            learning_rate=0.9, discount_factor=0.9, epsilon_schedule=linear_epsilon(1.0, 2 / episodes),
+            discretize=discretize, n_states=n_states, q_init=0.0 if q_init is None else np.reshape(q_init, (n_states, -1)),
+            env_kwargs={'max_episode_steps': 1000}, seed=seed,
+        )
+    raise ValueError(f"Unknown preset {preset!r}")
+
+def rolling_mean(values, window=100):
+    return np.array([np.mean(values[max(0, t-window):(t+1)]) for t in range(len(values))])
+
+def train_and_report(preset, num_envs, episodes, algorithm=None, seed=None, save=None, q_init=None):
+    trainer = make_trainer(preset, num_envs, episodes, algorithm, seed, q_init)
+    start = time.perf_counter()
+    returns = trainer.train(episodes)
+    elapsed = time.perf_counter() - start
+    trainer.close()
+
+    curve = rolling_mean(returns)
+    print(f"{preset} | {trainer.algorithm} | num_envs={num_envs:4d} | {elapsed:7.2f}s"
+          f" | mean return (last 100 episodes): {curve[-1]:.3f}")
+
+    if save is not None:
+        q = trainer.q
+        if preset == 'mountain_car':
+            q = q.reshape(20, 20, -1)  # same layout as part1/mountain_car.py
+        with open(save, 'wb') as f:
+            pickle.dump(q, f)
+    return returns, elapsed
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Vectorized tabular trainer")
+    parser.add_argument('preset', choices=['frozen_lake', 'mountain_car'], help='Which part to train')
+    parser.add_argument('--num-envs', type=int, default=16, help='Number of environments stepped together')
+    parser.add_argument('--episodes', type=int, default=None, help='Episodes to train (default 15000 / 5000)')
+    parser.add_argument('--algorithm', choices=ALGORITHMS, default=None, help='Update rule (default: the one used by the part)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for environments and exploration')
+    parser.add_argument('--save', default=None, help='Pickle the Q-table to this file')
+    parser.add_argument('--q-init', default=None, help='Pickled Q-table to start from (warm start)')
+    parser.add_argument('--compare', action='store_true', help='Also train with a single environment and compare')
+
+    args = parser.parse_args()
+    episodes = args.episodes or (15000 if args.preset == 'frozen_lake' else 5000)
+    q_init = None
+    if args.q_init is not None:
+        with open(args.q_init, 'rb') as f:
+            q_init = pickle.load(f)
+
+    returns, elapsed = train_and_report(args.preset, args.num_envs, episodes, args.algorithm, args.seed, args.save, q_init)
+    if args.compare:
+        single_returns, single_elapsed = train_and_report(args.preset, 1, episodes, args.algorithm, args.seed, q_init=q_init)
+        print(f"speedup: x{single_elapsed / elapsed:.1f}")
@@ -4,6 +4,7 @@ The Warehouse is divided into a rectangular grid. A Target is randomly placed on
 '''
 import random
 from enum import Enum
+import numpy as np
 import pygame
 import sys
 from os import path
@@ -25,17 +26,39 @@ class GridTile(Enum):
     def __str__(self):
         return self.name[:1]
 
+# (row, col) change for each RobotAction, indexed by the action's value.
+MOVE_DELTAS = ((0,-1), (1,0), (0,1), (-1,0))
+
+# Scaled sprites shared by every WarehouseRobot, keyed by (file name, cell size).
+_sprite_cache = {}
+
+def load_sprite(name, cell_size):
+    key = (name, cell_size)
+    if key not in _sprite_cache:
+        file_name = path.join(path.dirname(__file__), "sprites", name)
+        img = pygame.image.load(file_name)
+        _sprite_cache[key] = pygame.transform.scale(img, cell_size)
+    return _sprite_cache[key]
+
 class WarehouseRobot:
 
     # Initialize the grid size. Pass in an integer seed to make randomness (Targets) repeatable.
+    # Pygame (window, fonts, sprites) is only initialized on the first call to render().
     def __init__(self, grid_rows=4, grid_cols=5, fps=1):
         self.grid_rows = grid_rows
         self.grid_cols = grid_cols
+
+        # State: [robot_row, robot_col, target_row, target_col].
+        # robot_pos and target_pos are views into it, so the env can copy the whole state as its observation.
+        self.state = np.zeros(4, dtype=np.int32)
+        self.robot_pos = self.state[0:2]
+        self.target_pos = self.state[2:4]
+        self._rng = random.Random()
         self.reset()
 
         self.fps = fps
         self.last_action=''
-        self._init_pygame()
+        self.window_surface = None
 
     def _init_pygame(self):
         pygame.init() # initialize pygame
@@ -59,59 +82,52 @@ class WarehouseRobot:
         # Initialize game window
         self.window_surface = pygame.display.set_mode(self.window_size) 
 
-        # Load & resize sprites
-        file_name = path.join(path.dirname(__file__), "sprites/bot_blue.png")
-        img = pygame.image.load(file_name)
-        self.robot_img = pygame.transform.scale(img, self.cell_size)
-
-        file_name = path.join(path.dirname(__file__), "sprites/floor.png")
-        img = pygame.image.load(file_name)
-        self.floor_img = pygame.transform.scale(img, self.cell_size)
-
-        file_name = path.join(path.dirname(__file__), "sprites/package.png")
-        img = pygame.image.load(file_name)
-        self.goal_img = pygame.transform.scale(img, self.cell_size) 
+        # Load & resize sprites (cached across instances)
+        self.robot_img = load_sprite("bot_blue.png", self.cell_size)
+        self.floor_img = load_sprite("floor.png", self.cell_size)
+        self.goal_img = load_sprite("package.png", self.cell_size)
 
 
     def reset(self, seed=None):
-        # Initialize Robot's starting position
-        self.robot_pos = [0,0]
+        # Random Target position. Seeding our own generator keeps the global random module untouched.
+        if seed is not None:
+            self._rng.seed(seed)
+        target_row = self._rng.randint(1, self.grid_rows-1)
+        target_col = self._rng.randint(1, self.grid_cols-1)
 
-        # Random Target position
-        random.seed(seed)
-        self.target_pos = [
-            random.randint(1, self.grid_rows-1),
-            random.randint(1, self.grid_cols-1)
-        ]
+        # Robot starts in the top left corner
+        self.state[:] = (0, 0, target_row, target_col)
 
     def perform_action(self, robot_action:RobotAction) -> bool:
         self.last_action = robot_action
 
-        # Move Robot to the next cell
-        if robot_action == RobotAction.LEFT:
-            if self.robot_pos[1]>0:
-                self.robot_pos[1]-=1
-        elif robot_action == RobotAction.RIGHT:
-            if self.robot_pos[1]<self.grid_cols-1:
-                self.robot_pos[1]+=1
-        elif robot_action == RobotAction.UP:
-            if self.robot_pos[0]>0:
-                self.robot_pos[0]-=1
-        elif robot_action == RobotAction.DOWN:
-            if self.robot_pos[0]<self.grid_rows-1:
-                self.robot_pos[0]+=1
+        # Move Robot to the next cell, staying inside the grid.
+        # The state is read once as plain ints, which is much cheaper than indexing numpy scalars.
+        d_row, d_col = MOVE_DELTAS[robot_action.value if isinstance(robot_action, RobotAction) else robot_action]
+        row, col, target_row, target_col = self.state.tolist()
+        row = min(max(row + d_row, 0), self.grid_rows-1)
+        col = min(max(col + d_col, 0), self.grid_cols-1)
+        self.state[0] = row
+        self.state[1] = col
 
         # Return true if Robot reaches Target
-        return self.robot_pos == self.target_pos
+        return row == target_row and col == target_col
 
     def render(self):
+        if self.window_surface is None:
+            self._init_pygame()
+
+        robot_row, robot_col, target_row, target_col = self.state.tolist()
+        robot = (robot_row, robot_col)
+        target = (target_row, target_col)
+
         # Print current state on console
         for r in range(self.grid_rows):
             for c in range(self.grid_cols):
 
-                if([r,c] == self.robot_pos):
+                if((r,c) == robot):
                     print(GridTile.ROBOT, end=' ')
-                elif([r,c] == self.target_pos):
+                elif((r,c) == target):
                     print(GridTile.TARGET, end=' ')
                 else:
                     print(GridTile._FLOOR, end=' ')
@@ -132,15 +148,16 @@ class WarehouseRobot:
                 pos = (c * self.cell_width, r * self.cell_height)
                 self.window_surface.blit(self.floor_img, pos)
 
-                if([r,c] == self.target_pos):
+                if((r,c) == target):
                     # Draw target
                     self.window_surface.blit(self.goal_img, pos)
 
-                if([r,c] == self.robot_pos):
+                if((r,c) == robot):
                     # Draw robot
                     self.window_surface.blit(self.robot_img, pos)
                 
-        text_img = self.action_font.render(f'Action: {self.last_action}', True, (0,0,0), (255,255,255))
+        last_action = RobotAction(self.last_action) if self.last_action != '' else ''
+        text_img = self.action_font.render(f'Action: {last_action}', True, (0,0,0), (255,255,255))
         text_pos = (0, self.window_size[1] - self.action_info_height)
         self.window_surface.blit(text_img, text_pos)       
 